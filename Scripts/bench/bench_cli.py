@@ -0,0 +1,127 @@
+# 본 소스코드는 내부 사용 및 유지보수 목적에 한해 제공됩니다.
+# 무단 재배포 및 상업적 재사용은 허용되지 않습니다.
+"""
+헤드리스 CLI(spec_cli)의 실행 시간/최대 메모리를 GUI 진입 경로와 비교하고,
+CLI 실행 전체 과정에서 PyQt5/UI/폰트 모듈이 import되지 않는지 검사한다.
+
+- CLI: `python -X importtime -m spec_cli --format json` 실제 수집 포함 전체 실행
+- GUI 기준값: main import + QApplication/MainWindow 생성 (offscreen, 수집 제외)
+- 최대 메모리(RSS)는 resource 모듈이 있는 플랫폼(Linux/macOS)에서만 측정
+
+사용법:
+    python Scripts/bench/bench_cli.py [--repeat 5] [--args "--categories cpu,ram"]
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import shlex
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[2]
+SRC_DIR = ROOT / "src"
+
+# CLI 실행 중 import되면 안 되는 모듈 (접두어 일치)
+CLI_FORBIDDEN_PREFIXES = ("PyQt5", "ui", "controller", "core.font_utils", "core.spec_worker", "core.message_utils")
+
+GUI_BASELINE = (
+    "import sys\n"
+    "from PyQt5.QtWidgets import QApplication\n"
+    "import main\n"
+    "app = QApplication(sys.argv)\n"
+    "window = main.MainWindow()\n"
+)
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+
+def _run(argv: list[str]) -> tuple[float, subprocess.CompletedProcess]:
+    env = dict(os.environ)
+    env.setdefault("QT_QPA_PLATFORM", "offscreen")
+    started = time.perf_counter()
+    proc = subprocess.run(
+        [sys.executable] + argv,
+        cwd=str(SRC_DIR),
+        env=env,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+    )
+    return time.perf_counter() - started, proc
+
+
+def _measure(argv: list[str], repeat: int) -> tuple[float, float | None]:
+    """
+    argv를 repeat회 실행해 (최소 소요 시간, 하위 프로세스 최대 RSS MB)를 반환한다.
+    """
+    best = float("inf")
+    for _ in range(repeat):
+        elapsed, proc = _run(argv)
+        if proc.returncode not in (0, 1):
+            sys.stderr.write(proc.stderr.decode("utf-8", "replace"))
+            raise SystemExit(f"실행 실패: {' '.join(argv)} (종료 코드 {proc.returncode})")
+        best = min(best, elapsed)
+    rss_mb = None
+    if resource is not None:
+        # ru_maxrss: Linux는 KB, macOS는 bytes
+        maxrss = resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss
+        rss_mb = maxrss / (1024 * 1024) if sys.platform == "darwin" else maxrss / 1024
+    return best, rss_mb
+
+
+def _imported_modules(stderr: bytes) -> set[str]:
+    names = set()
+    for line in stderr.decode("utf-8", "replace").splitlines():
+        if line.startswith("import time:") and "self [us]" not in line:
+            names.add(line.rsplit("|", 1)[-1].strip())
+    return names
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--repeat", type=int, default=5, help="반복 횟수")
+    parser.add_argument("--args", default="--format json", help="spec_cli에 전달할 인자")
+    args = parser.parse_args()
+    cli_args = shlex.split(args.args)
+
+    _, proc = _run(["-X", "importtime", "-m", "spec_cli"] + cli_args)
+    leaked = sorted(
+        name for name in _imported_modules(proc.stderr)
+        if any(name == p or name.startswith(p + ".") for p in CLI_FORBIDDEN_PREFIXES)
+    )
+    ok = True
+    if leaked:
+        print(f"[FAIL] CLI 실행 중 GUI 모듈 import: {', '.join(leaked)}")
+        ok = False
+    if "--format" in cli_args and "json" in cli_args:
+        try:
+            json.loads(proc.stdout.decode("utf-8"))
+        except ValueError as e:
+            print(f"[FAIL] JSON 출력 파싱 실패: {e}")
+            ok = False
+
+    # RUSAGE_CHILDREN은 누적 최대값이므로 가벼운 CLI를 먼저 측정
+    cli_s, cli_rss = _measure(["-m", "spec_cli"] + cli_args, args.repeat)
+    print(f"CLI (수집 포함):        {cli_s * 1000:8.1f} ms" + (f" | 최대 RSS {cli_rss:6.1f} MB" if cli_rss else ""))
+    try:
+        gui_s, gui_rss = _measure(["-c", GUI_BASELINE], max(1, args.repeat // 2))
+    except SystemExit as e:
+        print(f"GUI 기준값 측정 생략: {e}")
+    else:
+        print(f"GUI (창 생성, 수집 제외): {gui_s * 1000:8.1f} ms" + (f" | 최대 RSS {gui_rss:6.1f} MB" if gui_rss else ""))
+        print(f"시간 비율: {cli_s / gui_s:6.2f}")
+
+    if not ok:
+        sys.exit(1)
+    print("[OK] CLI에서 GUI 모듈 미사용")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,56 @@
+# 본 소스코드는 내부 사용 및 유지보수 목적에 한해 제공됩니다.
+# 무단 재배포 및 상업적 재사용은 허용되지 않습니다.
+"""
+collect_all_specs() 순차/병렬 수집 소요 시간을 비교한다.
+가짜 wmi 모듈(fake_wmi)로 클래스별 조회 지연을 재현하므로 Linux에서도 실행할 수 있다.
+
+사용법:
+    python Scripts/bench/bench_collect.py [--scale 0.5] [--repeat 3]
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[2]
+sys.path.insert(0, str(ROOT / "src"))
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+import fake_wmi  # noqa: E402
+from core import collector  # noqa: E402
+
+
+def _measure(parallel: bool, repeat: int) -> float:
+    """
+    collect_all_specs()를 repeat회 실행해 최소 소요 시간(초)을 반환한다.
+    """
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        collector.collect_all_specs(parallel=parallel)
+        best = min(best, time.perf_counter() - started)
+    return best
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--scale", type=float, default=1.0, help="클래스 조회 지연 배율")
+    parser.add_argument("--repeat", type=int, default=3, help="반복 횟수")
+    args = parser.parse_args()
+
+    fake_wmi.configure(scale=args.scale)
+    fake_wmi.install(collector)
+
+    sequential = _measure(parallel=False, repeat=args.repeat)
+    parallel = _measure(parallel=True, repeat=args.repeat)
+
+    print(f"순차 수집: {sequential * 1000:8.1f} ms")
+    print(f"병렬 수집: {parallel * 1000:8.1f} ms")
+    print(f"개선 배율: {sequential / parallel:8.2f}x")
+
+
+if __name__ == "__main__":
+    main()
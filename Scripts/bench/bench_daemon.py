@@ -0,0 +1,107 @@
+# 본 소스코드는 내부 사용 및 유지보수 목적에 한해 제공됩니다.
+# 무단 재배포 및 상업적 재사용은 허용되지 않습니다.
+"""
+상주 사양 데몬(core.spec_daemon)의 응답 지연과 수집 공유(single-flight)를 검증한다.
+가짜 wmi 모듈(fake_wmi)로 수집 지연을 재현하므로 Linux에서도 실행할 수 있다. (Unix 소켓 사용)
+
+- 기동 직후 동시 요청 N개 → 수집 1회만 실행되는지
+- 캐시된 결과 요청 지연 (연결 생성 포함, ms)
+- invalidate 후 동시 요청 N개 → 재수집 1회로 합쳐지는지, 새 세대가 반환되는지
+- 데몬 결과가 collect_all_specs() 직접 수집 결과와 같은지
+
+사용법:
+    python Scripts/bench/bench_daemon.py [--scale 0.2] [--clients 16] [--requests 200]
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import sys
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[2]
+sys.path.insert(0, str(ROOT / "src"))
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+import fake_wmi  # noqa: E402
+from core import collector  # noqa: E402
+from core.daemon_client import SpecDaemonClient  # noqa: E402
+from core.spec_daemon import SpecDaemon  # noqa: E402
+
+
+def _concurrent_gets(client: SpecDaemonClient, count: int) -> list[dict]:
+    with ThreadPoolExecutor(max_workers=count) as pool:
+        return list(pool.map(lambda _: client.get(), range(count)))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--scale", type=float, default=0.2, help="클래스 조회 지연 배율")
+    parser.add_argument("--clients", type=int, default=16, help="동시 요청 수")
+    parser.add_argument("--requests", type=int, default=200, help="지연 측정 요청 수")
+    args = parser.parse_args()
+
+    fake_wmi.configure(scale=args.scale)
+    fake_wmi.install(collector)
+    collector.SMBIOS_ENABLED = False
+
+    endpoint = os.path.join(tempfile.mkdtemp(prefix="specd_bench_"), "specd.sock")
+    daemon = SpecDaemon(endpoint=endpoint)
+    thread = threading.Thread(target=daemon.serve_forever, name="specd", daemon=True)
+    thread.start()
+    if not daemon.ready.wait(5):
+        raise SystemExit("데몬 기동 실패")
+    client = SpecDaemonClient(endpoint, timeout_s=30)
+    ok = True
+
+    started = time.perf_counter()
+    responses = _concurrent_gets(client, args.clients)
+    first_ms = (time.perf_counter() - started) * 1000
+    stats = client.stats()
+    if stats["collections"] != 1 or len({r["generation"] for r in responses}) != 1:
+        print(f"[FAIL] 기동 직후 동시 요청: 수집 {stats['collections']}회 (기대 1회)")
+        ok = False
+    print(f"첫 결과 (동시 {args.clients}개, 수집 포함): {first_ms:8.1f} ms | 수집 {stats['last_collect_ms']} ms")
+
+    latencies = []
+    for _ in range(args.requests):
+        t = time.perf_counter()
+        client.get()
+        latencies.append((time.perf_counter() - t) * 1000)
+    latencies.sort()
+    print(
+        f"캐시 응답 지연: 중앙값 {latencies[len(latencies) // 2]:6.2f} ms | "
+        f"p95 {latencies[int(len(latencies) * 0.95)]:6.2f} ms"
+    )
+
+    before = stats["generation"]
+    client.invalidate()
+    responses = _concurrent_gets(client, args.clients)
+    stats = client.stats()
+    generations = {r["generation"] for r in responses}
+    if stats["collections"] != 2 or generations != {before + 1}:
+        print(f"[FAIL] 무효화 후 재수집: 수집 {stats['collections']}회, 세대 {sorted(generations)} (기대 2회, {before + 1})")
+        ok = False
+
+    if client.get_specs() != collector.collect_all_specs():
+        print("[FAIL] 데몬 결과가 직접 수집 결과와 다름")
+        ok = False
+
+    daemon.stop()
+    thread.join(5)
+    if os.path.exists(endpoint):
+        print("[FAIL] 종료 후 소켓 파일이 남아 있음")
+        ok = False
+
+    if not ok:
+        sys.exit(1)
+    print("[OK] 동시 요청 수집 1회 공유, 무효화 후 재수집 1회, 결과 일치")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,150 @@
+# 본 소스코드는 내부 사용 및 유지보수 목적에 한해 제공됩니다.
+# 무단 재배포 및 상업적 재사용은 허용되지 않습니다.
+"""
+상주 사양 데몬의 localhost HTTP 엔드포인트(core.spec_http)를 검증하고 응답 지연을 측정한다.
+가짜 wmi 모듈(fake_wmi)로 수집 지연을 재현하므로 Linux에서도 실행할 수 있다.
+
+- /specs 200 + ETag, 결과가 collect_all_specs()와 같은지, If-None-Match 일치 시 304
+- 최소 간격 이내의 /specs?refresh=1 동시 요청 N개 → 재수집 없음
+- 최소 간격이 지난 뒤 /specs?refresh=1 동시 요청 N개 → 재수집 1회, 내용이 같으면 ETag 유지
+- /healthz, /metrics(카테고리별 수집 시간), 외부 Host 헤더 거부(403)
+- keep-alive 연결의 /specs 304/200 응답 지연 (ms)
+
+사용법:
+    python Scripts/bench/bench_http.py [--scale 0.2] [--clients 16] [--requests 300]
+"""
+
+from __future__ import annotations
+
+import argparse
+import http.client
+import json
+import os
+import sys
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[2]
+sys.path.insert(0, str(ROOT / "src"))
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+import fake_wmi  # noqa: E402
+from core import collector  # noqa: E402
+from core.spec_daemon import SpecDaemon  # noqa: E402
+from core.spec_schema import SPEC_CATEGORIES, TIMED_OUT_KEY, restore_json_specs  # noqa: E402
+
+MIN_REFRESH_INTERVAL_S = 0.5
+
+
+def _get(port: int, path: str, headers: dict | None = None) -> tuple[int, dict, bytes]:
+    conn = http.client.HTTPConnection("127.0.0.1", port, timeout=30)
+    try:
+        conn.request("GET", path, headers=headers or {})
+        resp = conn.getresponse()
+        return resp.status, dict(resp.getheaders()), resp.read()
+    finally:
+        conn.close()
+
+
+def _burst(port: int, path: str, count: int) -> list[tuple[int, dict, bytes]]:
+    with ThreadPoolExecutor(max_workers=count) as pool:
+        return list(pool.map(lambda _: _get(port, path), range(count)))
+
+
+def _latency_ms(port: int, count: int, headers: dict) -> float:
+    """
+    keep-alive 연결 1개로 /specs를 count회 요청해 중앙값 지연(ms)을 반환한다.
+    """
+    conn = http.client.HTTPConnection("127.0.0.1", port, timeout=30)
+    samples = []
+    try:
+        for _ in range(count):
+            t = time.perf_counter()
+            conn.request("GET", "/specs", headers=headers)
+            conn.getresponse().read()
+            samples.append((time.perf_counter() - t) * 1000)
+    finally:
+        conn.close()
+    samples.sort()
+    return samples[len(samples) // 2]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--scale", type=float, default=0.2, help="클래스 조회 지연 배율")
+    parser.add_argument("--clients", type=int, default=16, help="동시 요청 수")
+    parser.add_argument("--requests", type=int, default=300, help="지연 측정 요청 수")
+    args = parser.parse_args()
+
+    fake_wmi.configure(scale=args.scale)
+    fake_wmi.install(collector)
+    collector.SMBIOS_ENABLED = False
+
+    endpoint = os.path.join(tempfile.mkdtemp(prefix="specd_http_bench_"), "specd.sock")
+    daemon = SpecDaemon(endpoint=endpoint, http_port=0, min_refresh_interval_s=MIN_REFRESH_INTERVAL_S)
+    thread = threading.Thread(target=daemon.serve_forever, name="specd", daemon=True)
+    thread.start()
+    if not daemon.ready.wait(5):
+        raise SystemExit("데몬 기동 실패")
+    port = daemon.http_address[1]
+    failures = []
+
+    status, headers, body = _get(port, "/specs")
+    etag = headers.get("ETag")
+    expected = collector.collect_all_specs()
+    expected.pop(TIMED_OUT_KEY, None)
+    if status != 200 or not etag or restore_json_specs(json.loads(body)["specs"]) != expected:
+        failures.append(f"/specs 첫 응답 {status}, ETag {etag}")
+    status, _, body = _get(port, "/specs", {"If-None-Match": etag})
+    if status != 304 or body:
+        failures.append(f"If-None-Match 일치 응답 {status} (기대 304)")
+
+    _burst(port, "/specs?refresh=1", args.clients)
+    stats = daemon.stats()
+    if stats["collections"] != 1:
+        failures.append(f"최소 간격 이내 재수집 요청: 수집 {stats['collections']}회 (기대 1회)")
+
+    time.sleep(MIN_REFRESH_INTERVAL_S + 0.1)
+    started = time.perf_counter()
+    responses = _burst(port, "/specs?refresh=1", args.clients)
+    burst_ms = (time.perf_counter() - started) * 1000
+    stats = daemon.stats()
+    if stats["collections"] != 2:
+        failures.append(f"동시 재수집 요청 {args.clients}개: 수집 {stats['collections']}회 (기대 2회)")
+    if {r[1].get("ETag") for r in responses} != {etag}:
+        failures.append("내용이 같은 재수집 후 ETag 변경")
+    print(f"동시 재수집 요청 {args.clients}개 (수집 1회 공유): {burst_ms:8.1f} ms")
+
+    status, _, body = _get(port, "/healthz")
+    if status != 200 or json.loads(body)["status"] != "ok":
+        failures.append(f"/healthz {status} {body[:80]!r}")
+    status, _, body = _get(port, "/metrics")
+    metrics = body.decode("utf-8")
+    missing = [c for c in SPEC_CATEGORIES if f'category_collect_seconds{{category="{c}"}}' not in metrics]
+    if status != 200 or missing:
+        failures.append(f"/metrics {status}, 카테고리 수집 시간 누락: {missing}")
+    status, _, _ = _get(port, "/specs", {"Host": "attacker.example:80"})
+    if status != 403:
+        failures.append(f"외부 Host 헤더 응답 {status} (기대 403)")
+    status, _, _ = _get(port, "/nope")
+    if status != 404:
+        failures.append(f"없는 경로 응답 {status} (기대 404)")
+
+    print(f"/specs 304 응답 지연 (keep-alive): 중앙값 {_latency_ms(port, args.requests, {'If-None-Match': etag}):6.2f} ms")
+    print(f"/specs 200 응답 지연 (keep-alive): 중앙값 {_latency_ms(port, args.requests, {}):6.2f} ms")
+
+    daemon.stop()
+    thread.join(5)
+
+    for failure in failures:
+        print(f"[FAIL] {failure}")
+    if failures:
+        sys.exit(1)
+    print("[OK] ETag/304, 재수집 간격 제한/공유, healthz/metrics, Host 검사")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,247 @@
+# 본 소스코드는 내부 사용 및 유지보수 목적에 한해 제공됩니다.
+# 무단 재배포 및 상업적 재사용은 허용되지 않습니다.
+"""
+하드웨어 변경 감시(core.hw_watcher)가 변경된 카테고리만 재수집하는지 검증하고 반영 지연/유휴 비용을 측정한다.
+가짜 이벤트 공급원(QueueEventSource)과 가짜 wmi 모듈(fake_wmi)을 사용하므로 Linux에서도 실행할 수 있다. (Unix 소켓 사용)
+
+- uevent 메시지 해석: 디스크 추가/제거만 storage, GPU(cardN) 추가/제거만 vga, 파티션/loop/커넥터 무시
+- 연속 이벤트(디스크 + 파티션 여러 개)가 한 번의 알림으로 합쳐지는지
+- Windows 공급원(WmiEventSource): 클래스마다 __InstanceOperationEvent 구독 1개, 생성/삭제만 추가/제거로 전달
+- 유휴 상태에서 감시 스레드의 CPU 사용 시간 (대기 중 깨어나지 않아야 함)
+- 데몬: 디스크 추가 이벤트 → storage만 재수집, 이벤트부터 새 세대 게시까지 지연, 결과가 전체 수집과 같은지
+- invalidate 요청의 categories 검증, RefreshScheduler.invalidate()
+
+사용법:
+    python Scripts/bench/bench_hw_watcher.py [--scale 0.05] [--idle 2.0]
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[2]
+sys.path.insert(0, str(ROOT / "src"))
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+import fake_wmi  # noqa: E402
+from core import collector, hw_watcher  # noqa: E402
+from core.daemon_client import DaemonUnavailableError, SpecDaemonClient  # noqa: E402
+from core.hw_watcher import HardwareWatcher, QueueEventSource, WmiEventSource, parse_uevent  # noqa: E402
+from core.refresh_scheduler import RefreshScheduler  # noqa: E402
+from core.spec_daemon import SpecDaemon, _collect_model  # noqa: E402
+from core.spec_schema import CATEGORY_STORAGE, CATEGORY_VGA, SPEC_CATEGORIES  # noqa: E402
+
+# (메시지, 기대 카테고리)
+UEVENT_SAMPLES = (
+    (b"add@/devices/pci0000:00/usb2/2-1/host6/block/sdb\0ACTION=add\0SUBSYSTEM=block\0DEVNAME=sdb\0DEVTYPE=disk", CATEGORY_STORAGE),
+    (b"add@/devices/.../block/sdb/sdb1\0ACTION=add\0SUBSYSTEM=block\0DEVNAME=sdb1\0DEVTYPE=partition", None),
+    (b"remove@/devices/.../nvme1n1\0ACTION=remove\0SUBSYSTEM=block\0DEVNAME=nvme1n1\0DEVTYPE=disk", CATEGORY_STORAGE),
+    (b"change@/devices/virtual/block/loop0\0ACTION=change\0SUBSYSTEM=block\0DEVNAME=loop0\0DEVTYPE=disk", None),
+    (b"add@/devices/pci0000:00/0000:00:02.0/drm/card1\0ACTION=add\0SUBSYSTEM=drm\0DEVNAME=dri/card1", CATEGORY_VGA),
+    (b"change@/devices/.../drm/card0\0ACTION=change\0SUBSYSTEM=drm\0DEVNAME=dri/card0\0HOTPLUG=1", None),
+    (b"add@/devices/.../drm/card0/card0-HDMI-A-1\0ACTION=add\0SUBSYSTEM=drm", None),
+    (b"add@/devices/.../drm/renderD128\0ACTION=add\0SUBSYSTEM=drm\0DEVNAME=dri/renderD128", None),
+    (b"add@/devices/.../input/input9\0ACTION=add\0SUBSYSTEM=input", None),
+)
+
+
+def _check_uevents(failures: list) -> None:
+    for data, expected in UEVENT_SAMPLES:
+        event = parse_uevent(data)
+        category = event.category if event is not None else None
+        if category != expected:
+            header = data.split(b"\0", 1)[0]
+            failures.append(f"uevent {header!r}: {category} (기대 {expected})")
+    print(f"uevent 해석: 샘플 {len(UEVENT_SAMPLES)}개 확인")
+
+
+def _check_debounce(failures: list, idle_s: float) -> None:
+    source = QueueEventSource()
+    watcher = HardwareWatcher(source)
+    dispatched = []
+    arrived = threading.Event()
+
+    def on_change(categories):
+        dispatched.append((time.perf_counter(), categories))
+        arrived.set()
+
+    watcher.start(on_change)
+    # 유휴 비용: 이벤트가 없는 동안 프로세스 CPU 시간 증가분 (메인 스레드는 sleep)
+    cpu_started = time.process_time()
+    time.sleep(idle_s)
+    idle_cpu_ms = (time.process_time() - cpu_started) * 1000
+
+    started = time.perf_counter()
+    source.push(CATEGORY_STORAGE, hw_watcher.ACTION_ADD, "sdb")
+    for index in range(1, 5):
+        source.push(CATEGORY_STORAGE, hw_watcher.ACTION_CHANGE, f"sdb{index}")
+    source.push(CATEGORY_VGA, hw_watcher.ACTION_ADD, "card1")
+    arrived.wait(5)
+    time.sleep(hw_watcher.DEBOUNCE_S * 2)
+    watcher.stop()
+    stats = watcher.stats()
+
+    latency_ms = (dispatched[0][0] - started) * 1000 if dispatched else float("inf")
+    print(
+        f"연속 이벤트 병합: 이벤트 {stats['events']}개 → 알림 {stats['dispatches']}회 "
+        f"{dispatched[0][1] if dispatched else ()} | 알림 지연 {latency_ms:.0f} ms | "
+        f"유휴 {idle_s:.1f}s CPU {idle_cpu_ms:.1f} ms"
+    )
+    if [c for _, c in dispatched] != [(CATEGORY_VGA, CATEGORY_STORAGE)]:
+        failures.append(f"연속 이벤트 병합 실패: {[c for _, c in dispatched]}")
+    if latency_ms >= 1000:
+        failures.append(f"알림 지연 {latency_ms:.0f} ms (1초 이상)")
+    if idle_cpu_ms > 20:
+        failures.append(f"유휴 CPU {idle_cpu_ms:.1f} ms")
+    if any(t.name.startswith("hw-watch") for t in threading.enumerate()):
+        failures.append("종료 후 감시 스레드가 남아 있음")
+
+
+def _check_wmi_source(failures: list) -> None:
+    source = WmiEventSource()
+    received = []
+    arrived = threading.Event()
+
+    def emit(event):
+        received.append((event.category, event.action, event.detail))
+        if len(received) == 2:
+            arrived.set()
+
+    thread = threading.Thread(target=source.run, args=(emit,), name="hw-watch-wmi", daemon=True)
+    thread.start()
+    deadline = time.monotonic() + 5
+    while len(fake_wmi.SUBSCRIPTIONS) < len(hw_watcher.WMI_WATCH_CLASSES) and time.monotonic() < deadline:
+        time.sleep(0.01)
+    fake_wmi.push_event("MSFT_PhysicalDisk", "modification", FriendlyName="Samsung SSD 980 PRO 1TB")
+    fake_wmi.push_event("MSFT_PhysicalDisk", "creation", FriendlyName="USB SanDisk 3.2Gen1")
+    fake_wmi.push_event("Win32_VideoController", "deletion", Name="NVIDIA GeForce RTX 3050")
+    arrived.wait(5)
+    time.sleep(0.05)
+    source.close()
+    thread.join(5)
+
+    subscriptions = sorted(fake_wmi.SUBSCRIPTIONS)
+    expected = [
+        (hw_watcher.WMI_NOTIFICATION_TYPE, "MSFT_PhysicalDisk", hw_watcher.WMI_EVENT_WITHIN_S),
+        (hw_watcher.WMI_NOTIFICATION_TYPE, "Win32_VideoController", hw_watcher.WMI_EVENT_WITHIN_S),
+    ]
+    print(f"WMI 이벤트 구독: {len(subscriptions)}개 {[c for _, c, _ in subscriptions]} | 전달 {received}")
+    if subscriptions != expected:
+        failures.append(f"WMI 이벤트 구독: {subscriptions} (기대 {expected})")
+    if sorted(received) != [
+        (CATEGORY_STORAGE, hw_watcher.ACTION_ADD, "USB SanDisk 3.2Gen1"),
+        (CATEGORY_VGA, hw_watcher.ACTION_REMOVE, "NVIDIA GeForce RTX 3050"),
+    ]:
+        failures.append(f"WMI 이벤트 변환: {received}")
+    if thread.is_alive() or any(t.name.startswith("hw-watch-") for t in threading.enumerate()):
+        failures.append("WMI 공급원 종료 후 감시 스레드가 남아 있음")
+
+
+def _wait_generation(client: SpecDaemonClient, generation: int, timeout_s: float = 10.0) -> dict:
+    deadline = time.monotonic() + timeout_s
+    while True:
+        stats = client.stats()
+        if stats["generation"] > generation and not stats["collecting"] or time.monotonic() > deadline:
+            return stats
+        time.sleep(0.005)
+
+
+def _check_daemon(failures: list) -> None:
+    calls = []
+
+    def collect_fn(durations_ms, categories):
+        calls.append(tuple(categories))
+        return _collect_model(True, durations_ms, categories)
+
+    source = QueueEventSource()
+    endpoint = os.path.join(tempfile.mkdtemp(prefix="hw_watch_bench_"), "specd.sock")
+    daemon = SpecDaemon(endpoint=endpoint, collect_fn=collect_fn, hardware_watcher=HardwareWatcher(source))
+    thread = threading.Thread(target=daemon.serve_forever, name="specd", daemon=True)
+    thread.start()
+    if not daemon.ready.wait(5):
+        raise SystemExit("데몬 기동 실패")
+    client = SpecDaemonClient(endpoint, timeout_s=30)
+    full = client.get_specs()
+    full_ms = client.stats()["last_collect_ms"]
+
+    generation = client.stats()["generation"]
+    started = time.perf_counter()
+    source.push(CATEGORY_STORAGE, hw_watcher.ACTION_ADD, "sdb")
+    stats = _wait_generation(client, generation)
+    applied_ms = (time.perf_counter() - started) * 1000
+    print(
+        f"데몬 디스크 추가: 수집 {', '.join(calls[-1])} | 이벤트→새 세대 {applied_ms:.0f} ms "
+        f"(수집 {stats['last_collect_ms']} ms, 전체 수집 {full_ms} ms) | 감시 {stats.get('hardware_watcher')}"
+    )
+    if calls[-1] != (CATEGORY_STORAGE,) or stats["generation"] != generation + 1:
+        failures.append(f"디스크 추가 후 재수집: {calls}, 세대 {stats['generation']}")
+    if applied_ms >= 1000:
+        failures.append(f"디스크 추가 반영 지연 {applied_ms:.0f} ms (1초 이상)")
+    if client.get_specs() != full:
+        failures.append("부분 재수집 병합 결과가 전체 수집 결과와 다름")
+
+    generation = stats["generation"]
+    client.invalidate((CATEGORY_VGA,))
+    stats = _wait_generation(client, generation)
+    if calls[-1] != (CATEGORY_VGA,) or client.get_specs() != full:
+        failures.append(f"invalidate(vga) 후 재수집: {calls[-1]}")
+    try:
+        client.request("invalidate", categories=["floppy"])
+        failures.append("알 수 없는 카테고리 무효화가 거부되지 않음")
+    except DaemonUnavailableError:
+        pass
+    client.invalidate()
+    client.get(fresh=False)
+    if calls[-1] != SPEC_CATEGORIES:
+        failures.append(f"전체 무효화 후 재수집: {calls[-1]}")
+
+    daemon.stop()
+    thread.join(5)
+    if any(t.name.startswith("hw-watch") for t in threading.enumerate()):
+        failures.append("데몬 종료 후 감시 스레드가 남아 있음")
+
+
+def _check_scheduler(failures: list) -> None:
+    scheduler = RefreshScheduler(collector=None)
+    scheduler.mark_collected({})
+    scheduler.invalidate((CATEGORY_STORAGE,))
+    if scheduler.stale_categories() != (CATEGORY_STORAGE,):
+        failures.append(f"RefreshScheduler.invalidate(storage) 후 만료: {scheduler.stale_categories()}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--scale", type=float, default=0.05, help="클래스 조회 지연 배율")
+    parser.add_argument("--idle", type=float, default=2.0, help="유휴 CPU 측정 시간(초)")
+    args = parser.parse_args()
+
+    fake_wmi.configure(scale=args.scale)
+    fake_wmi.install(collector)
+    collector.SMBIOS_ENABLED = False
+    failures = []
+
+    _check_uevents(failures)
+    _check_debounce(failures, args.idle)
+    _check_wmi_source(failures)
+    _check_daemon(failures)
+    _check_scheduler(failures)
+    source = hw_watcher.default_event_source()
+    print(f"현재 플랫폼 이벤트 공급원: {type(source).__name__ if source is not None else '없음'}")
+    if source is not None:
+        source.close()
+
+    for failure in failures:
+        print(f"[FAIL] {failure}")
+    if failures:
+        sys.exit(1)
+    print("[OK] uevent 해석, 연속 이벤트 병합, 유휴 대기, WMI 구독/변환, 변경 카테고리만 재수집, 병합 결과 일치")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,86 @@
+# 본 소스코드는 내부 사용 및 유지보수 목적에 한해 제공됩니다.
+# 무단 재배포 및 상업적 재사용은 허용되지 않습니다.
+"""
+Linux procfs/sysfs 백엔드의 수집 결과와 전체 수집 소요 시간을 측정한다.
+가짜 sysfs 트리(fake_sysfs)를 임시 디렉토리에 만들어 기대 결과와 비교한다.
+
+GPU 수집은 GPU 여러 개와 PCI 장치 수백 개가 있는 서버 트리에서도 따로 측정한다.
+
+사용법:
+    python Scripts/bench/bench_linux.py [--repeat 200] [--budget-ms 10] [--gpus 8]
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[2]
+sys.path.insert(0, str(ROOT / "src"))
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+import fake_sysfs  # noqa: E402
+from core import linux_backend  # noqa: E402
+from core.spec_schema import SPEC_CATEGORIES, empty_specs, merge_category_result  # noqa: E402
+
+
+def _sweep(root: str) -> dict:
+    """
+    모든 카테고리를 수집해 사양 딕셔너리로 병합한다.
+    """
+    specs = empty_specs()
+    for category in SPEC_CATEGORIES:
+        merge_category_result(specs, category, linux_backend.collect_category(category, root))
+    return specs
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--repeat", type=int, default=200, help="반복 횟수")
+    parser.add_argument("--budget-ms", type=float, default=10.0, help="전체 수집 1회 허용 시간(ms)")
+    parser.add_argument("--gpus", type=int, default=8, help="서버 트리의 GPU 수")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        root = str(fake_sysfs.build(Path(tmp)))
+
+        specs = _sweep(root)
+        if specs != fake_sysfs.EXPECTED_SPECS:
+            print("[FAIL] 수집 결과가 기대값과 다릅니다.")
+            for key in fake_sysfs.EXPECTED_SPECS:
+                if specs.get(key) != fake_sysfs.EXPECTED_SPECS[key]:
+                    print(f"  {key}: {specs.get(key)!r} != {fake_sysfs.EXPECTED_SPECS[key]!r}")
+            sys.exit(1)
+
+        best = float("inf")
+        for _ in range(args.repeat):
+            started = time.perf_counter()
+            _sweep(root)
+            best = min(best, time.perf_counter() - started)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        server_root = str(fake_sysfs.build_gpu_server(Path(tmp), gpus=args.gpus))
+        gpu_list = linux_backend.collect_gpu(server_root)
+        # GPU + BMC 디스플레이(ASPEED) 1개
+        if len(gpu_list or ()) != args.gpus + 1:
+            print(f"[FAIL] 서버 GPU 수 불일치: {gpu_list!r}")
+            sys.exit(1)
+        gpu_best = float("inf")
+        for _ in range(max(args.repeat // 10, 1)):
+            started = time.perf_counter()
+            linux_backend.collect_gpu(server_root)
+            gpu_best = min(gpu_best, time.perf_counter() - started)
+
+    print(f"전체 수집(최소): {best * 1000:8.3f} ms")
+    print(f"GPU 수집(서버, GPU {args.gpus}개, 최소): {gpu_best * 1000:8.3f} ms")
+    if max(best, gpu_best) * 1000 > args.budget_ms:
+        print(f"[FAIL] 허용 시간 {args.budget_ms:.1f} ms 초과")
+        sys.exit(1)
+    print("[OK] 결과 일치, 허용 시간 이내")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,107 @@
+# 본 소스코드는 내부 사용 및 유지보수 목적에 한해 제공됩니다.
+# 무단 재배포 및 상업적 재사용은 허용되지 않습니다.
+"""
+PCI ID 색인(core.pci_ids)의 조회 결과를 검증하고 색인 열기/조회 시간을 측정한다.
+표본(fake_pci_ids.SAMPLE)으로 이름 결정 규칙을 확인하고,
+실제 pci.ids 규모의 합성 데이터(또는 --source로 지정한 실제 pci.ids)로 성능을 측정한다.
+
+사용법:
+    python Scripts/bench/bench_pci_ids.py [--source /usr/share/hwdata/pci.ids] [--lookups 200000]
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[2]
+sys.path.insert(0, str(ROOT / "src"))
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+import fake_pci_ids  # noqa: E402
+from core import pci_ids  # noqa: E402
+
+
+def _check(label: str, actual, expected) -> bool:
+    ok = actual == expected
+    print(f"[{'OK' if ok else 'FAIL'}] {label}: {actual!r}" + ("" if ok else f" != {expected!r}"))
+    return ok
+
+
+def _write_index(tmp: str, name: str, lines) -> str:
+    path = Path(tmp) / name
+    path.write_bytes(pci_ids.build_index(lines))
+    return str(path)
+
+
+def _verify_sample(tmp: str) -> bool:
+    db = pci_ids.PciIdDatabase(_write_index(tmp, "sample.bin", fake_pci_ids.SAMPLE.splitlines()))
+    ok = True
+    for vendor_id, expected in fake_pci_ids.EXPECTED_VENDORS:
+        ok = _check(f"벤더 {vendor_id:04X}", pci_ids.gpu_vendor_name(vendor_id, db=db), expected) and ok
+    for args, expected in fake_pci_ids.EXPECTED_DEVICES:
+        ok = _check(f"장치 {args}", pci_ids.gpu_device_name(*args, db=db), expected) and ok
+    for pnp, expected in fake_pci_ids.EXPECTED_PNP:
+        ok = _check(f"PNPDeviceID {pnp[:28]}", pci_ids.parse_pnp_device_id(pnp), expected) and ok
+    ok = _check("클래스 목록 제외", db.vendor_name(0x0003), None) and ok
+    db.close()
+    return ok
+
+
+def _verify_lazy() -> bool:
+    # GPU 수집 모듈 import만으로는 색인 파일을 열지 않아야 함
+    import core.collector  # noqa: F401
+    import core.gpu_dxgi  # noqa: F401
+
+    return _check("import 시 색인 미로드", pci_ids._db_loaded, False)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--source", help="실제 pci.ids 경로 (없으면 합성 데이터)")
+    parser.add_argument("--lookups", type=int, default=200_000, help="조회 횟수")
+    args = parser.parse_args()
+
+    ok = _verify_lazy()
+    with tempfile.TemporaryDirectory() as tmp:
+        ok = _verify_sample(tmp) and ok
+
+        if args.source:
+            with open(args.source, "r", encoding="utf-8", errors="replace") as f:
+                lines = f.readlines()
+        else:
+            lines = fake_pci_ids.synthetic_lines()
+
+        started = time.perf_counter()
+        path = _write_index(tmp, "full.bin", lines)
+        build_s = time.perf_counter() - started
+
+        started = time.perf_counter()
+        db = pci_ids.PciIdDatabase(path)
+        open_s = time.perf_counter() - started
+        print(f"색인 {Path(path).stat().st_size:,} bytes | 항목 {db.entry_counts} | "
+              f"생성 {build_s * 1000:.0f}ms | 열기 {open_s * 1e6:.0f}us")
+
+        vendors, devices, _ = pci_ids.parse_pci_ids(lines)
+        rng = random.Random(7)
+        device_keys = rng.choices(sorted(devices), k=args.lookups)
+        started = time.perf_counter()
+        for key in device_keys:
+            db.device_name(key >> 16, key & 0xFFFF)
+        elapsed = (time.perf_counter() - started) / args.lookups
+        print(f"디바이스 이름 조회: {elapsed * 1e6:6.2f} us/회")
+        ok = _check("조회 결과 일치", all(db.device_name(k >> 16, k & 0xFFFF) == devices[k] for k in device_keys[:2000]),
+                    True) and ok
+        ok = _check("조회 1회 10us 이하", elapsed < 10e-6, True) and ok
+        db.close()
+
+    if not ok:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,103 @@
+# 본 소스코드는 내부 사용 및 유지보수 목적에 한해 제공됩니다.
+# 무단 재배포 및 상업적 재사용은 허용되지 않습니다.
+"""
+WQL 프로젝션 조회와 전체 속성 열거의 수집 소요 시간을 비교한다.
+가짜 wmi 모듈(fake_wmi)의 속성 비용 모델(인스턴스 × 속성 수 × 비용)을 사용한다.
+프로젝션이 거부된 오류(잘못된 쿼리/속성)에만 클래스를 전체 열거로 고정하고,
+RPC 오류 등 일시적 오류는 그 조회만 폴백하는지도 확인한다.
+
+사용법:
+    python Scripts/bench/bench_projection.py [--property-cost-ms 2] [--scale 0.1] [--repeat 3]
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[2]
+sys.path.insert(0, str(ROOT / "src"))
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+import fake_wmi  # noqa: E402
+from core import collector, wmi_query  # noqa: E402
+
+
+def _measure(projection: bool, repeat: int) -> float:
+    """
+    순차 수집을 repeat회 실행해 최소 소요 시간(초)을 반환한다.
+    """
+    wmi_query.WMI_PROJECTION_ENABLED = projection
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        collector.collect_all_specs(parallel=False)
+        best = min(best, time.perf_counter() - started)
+    return best
+
+
+class _RejectingConnection:
+    """
+    프로젝션 WQL 조회에서 지정한 예외를 내고 전체 열거는 성공하는 연결
+    """
+
+    def __init__(self, error: Exception):
+        self._error = error
+
+    def query(self, wql: str) -> list:
+        raise self._error
+
+    def __getattr__(self, class_name: str):
+        return lambda: ["row"]
+
+
+def _check_projection_fallback() -> bool:
+    """
+    오류 종류별로 전체 열거 폴백과 클래스 고정(_projection_unsupported) 여부를 확인한다.
+    """
+    wmi_query.WMI_PROJECTION_ENABLED = True
+    excepinfo = (0, "SWbemServicesEx", "Invalid query", None, 0, wmi_query.WBEM_E_INVALID_QUERY - 0x100000000)
+    cases = (
+        ("잘못된 속성", fake_wmi.FakeComError(wmi_query.WBEM_E_INVALID_PROPERTY, "Invalid property"), True),
+        ("잘못된 쿼리(DISP)", Exception(wmi_query.DISP_E_EXCEPTION - 0x100000000, "예외 발생", excepinfo, None), True),
+        ("RPC 오류", fake_wmi.FakeComError(fake_wmi.RPC_S_SERVER_UNAVAILABLE, "RPC 서버를 사용할 수 없습니다."), False),
+        ("접근 거부", fake_wmi.FakeComError(0x80070005, "액세스가 거부되었습니다."), False),
+    )
+    ok = True
+    for index, (label, error, rejected) in enumerate(cases):
+        class_name = f"Win32_Check{index}"
+        rows = wmi_query.query_wmi(_RejectingConnection(error), class_name, ("Name",))
+        pinned = class_name in wmi_query._projection_unsupported
+        print(f"{label:16s}: 폴백 결과 {len(rows)}개 | 클래스 고정 {pinned}")
+        if rows != ["row"] or pinned != rejected:
+            print(f"[FAIL] {label}: 클래스 고정 {pinned} (기대 {rejected})")
+            ok = False
+    return ok
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--property-cost-ms", type=float, default=2.0, help="속성 1개 마샬링 비용(ms)")
+    parser.add_argument("--scale", type=float, default=0.1, help="클래스 기본 조회 지연 배율")
+    parser.add_argument("--repeat", type=int, default=3, help="반복 횟수")
+    args = parser.parse_args()
+
+    fake_wmi.configure(scale=args.scale, property_cost_s=args.property_cost_ms / 1000)
+    fake_wmi.install(collector)
+
+    full = _measure(projection=False, repeat=args.repeat)
+    projected = _measure(projection=True, repeat=args.repeat)
+
+    print(f"전체 열거:     {full * 1000:8.1f} ms")
+    print(f"프로젝션 조회: {projected * 1000:8.1f} ms")
+    print(f"개선 배율:     {full / projected:8.2f}x")
+
+    if not _check_projection_fallback():
+        sys.exit(1)
+    print("[OK] 거부된 프로젝션만 클래스 고정, 일시적 오류는 해당 조회만 폴백")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,161 @@
+# 본 소스코드는 내부 사용 및 유지보수 목적에 한해 제공됩니다.
+# 무단 재배포 및 상업적 재사용은 허용되지 않습니다.
+"""
+RAM 브랜드 판별(core.ram_brand) 처리량을 측정한다.
+합성 (Manufacturer, PartNumber) 목록으로 기존 re.match 연쇄 방식과 단일 컴파일 정규식,
+LRU 캐시, resolve_many() 일괄 처리를 비교하고 판별 결과가 같은지 확인한다.
+실제 모듈 라벨의 PartNumber 표본(REAL_PART_NUMBERS)으로 제조사별 접두 패턴도 확인한다.
+
+사용법:
+    python Scripts/bench/bench_ram_brand.py [--count 1000000] [--unique 5000]
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import re
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[2]
+sys.path.insert(0, str(ROOT / "src"))
+
+from core import ram_brand  # noqa: E402
+from core.ram_brand import RamBrand  # noqa: E402
+
+MANUFACTURERS = (
+    "Samsung", "SK Hynix", "Micron", "Kingston", "80CE", "80AD", "802C", "0198", "859B",
+    "04CD", "Unknown", "0000", "", None, "Crucial Technology", "Corsair", "Undefined",
+)
+PART_PREFIXES = (
+    "M378A2K43EB1-", "HMA82GU6CJR8N-", "MT16KTF1G64AZ-", "KVR32N22S8/", "KF432C16BB/",
+    "9905624-", "AD4U32008G22-", "AX4U32008G16A-", "F4-3200C16-", "CMK16GX4M2B",
+    "CT16G4DFRA32A.", "TED416G3200C22", "XYZ", "",
+)
+
+
+# 실제 모듈 라벨/제조사 데이터시트의 PartNumber → 기대 브랜드 (None: 판별하지 않아야 함)
+REAL_PART_NUMBERS = (
+    ("M378A2K43EB1-CWE", RamBrand.SAMSUNG),       # DDR4 UDIMM
+    ("M471A1K43DB1-CWE", RamBrand.SAMSUNG),       # DDR4 SODIMM
+    ("M393A4K40DB3-CWE", RamBrand.SAMSUNG),       # DDR4 RDIMM
+    ("M471B5173QH0-YK0", RamBrand.SAMSUNG),       # DDR3L SODIMM
+    ("M323R2GA3BB0-CQKOD", RamBrand.SAMSUNG),     # DDR5 UDIMM
+    ("M425R1GB4BB0-CQKOD", RamBrand.SAMSUNG),     # DDR5 SODIMM
+    ("M321R4GA3BB6-CQKET", RamBrand.SAMSUNG),     # DDR5 RDIMM
+    ("HMA81GU6CJR8N-VK", RamBrand.SK_HYNIX),      # DDR4 UDIMM
+    ("HMA851S6CJR6N-VK", RamBrand.SK_HYNIX),      # DDR4 SODIMM
+    ("HMT41GU6BFR8C-PB", RamBrand.SK_HYNIX),      # DDR3 UDIMM
+    ("HMCG78MEBUA081N", RamBrand.SK_HYNIX),       # DDR5 UDIMM
+    ("MTA8ATF1G64AZ-3G2J1", RamBrand.MICRON),
+    ("CT8G4DFRA32A.M4FE", RamBrand.MICRON),       # Crucial DDR4
+    ("CT16G4SFRA32A.M8FRS", RamBrand.MICRON),     # Crucial DDR4 SODIMM
+    ("CT16G48C40U5.M8A1", RamBrand.MICRON),       # Crucial DDR5
+    ("F4-3200C16D-16GVKB", RamBrand.G_SKILL),
+    ("F5-6000J3038F16GX2-TZ5N", RamBrand.G_SKILL),
+    ("F3-1600C9D-8GXM", RamBrand.G_SKILL),
+    ("CMK16GX4M2B3200C16", RamBrand.CORSAIR),     # Vengeance LPX
+    ("CMW32GX4M2E3200C16", RamBrand.CORSAIR),     # Vengeance RGB Pro
+    ("CMT32GX4M2C3200C16", RamBrand.CORSAIR),     # Dominator Platinum RGB
+    ("CMH32GX5M2B5600C36", RamBrand.CORSAIR),     # Vengeance RGB DDR5
+    ("CMSX8GX4M1A2400C16", RamBrand.CORSAIR),     # Vengeance SODIMM
+    ("KF432C16BB/8", RamBrand.KINGSTON),
+    ("KVR32N22S8/8", RamBrand.KINGSTON),
+    ("AX4U320038G16A-SB10", RamBrand.ADATA),
+    ("TF3D416G3200HC16F", None),                  # Team Group (패턴 없음)
+    ("BL8G32C16U4B.M8FE1", None),                 # Crucial Ballistix (패턴 없음)
+    ("CMOS", None),
+    ("F4-", None),
+)
+
+
+def _check_real_part_numbers() -> list[str]:
+    """
+    실제 PartNumber 표본이 기대 브랜드로 판별되는지 확인한다.
+    """
+    mismatches = []
+    for part_number, expected in REAL_PART_NUMBERS:
+        brand = ram_brand._detect_by_part_number(part_number)
+        if brand != expected:
+            mismatches.append(f"{part_number}: {brand} (기대 {expected})")
+    return mismatches
+
+
+def _legacy_detect_by_part_number(part_number: str | None):
+    """
+    단일 정규식 도입 이전의 re.match 연쇄 판별 (비교 기준)
+    """
+    if not part_number:
+        return None
+    pn = part_number.strip().upper()
+    if re.match(r"^M(T|TA|PT)[0-9A-Z]", pn):
+        return RamBrand.MICRON
+    if re.match(r"^(KVR|KF)[0-9A-Z]", pn):
+        return RamBrand.KINGSTON
+    if re.match(r"^99[0-9]{5}", pn):
+        return RamBrand.KINGSTON
+    if re.match(r"^AD[23][0-9A-Z]", pn):
+        return RamBrand.ADATA
+    if re.match(r"^AX[34]U[0-9A-Z]", pn):
+        return RamBrand.ADATA
+    return None
+
+
+def _make_pairs(count: int, unique: int) -> list[tuple]:
+    rng = random.Random(1234)
+    pool = [
+        (rng.choice(MANUFACTURERS), f"{rng.choice(PART_PREFIXES)}{rng.randrange(10000):04d}")
+        for _ in range(unique)
+    ]
+    # 실제 재고처럼 일부 조합이 자주 반복되도록 앞쪽 조합에 가중치
+    return [pool[min(int(rng.paretovariate(1.2)) - 1, unique - 1)] for _ in range(count)]
+
+
+def _measure(label: str, func, count: int):
+    started = time.perf_counter()
+    result = func()
+    elapsed = time.perf_counter() - started
+    print(f"{label:<28}: {elapsed:7.3f}s ({elapsed / count * 1e9:8.1f} ns/건)")
+    return result
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--count", type=int, default=1_000_000, help="판별할 항목 수")
+    parser.add_argument("--unique", type=int, default=5000, help="서로 다른 조합 수")
+    args = parser.parse_args()
+
+    pairs = _make_pairs(args.count, args.unique)
+    part_numbers = [pn for _, pn in pairs]
+    uncached = ram_brand.resolve_ram_brand_display.__wrapped__
+
+    legacy = _measure("PartNumber re.match 연쇄", lambda: [_legacy_detect_by_part_number(pn) for pn in part_numbers],
+                      args.count)
+    compiled = _measure("PartNumber 단일 정규식", lambda: [ram_brand._detect_by_part_number(pn) for pn in part_numbers],
+                        args.count)
+    plain = _measure("표기 판별 (캐시 없음)", lambda: [uncached(m, pn) for m, pn in pairs], args.count)
+    ram_brand.resolve_ram_brand_display.cache_clear()
+    cached = _measure("표기 판별 (LRU 캐시)",
+                      lambda: [ram_brand.resolve_ram_brand_display(m, pn) for m, pn in pairs], args.count)
+    batch = _measure("resolve_many()", lambda: ram_brand.resolve_many(pairs), args.count)
+    print(f"LRU 캐시: {ram_brand.resolve_ram_brand_display.cache_info()}")
+
+    # 기존 패턴이 판별하던 PartNumber는 결과가 같아야 함 (제조사별 접두 패턴은 기존 미판별 항목만 추가로 판별)
+    regressions = sum(1 for old, new in zip(legacy, compiled) if old is not None and old != new)
+    real_mismatches = _check_real_part_numbers()
+    for mismatch in real_mismatches:
+        print(f"[FAIL] 실제 PartNumber 판별: {mismatch}")
+    ok = regressions == 0 and not real_mismatches and plain == cached == batch
+    print(
+        f"[{'OK' if ok else 'FAIL'}] 기존 판별 불일치 {regressions}건, "
+        f"실제 PartNumber {len(REAL_PART_NUMBERS) - len(real_mismatches)}/{len(REAL_PART_NUMBERS)}건 일치, "
+        f"캐시/일괄 결과 일치 {plain == cached == batch}"
+    )
+    if not ok:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
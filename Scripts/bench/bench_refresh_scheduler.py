@@ -0,0 +1,145 @@
+# 본 소스코드는 내부 사용 및 유지보수 목적에 한해 제공됩니다.
+# 무단 재배포 및 상업적 재사용은 허용되지 않습니다.
+"""
+카테고리별 TTL 재수집 스케줄러(core.refresh_scheduler)의 선택 재수집을 검증하고 비용을 측정한다.
+가짜 wmi 모듈(fake_wmi)로 수집 지연을 재현하고 가짜 시계로 시간을 진행시키므로 Linux에서도 실행할 수 있다.
+
+- 전체 수집 직후 재수집 → 수집 없음 (WMI 클래스 조회 0회)
+- storage TTL 경과 → storage만, vga TTL 경과 → vga/storage만, 6시간 경과 → 전체 수집
+- 선택 재수집 결과가 전체 수집 결과와 같은지, 재수집 시간/클래스 조회 수 비교
+- CachedSpecCollector.collect()가 캐시된 나머지 카테고리와 병합해 캐시를 갱신하는지
+- 생략 카운터 (categories_skipped, skipped_by_category)
+
+사용법:
+    python Scripts/bench/bench_refresh_scheduler.py [--scale 0.2]
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[2]
+sys.path.insert(0, str(ROOT / "src"))
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+import fake_wmi  # noqa: E402
+from core import collector  # noqa: E402
+from core.cached_collector import CachedSpecCollector, compute_fingerprint  # noqa: E402
+from core.collector_wrapper import CollectorWrapper  # noqa: E402
+from core.refresh_scheduler import DEFAULT_CATEGORY_TTLS_S, RefreshScheduler  # noqa: E402
+from core.spec_schema import SPEC_CATEGORIES  # noqa: E402
+
+
+class FakeClock:
+    """
+    수동으로 진행시키는 단조 시계
+    """
+
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class RecordingCollector:
+    """
+    collect()에 전달된 카테고리를 기록하는 수집기 래퍼
+    """
+
+    def __init__(self, delegate):
+        self._delegate = delegate
+        self.calls = []
+
+    def collect_all_specs(self) -> dict:
+        return self.collect(SPEC_CATEGORIES)
+
+    def collect(self, categories: tuple[str, ...] = SPEC_CATEGORIES) -> dict:
+        self.calls.append(tuple(categories))
+        return self._delegate.collect(categories)
+
+
+def _timed_refresh(scheduler: RefreshScheduler, specs: dict, force: bool = False) -> tuple[dict, float, int]:
+    fake_wmi.reset_stats()
+    started = time.perf_counter()
+    result = scheduler.refresh(specs, force=force)
+    return result, (time.perf_counter() - started) * 1000, fake_wmi.STATS["class_queries"]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--scale", type=float, default=0.2, help="클래스 조회 지연 배율")
+    args = parser.parse_args()
+
+    fake_wmi.configure(scale=args.scale)
+    fake_wmi.install(collector)
+    collector.SMBIOS_ENABLED = False
+    failures = []
+
+    wrapper = CollectorWrapper(parallel=False)
+    fake_wmi.reset_stats()
+    started = time.perf_counter()
+    full = wrapper.collect_all_specs()
+    full_ms = (time.perf_counter() - started) * 1000
+    full_queries = fake_wmi.STATS["class_queries"]
+    print(f"전체 수집: {full_ms:8.1f} ms | 클래스 조회 {full_queries}회")
+
+    clock = FakeClock()
+    recording = RecordingCollector(wrapper)
+    scheduler = RefreshScheduler(recording, clock=clock)
+    scheduler.mark_collected(full)
+
+    steps = [
+        ("TTL 이내", 1.0, ()),
+        ("storage TTL 경과", DEFAULT_CATEGORY_TTLS_S["storage"], ("storage",)),
+        ("vga TTL 경과", DEFAULT_CATEGORY_TTLS_S["vga"], ("vga", "storage")),
+        ("6시간 경과", DEFAULT_CATEGORY_TTLS_S["cpu"], SPEC_CATEGORIES),
+    ]
+    for label, advance_s, expected in steps:
+        clock.now += advance_s
+        recording.calls.clear()
+        result, elapsed_ms, queries = _timed_refresh(scheduler, full)
+        collected = recording.calls[0] if recording.calls else ()
+        print(f"{label:16s}: {elapsed_ms:8.1f} ms | 클래스 조회 {queries:2d}회 | 수집 {', '.join(collected) or '없음'}")
+        if collected != tuple(expected):
+            failures.append(f"{label}: 수집 {collected} (기대 {expected})")
+        if result != full:
+            failures.append(f"{label}: 병합 결과가 전체 수집 결과와 다름")
+        if not expected and queries:
+            failures.append(f"{label}: 수집 없이 클래스 조회 {queries}회")
+
+    recording.calls.clear()
+    _, elapsed_ms, queries = _timed_refresh(scheduler, full, force=True)
+    if recording.calls != [SPEC_CATEGORIES]:
+        failures.append(f"강제 재수집: {recording.calls}")
+    print(f"{'강제 재수집':16s}: {elapsed_ms:8.1f} ms | 클래스 조회 {queries:2d}회")
+
+    stats = scheduler.stats()
+    print(
+        f"집계: 재수집 {stats['refreshes']}회 | 수집 {stats['categories_collected']}개 | "
+        f"생략 {stats['categories_skipped']}개 | 카테고리별 생략 {stats['skipped_by_category']}"
+    )
+    if stats["categories_skipped"] != 6 + 5 + 4:
+        failures.append(f"생략 카테고리 수 {stats['categories_skipped']} (기대 15)")
+
+    cached = CachedSpecCollector(wrapper, cache_dir=Path(tempfile.mkdtemp(prefix="refresh_bench_")))
+    cached.refresh()
+    partial = dict(full, ssd=None, hdd=None)
+    cached._save(compute_fingerprint(), partial)
+    cached.collect(("storage",))
+    if cached.peek_cached_specs() != full:
+        failures.append("CachedSpecCollector.collect(storage) 후 캐시가 전체 수집 결과와 다름")
+
+    for failure in failures:
+        print(f"[FAIL] {failure}")
+    if failures:
+        sys.exit(1)
+    print("[OK] 만료 카테고리만 수집, 병합 결과 일치, 캐시 병합, 생략 집계")
+
+
+if __name__ == "__main__":
+    main()
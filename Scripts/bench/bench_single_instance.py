@@ -0,0 +1,121 @@
+# 본 소스코드는 내부 사용 및 유지보수 목적에 한해 제공됩니다.
+# 무단 재배포 및 상업적 재사용은 허용되지 않습니다.
+"""
+단일 인스턴스 전달(core.single_instance)을 실제 main.py 프로세스로 검증하고 중복 실행 비용을 측정한다.
+
+- 첫 인스턴스: main.py 실행 (offscreen), 사양 수집 완료까지 소요 시간
+- 중복 실행: main.py 재실행 → 기존 인스턴스에 전달 후 종료까지 소요 시간, 종료 코드 0
+- 기존 인스턴스 로그에 활성화/재수집(--refresh) 요청이 기록되는지
+- 첫 인스턴스를 강제 종료한 뒤 새 실행이 남은 잠금/소켓을 정리하고 첫 인스턴스가 되는지
+- HOME/TMPDIR를 임시 디렉토리로 바꿔 실제 사용자 환경(로그/잠금)과 분리 (Linux/macOS)
+
+사용법:
+    python Scripts/bench/bench_single_instance.py [--repeat 5]
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[2]
+SRC_DIR = ROOT / "src"
+
+STARTUP_TIMEOUT_S = 30.0
+
+
+def _env(home: str) -> dict:
+    env = dict(os.environ)
+    env.update(HOME=home, TMPDIR=home, XDG_RUNTIME_DIR=home, QT_QPA_PLATFORM="offscreen")
+    return env
+
+
+def _log_text(home: str) -> str:
+    path = Path(home) / ".PC_Spec_Viewer" / "logs" / "app.log"
+    return path.read_text(encoding="utf-8") if path.exists() else ""
+
+
+def _start_primary(home: str, marker: str) -> tuple[subprocess.Popen, float]:
+    """
+    첫 인스턴스를 실행하고 marker 로그가 새로 남을 때까지 기다린다.
+
+    Returns:
+        tuple: (프로세스, marker까지 소요 시간(초))
+    """
+    before = _log_text(home).count(marker)
+    started = time.perf_counter()
+    proc = subprocess.Popen(
+        [sys.executable, "main.py"], cwd=str(SRC_DIR), env=_env(home), stderr=subprocess.DEVNULL,
+    )
+    while _log_text(home).count(marker) <= before:
+        if proc.poll() is not None or time.perf_counter() - started > STARTUP_TIMEOUT_S:
+            proc.kill()
+            raise SystemExit("첫 인스턴스 기동 실패")
+        time.sleep(0.02)
+    return proc, time.perf_counter() - started
+
+
+def _launch_duplicate(home: str, *args: str) -> tuple[int, float]:
+    started = time.perf_counter()
+    proc = subprocess.run(
+        [sys.executable, "main.py"] + list(args), cwd=str(SRC_DIR), env=_env(home),
+        stderr=subprocess.DEVNULL, timeout=30,
+    )
+    return proc.returncode, time.perf_counter() - started
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--repeat", type=int, default=5, help="중복 실행 횟수")
+    args = parser.parse_args()
+
+    home = tempfile.mkdtemp(prefix="single_instance_bench_")
+    ok = True
+    primary, primary_s = _start_primary(home, "자동 사양 수집 완료")
+    try:
+        print(f"첫 인스턴스 (창 생성 + 수집): {primary_s * 1000:8.1f} ms")
+
+        timings = []
+        for _ in range(args.repeat):
+            code, elapsed = _launch_duplicate(home)
+            timings.append(elapsed)
+            if code != 0:
+                print(f"[FAIL] 중복 실행 종료 코드 {code}")
+                ok = False
+        code, _ = _launch_duplicate(home, "--refresh")
+        if code != 0:
+            print(f"[FAIL] --refresh 중복 실행 종료 코드 {code}")
+            ok = False
+        print(f"중복 실행 (전달 후 종료):     {min(timings) * 1000:8.1f} ms (최소, {args.repeat}회)")
+
+        time.sleep(0.5)
+        log = _log_text(home)
+        requests = log.count("다른 실행의 활성화 요청")
+        if requests != args.repeat + 1 or "재수집=True" not in log:
+            print(f"[FAIL] 활성화 요청 기록 {requests}회 (기대 {args.repeat + 1}회, 재수집 1회)")
+            ok = False
+        if primary.poll() is not None:
+            print("[FAIL] 첫 인스턴스가 종료됨")
+            ok = False
+    finally:
+        primary.kill()
+        primary.wait()
+
+    # 강제 종료로 남은 잠금/소켓 파일이 있어도 새 실행이 첫 인스턴스가 되어야 함
+    recovered, _ = _start_primary(home, "단일 인스턴스 서버 시작")
+    recovered.kill()
+    recovered.wait()
+    print("강제 종료 후 재실행: 첫 인스턴스로 기동")
+
+    if not ok:
+        sys.exit(1)
+    print("[OK] 중복 실행은 기존 인스턴스에 전달 후 종료")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,82 @@
+# 본 소스코드는 내부 사용 및 유지보수 목적에 한해 제공됩니다.
+# 무단 재배포 및 상업적 재사용은 허용되지 않습니다.
+"""
+SMBIOS 원시 테이블 파싱 결과를 검증하고 파싱 소요 시간을 측정한다.
+가짜 테이블(fake_smbios)을 Linux DMI 형식과 Windows RSMB 형식으로 모두 확인한다.
+
+사용법:
+    python Scripts/bench/bench_smbios.py [--repeat 2000]
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[2]
+sys.path.insert(0, str(ROOT / "src"))
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+import fake_smbios  # noqa: E402
+from core import collector, linux_backend, smbios  # noqa: E402
+from core.spec_model import SystemSpecs  # noqa: E402
+from core.spec_schema import CATEGORY_RAM  # noqa: E402
+
+
+def _check(label: str, actual, expected) -> bool:
+    ok = actual == expected
+    print(f"[{'OK' if ok else 'FAIL'}] {label}: {actual!r}" + ("" if ok else f" != {expected!r}"))
+    return ok
+
+
+def _verify(tables: smbios.SmbiosTables, source: str) -> bool:
+    board = tables.baseboards[0]
+    # 앱과 같은 경로: 메모리 모듈 → RamSpec → SystemSpecs → 표시 문자열 사양 딕셔너리
+    model = SystemSpecs()
+    model.merge(CATEGORY_RAM, collector._build_ram_spec(tables.installed_memory))
+    ram = model.to_specs_dict()[CATEGORY_RAM]
+    results = [
+        _check(f"{source} M/B", collector._format_baseboard(board.Manufacturer, board.Product, board.Version),
+               fake_smbios.EXPECTED_BASEBOARD),
+        _check(f"{source} 섀시", collector._classify_chassis_types(tables.chassis[0].ChassisTypes),
+               collector.SYSTEM_TYPE_DESKTOP),
+        _check(f"{source} CPU", tables.processors[0].Name, fake_smbios.EXPECTED_CPU_NAME),
+        _check(f"{source} 메모리 슬롯", len(tables.memory_devices), fake_smbios.EXPECTED_MEMORY_SLOTS),
+        _check(f"{source} 장착 메모리", len(tables.installed_memory), fake_smbios.EXPECTED_INSTALLED_MEMORY),
+        _check(f"{source} RAM 총 용량", ram[0] if ram else None, fake_smbios.EXPECTED_RAM_TOTAL),
+        _check(f"{source} 교체형 모듈 수", len(ram[1]) if ram else None, fake_smbios.EXPECTED_RAM_MODULE_COUNT),
+    ]
+    print(f"       RAM: {ram}")
+    return all(results)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--repeat", type=int, default=2000, help="반복 횟수")
+    args = parser.parse_args()
+
+    table = fake_smbios.build_table()
+    ok = _verify(smbios.parse_tables(table), "DMI")
+    ok = _verify(smbios.parse_tables(smbios.strip_raw_smbios_header(fake_smbios.build_rsmb(table))), "RSMB") and ok
+
+    with tempfile.TemporaryDirectory() as tmp:
+        dmi_path = Path(tmp) / linux_backend.DMI_TABLE_PATH
+        dmi_path.parent.mkdir(parents=True)
+        dmi_path.write_bytes(table)
+        ram = linux_backend.collect_ram(tmp)
+        ok = _check("Linux 백엔드 RAM 총 용량", ram[0] if ram else None, fake_smbios.EXPECTED_RAM_TOTAL) and ok
+
+    started = time.perf_counter()
+    for _ in range(args.repeat):
+        smbios.parse_tables(table)
+    elapsed = (time.perf_counter() - started) / args.repeat
+    print(f"테이블 {len(table)} bytes 파싱: {elapsed * 1e6:8.1f} us/회")
+    if not ok:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,160 @@
+# 본 소스코드는 내부 사용 및 유지보수 목적에 한해 제공됩니다.
+# 무단 재배포 및 상업적 재사용은 허용되지 않습니다.
+"""
+메모리 매핑 스냅샷(core.spec_snapshot)의 게시자 1개 / 읽기 프로세스 N개 경합 벤치마크
+
+- 게시자: duration 동안 쉬지 않고(또는 --interval-ms 간격으로) 사양을 게시
+  (게시마다 cpu/mainboard 문자열에 같은 번호를 넣어 읽기 측이 찢어진 읽기를 검출할 수 있게 함)
+- 읽기 프로세스: 같은 시간 동안 SnapshotReader.read()를 반복
+  - 초당 읽기 횟수, 새 세대 디코딩 횟수, seqlock 재시도 횟수
+  - cpu/mainboard 번호 불일치(찢어진 읽기) 또는 세대 역행이 1건이라도 있으면 실패
+- 기준값: 게시가 없을 때(같은 세대) 읽기 1회 지연
+
+사용법:
+    python Scripts/bench/bench_snapshot.py [--readers 8] [--duration 3] [--interval-ms 0]
+"""
+
+from __future__ import annotations
+
+import argparse
+import multiprocessing
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[2]
+sys.path.insert(0, str(ROOT / "src"))
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from core.spec_snapshot import SnapshotPublisher, SnapshotReader  # noqa: E402
+
+BASE_SPECS = {
+    "system_type": "데스크탑",
+    "cpu": "",
+    "ram": ("32GB", ["Samsung DDR5 5600MHz 16GB x2"]),
+    "mainboard": "",
+    "vga": ["NVIDIA GeForce RTX 4070 (12GB)", "Intel(R) UHD Graphics 770"],
+    "ssd": ["Samsung SSD 990 PRO 2TB (2TB)"],
+    "hdd": ["ST4000DM004-2CV104 (4TB)"],
+}
+
+
+def _specs(number: int) -> dict:
+    specs = dict(BASE_SPECS)
+    specs["cpu"] = f"13th Gen Intel(R) Core(TM) i7-13700 #{number}"
+    specs["mainboard"] = f"ASUS PRIME B760M-A #{number}"
+    return specs
+
+
+def _writer(path: str, duration_s: float, interval_s: float, start, result) -> None:
+    publisher = SnapshotPublisher(path)
+    start.wait()
+    deadline = time.perf_counter() + duration_s
+    count = 0
+    started = time.perf_counter()
+    while time.perf_counter() < deadline:
+        count += 1
+        publisher.publish(_specs(count))
+        if interval_s:
+            time.sleep(interval_s)
+    elapsed = time.perf_counter() - started
+    publisher.close()
+    result.put(("writer", count, elapsed))
+
+
+def _reader(path: str, duration_s: float, start, result) -> None:
+    reader = SnapshotReader(path)
+    start.wait()
+    reads = decoded = torn = regressions = 0
+    last_generation = 0
+    last_record = None
+    started = time.perf_counter()
+    deadline = started + duration_s
+    while time.perf_counter() < deadline:
+        record = reader.read()
+        reads += 1
+        if record is None or record is last_record:
+            continue
+        decoded += 1
+        last_record = record
+        if record.specs["cpu"].rsplit("#", 1)[-1] != record.specs["mainboard"].rsplit("#", 1)[-1]:
+            torn += 1
+        if record.generation < last_generation:
+            regressions += 1
+        last_generation = record.generation
+    result.put(("reader", reads, time.perf_counter() - started, decoded, reader.retries, torn, regressions))
+
+
+def _uncontended_read_us(path: str, repeat: int = 200000) -> tuple[float, float]:
+    """
+    게시가 없을 때 (같은 세대 재사용 읽기 지연, 새 세대 디코딩 포함 지연)을 us로 반환한다.
+    """
+    publisher = SnapshotPublisher(path)
+    publisher.publish(_specs(0))
+    reader = SnapshotReader(path)
+    reader.read()
+    started = time.perf_counter()
+    for _ in range(repeat):
+        reader.read()
+    cached_us = (time.perf_counter() - started) / repeat * 1e6
+
+    decode_repeat = 2000
+    total = 0.0
+    for i in range(decode_repeat):
+        publisher.publish(_specs(i + 1))
+        t = time.perf_counter()
+        reader.read()
+        total += time.perf_counter() - t
+    reader.close()
+    publisher.close()
+    return cached_us, total / decode_repeat * 1e6
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--readers", type=int, default=max(2, (os.cpu_count() or 2)), help="읽기 프로세스 수")
+    parser.add_argument("--duration", type=float, default=3.0, help="측정 시간(초)")
+    parser.add_argument("--interval-ms", type=float, default=0.0, help="게시 간격(ms, 0이면 쉬지 않고 게시)")
+    args = parser.parse_args()
+
+    path = os.path.join(tempfile.mkdtemp(prefix="spec_snapshot_bench_"), "specs.snap")
+    cached_us, decode_us = _uncontended_read_us(path)
+    print(f"경합 없음: 같은 세대 읽기 {cached_us:6.2f} us | 새 세대 읽기(디코딩 포함) {decode_us:6.2f} us")
+
+    ctx = multiprocessing.get_context("spawn")
+    start = ctx.Event()
+    result = ctx.Queue()
+    procs = [ctx.Process(target=_writer, args=(path, args.duration, args.interval_ms / 1000, start, result))]
+    procs += [ctx.Process(target=_reader, args=(path, args.duration, start, result)) for _ in range(args.readers)]
+    for proc in procs:
+        proc.start()
+    time.sleep(1.0)  # spawn 프로세스 import 완료 대기
+    start.set()
+    rows = [result.get(timeout=args.duration + 30) for _ in procs]
+    for proc in procs:
+        proc.join()
+
+    writer = next(r for r in rows if r[0] == "writer")
+    readers = [r for r in rows if r[0] == "reader"]
+    total_reads = sum(r[1] for r in readers)
+    torn = sum(r[5] for r in readers)
+    regressions = sum(r[6] for r in readers)
+    print(f"게시자 1개: {writer[1] / writer[2]:10.0f} 게시/s")
+    print(
+        f"읽기 {len(readers)}개: 합계 {total_reads / args.duration:10.0f} 읽기/s | "
+        f"프로세스당 {total_reads / args.duration / len(readers):10.0f} 읽기/s"
+    )
+    print(
+        f"  새 세대 디코딩 {sum(r[3] for r in readers)}회 | seqlock 재시도 {sum(r[4] for r in readers)}회 | "
+        f"찢어진 읽기 {torn}건 | 세대 역행 {regressions}건"
+    )
+    if torn or regressions:
+        print("[FAIL] 일관되지 않은 스냅샷을 읽음")
+        sys.exit(1)
+    print("[OK] 경합 중에도 일관된 스냅샷만 읽음")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,119 @@
+# 본 소스코드는 내부 사용 및 유지보수 목적에 한해 제공됩니다.
+# 무단 재배포 및 상업적 재사용은 허용되지 않습니다.
+"""
+타입 사양 모델(core.spec_model)을 검증하고 기존 사양 딕셔너리와 메모리 사용량을 비교한다.
+
+- 모델 → to_specs_dict() 결과가 기존 collect_all_specs()/linux_backend.collect_category()와 같은지 확인
+- to_dict() → JSON → from_dict() 왕복 후 값이 같은지 확인 (원시 값 손실 없음)
+- 모델 인스턴스에 __dict__가 없는지(__slots__) 확인하고, 같은 정보를 담은 dict 대비 크기를 측정
+
+사용법:
+    python Scripts/bench/bench_spec_model.py [--count 100000]
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+import tempfile
+import tracemalloc
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[2]
+sys.path.insert(0, str(ROOT / "src"))
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+import fake_sysfs  # noqa: E402
+import fake_wmi  # noqa: E402
+from core import collector, linux_backend  # noqa: E402
+from core.spec_model import CpuSpec, DiskSpec, SystemSpecs  # noqa: E402
+from core.spec_schema import SPEC_CATEGORIES, empty_specs, merge_category_result  # noqa: E402
+
+
+def _check(label: str, actual, expected) -> bool:
+    ok = actual == expected
+    print(f"[{'OK' if ok else 'FAIL'}] {label}: {actual!r}" + ("" if ok else f" != {expected!r}"))
+    return ok
+
+
+def _roundtrip(specs: SystemSpecs) -> SystemSpecs:
+    return SystemSpecs.from_dict(json.loads(json.dumps(specs.to_dict())))
+
+
+def _verify_linux() -> bool:
+    with tempfile.TemporaryDirectory() as tmp:
+        root = str(fake_sysfs.build(Path(tmp)))
+        model = SystemSpecs()
+        legacy = empty_specs()
+        for category in SPEC_CATEGORIES:
+            model.merge(category, linux_backend.collect_category_model(category, root))
+            merge_category_result(legacy, category, linux_backend.collect_category(category, root))
+
+    ok = _check("Linux 모델 → 사양 딕셔너리", model.to_specs_dict(), fake_sysfs.EXPECTED_SPECS)
+    ok = _check("Linux 기존 어댑터", legacy, fake_sysfs.EXPECTED_SPECS) and ok
+    ok = _check("Linux CPU 모델", model.cpu, CpuSpec(
+        name="12th Gen Intel(R) Core(TM) i7-12700",
+        cores=1,
+        threads=2,
+        max_clock_mhz=fake_sysfs.CPU_MAX_FREQ_KHZ // 1000,
+    )) and ok
+    ok = _check("Linux RAM 모듈 정보 없음", model.ram.modules_known, False) and ok
+    ok = _check("Linux JSON 왕복", _roundtrip(model), model) and ok
+    return ok
+
+
+def _verify_wmi() -> bool:
+    fake_wmi.configure(scale=0.0)
+    fake_wmi.install(collector)
+    collector.SMBIOS_ENABLED = False
+
+    model = collector.collect_spec_model(parallel=True)
+    legacy = collector.collect_all_specs(parallel=False)
+    ok = _check("WMI 모델 → 사양 딕셔너리", model.to_specs_dict(), legacy)
+    ok = _check("WMI CPU 모델", model.cpu, CpuSpec(
+        name="Intel(R) Core(TM) i7-12700 CPU @ 2.10GHz", cores=12, threads=20, max_clock_mhz=2100,
+    )) and ok
+    ok = _check("WMI RAM 총 용량(bytes)", model.ram.total_bytes, 32 * 1024 ** 3) and ok
+    ok = _check("WMI GPU VRAM(bytes)", [g.dedicated_vram_bytes for g in model.vga], [4 * 1024 ** 3]) and ok
+    ok = _check("WMI JSON 왕복", _roundtrip(model), model) and ok
+
+    partial = collector.collect_spec_model(parallel=True, categories=("cpu", "vga"))
+    ok = _check("카테고리 선택 수집", [c for c in SPEC_CATEGORIES if getattr(partial, c) is not None], ["cpu", "vga"]) and ok
+    return ok
+
+
+def _measure_memory(count: int) -> bool:
+    disk = DiskSpec(name="Samsung SSD 980 PRO 1TB", size_bytes=1000204886016, kind="ssd", media_type=4, bus_type=17)
+    ok = _check("__slots__ (인스턴스 dict 없음)", hasattr(disk, "__dict__"), False)
+
+    def _allocated(factory) -> int:
+        tracemalloc.start()
+        items = [factory(i) for i in range(count)]
+        current, _ = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        del items
+        return current
+
+    as_model = _allocated(lambda i: DiskSpec(disk.name, i, disk.kind, disk.media_type, disk.bus_type))
+    as_dict = _allocated(lambda i: {
+        "name": disk.name, "size_bytes": i, "kind": disk.kind, "media_type": disk.media_type, "bus_type": disk.bus_type,
+    })
+    print(f"DiskSpec {count:,}개: {as_model / count:6.1f} bytes/개 | dict: {as_dict / count:6.1f} bytes/개")
+    return _check("모델이 dict보다 작음", as_model < as_dict, True) and ok
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--count", type=int, default=100_000, help="메모리 측정 인스턴스 수")
+    args = parser.parse_args()
+
+    ok = _verify_linux()
+    ok = _verify_wmi() and ok
+    ok = _measure_memory(args.count) and ok
+    if not ok:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
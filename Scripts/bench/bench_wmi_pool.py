@@ -0,0 +1,192 @@
+# 본 소스코드는 내부 사용 및 유지보수 목적에 한해 제공됩니다.
+# 무단 재배포 및 상업적 재사용은 허용되지 않습니다.
+"""
+WMI 연결 풀(core.wmi_pool)이 수집 간에 연결 생성 비용을 나누어 내는지 검증하고 측정한다.
+가짜 wmi 모듈(fake_wmi)로 연결 생성/조회 지연과 WMI 서비스 재시작(RPC 오류)을 재현하므로 Linux에서도 실행할 수 있다.
+
+- 풀 미사용/사용 각각 병렬·순차 수집 N회: 수집 1회 평균 시간, 수집당 연결 생성 수
+- 풀 사용 시 첫 수집 이후 연결 생성 0회, 결과가 풀 미사용 수집과 같은지
+- storage만 수집하면 기본 네임스페이스 연결을, cpu만 수집하면 Storage 네임스페이스 연결을 만들지 않는지
+- 기존 연결이 RPC 오류를 내면 제거 후 재연결하여 같은 결과를 반환하는지
+- 유휴 연결 점검(probe), 종료 시 상주 워커 정리
+- 데몬처럼 같은 스레드에서 수집마다 아파트먼트를 새로 여는 경우 이전 아파트먼트의 연결을 쓰지 않는지,
+  상주 워커 안에서 아파트먼트를 중첩 초기화하지 않는지
+
+사용법:
+    python Scripts/bench/bench_wmi_pool.py [--scale 0.05] [--connect-ms 80] [--sweeps 5]
+"""
+
+from __future__ import annotations
+
+import argparse
+import itertools
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[2]
+sys.path.insert(0, str(ROOT / "src"))
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+import fake_wmi  # noqa: E402
+from core import collector, wmi_pool  # noqa: E402
+from core.spec_daemon import _collect_model  # noqa: E402
+from core.spec_schema import CATEGORY_CPU, CATEGORY_STORAGE  # noqa: E402
+
+
+def _collect(parallel: bool, categories=None) -> dict:
+    if categories is None:
+        return collector.collect_all_specs(parallel=parallel)
+    return collector.collect_spec_model(parallel=parallel, categories=categories).to_specs_dict()
+
+
+def _sweeps(parallel: bool, count: int) -> tuple[list[float], list[int], dict]:
+    """
+    수집을 count회 반복해 회차별 시간(ms)과 연결 생성 수를 반환한다.
+    """
+    times, connections = [], []
+    specs = None
+    for _ in range(count):
+        fake_wmi.reset_stats()
+        started = time.perf_counter()
+        specs = _collect(parallel)
+        times.append((time.perf_counter() - started) * 1000)
+        connections.append(fake_wmi.STATS["connections"])
+    return times, connections, specs
+
+
+def _collect_workers() -> list[str]:
+    return [t.name for t in threading.enumerate() if t.name.startswith("spec-collect-") and t.is_alive()]
+
+
+def _check_apartments(failures: list) -> None:
+    """
+    아파트먼트 번호를 추적하는 _com_apartment로 바꿔 연결이 만든 아파트먼트 밖에서 조회되는지 확인한다.
+    (데몬의 단일 수집 스레드처럼 수집마다 아파트먼트를 새로 여는 순차 수집과 상주 워커의 병렬 수집)
+    """
+    state = threading.local()
+    counter = itertools.count(1)
+    real_apartment = collector._com_apartment
+    real_open = collector._open_wmi
+    misuse = []
+
+    @contextmanager
+    def tracking_apartment():
+        if getattr(state, "apartment", None) is not None:
+            misuse.append(f"{threading.current_thread().name}: 아파트먼트 중첩 초기화")
+        with real_apartment():
+            state.apartment = next(counter)
+            try:
+                yield
+            finally:
+                state.apartment = None
+
+    def tracking_open(namespace: str):
+        conn = real_open(namespace)
+        created_in = getattr(state, "apartment", None)
+        query = conn.query
+
+        def checked_query(wql: str):
+            current = getattr(state, "apartment", None)
+            if current != created_in:
+                misuse.append(f"{wql.split(' FROM ')[-1]}: 아파트먼트 {created_in}의 연결을 {current}에서 사용")
+            return query(wql)
+
+        conn.query = checked_query
+        return conn
+
+    collector._com_apartment = tracking_apartment
+    collector._open_wmi = tracking_open
+    try:
+        with ThreadPoolExecutor(max_workers=1, thread_name_prefix="specd-collect") as executor:
+            for parallel in (False, False, True, True):
+                executor.submit(_collect_model, parallel, {}).result()
+    finally:
+        collector._com_apartment = real_apartment
+        collector._open_wmi = real_open
+        wmi_pool.close_default_pool()
+    print(f"수집마다 아파트먼트 재생성(데몬 방식) 순차 2회 + 병렬 2회: 잘못된 사용 {len(misuse)}건")
+    failures.extend(sorted(set(misuse)))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--scale", type=float, default=0.05, help="클래스 조회 지연 배율")
+    parser.add_argument("--connect-ms", type=float, default=80.0, help="연결 생성 지연(ms)")
+    parser.add_argument("--sweeps", type=int, default=5, help="반복 수집 횟수")
+    args = parser.parse_args()
+
+    fake_wmi.configure(scale=args.scale, connect_latency_s=args.connect_ms / 1000)
+    fake_wmi.install(collector)
+    collector.SMBIOS_ENABLED = False
+    failures = []
+
+    print(f"{'모드':14s} {'첫 수집':>10s} {'이후 평균':>10s} {'수집당 연결':>12s}")
+    baseline = {}
+    for pooled in (False, True):
+        collector.WMI_POOL_ENABLED = pooled
+        for parallel in (True, False):
+            times, connections, specs = _sweeps(parallel, args.sweeps)
+            label = f"{'풀' if pooled else '풀 없음'}/{'병렬' if parallel else '순차'}"
+            rest = times[1:] or times
+            print(
+                f"{label:14s} {times[0]:8.1f}ms {sum(rest) / len(rest):8.1f}ms "
+                f"{' '.join(str(c) for c in connections):>12s}"
+            )
+            if not pooled:
+                baseline[parallel] = specs
+            else:
+                if specs != baseline[parallel]:
+                    failures.append(f"{label}: 결과가 풀 미사용 수집과 다름")
+                if any(connections[1:]):
+                    failures.append(f"{label}: 첫 수집 이후 연결 생성 {connections[1:]}")
+    pool = wmi_pool.default_pool()
+    print(f"풀 집계: {pool.stats()}")
+
+    collector.WMI_POOL_ENABLED = False
+    for categories, expected in (((CATEGORY_STORAGE,), 1), ((CATEGORY_CPU,), 1)):
+        fake_wmi.reset_stats()
+        _collect(False, categories)
+        if fake_wmi.STATS["connections"] != expected:
+            failures.append(f"{categories} 순차 수집 연결 {fake_wmi.STATS['connections']}개 (기대 {expected}개)")
+
+    collector.WMI_POOL_ENABLED = True
+    fake_wmi.break_connections()
+    evictions = pool.evictions
+    fake_wmi.reset_stats()
+    specs = _collect(True)
+    if specs != baseline[True]:
+        failures.append("RPC 오류 후 재연결 수집 결과가 다름")
+    print(f"WMI 서비스 재시작 후 수집: 연결 제거 {pool.evictions - evictions}개, 재연결 {fake_wmi.STATS['connections']}개")
+    if pool.evictions == evictions or not fake_wmi.STATS["connections"]:
+        failures.append("RPC 오류 후 연결 제거/재연결 없음")
+
+    wmi_pool.close_default_pool()
+    if _collect_workers():
+        failures.append(f"종료 후 남은 수집 워커: {_collect_workers()}")
+
+    probe_idle_s, wmi_pool.PROBE_IDLE_S = wmi_pool.PROBE_IDLE_S, 0.0
+    _collect(True)
+    fake_wmi.reset_stats()
+    _collect(True)
+    probe_stats = wmi_pool.default_pool().stats()
+    print(f"유휴 점검(매번): {probe_stats['probes']}회, 연결 생성 {fake_wmi.STATS['connections']}개")
+    if not probe_stats["probes"] or fake_wmi.STATS["connections"]:
+        failures.append(f"유휴 점검 후 재사용 실패: {probe_stats}")
+    wmi_pool.close_default_pool()
+    wmi_pool.PROBE_IDLE_S = probe_idle_s
+
+    _check_apartments(failures)
+
+    for failure in failures:
+        print(f"[FAIL] {failure}")
+    if failures:
+        sys.exit(1)
+    print("[OK] 연결 재사용, 미사용 네임스페이스 연결 생략, RPC 오류 재연결, 점검, 종료 정리, 아파트먼트 경계")
+
+
+if __name__ == "__main__":
+    main()
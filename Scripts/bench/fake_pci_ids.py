@@ -0,0 +1,88 @@
+# 본 소스코드는 내부 사용 및 유지보수 목적에 한해 제공됩니다.
+# 무단 재배포 및 상업적 재사용은 허용되지 않습니다.
+"""
+pci.ids 형식의 작은 표본과 대량 합성 데이터를 만든다.
+bench_pci_ids.py 및 GPU 수집 검증 스크립트에서 사용한다.
+
+사용법:
+    import fake_pci_ids
+    lines = fake_pci_ids.SAMPLE.splitlines()
+    lines = fake_pci_ids.synthetic_lines(vendors=2500, devices_per_vendor=16)
+"""
+
+from __future__ import annotations
+
+SAMPLE = """\
+# pci.ids 표본 (실제 파일 형식과 동일: 탭 들여쓰기, ID와 이름 사이 공백 2칸)
+1002  Advanced Micro Devices, Inc. [AMD/ATI]
+\t73bf  Navi 21 [Radeon RX 6800/6800 XT / 6900 XT]
+\t\t1da2 e438  Radeon RX 6800 XT Nitro+
+1013  Cirrus Logic
+\t00b8  GD 5446
+102b  Matrox Electronics Systems Ltd.
+\t0536  Integrated Matrox G200eW3 Graphics Controller
+10de  NVIDIA Corporation
+\t2484  GA104 [GeForce RTX 3070]
+\t\t1043 87c1  TUF Gaming GeForce RTX 3070
+\t2507  GA106 [GeForce RTX 3050]
+1234  Technical Corp.
+\t1111  QEMU Virtual Video Controller
+15ad  VMware
+\t0405  SVGA II Adapter
+1a03  ASPEED Technology, Inc.
+\t2000  ASPEED Graphics Family
+1af4  Red Hat, Inc.
+\t1050  Virtio 1.0 GPU
+8086  Intel Corporation
+\t4680  AlderLake-S GT1 [UHD Graphics 770]
+\t9a49  TigerLake-LP GT2 [Iris Xe Graphics]
+
+C 03  Display controller
+\t00  VGA compatible controller
+"""
+
+# (설명, 조회 인자, 기대값) — gpu_vendor_name / gpu_device_name 기준
+EXPECTED_VENDORS = (
+    (0x10DE, "NVIDIA"),                    # 우선 표기
+    (0x102B, "Matrox Electronics Systems Ltd."),
+    (0x1A03, "ASPEED Technology, Inc."),
+    (0x15AD, "VMware"),
+    (0xABCD, "VEN_ABCD"),                  # 미등록
+)
+EXPECTED_DEVICES = (
+    ((0x10DE, 0x2484, 0x1043, 0x87C1), "TUF Gaming GeForce RTX 3070"),
+    ((0x10DE, 0x2484, None, None), "GeForce RTX 3070"),
+    ((0x10DE, 0x2484, 0x1458, 0x0001), "GeForce RTX 3070"),
+    ((0x8086, 0x4680, None, None), "UHD Graphics 770"),
+    ((0x1002, 0x73BF, 0x1DA2, 0xE438), "Radeon RX 6800 XT Nitro+"),
+    ((0x1A03, 0x2000, None, None), "ASPEED Graphics Family"),
+    ((0x10DE, 0xFFFF, None, None), None),
+)
+EXPECTED_PNP = (
+    ("PCI\\VEN_10DE&DEV_2484&SUBSYS_87C11043&REV_A1\\4&1A2B3C4D&0&0008", (0x10DE, 0x2484, 0x1043, 0x87C1)),
+    ("PCI\\VEN_1A03&DEV_2000&REV_41", (0x1A03, 0x2000, None, None)),
+    ("ROOT\\BasicDisplay\\0000", None),
+)
+
+
+def synthetic_lines(vendors: int = 2500, devices_per_vendor: int = 16, subsystems_per_device: int = 2) -> list[str]:
+    """
+    실제 pci.ids와 비슷한 규모의 합성 데이터를 만든다.
+
+    Args:
+        vendors: 벤더 수
+        devices_per_vendor: 벤더당 디바이스 수
+        subsystems_per_device: 디바이스당 서브시스템 수
+
+    Returns:
+        list[str]: pci.ids 형식 줄 목록
+    """
+    lines = []
+    for v in range(vendors):
+        vendor_id = (v * 26 + 0x1000) & 0xFFFF
+        lines.append(f"{vendor_id:04x}  Vendor {v} Corporation")
+        for d in range(devices_per_vendor):
+            lines.append(f"\t{d * 7:04x}  Chip{d} [Product {v}-{d}]")
+            for s in range(subsystems_per_device):
+                lines.append(f"\t\t{(s * 97 + 0x1000) & 0xFFFF:04x} {s:04x}  Board {s} for Product {v}-{d}")
+    return lines
@@ -0,0 +1,115 @@
+# 본 소스코드는 내부 사용 및 유지보수 목적에 한해 제공됩니다.
+# 무단 재배포 및 상업적 재사용은 허용되지 않습니다.
+"""
+벤치마크/검증용 SMBIOS 원시 테이블 생성기.
+실제 펌웨어 덤프와 같은 바이너리 형식(서식 영역 + 이중 NUL로 끝나는 문자열 집합)을 만든다.
+
+- build_table()은 /sys/firmware/dmi/tables/DMI와 같은 헤더 없는 테이블을 반환한다.
+- build_rsmb()는 GetSystemFirmwareTable('RSMB')와 같은 RawSMBIOSData 헤더 포함 데이터를 반환한다.
+- EXPECTED_*는 기본 테이블에서 기대하는 디코딩/수집 결과이다.
+- Scripts/bench/*.py 벤치마크 스크립트에서만 사용한다.
+"""
+
+from __future__ import annotations
+
+import struct
+
+
+def _structure(struct_type: int, handle: int, body: bytes, strings: tuple[str, ...]) -> bytes:
+    """
+    SMBIOS 구조체 하나를 만든다. (body는 헤더 4바이트 뒤의 서식 영역)
+    """
+    header = struct.pack("<BBH", struct_type, 4 + len(body), handle)
+    if strings:
+        string_set = b"".join(s.encode("ascii") + b"\x00" for s in strings) + b"\x00"
+    else:
+        string_set = b"\x00\x00"
+    return header + body + string_set
+
+
+def _baseboard(handle: int) -> bytes:
+    # Manufacturer(1), Product(2), Version(3), Serial(4)
+    body = bytes([1, 2, 3, 4])
+    return _structure(2, handle, body, ("Gigabyte Technology Co., Ltd.", "B760M AORUS ELITE AX", "x.x", "SN123"))
+
+
+def _chassis(handle: int, chassis_type: int) -> bytes:
+    # Manufacturer(1), Type(잠금 비트 포함), Version, Serial, Asset
+    body = bytes([1, 0x80 | chassis_type, 0, 0, 0])
+    return _structure(3, handle, body, ("Default string",))
+
+
+def _processor(handle: int) -> bytes:
+    body = bytearray(0x1A - 4)
+    body[0x04 - 4] = 1                                   # Socket Designation
+    body[0x07 - 4] = 2                                   # Processor Manufacturer
+    body[0x10 - 4] = 3                                   # Processor Version
+    struct.pack_into("<H", body, 0x14 - 4, 4900)         # Max Speed
+    struct.pack_into("<H", body, 0x16 - 4, 2100)         # Current Speed
+    return _structure(4, handle, bytes(body), ("LGA1700", "Intel(R) Corporation", "12th Gen Intel(R) Core(TM) i7-12700"))
+
+
+def _memory(handle: int, size_mb: int, form_factor: int, speed: int, strings: tuple[str, ...]) -> bytes:
+    """
+    Type 17 (SMBIOS 3.2 길이 0x54)를 만든다. strings = (DeviceLocator, BankLocator, Manufacturer, Serial, Asset, PartNumber)
+    """
+    body = bytearray(0x54 - 4)
+    if size_mb >= 0x7FFF:
+        struct.pack_into("<H", body, 0x0C - 4, 0x7FFF)
+        struct.pack_into("<I", body, 0x1C - 4, size_mb)
+    else:
+        struct.pack_into("<H", body, 0x0C - 4, size_mb)
+    body[0x0E - 4] = form_factor
+    struct.pack_into("<H", body, 0x15 - 4, speed)
+    # 빈 문자열은 번호 0으로 기록 (문자열 집합에 넣으면 이중 NUL로 집합이 끝나 버림)
+    present: list[str] = []
+    for offset, value in zip((0x10, 0x11, 0x17, 0x18, 0x19, 0x1A), strings):
+        if value:
+            present.append(value)
+            body[offset - 4] = len(present)
+    return _structure(17, handle, bytes(body), tuple(present))
+
+
+def build_table(chassis_type: int = 3) -> bytes:
+    """
+    Type 0(무관) / 2 / 3 / 4 / 17×4 / 127로 이루어진 원시 테이블을 만든다.
+
+    메모리: 교체형 DIMM 16GB×2 (Samsung JEDEC 코드, SK hynix), 빈 슬롯 1개, 온보드(Die) 8GB 1개
+
+    Args:
+        chassis_type: Type 3 섀시 유형 코드
+
+    Returns:
+        bytes: 헤더 없는 SMBIOS 테이블
+    """
+    parts = [
+        _structure(0, 0x0000, bytes(0x18 - 4), ("American Megatrends Inc.", "F20")),
+        _baseboard(0x0002),
+        _chassis(0x0003, chassis_type),
+        _processor(0x0004),
+        _memory(0x0011, 16384, 0x09, 3200,
+                ("DIMM 0", "P0 CHANNEL A", "Samsung", "00000000", "Asset", "M378A2K43EB1-CWE")),
+        _memory(0x0012, 16384, 0x09, 3200,
+                ("DIMM 1", "P0 CHANNEL B", "SK Hynix", "00000000", "Asset", "HMA82GU6DJR8N-XN")),
+        _memory(0x0013, 0, 0x02, 0, ("DIMM 2", "P0 CHANNEL C", "", "", "", "")),
+        _memory(0x0014, 8192, 0x10, 4800,
+                ("Controller0-ChannelA", "BANK 0", "Micron", "00000000", "Asset", "MT62F1G32D4DR")),
+        _structure(127, 0xFEFF, b"", ()),
+    ]
+    return b"".join(parts)
+
+
+def build_rsmb(table: bytes | None = None) -> bytes:
+    """
+    RawSMBIOSData 헤더를 붙인 GetSystemFirmwareTable('RSMB') 형식 데이터를 만든다.
+    """
+    table = build_table() if table is None else table
+    return struct.pack("<BBBBI", 0, 3, 2, 0, len(table)) + table
+
+
+EXPECTED_BASEBOARD = "Gigabyte Technology Co., Ltd. B760M AORUS ELITE AX"
+EXPECTED_CPU_NAME = "12th Gen Intel(R) Core(TM) i7-12700"
+EXPECTED_MEMORY_SLOTS = 4
+EXPECTED_INSTALLED_MEMORY = 3
+EXPECTED_RAM_TOTAL = "40GB"
+EXPECTED_RAM_MODULE_COUNT = 2
@@ -0,0 +1,183 @@
+# 본 소스코드는 내부 사용 및 유지보수 목적에 한해 제공됩니다.
+# 무단 재배포 및 상업적 재사용은 허용되지 않습니다.
+"""
+벤치마크/검증용 가짜 procfs·sysfs 트리 생성기.
+실제 하드웨어 없이 core.linux_backend의 파일 파싱과 분류 결과를 재현하기 위해 존재한다.
+
+- build(root)로 root 아래에 proc/, sys/ 파일과 PCI ID 색인(assets/pci_ids.bin)을 만든다.
+- build_gpu_server(root)는 GPU 여러 개와 PCI 장치 수백 개가 있는 서버 트리를 만든다.
+- EXPECTED_SPECS는 기본 트리에서 기대하는 수집 결과이다.
+- Scripts/bench/*.py 벤치마크 스크립트에서만 사용한다.
+"""
+
+from __future__ import annotations
+
+import os
+from pathlib import Path
+
+import fake_pci_ids
+
+CPUINFO = """processor\t: 0
+vendor_id\t: GenuineIntel
+model name\t: 12th Gen Intel(R) Core(TM) i7-12700
+cpu MHz\t\t: 2100.000
+physical id\t: 0
+core id\t\t: 0
+
+processor\t: 1
+vendor_id\t: GenuineIntel
+model name\t: 12th Gen Intel(R) Core(TM) i7-12700
+cpu MHz\t\t: 2100.000
+physical id\t: 0
+core id\t\t: 0
+"""
+CPU_MAX_FREQ_KHZ = 4900000
+
+# 32GB 실장 시스템의 일반적인 MemTotal (커널 예약분만큼 작음)
+MEMINFO = """MemTotal:       32671516 kB
+MemFree:        20013412 kB
+MemAvailable:   27730120 kB
+"""
+
+DMI = {
+    "board_vendor": "Gigabyte Technology Co., Ltd.",
+    "board_name": "B760M AORUS ELITE AX",
+    "board_version": "x.x",
+    "chassis_type": "3",
+}
+
+# (이름, 섹터 수, rotational, vendor, model, 물리 장치 여부)
+BLOCK_DEVICES = (
+    ("nvme0n1", 1953525168, "0", None, "Samsung SSD 980 PRO 1TB", True),
+    ("sda", 3907029168, "1", "ATA", "WDC WD20EZAZ-00L", True),
+    ("sdb", 500118192, "0", "ATA", "CT250MX500SSD1", True),
+    ("loop0", 131072, "0", None, None, False),
+    ("dm-0", 1953525168, "0", None, None, False),
+    ("zram0", 8388608, "0", None, None, False),
+)
+
+# (PCI 주소, class, vendor, device, subsystem_vendor, subsystem_device, DRM 카드, VRAM 노드 → 값)
+PCI_DEVICES = (
+    ("0000:00:00.0", 0x060000, 0x8086, 0x4660, 0x1458, 0x5000, None, {}),
+    ("0000:00:02.0", 0x030000, 0x8086, 0x4680, 0x1458, 0xD000, "card0", {}),
+    ("0000:00:0f.0", 0x030000, 0x15AD, 0x0405, 0x15AD, 0x0405, "card2", {}),
+    ("0000:00:1f.0", 0x060100, 0x8086, 0x7A06, 0x1458, 0x5001, None, {}),
+    ("0000:01:00.0", 0x030200, 0x10DE, 0x2484, 0x1043, 0x87C1, None, {}),
+    ("0000:03:00.0", 0x030000, 0x1002, 0x73BF, 0x1DA2, 0xE438, "card1", {"mem_info_vram_total": 16 * 1024 ** 3}),
+)
+
+EXPECTED_SPECS = {
+    "system_type": "데스크탑",
+    "cpu": "12th Gen Intel(R) Core(TM) i7-12700",
+    "ram": ("32GB", ["모듈 정보 미제공"]),
+    "mainboard": "Gigabyte Technology Co., Ltd. B760M AORUS ELITE AX",
+    "vga": [
+        "Radeon RX 6800 XT Nitro+ (16GB / AMD)",
+        "UHD Graphics 770 (Intel)",
+        "TUF Gaming GeForce RTX 3070 (NVIDIA)",
+    ],
+    "ssd": ["Samsung SSD 980 PRO 1TB (931.51GB)", "CT250MX500SSD1 (238.47GB)"],
+    "hdd": ["WDC WD20EZAZ-00L (1863.02GB)"],
+}
+
+
+def _write(path: Path, text: str) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(text, encoding="utf-8")
+
+
+def build(root: Path) -> Path:
+    """
+    root 아래에 가짜 procfs/sysfs 트리를 만든다.
+
+    Args:
+        root: 트리를 만들 디렉토리
+
+    Returns:
+        Path: root
+    """
+    root = Path(root)
+    _write(root / "proc" / "cpuinfo", CPUINFO)
+    _write(root / "proc" / "meminfo", MEMINFO)
+    _write(root / "sys" / "devices" / "system" / "cpu" / "cpu0" / "cpufreq" / "cpuinfo_max_freq", f"{CPU_MAX_FREQ_KHZ}\n")
+    for name, value in DMI.items():
+        _write(root / "sys" / "class" / "dmi" / "id" / name, value + "\n")
+
+    _build_pci(root, PCI_DEVICES)
+    pci_ids_path = root / "assets" / "pci_ids.bin"
+    pci_ids_path.parent.mkdir(parents=True, exist_ok=True)
+    pci_ids_path.write_bytes(_pci_ids_index())
+
+    for name, sectors, rotational, vendor, model, physical in BLOCK_DEVICES:
+        disk = root / "sys" / "block" / name
+        _write(disk / "size", f"{sectors}\n")
+        _write(disk / "queue" / "rotational", f"{rotational}\n")
+        if physical:
+            if vendor:
+                _write(disk / "device" / "vendor", f"{vendor:<8}\n")
+            if model:
+                _write(disk / "device" / "model", f"{model:<16}\n")
+    return root
+
+
+def _pci_ids_index() -> bytes:
+    from core import pci_ids
+
+    return pci_ids.build_index(fake_pci_ids.SAMPLE.splitlines())
+
+
+def _build_pci(root: Path, devices) -> None:
+    """
+    sys/devices 아래 PCI 장치와 sys/bus/pci/devices, sys/class/drm 링크를 만든다. (실제 sysfs와 같은 symlink 구조)
+    """
+    for address, pci_class, vendor, device, subvendor, subdevice, card, vram_nodes in devices:
+        device_dir = root / "sys" / "devices" / "pci0000:00" / address
+        _write(device_dir / "class", f"0x{pci_class:06x}\n")
+        _write(device_dir / "vendor", f"0x{vendor:04x}\n")
+        _write(device_dir / "device", f"0x{device:04x}\n")
+        _write(device_dir / "subsystem_vendor", f"0x{subvendor:04x}\n")
+        _write(device_dir / "subsystem_device", f"0x{subdevice:04x}\n")
+        for node, value in vram_nodes.items():
+            _write(device_dir / node, f"{value}\n")
+
+        bus_dir = root / "sys" / "bus" / "pci" / "devices"
+        bus_dir.mkdir(parents=True, exist_ok=True)
+        os.symlink(os.path.relpath(device_dir, bus_dir), bus_dir / address)
+
+        if card:
+            card_dir = root / "sys" / "class" / "drm" / card
+            card_dir.mkdir(parents=True, exist_ok=True)
+            os.symlink(os.path.relpath(device_dir, card_dir), card_dir / "device")
+            # 커넥터 디렉토리는 카드로 취급하지 않아야 함
+            (root / "sys" / "class" / "drm" / f"{card}-DP-1").mkdir(exist_ok=True)
+
+
+def build_gpu_server(root: Path, gpus: int = 8, other_devices: int = 300) -> Path:
+    """
+    GPU가 여러 개인 서버의 sysfs 트리를 만든다. (GPU 수집 시간 측정용)
+
+    GPU는 amdgpu 카드(VRAM 노드 있음)와 DRM 드라이버 없는 NVIDIA 연산 GPU를 번갈아 만든다.
+
+    Args:
+        root: 트리를 만들 디렉토리
+        gpus: GPU 수
+        other_devices: GPU가 아닌 PCI 장치 수
+
+    Returns:
+        Path: root
+    """
+    root = Path(root)
+    devices = [("0000:00:0f.0", 0x030000, 0x1A03, 0x2000, 0x1A03, 0x2000, "card0", {})]
+    for i in range(gpus):
+        address = f"0000:{0x40 + i:02x}:00.0"
+        if i % 2:
+            devices.append((address, 0x030200, 0x10DE, 0x2484, 0x10DE, 0x0000, None, {}))
+        else:
+            devices.append((address, 0x030000, 0x1002, 0x73BF, 0x1DA2, 0xE438, f"card{i + 1}",
+                            {"mem_info_vram_total": 16 * 1024 ** 3}))
+    for i in range(other_devices):
+        devices.append((f"0001:{i // 32:02x}:{i % 32:02x}.0", 0x020000, 0x15B3, 0x101B, 0x15B3, 0x0007, None, {}))
+    _build_pci(root, devices)
+    (root / "assets").mkdir(parents=True, exist_ok=True)
+    (root / "assets" / "pci_ids.bin").write_bytes(_pci_ids_index())
+    return root
@@ -0,0 +1,317 @@
+# 본 소스코드는 내부 사용 및 유지보수 목적에 한해 제공됩니다.
+# 무단 재배포 및 상업적 재사용은 허용되지 않습니다.
+"""
+벤치마크용 가짜 wmi 모듈.
+Windows가 아닌 환경에서도 WMI 클래스 조회 지연을 재현해 수집 경로를 측정하기 위해 존재한다.
+
+- install(collector)로 core.collector의 wmi 모듈을 교체한다.
+- 클래스별 조회 지연(CLASS_LATENCY_S)은 configure()로 조정한다.
+- 속성 비용 모델: 인스턴스당 마샬링 속성 수 × PROPERTY_COST_S 만큼 추가 지연
+  (전체 열거는 CLASS_PROPERTY_COUNT개, 프로젝션 WQL은 SELECT한 속성 수만큼)
+- 연결 생성 지연(CONNECT_LATENCY_S)과 WMI 서비스 재시작(break_connections(): 기존 연결이 RPC 오류)을 재현한다.
+- 내장 이벤트 구독(WMI.watch_for)은 SUBSCRIPTIONS에 기록하고 push_event()로 넣은 이벤트를 전달한다.
+- Scripts/bench/*.py 벤치마크 스크립트에서만 사용한다.
+"""
+
+from __future__ import annotations
+
+import queue
+import re
+import threading
+import time
+
+DEFAULT_CLASS_LATENCY_S = 0.2
+
+CLASS_LATENCY_S: dict[str, float] = {
+    "Win32_SystemEnclosure": 0.15,
+    "Win32_ComputerSystem": 0.25,
+    "Win32_Processor": 0.3,
+    "Win32_PhysicalMemory": 0.4,
+    "Win32_BaseBoard": 0.1,
+    "Win32_VideoController": 0.5,
+    "MSFT_PhysicalDisk": 0.8,
+    "__NAMESPACE": 0.005,
+}
+
+# 실제 WMI 클래스의 대략적인 속성 수 (전체 열거 시 마샬링되는 속성 수)
+CLASS_PROPERTY_COUNT: dict[str, int] = {
+    "Win32_SystemEnclosure": 34,
+    "Win32_ComputerSystem": 61,
+    "Win32_Processor": 48,
+    "Win32_PhysicalMemory": 36,
+    "Win32_BaseBoard": 29,
+    "Win32_VideoController": 59,
+    "MSFT_PhysicalDisk": 40,
+}
+DEFAULT_PROPERTY_COUNT = 40
+
+# 인스턴스 1개의 속성 1개를 마샬링하는 비용(초)
+PROPERTY_COST_S = 0.0
+
+# wmi.WMI() 연결 생성 지연(초) (실제 환경은 수십~수백 ms)
+CONNECT_LATENCY_S = 0.0
+
+# RPC_S_SERVER_UNAVAILABLE (pywintypes.com_error처럼 부호 있는 정수로 전달)
+RPC_S_SERVER_UNAVAILABLE = 0x800706BA - (1 << 32)
+
+_WQL_PATTERN = re.compile(r"^\s*SELECT\s+(.+?)\s+FROM\s+(\w+)\s*$", re.IGNORECASE)
+
+_stats_lock = threading.Lock()
+STATS = {"connections": 0, "class_queries": 0}
+# 이 세대보다 먼저 만든 연결은 RPC 오류를 발생시킴 (break_connections())
+_broken_before = 0
+_generation = 0
+# watch_for() 구독 기록 (notification_type, wmi_class, delay_secs)과 클래스별 이벤트 큐
+SUBSCRIPTIONS: list[tuple] = []
+_event_queues: dict[str, queue.Queue] = {}
+_events_lock = threading.Lock()
+
+
+class x_wmi_timed_out(Exception):
+    """
+    wmi.x_wmi_timed_out을 흉내 낸다. (이벤트 대기 시간 초과)
+    """
+
+
+class FakeComError(Exception):
+    """
+    pywintypes.com_error를 흉내 낸다. (args = (hresult, 메시지, excepinfo, argerror))
+    """
+
+    def __init__(self, hresult: int, message: str):
+        super().__init__(hresult, message, None, None)
+        self.hresult = hresult
+
+
+class FakeWmiObject:
+    """
+    WMI 인스턴스를 흉내 내는 속성 보관 객체.
+
+    - 책임: 속성 값 제공
+    - 비책임: 조회 지연 재현
+    - 사용처: FakeWMI 클래스 조회 결과
+    """
+
+    def __init__(self, **props):
+        self.__dict__.update(props)
+
+
+FAKE_DATA: dict[str, list[dict]] = {
+    "Win32_SystemEnclosure": [{"ChassisTypes": [3]}],
+    "Win32_ComputerSystem": [{"PCSystemType": 1, "PCSystemTypeEx": 1}],
+    "Win32_Processor": [{
+        "Name": "Intel(R) Core(TM) i7-12700 CPU @ 2.10GHz",
+        "NumberOfCores": 12,
+        "NumberOfLogicalProcessors": 20,
+        "MaxClockSpeed": 2100,
+    }],
+    "Win32_PhysicalMemory": [
+        {
+            "Capacity": str(16 * 1024 ** 3),
+            "Speed": 3200,
+            "Manufacturer": "Samsung",
+            "PartNumber": "M378A2K43EB1-CWE",
+            "FormFactor": 8,
+            "DeviceLocator": "DIMM1",
+            "BankLabel": "BANK 0",
+        },
+        {
+            "Capacity": str(16 * 1024 ** 3),
+            "Speed": 3200,
+            "Manufacturer": "80CE",
+            "PartNumber": "M378A2K43EB1-CWE",
+            "FormFactor": 8,
+            "DeviceLocator": "DIMM2",
+            "BankLabel": "BANK 1",
+        },
+    ],
+    "Win32_BaseBoard": [{"Manufacturer": "Gigabyte", "Product": "B760M AORUS ELITE AX", "Version": "x.x"}],
+    "Win32_VideoController": [
+        {"Name": "NVIDIA GeForce RTX 3050", "AdapterRAM": 4 * 1024 ** 3, "AdapterCompatibility": "NVIDIA"},
+    ],
+    "MSFT_PhysicalDisk": [
+        {"FriendlyName": "Samsung SSD 980 PRO 1TB", "Size": 1000204886016, "MediaType": 4, "BusType": 17},
+        {"FriendlyName": "WDC WD20EZAZ", "Size": 2000398934016, "MediaType": 3, "BusType": 11},
+    ],
+}
+
+
+def configure(
+    latencies: dict[str, float] | None = None,
+    scale: float = 1.0,
+    property_cost_s: float | None = None,
+    connect_latency_s: float | None = None,
+) -> None:
+    """
+    클래스별 조회 지연을 설정한다.
+
+    Args:
+        latencies: 클래스 이름 → 지연(초) 덮어쓰기 값
+        scale: 전체 지연 배율
+        property_cost_s: 속성 1개 마샬링 비용(초)
+        connect_latency_s: 연결 생성 지연(초)
+
+    Returns:
+        None
+    """
+    global PROPERTY_COST_S, CONNECT_LATENCY_S
+    if property_cost_s is not None:
+        PROPERTY_COST_S = property_cost_s
+    if connect_latency_s is not None:
+        CONNECT_LATENCY_S = connect_latency_s
+    if latencies:
+        CLASS_LATENCY_S.update(latencies)
+    for key in list(CLASS_LATENCY_S):
+        CLASS_LATENCY_S[key] *= scale
+
+
+def reset_stats() -> None:
+    """
+    호출 통계를 초기화한다.
+
+    Returns:
+        None
+    """
+    with _stats_lock:
+        for key in STATS:
+            STATS[key] = 0
+
+
+def break_connections() -> None:
+    """
+    WMI 서비스 재시작을 재현한다. 지금까지 만든 연결은 이후 모든 조회에서 RPC 오류를 발생시킨다.
+
+    Returns:
+        None
+    """
+    global _broken_before
+    with _stats_lock:
+        _broken_before = _generation + 1
+
+
+def push_event(class_name: str, event_type: str, **props) -> None:
+    """
+    watch_for()로 구독한 클래스에 내장 이벤트를 넣는다.
+
+    Args:
+        class_name: 대상 클래스 (예: "MSFT_PhysicalDisk")
+        event_type: wmi 모듈의 event_type ("creation", "deletion", "modification")
+        **props: 대상 인스턴스 속성
+
+    Returns:
+        None
+    """
+    _event_queue(class_name).put(FakeWmiObject(event_type=event_type, **props))
+
+
+def _event_queue(class_name: str) -> queue.Queue:
+    with _events_lock:
+        return _event_queues.setdefault(class_name, queue.Queue())
+
+
+def _count(key: str) -> None:
+    with _stats_lock:
+        STATS[key] += 1
+
+
+class WMI:
+    """
+    wmi.WMI 연결 객체를 흉내 낸다.
+
+    - 책임: 클래스 속성 접근 시 지연 후 FakeWmiObject 목록 반환
+    - 비책임: 실제 WQL 해석
+    - 사용처: install() 이후 core.collector
+    """
+
+    def __init__(self, namespace: str | None = None, **kwargs):
+        global _generation
+        self.namespace = namespace
+        time.sleep(CONNECT_LATENCY_S)
+        with _stats_lock:
+            _generation += 1
+            self._generation = _generation
+        _count("connections")
+
+    def _check_alive(self) -> None:
+        if self._generation < _broken_before:
+            raise FakeComError(RPC_S_SERVER_UNAVAILABLE, "RPC 서버를 사용할 수 없습니다.")
+
+    def __getattr__(self, class_name: str):
+        if not class_name.startswith(("Win32_", "MSFT_")):
+            raise AttributeError(class_name)
+
+        def _query(*args, **kwargs):
+            self._check_alive()
+            return _fetch(class_name, None)
+
+        return _query
+
+    def watch_for(self, notification_type: str = "operation", wmi_class: str = "", delay_secs: int = 1, **kwargs):
+        """
+        내장 이벤트 구독을 기록하고 push_event()로 넣은 이벤트를 반환하는 대기 함수를 돌려준다.
+
+        "Operation"은 모든 이벤트를, "Creation"/"Deletion"/"Modification"은 해당 종류만 전달한다.
+        """
+        self._check_alive()
+        with _events_lock:
+            SUBSCRIPTIONS.append((notification_type, wmi_class, delay_secs))
+        events = _event_queue(wmi_class)
+        wanted = notification_type.lower()
+
+        def _next(timeout_ms: int = -1):
+            deadline = time.monotonic() + timeout_ms / 1000 if timeout_ms >= 0 else None
+            while True:
+                remaining = None if deadline is None else max(0.0, deadline - time.monotonic())
+                try:
+                    event = events.get(timeout=remaining)
+                except queue.Empty:
+                    raise x_wmi_timed_out() from None
+                if wanted == "operation" or event.event_type == wanted:
+                    return event
+
+        return _next
+
+    def query(self, wql: str) -> list:
+        """
+        "SELECT <필드> FROM <클래스>" 형식의 WQL만 해석한다.
+        """
+        self._check_alive()
+        match = _WQL_PATTERN.match(wql)
+        if not match:
+            raise ValueError(f"지원하지 않는 WQL: {wql}")
+        projection, class_name = match.group(1), match.group(2)
+        fields = None if projection.strip() == "*" else tuple(f.strip() for f in projection.split(","))
+        return _fetch(class_name, fields)
+
+
+def _fetch(class_name: str, fields: tuple[str, ...] | None) -> list:
+    """
+    클래스 조회 지연(기본 + 속성 비용)을 재현하고 인스턴스 목록을 반환한다.
+    """
+    _count("class_queries")
+    rows = FAKE_DATA.get(class_name, [])
+    prop_count = len(fields) if fields else CLASS_PROPERTY_COUNT.get(class_name, DEFAULT_PROPERTY_COUNT)
+    time.sleep(
+        CLASS_LATENCY_S.get(class_name, DEFAULT_CLASS_LATENCY_S)
+        + len(rows) * prop_count * PROPERTY_COST_S
+    )
+    if fields:
+        return [FakeWmiObject(**{k: v for k, v in props.items() if k in fields}) for props in rows]
+    return [FakeWmiObject(**props) for props in rows]
+
+
+def install(collector_module) -> None:
+    """
+    core.collector가 이 모듈을 wmi로 사용하도록 교체한다.
+
+    Args:
+        collector_module: core.collector 모듈 객체
+
+    Returns:
+        None
+    """
+    import sys
+
+    collector_module.wmi = sys.modules[__name__]
+    collector_module.WMI_AVAILABLE = True
+    collector_module._is_windows_wmi_available = lambda: True
@@ -0,0 +1,100 @@
+# 본 소스코드는 내부 사용 및 유지보수 목적에 한해 제공됩니다.
+# 무단 재배포 및 상업적 재사용은 허용되지 않습니다.
+"""
+main.py import 비용을 `python -X importtime`으로 측정하고 회귀를 검사한다.
+첫 화면 표시 전에 로드되면 안 되는 모듈(WMI/pywin32/psutil/DXGI/collector/formatter)이
+import되면 실패(종료 코드 1)한다.
+
+사용법:
+    python Scripts/bench/import_report.py [--top 15] [--budget-ms 0]
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[2]
+SRC_DIR = ROOT / "src"
+
+# 첫 화면 표시 경로에서 import되면 안 되는 모듈 (최초 사용 시 지연 로드 대상)
+FORBIDDEN_MODULES = (
+    "wmi",
+    "pythoncom",
+    "pywintypes",
+    "win32com",
+    "psutil",
+    "core.collector",
+    "core.gpu_dxgi",
+    "core.formatter",
+    "core.ram_brand",
+)
+
+
+def _run_importtime(module: str) -> list[tuple[int, int, str]]:
+    """
+    module을 import하는 하위 프로세스를 -X importtime으로 실행하고 결과를 파싱한다.
+
+    Returns:
+        list[tuple[int, int, str]]: (self_us, cumulative_us, 모듈 이름) 목록
+    """
+    env = dict(os.environ)
+    env.setdefault("QT_QPA_PLATFORM", "offscreen")
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=str(SRC_DIR),
+        env=env,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        universal_newlines=True,
+    )
+    if proc.returncode != 0:
+        sys.stderr.write(proc.stderr)
+        raise SystemExit(f"import {module} 실패 (종료 코드 {proc.returncode})")
+
+    rows = []
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        try:
+            self_us, cumulative_us, name = line[len("import time:"):].split("|", 2)
+            rows.append((int(self_us), int(cumulative_us), name.strip()))
+        except ValueError:
+            continue
+    return rows
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--module", default="main", help="측정할 진입 모듈")
+    parser.add_argument("--top", type=int, default=15, help="누적 시간 상위 출력 개수")
+    parser.add_argument("--budget-ms", type=float, default=0.0, help="총 import 시간 상한(ms, 0이면 검사 안 함)")
+    args = parser.parse_args()
+
+    rows = _run_importtime(args.module)
+    total_us = sum(self_us for self_us, _, _ in rows)
+    imported = {name for _, _, name in rows}
+
+    print(f"import {args.module}: 모듈 {len(rows)}개, 총 {total_us / 1000:.1f} ms")
+    print(f"{'누적(ms)':>10} {'자체(ms)':>10}  모듈")
+    for self_us, cumulative_us, name in sorted(rows, key=lambda r: r[1], reverse=True)[:args.top]:
+        print(f"{cumulative_us / 1000:10.1f} {self_us / 1000:10.1f}  {name}")
+
+    failed = False
+    leaked = [m for m in FORBIDDEN_MODULES if m in imported]
+    if leaked:
+        print(f"[FAIL] 첫 화면 경로에서 지연 로드 대상 모듈이 import됨: {', '.join(leaked)}")
+        failed = True
+    if args.budget_ms and total_us / 1000 > args.budget_ms:
+        print(f"[FAIL] 총 import 시간 {total_us / 1000:.1f} ms > 상한 {args.budget_ms:.1f} ms")
+        failed = True
+    if not failed:
+        print("[OK] import 회귀 검사 통과")
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
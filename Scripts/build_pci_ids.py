@@ -0,0 +1,43 @@
+# 본 소스코드는 내부 사용 및 유지보수 목적에 한해 제공됩니다.
+# 무단 재배포 및 상업적 재사용은 허용되지 않습니다.
+"""
+pci.ids 텍스트(https://pci-ids.ucw.cz)를 앱에 번들하는 바이너리 색인(src/assets/pci_ids.bin)으로 변환한다.
+색인 형식은 core.pci_ids 모듈 설명 참고.
+
+사용법:
+    python Scripts/build_pci_ids.py <pci.ids 경로> [--output src/assets/pci_ids.bin]
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT / "src"))
+
+from core import pci_ids  # noqa: E402
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("source", help="pci.ids 텍스트 파일 경로")
+    parser.add_argument("--output", default=str(ROOT / "src" / pci_ids.PCI_IDS_RESOURCE), help="출력 색인 경로")
+    args = parser.parse_args()
+
+    with open(args.source, "r", encoding="utf-8", errors="replace") as f:
+        data = pci_ids.build_index(f)
+
+    output = Path(args.output)
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_bytes(data)
+
+    db = pci_ids.PciIdDatabase(str(output))
+    counts = db.entry_counts
+    db.close()
+    print(f"[OK] {output} ({len(data):,} bytes) | 벤더 {counts[0]:,} | 디바이스 {counts[1]:,} | 서브시스템 {counts[2]:,}")
+
+
+if __name__ == "__main__":
+    main()
@@ -60,6 +60,16 @@ Remove-Item -Recurse -Force dist, build -ErrorAction SilentlyContinue
 Remove-Item -Recurse -Force release -ErrorAction SilentlyContinue
 New-Item -ItemType Directory -Force release | Out-Null
 
+# PCI ID 색인 생성 (pci.ids가 있으면 src\assets\pci_ids.bin 갱신, 없으면 기존 색인 사용)
+$pciIdsSource = Join-Path $PROJECT_ROOT "Scripts\pci.ids"
+if (Test-Path $pciIdsSource) {
+    python Scripts\build_pci_ids.py $pciIdsSource
+    if ($LASTEXITCODE -ne 0) {
+        Write-Host "[FAIL] PCI ID index build failed."
+        exit 1
+    }
+}
+
 # PyInstaller 빌드 (onedir)
 pyinstaller --noconsole --onedir `
   --clean `
@@ -8,21 +8,48 @@ from __future__ import annotations
 View와 데이터 수집/포맷팅 로직을 연결하는 컨트롤러
 UI 이벤트 처리, 사양 수집/표시, 클립보드 복사, 외부 링크 열기를 담당함
 
-- Controller.__init__()에서 View와 연결 및 초기 사양 수집
+- Controller.__init__()에서 View와 연결 및 초기 사양 수집 시작 (QThreadPool 워커, GUI 스레드 비차단)
+- 창 종료 시 진행 중인 수집을 취소하고 shutdown()에서 제한 시간만 대기
+- 하드웨어 변경 감시(core.hw_watcher)가 있으면 변경된 카테고리만 재수집
 - UI 버튼 클릭 이벤트를 이벤트 핸들러로 라우팅
 - collector/formatter를 호출하여 View 업데이트
 - SOLID 원칙 준수: 인터페이스에 의존하여 구현체 교체 가능
 """
 import logging
 from typing import Optional
+from PyQt5.QtCore import QObject, QThreadPool, QTimer, pyqtSignal
 from PyQt5.QtWidgets import QApplication
 from core.interfaces import ISpecCollector, ISpecFormatter
 from core.collector_wrapper import CollectorWrapper
 from core.formatter_wrapper import FormatterWrapper
 from core.message_utils import show_error, show_information
+from core.refresh_scheduler import RefreshScheduler
+from core.spec_schema import (
+    SPEC_KEYS,
+    TIMED_OUT_KEY,
+    category_spec_keys,
+    category_value,
+    empty_specs,
+    merge_category_result,
+)
+from core.spec_worker import SpecCollectWorker, SpecStreamWorker
 
 logger = logging.getLogger(__name__)
 
+# 하드웨어 변경 시 다른 수집이 진행 중이면 다시 시도할 간격(ms)
+HARDWARE_CHANGE_RETRY_MS = 500
+
+
+class _HardwareChangeRelay(QObject):
+    """
+    감시 스레드의 하드웨어 변경 알림을 GUI 스레드로 전달하는 시그널
+
+    - 책임: 변경 카테고리 튜플 시그널 정의 (GUI 스레드에서 생성하므로 슬롯은 GUI 스레드에서 호출)
+    - 비책임: 재수집
+    - 사용처: Controller
+    """
+    changed = pyqtSignal(object)
+
 
 class Controller:
     """
@@ -34,7 +61,10 @@ class Controller:
     """
     def __init__(self, view, 
                  spec_collector: Optional[ISpecCollector] = None,
-                 spec_formatter: Optional[ISpecFormatter] = None):
+                 spec_formatter: Optional[ISpecFormatter] = None,
+                 stale_while_revalidate: bool = False,
+                 refresh_scheduler: Optional[RefreshScheduler] = None,
+                 hardware_watcher=None):
         """
         Controller 초기화
         
@@ -42,9 +72,24 @@ class Controller:
             view: MainWindow 인스턴스
             spec_collector: 사양 수집기 구현체 (기본값: CollectorWrapper)
             spec_formatter: 사양 포맷터 구현체 (기본값: FormatterWrapper)
+            stale_while_revalidate: 마지막 캐시 사양을 즉시 표시하고 백그라운드에서 재수집할지 여부
+                (spec_collector가 peek_cached_specs()/refresh()를 제공할 때만 동작)
+            refresh_scheduler: 재수집 시 TTL이 지난 카테고리만 수집할 스케줄러 (None이면 전체 재수집)
+            hardware_watcher: 장치 추가/제거 시 변경된 카테고리를 알려 줄 core.hw_watcher.HardwareWatcher
+                (None이면 감시하지 않음, 창이 닫힐 때 종료)
         """
         self.view = view
         self.current_specs: Optional[dict] = None
+        self._stale_while_revalidate = stale_while_revalidate
+        self._refresh_scheduler = refresh_scheduler
+        self._thread_pool = QThreadPool()
+        self._workers: list = []
+        self._closing = False
+        self._partial_specs: dict = {}
+        self._section_html: dict = {}
+        self._hardware_watcher = hardware_watcher
+        self._hardware_relay = _HardwareChangeRelay()
+        self._pending_hardware_changes: set = set()
         
         # 의존성 주입 (DIP 준수)
         if spec_collector is None:
@@ -57,15 +102,23 @@ class Controller:
         
         self.bind_signals()
         self.load_specs()
+        if self._hardware_watcher is not None:
+            self._hardware_watcher.start(self._hardware_relay.changed.emit)
     
     def bind_signals(self):
         """
         UI 위젯의 시그널을 이벤트 핸들러에 연결
         
-        btnCopySpecs 버튼 클릭 이벤트를 핸들러에 연결
+        btnCopySpecs 버튼 클릭, 새로 고침 단축키(F5/Ctrl+F5) 이벤트를 핸들러에 연결
         """
         # 버튼 클릭 이벤트 연결
         self.view.ui.btnCopySpecs.clicked.connect(self.on_copy_specs_clicked)
+        # F5: 만료된 카테고리만 재수집, Ctrl+F5: 전체 재수집
+        self.view.refresh_requested.connect(self.refresh_specs)
+        # 창 종료 시 진행 중인 수집 취소
+        self.view.closing.connect(self.on_window_closing)
+        # 하드웨어 변경 감시 스레드 → GUI 스레드
+        self._hardware_relay.changed.connect(self.on_hardware_changed)
         
         logger.info("시그널 바인딩 완료")
 
@@ -73,19 +126,355 @@ class Controller:
         """
         실행 시 자동으로 사양을 수집하고 표시
         
-        spec_collector를 호출하여 시스템 사양을 수집하고,
-        render_specs()로 UI에 표시함
+        spec_collector 호출은 백그라운드 워커에서 수행되며,
+        결과는 시그널로 전달되어 render_specs()로 UI에 표시됨
         예외 발생 시 handle_error()로 처리
         """
+        if self._stale_while_revalidate and self._load_cached_specs():
+            self._start_revalidate()
+            return
+
+        if self._supports_progressive_render():
+            self._start_streaming()
+            return
+
+        logger.info("자동 사양 수집 시작")
+        worker = SpecCollectWorker(self._spec_collector.collect_all_specs)
+        worker.signals.finished.connect(self.on_collect_finished)
+        worker.signals.failed.connect(self.on_collect_failed)
+        self._start_worker(worker)
+
+    def _start_worker(self, worker) -> None:
+        """
+        워커를 스레드 풀에서 실행하고 취소 대상으로 등록한다.
+
+        Args:
+            worker: SpecCollectWorker 또는 SpecStreamWorker
+        """
+        self._workers = [w for w in self._workers if not w.is_done]
+        self._workers.append(worker)
+        self._thread_pool.start(worker)
+
+    def on_collect_finished(self, specs: dict):
+        """
+        일괄 수집 완료 핸들러
+
+        Args:
+            specs: 수집된 사양 딕셔너리
+        """
+        if self._closing:
+            return
+        self.current_specs = specs
+        self._mark_collected(specs)
+        self.render_specs(specs)
+        logger.info("자동 사양 수집 완료")
+
+    def on_collect_failed(self, exc: Exception):
+        """
+        일괄 수집 실패 핸들러
+
+        Args:
+            exc: 발생한 예외
+        """
+        if self._closing:
+            return
+        self.handle_error(exc)
+
+    def on_window_closing(self):
+        """
+        창 종료 이벤트 핸들러
+
+        진행 중인 수집 워커에 취소를 요청한다. 이후 도착하는 결과는 무시된다.
+        """
+        self._closing = True
+        if self._hardware_watcher is not None:
+            self._hardware_watcher.stop()
+        pending = [w for w in self._workers if not w.is_done]
+        for worker in pending:
+            worker.cancel()
+        if pending:
+            logger.info("진행 중인 사양 수집 %d건 취소 요청", len(pending))
+
+    def shutdown(self, timeout_ms: int = 1000) -> bool:
+        """
+        수집 워커를 취소하고 제한 시간 동안만 종료를 기다린다.
+
+        WMI 호출이 멈춘 경우 스레드를 강제로 중단할 수 없으므로
+        False를 반환하면 호출자가 프로세스를 즉시 종료해야 한다.
+
+        Args:
+            timeout_ms: 최대 대기 시간(ms)
+
+        Returns:
+            bool: 모든 워커가 제한 시간 내 종료되었으면 True
+        """
+        self.on_window_closing()
+        done = self._thread_pool.waitForDone(timeout_ms)
+        if not done:
+            logger.warning("사양 수집 워커가 %dms 내에 종료되지 않음", timeout_ms)
+        if self._refresh_scheduler is not None:
+            logger.info("선택 재수집 집계 | %s", self._refresh_scheduler.stats())
+        if self._hardware_watcher is not None:
+            logger.info("하드웨어 변경 감시 집계 | %s", self._hardware_watcher.stats())
+        return done
+    
+    def _supports_progressive_render(self) -> bool:
+        """
+        수집기/포맷터가 점진 렌더링에 필요한 메서드를 제공하는지 확인한다.
+
+        Returns:
+            bool: 스트리밍 수집 + 섹션 단위 HTML 생성이 모두 가능하면 True
+        """
+        return (
+            hasattr(self._spec_collector, "iter_category_results")
+            and hasattr(self._spec_formatter, "render_spec_section")
+            and hasattr(self._spec_formatter, "assemble_spec_html")
+        )
+
+    def _start_streaming(self):
+        """
+        모든 항목을 수집 중으로 표시한 뒤 백그라운드에서 스트리밍 수집을 시작한다.
+
+        카테고리가 완료될 때마다 on_category_ready()에서 해당 섹션만 다시 생성한다.
+        """
+        logger.info("자동 사양 수집 시작 (점진 렌더링)")
+        self._partial_specs = empty_specs()
+        self._section_html = {
+            key: self._spec_formatter.render_spec_section(key, self._partial_specs, pending=True)
+            for key in SPEC_KEYS
+        }
+        self._show_section_html()
+
+        worker = SpecStreamWorker(self._spec_collector.iter_category_results)
+        worker.signals.category_ready.connect(self.on_category_ready)
+        worker.signals.finished.connect(self.on_stream_finished)
+        worker.signals.failed.connect(self.on_stream_failed)
+        self._start_worker(worker)
+
+    def _show_section_html(self):
+        """
+        현재 섹션 HTML 조각을 조립하여 View에 표시한다.
+        """
         try:
-            logger.info("자동 사양 수집 시작")
-            specs = self._spec_collector.collect_all_specs()
-            self.current_specs = specs
-            self.render_specs(specs)
-            logger.info("자동 사양 수집 완료")
+            html = self._spec_formatter.assemble_spec_html(self._section_html)
+            self.view.set_specs_html(html)
+            self.view.hide_loading_overlay()
         except Exception as e:
+            logger.exception("사양 렌더링 실패")
             self.handle_error(e)
-    
+
+    def on_category_ready(self, category: str, value):
+        """
+        카테고리 수집 완료 핸들러
+
+        해당 카테고리의 섹션만 다시 생성하여 표시한다.
+
+        Args:
+            category: 완료된 카테고리
+            value: 카테고리 수집 결과
+        """
+        if self._closing:
+            return
+        merge_category_result(self._partial_specs, category, value)
+        for key in category_spec_keys(category):
+            self._section_html[key] = self._spec_formatter.render_spec_section(key, self._partial_specs)
+        self._show_section_html()
+        logger.info("사양 부분 렌더링 | %s", category)
+
+    def on_stream_finished(self, specs: dict):
+        """
+        스트리밍 수집 완료 핸들러
+
+        Args:
+            specs: 병합된 전체 사양 딕셔너리
+        """
+        if self._closing:
+            return
+        self.current_specs = specs
+        self._mark_collected(specs)
+        logger.info("자동 사양 수집 완료")
+
+    def on_stream_failed(self, exc: Exception):
+        """
+        스트리밍 수집 실패 핸들러
+
+        Args:
+            exc: 발생한 예외
+        """
+        if self._closing:
+            return
+        self.handle_error(exc)
+
+    def _load_cached_specs(self) -> bool:
+        """
+        마지막으로 저장된 캐시 사양을 즉시 표시한다.
+
+        Returns:
+            bool: 캐시 사양을 표시했으면 True
+        """
+        peek = getattr(self._spec_collector, "peek_cached_specs", None)
+        if peek is None or not hasattr(self._spec_collector, "refresh"):
+            return False
+        try:
+            specs = peek()
+        except Exception:
+            logger.exception("캐시 사양 로드 실패")
+            return False
+        if not specs:
+            return False
+
+        self.current_specs = specs
+        self.render_specs(specs)
+        logger.info("캐시 사양 우선 표시 완료")
+        return True
+
+    def on_activation_requested(self, refresh: bool):
+        """
+        다른 실행의 활성화 요청 핸들러 (단일 인스턴스)
+
+        창을 앞으로 가져오고, 요청 시 사양을 재수집한다.
+
+        Args:
+            refresh: 재수집 요청 여부
+        """
+        if self._closing:
+            return
+        self.view.bring_to_front()
+        if refresh:
+            self.refresh_specs()
+
+    def refresh_specs(self, force: bool = False) -> bool:
+        """
+        표시 중인 사양을 유지한 채 백그라운드에서 재수집한다.
+
+        이미 수집 중이면 WMI 조회가 겹치지 않도록 새로 시작하지 않는다.
+        재수집 스케줄러가 있으면 TTL이 지난 카테고리만 수집하고, 만료된 카테고리가 없으면 수집하지 않는다.
+
+        Args:
+            force: True이면 TTL과 관계없이 모든 카테고리를 재수집
+
+        Returns:
+            bool: 재수집을 시작했으면 True
+        """
+        if any(not w.is_done for w in self._workers):
+            logger.info("사양 수집 진행 중 → 재수집 요청 생략")
+            return False
+        scheduler = self._refresh_scheduler
+        if scheduler is None or self.current_specs is None:
+            self._start_revalidate()
+            return True
+
+        if not force and not scheduler.stale_categories():
+            logger.info("모든 카테고리가 TTL 이내 → 재수집 생략 | %s", scheduler.stats()["ages_s"])
+            return False
+        specs = dict(self.current_specs)
+        worker = SpecCollectWorker(lambda: scheduler.refresh(specs, force=force))
+        worker.signals.finished.connect(self.on_revalidate_finished)
+        worker.signals.failed.connect(self.on_revalidate_failed)
+        self._start_worker(worker)
+        logger.info("백그라운드 선택 재수집 시작%s", "(전체)" if force else "")
+        return True
+
+    def on_hardware_changed(self, categories: tuple):
+        """
+        하드웨어 변경 알림 핸들러 (GUI 스레드)
+
+        변경된 카테고리를 TTL과 관계없이 만료시키고 재수집한다.
+        다른 수집이 진행 중이면 그 결과가 변경 이전 값일 수 있으므로 끝난 뒤 다시 시도한다.
+
+        Args:
+            categories: 변경된 카테고리 (SPEC_CATEGORIES 중 일부)
+        """
+        if self._closing:
+            return
+        logger.info("하드웨어 변경 감지 | %s", ", ".join(categories))
+        self._pending_hardware_changes.update(categories)
+        self._apply_hardware_changes()
+
+    def _apply_hardware_changes(self) -> None:
+        """
+        쌓인 하드웨어 변경 카테고리로 재수집을 시작한다. (수집 중이면 HARDWARE_CHANGE_RETRY_MS 후 재시도)
+        """
+        if self._closing or not self._pending_hardware_changes:
+            return
+        if any(not w.is_done for w in self._workers):
+            QTimer.singleShot(HARDWARE_CHANGE_RETRY_MS, self._apply_hardware_changes)
+            return
+        categories = tuple(self._pending_hardware_changes)
+        self._pending_hardware_changes.clear()
+        if self._refresh_scheduler is not None:
+            self._refresh_scheduler.invalidate(categories)
+        self.refresh_specs()
+
+    def _mark_collected(self, specs: dict) -> None:
+        """
+        전체 수집 결과를 받았음을 재수집 스케줄러에 기록한다. (스케줄러가 없으면 무시)
+
+        Args:
+            specs: 전체 수집 결과
+        """
+        if self._refresh_scheduler is not None:
+            self._refresh_scheduler.mark_collected(specs)
+
+    def _start_revalidate(self):
+        """
+        백그라운드 스레드에서 사양을 재수집한다.
+
+        수집기가 refresh()를 제공하면 캐시를 거치지 않고 새로 수집한다.
+        결과는 on_revalidate_finished()/on_revalidate_failed()로 전달된다.
+        """
+        collect = getattr(self._spec_collector, "refresh", None) or self._spec_collector.collect_all_specs
+
+        def refresh() -> dict:
+            specs = collect()
+            self._mark_collected(specs)
+            return specs
+
+        worker = SpecCollectWorker(refresh)
+        worker.signals.finished.connect(self.on_revalidate_finished)
+        worker.signals.failed.connect(self.on_revalidate_failed)
+        self._start_worker(worker)
+        logger.info("백그라운드 사양 재수집 시작")
+
+    def on_revalidate_finished(self, specs: dict):
+        """
+        백그라운드 재수집 완료 핸들러
+
+        표시 중인 사양과 다를 때만 다시 렌더링하고 갱신 표시를 띄운다.
+        시간 초과된 카테고리는 표시 중인 캐시 값을 유지한다.
+
+        Args:
+            specs: 새로 수집한 사양 딕셔너리
+        """
+        if self._closing:
+            return
+        timed_out = specs.get(TIMED_OUT_KEY)
+        if timed_out and self.current_specs:
+            specs = dict(specs)
+            del specs[TIMED_OUT_KEY]
+            for category in timed_out:
+                merge_category_result(specs, category, category_value(self.current_specs, category))
+            logger.info("백그라운드 재수집 시간 초과 카테고리는 캐시 값 유지 | %s", ", ".join(timed_out))
+        if specs == self.current_specs:
+            logger.info("백그라운드 재수집 완료 | 변경 없음")
+            return
+
+        self.current_specs = specs
+        self.render_specs(specs)
+        self.view.show_updated_indicator()
+        logger.info("백그라운드 재수집 완료 | 변경 사항 반영")
+
+    def on_revalidate_failed(self, exc: Exception):
+        """
+        백그라운드 재수집 실패 핸들러
+
+        캐시 사양이 이미 표시되어 있으므로 사용자에게 오류 창을 띄우지 않고 기록만 한다.
+
+        Args:
+            exc: 발생한 예외
+        """
+        logger.warning("백그라운드 재수집 실패(캐시 사양 유지): %s", exc)
+
     def on_copy_specs_clicked(self):
         """
         PC 사양 복사 버튼 클릭 이벤트 핸들러
@@ -134,6 +523,7 @@ class Controller:
         try:
             html = self._spec_formatter.format_specs_html(specs)
             self.view.set_specs_html(html)
+            self.view.hide_loading_overlay()
             
             logger.info("사양 렌더링 완료")
         except Exception as e:
@@ -150,7 +540,8 @@ class Controller:
             exc: 발생한 예외
         """
         # 전체 스택 트레이스를 로거에 기록
-        logger.exception("오류 발생: %s", str(exc))
+        logger.exception("오류 발생: %s", str(exc), exc_info=exc)
+        self.view.hide_loading_overlay()
         
         # 사용자에게 오류 메시지 표시
         error_message = "PC 사양 수집 중 오류가 발생했습니다.\n\n"
@@ -0,0 +1,408 @@
+# 본 소스코드는 내부 사용 및 유지보수 목적에 한해 제공됩니다.
+# 무단 재배포 및 상업적 재사용은 허용되지 않습니다.
+# core/cached_collector.py
+
+"""
+디스크 캐시 기반 수집기 데코레이터
+마지막 수집 결과를 사용자 데이터 경로에 저장하고, 하드웨어 지문이 같으면 WMI 수집 없이 반환
+
+- 책임: 캐시 로드/저장(원자적 쓰기, 스키마 버전), 지문 계산, 히트/미스 집계
+- 비책임: 실제 수집 로직 (delegate ISpecCollector에 위임)
+- 사용처: main.py에서 CollectorWrapper를 감싸 Controller에 주입
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import platform
+import socket
+import time
+from pathlib import Path
+from typing import Iterator
+
+from core.interfaces import ISpecCollector
+from core.refresh_scheduler import collect_categories
+from core.spec_schema import (
+    SPEC_CATEGORIES,
+    TIMED_OUT,
+    TIMED_OUT_KEY,
+    category_value,
+    empty_specs,
+    merge_category_result,
+    restore_json_specs,
+)
+
+logger = logging.getLogger(__name__)
+
+# 캐시에 저장하는 표시 문자열이 바뀌는 변경마다 올림 (이전 빌드가 저장한 캐시는 읽지 않고 새로 수집)
+CACHE_SCHEMA_VERSION = 2
+CACHE_FILE_NAME = "specs.json"
+
+
+def _read_machine_id() -> str:
+    """
+    머신 고유 식별자를 반환한다.
+
+    Windows는 레지스트리 MachineGuid, 그 외는 /etc/machine-id를 사용하고
+    모두 실패하면 호스트 이름으로 대체한다.
+
+    Args:
+        없음
+
+    Returns:
+        str: 머신 식별 문자열
+    """
+    if platform.system() == "Windows":
+        try:
+            import winreg
+
+            key = winreg.OpenKey(
+                winreg.HKEY_LOCAL_MACHINE,
+                r"SOFTWARE\Microsoft\Cryptography",
+                0,
+                winreg.KEY_READ | getattr(winreg, "KEY_WOW64_64KEY", 0),
+            )
+            try:
+                value, _ = winreg.QueryValueEx(key, "MachineGuid")
+            finally:
+                winreg.CloseKey(key)
+            if value:
+                return str(value)
+        except Exception as e:
+            logger.debug(f"MachineGuid 조회 실패: {e}")
+    else:
+        try:
+            value = Path("/etc/machine-id").read_text(encoding="ascii").strip()
+            if value:
+                return value
+        except Exception as e:
+            logger.debug(f"machine-id 조회 실패: {e}")
+
+    return socket.gethostname()
+
+
+def compute_fingerprint() -> dict:
+    """
+    캐시 무효화 판단용 하드웨어 지문을 계산한다.
+
+    WMI를 사용하지 않는 저비용 값(부팅 시각, 머신 식별자, 총 RAM)만 사용한다.
+    psutil을 사용할 수 없으면 해당 값은 None으로 둔다.
+
+    Args:
+        없음
+
+    Returns:
+        dict: {"boot_time": int | None, "machine_id": str, "total_ram": int | None}
+    """
+    boot_time = None
+    total_ram = None
+    try:
+        import psutil
+
+        boot_time = int(round(psutil.boot_time()))
+        total_ram = int(psutil.virtual_memory().total)
+    except Exception as e:
+        logger.debug(f"psutil 기반 지문 계산 실패: {e}")
+
+    return {
+        "boot_time": boot_time,
+        "machine_id": _read_machine_id(),
+        "total_ram": total_ram,
+    }
+
+
+def _write_json_atomic(path: Path, payload: dict) -> None:
+    """
+    임시 파일에 기록한 뒤 교체하여 JSON을 원자적으로 저장한다.
+
+    Args:
+        path: 저장 경로
+        payload: 저장할 딕셔너리
+
+    Returns:
+        None
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    try:
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(payload, f, ensure_ascii=False)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(str(tmp_path), str(path))
+    finally:
+        if tmp_path.exists():
+            try:
+                tmp_path.unlink()
+            except OSError:
+                pass
+
+
+class CachedSpecCollector:
+    """
+    ISpecCollector 결과를 디스크에 캐시하는 데코레이터
+
+    - 책임: 지문이 같으면 캐시 반환, 다르면 delegate 수집 후 저장
+    - 비책임: 실제 수집 로직 (delegate에 위임)
+    - 사용처: main.py에서 Controller의 spec_collector로 주입
+    """
+
+    def __init__(self, delegate: ISpecCollector, cache_dir: Path, bypass: bool = False, publisher=None):
+        """
+        CachedSpecCollector 초기화
+
+        Args:
+            delegate: 실제 수집을 담당하는 ISpecCollector 구현체
+            cache_dir: 캐시 파일을 저장할 디렉토리
+            bypass: True이면 캐시를 읽지 않고 항상 새로 수집(저장은 수행)
+            publisher: 반환하는 사양을 메모리 매핑 파일에도 게시할 core.spec_snapshot.SnapshotPublisher
+        """
+        self._delegate = delegate
+        self._publisher = publisher
+        self._cache_path = Path(cache_dir) / CACHE_FILE_NAME
+        self._bypass = bypass
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def cache_path(self) -> Path:
+        """캐시 파일 경로"""
+        return self._cache_path
+
+    def collect_all_specs(self) -> dict:
+        """
+        모든 시스템 사양을 반환 (지문이 같으면 캐시, 아니면 새로 수집)
+
+        Returns:
+            dict: collect_all_specs() 반환 형식의 딕셔너리
+        """
+        started = time.perf_counter()
+        fingerprint = compute_fingerprint()
+
+        if not self._bypass:
+            specs = self._load(fingerprint)
+            if specs is not None:
+                self.hits += 1
+                logger.info(
+                    "사양 캐시 히트 | %.1fms | hits=%d misses=%d",
+                    (time.perf_counter() - started) * 1000, self.hits, self.misses,
+                )
+                self._publish(specs)
+                return specs
+
+        self.misses += 1
+        logger.info(
+            "사양 캐시 미스%s | hits=%d misses=%d",
+            "(우회)" if self._bypass else "", self.hits, self.misses,
+        )
+        return self._collect_and_store(fingerprint)
+
+    def collect(self, categories: tuple[str, ...] = SPEC_CATEGORIES) -> dict:
+        """
+        지정한 카테고리만 delegate로 새로 수집하고 캐시된 나머지 카테고리와 병합해 캐시를 갱신한다.
+
+        캐시가 없거나 지문이 다르면 병합할 기준이 없으므로 전체 수집일 때만 저장한다.
+        시간 초과된 카테고리는 캐시 값을 유지한다.
+
+        Args:
+            categories: 새로 수집할 카테고리 목록
+
+        Returns:
+            dict: collect_all_specs() 반환 형식의 딕셔너리 (지정하지 않은 카테고리의 값은 의미 없음)
+        """
+        fingerprint = compute_fingerprint()
+        fresh = collect_categories(self._delegate, categories)
+        if set(SPEC_CATEGORIES) <= set(categories):
+            self._save(fingerprint, fresh)
+            self._publish(fresh)
+            return fresh
+
+        cached = self._load(fingerprint)
+        if cached is None:
+            logger.info("선택 재수집 결과를 병합할 캐시 없음 → 저장 생략 | %s", ", ".join(categories))
+            return fresh
+        cached.pop(TIMED_OUT_KEY, None)
+        for category in categories:
+            value = category_value(fresh, category)
+            if value is not TIMED_OUT:
+                merge_category_result(cached, category, value)
+        self._save(fingerprint, cached)
+        self._publish(cached)
+        return fresh
+
+    def iter_category_results(self) -> Iterator[tuple[str, object]]:
+        """
+        카테고리별 결과를 반환한다. (캐시 히트 시 즉시, 미스 시 delegate 스트리밍)
+
+        delegate가 스트리밍을 지원하지 않으면 일괄 수집 후 카테고리별로 나누어 반환한다.
+        스트리밍이 끝까지 진행된 경우에만 캐시에 저장한다.
+
+        Yields:
+            tuple[str, object]: (카테고리, 수집 결과)
+        """
+        fingerprint = compute_fingerprint()
+        specs = None if self._bypass else self._load(fingerprint)
+        if specs is not None:
+            self.hits += 1
+            logger.info("사양 캐시 히트(스트리밍) | hits=%d misses=%d", self.hits, self.misses)
+        else:
+            self.misses += 1
+            logger.info("사양 캐시 미스(스트리밍) | hits=%d misses=%d", self.hits, self.misses)
+            stream = getattr(self._delegate, "iter_category_results", None)
+            if stream is None:
+                specs = self._collect_and_store(fingerprint)
+            else:
+                collected = empty_specs()
+                for category, value in stream():
+                    merge_category_result(collected, category, value)
+                    yield category, value
+                self._save(fingerprint, collected)
+                self._publish(collected)
+                return
+
+        self._publish(specs)
+        for category in SPEC_CATEGORIES:
+            yield category, category_value(specs, category)
+
+    def peek_cached_specs(self) -> dict | None:
+        """
+        지문과 무관하게 마지막으로 저장된 사양을 반환한다. (수집하지 않음)
+
+        stale-while-revalidate 시작 시 즉시 표시할 값으로 사용한다.
+        bypass 모드에서는 항상 None을 반환한다.
+
+        Returns:
+            dict | None: 마지막 저장 사양 또는 None
+        """
+        if self._bypass:
+            return None
+        payload = self._read_payload()
+        if payload is None:
+            return None
+        return restore_json_specs(payload["specs"])
+
+    def refresh(self) -> dict:
+        """
+        캐시를 무시하고 delegate로 새로 수집한 뒤 캐시를 갱신한다.
+
+        Returns:
+            dict: 새로 수집한 사양 딕셔너리
+        """
+        return self._collect_and_store(compute_fingerprint())
+
+    def invalidate(self) -> None:
+        """
+        캐시 파일을 삭제한다.
+
+        Returns:
+            None
+        """
+        try:
+            self._cache_path.unlink()
+            logger.info("사양 캐시 삭제: %s", self._cache_path)
+        except FileNotFoundError:
+            pass
+        except OSError as e:
+            logger.warning(f"사양 캐시 삭제 실패: {e}")
+
+    def _collect_and_store(self, fingerprint: dict) -> dict:
+        """
+        delegate로 수집하고 결과를 캐시에 저장한다.
+
+        Args:
+            fingerprint: 현재 하드웨어 지문
+
+        Returns:
+            dict: 수집된 사양 딕셔너리
+        """
+        specs = self._delegate.collect_all_specs()
+        self._save(fingerprint, specs)
+        self._publish(specs)
+        return specs
+
+    def _publish(self, specs: dict) -> None:
+        """
+        사양을 스냅샷 파일에 게시한다. (publisher가 없으면 무시, 실패해도 수집 결과에는 영향 없음)
+
+        Args:
+            specs: 게시할 사양 딕셔너리
+
+        Returns:
+            None
+        """
+        if self._publisher is None:
+            return
+        try:
+            self._publisher.publish(specs)
+        except (OSError, ValueError) as e:
+            logger.warning(f"사양 스냅샷 게시 실패: {e}")
+
+    def _read_payload(self) -> dict | None:
+        """
+        캐시 파일을 읽어 스키마 버전이 맞는 payload를 반환한다.
+
+        Returns:
+            dict | None: payload 또는 없음/손상/버전 불일치 시 None
+        """
+        try:
+            with open(self._cache_path, "r", encoding="utf-8") as f:
+                payload = json.load(f)
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            logger.warning(f"사양 캐시 읽기 실패(무시): {e}")
+            return None
+
+        if not isinstance(payload, dict) or payload.get("schema") != CACHE_SCHEMA_VERSION:
+            logger.info("사양 캐시 스키마 불일치 → 무시")
+            return None
+        if not isinstance(payload.get("specs"), dict):
+            return None
+        return payload
+
+    def _load(self, fingerprint: dict) -> dict | None:
+        """
+        지문이 일치하는 캐시 사양을 반환한다.
+
+        Args:
+            fingerprint: 현재 하드웨어 지문
+
+        Returns:
+            dict | None: 캐시 사양 또는 None
+        """
+        payload = self._read_payload()
+        if payload is None:
+            return None
+        if payload.get("fingerprint") != fingerprint:
+            logger.info("사양 캐시 지문 불일치 → 재수집")
+            return None
+        return restore_json_specs(payload["specs"])
+
+    def _save(self, fingerprint: dict, specs: dict) -> None:
+        """
+        수집 결과를 캐시 파일에 저장한다. 실패해도 수집 결과에는 영향이 없다.
+
+        시간 초과 카테고리가 있는 부분 결과는 다음 실행에서 재수집되도록 저장하지 않는다.
+
+        Args:
+            fingerprint: 현재 하드웨어 지문
+            specs: 저장할 사양 딕셔너리
+
+        Returns:
+            None
+        """
+        if specs.get(TIMED_OUT_KEY):
+            logger.info("부분 수집 결과는 캐시하지 않음 | 시간 초과: %s", ", ".join(specs[TIMED_OUT_KEY]))
+            return
+        payload = {
+            "schema": CACHE_SCHEMA_VERSION,
+            "saved_at": time.time(),
+            "fingerprint": fingerprint,
+            "specs": specs,
+        }
+        try:
+            _write_json_atomic(self._cache_path, payload)
+        except Exception as e:
+            logger.warning(f"사양 캐시 저장 실패: {e}")
@@ -6,17 +6,53 @@ from __future__ import annotations
 
 """
 시스템 사양 수집 모듈
-Windows WMI, platform, psutil을 사용하여 CPU/RAM/M/B/VGA/SSD/HDD 정보를 수집
+Windows WMI, DXGI, platform을 사용하여 CPU/RAM/M/B/VGA/SSD/HDD 정보를 수집
 
 - collect_all_specs()에서 모든 사양을 수집하여 딕셔너리로 반환
 - controller.py에서 호출되어 View에 표시될 데이터 제공
 - Windows 전용 WMI 사용 (wmi 모듈 필요)
+- wmi(pywin32)/DXGI 모듈은 import 시점이 아닌 최초 수집 시점에 로드 (콜드 스타트 단축)
+- Linux에서는 core.linux_backend(/proc, /sys)로 수집하며 SSD/HDD·섀시 분류 규칙은 공유
+- system_type/ram/mainboard는 SMBIOS 원시 테이블(core.smbios)을 우선 사용하고 실패 시 WMI로 폴백
+- WMI 연결은 core.wmi_pool에 (네임스페이스, 스레드) 단위로 보관해 수집 간에 재사용 (WMI_POOL_ENABLED)
+- 수집 경로는 타입 모델(core.spec_model)을 만들고, 기존 collect_*()/iter_category_results()/collect_all_specs()는
+  core.spec_model.to_category_result()로 표시 문자열 형식을 유지하는 어댑터
 """
 import logging
+import os
 import platform
-import psutil
-
-from core.ram_brand import resolve_ram_brand_display
+import queue
+import threading
+import time
+from contextlib import contextmanager
+from typing import Iterator
+
+from core.spec_model import (
+    DISK_KIND_HDD,
+    DISK_KIND_SSD,
+    CpuSpec,
+    DiskSpec,
+    GpuSpec,
+    MemoryModuleSpec,
+    RamSpec,
+    SystemSpecs,
+    to_category_result,
+)
+from core import wmi_pool
+from core.wmi_query import MemoizedWmiConnection, WmiQueryMemo, query_wmi
+from core.spec_schema import (
+    CATEGORY_CPU,
+    CATEGORY_MAINBOARD,
+    CATEGORY_RAM,
+    CATEGORY_STORAGE,
+    CATEGORY_SYSTEM_TYPE,
+    CATEGORY_VGA,
+    SPEC_CATEGORIES,
+    TIMED_OUT,
+    TIMED_OUT_KEY,
+    empty_specs,
+    merge_category_result,
+)
 
 logger = logging.getLogger(__name__)
 INFO_NOT_PROVIDED = "모듈 정보 미제공"
@@ -25,24 +61,11 @@ SYSTEM_TYPE_LAPTOP = "노트북"
 SYSTEM_TYPE_ALL_IN_ONE = "올인원 PC"
 SYSTEM_TYPE_UNKNOWN = "유형 미확정"
 
-try:
-    import wmi
-    WMI_AVAILABLE = True
-except ImportError:
-    WMI_AVAILABLE = False
-    logger.warning("wmi 모듈을 사용할 수 없습니다. 일부 정보 수집이 제한될 수 있습니다.")
-    
-# --- (추가) DXGI 기반 GPU/VRAM 수집 모듈 로드 (실패 시에도 안전) ---
-try:
-    # core 패키지로 import 되는 경우(정상)
-    from .gpu_dxgi import collect_gpu_dxgi_strings, is_dxgi_available
-    
-except Exception:
-    collect_gpu_dxgi_strings = None  # type: ignore
-    def is_dxgi_available() -> bool:  # fallback
-        return False
-    logger.info("DXGI 모듈을 사용할 수 없습니다. GPU VRAM은 WMI 방식으로 폴백됩니다.")
+# wmi 모듈은 _load_wmi()에서 최초 사용 시 로드 (None = 아직 확인 안 함)
+wmi = None
+WMI_AVAILABLE: bool | None = None
 
+DEFAULT_NAMESPACE = r"root\cimv2"
 STORAGE_NAMESPACE = r"root\Microsoft\Windows\Storage"
 MEDIA_TYPE_SSD = 4
 MEDIA_TYPE_HDD = 3
@@ -56,6 +79,78 @@ CHASSIS_TYPES_PORTABLE = {8, 9, 10, 14, 30, 31, 32}
 CHASSIS_TYPES_DESKTOP = {3, 4, 6, 7, 15, 16, 17}
 CHASSIS_TYPES_ALL_IN_ONE = {13}
 
+# collect_*()가 실제로 읽는 WMI 속성 (프로젝션 WQL SELECT 목록)
+ENCLOSURE_FIELDS = ("ChassisTypes",)
+COMPUTER_SYSTEM_FIELDS = ("PCSystemType", "PCSystemTypeEx")
+PROCESSOR_FIELDS = ("Name", "NumberOfCores", "NumberOfLogicalProcessors", "MaxClockSpeed")
+PHYSICAL_MEMORY_FIELDS = (
+    "Capacity", "Speed", "Manufacturer", "PartNumber",
+    "FormFactor", "DeviceLocator", "BankLabel",
+)
+BASEBOARD_FIELDS = ("Manufacturer", "Product", "Version")
+VIDEO_CONTROLLER_FIELDS = ("Name", "AdapterRAM", "AdapterCompatibility", "PNPDeviceID")
+# SeekPenalty/RotationRate는 MSFT_PhysicalDisk 속성이 아니므로 SELECT하지 않음 (getattr 폴백 유지)
+PHYSICAL_DISK_FIELDS = ("FriendlyName", "Model", "Size", "MediaType", "BusType")
+
+# SMBIOS 원시 테이블 우선 사용 여부 (system_type/ram/mainboard를 WMI 조회 없이 한 번의 읽기로 수집)
+SMBIOS_ENABLED = True
+SMBIOS_CATEGORIES = (CATEGORY_SYSTEM_TYPE, CATEGORY_RAM, CATEGORY_MAINBOARD)
+
+# WMI 연결 풀 사용 여부 (False면 수집마다 연결 생성, 병렬 수집 워커도 수집마다 새 스레드)
+WMI_POOL_ENABLED = True
+
+# 카테고리별 스레드 병렬 수집 사용 여부 기본값 (False면 기존 순차 수집)
+PARALLEL_COLLECTION_DEFAULT = True
+
+# 카테고리별 수집 제한 시간(초) — 초과 시 TIMED_OUT으로 보고하고 나머지 카테고리는 계속 표시
+CATEGORY_TIMEOUT_S = 10.0
+# 카테고리별 개별 제한 시간 (Storage 네임스페이스는 드라이버 상태에 따라 느린 경우가 많음)
+CATEGORY_TIMEOUTS_S = {
+    CATEGORY_STORAGE: 20.0,
+}
+# 수집 1회 전체 제한 시간(초)
+SWEEP_DEADLINE_S = 30.0
+
+
+def _load_wmi() -> bool:
+    """
+    wmi 모듈(pywin32 포함)을 최초 호출 시 한 번만 로드한다.
+
+    Args:
+        없음
+
+    Returns:
+        bool: wmi 모듈 사용 가능 여부
+    """
+    global wmi, WMI_AVAILABLE
+    if WMI_AVAILABLE is None:
+        try:
+            import wmi as wmi_module
+            wmi = wmi_module
+            WMI_AVAILABLE = True
+        except ImportError:
+            WMI_AVAILABLE = False
+            logger.warning("wmi 모듈을 사용할 수 없습니다. 일부 정보 수집이 제한될 수 있습니다.")
+    return WMI_AVAILABLE
+
+
+def _load_dxgi():
+    """
+    DXGI 기반 GPU/VRAM 수집 모듈을 최초 호출 시 로드한다. (실패 시에도 안전)
+
+    Args:
+        없음
+
+    Returns:
+        module | None: core.gpu_dxgi 모듈 또는 로드 실패 시 None
+    """
+    try:
+        from core import gpu_dxgi
+        return gpu_dxgi
+    except Exception:
+        logger.info("DXGI 모듈을 사용할 수 없습니다. GPU VRAM은 WMI 방식으로 폴백됩니다.")
+        return None
+
 
 def _is_windows_wmi_available() -> bool:
     """
@@ -67,42 +162,23 @@ def _is_windows_wmi_available() -> bool:
     Returns:
         bool: Windows이며 WMI 사용 가능 시 True
     """
-    return platform.system() == "Windows" and WMI_AVAILABLE
+    return platform.system() == "Windows" and _load_wmi()
 
 
-def _is_portable_system(wmi_conn=None) -> bool:
+def _is_linux_backend_available() -> bool:
     """
-    휴대형 시스템 여부를 반환한다.
+    Linux procfs/sysfs 수집 백엔드 사용 가능 여부를 반환한다.
 
     Args:
-        wmi_conn: WMI 연결 객체 (None이면 새로 생성)
+        없음
 
     Returns:
-        bool: 노트북/태블릿 등 휴대형이면 True
+        bool: Linux이며 /proc을 읽을 수 있으면 True
     """
-    if not _is_windows_wmi_available():
+    if platform.system() != "Linux":
         return False
-
-    try:
-        if wmi_conn is None:
-            wmi_conn = wmi.WMI()
-
-        enclosures = wmi_conn.Win32_SystemEnclosure()
-        if enclosures:
-            chassis_types = enclosures[0].ChassisTypes or []
-            if any(ct in CHASSIS_TYPES_PORTABLE for ct in chassis_types):
-                return True
-
-        systems = wmi_conn.Win32_ComputerSystem()
-        if systems:
-            pc_system_type = int(getattr(systems[0], "PCSystemType", 0) or 0)
-            pc_system_type_ex = int(getattr(systems[0], "PCSystemTypeEx", 0) or 0)
-            if pc_system_type in (2, 8) or pc_system_type_ex in (2, 8):
-                return True
-    except Exception as e:
-        logger.warning(f"휴대형 시스템 판별 실패: {e}")
-
-    return False
+    from core import linux_backend
+    return linux_backend.is_available()
 
 
 def _is_replaceable_ram(mem) -> bool:
@@ -137,6 +213,31 @@ def _is_replaceable_ram(mem) -> bool:
     return False
 
 
+def _classify_chassis_types(chassis_types: list[int]) -> str | None:
+    """
+    SMBIOS 섀시 유형 목록으로 시스템 유형을 판별한다.
+
+    서로 다른 그룹(올인원/휴대형/데스크탑)이 섞여 있으면 판별하지 않는다.
+
+    Args:
+        chassis_types: 섀시 유형 코드 목록
+
+    Returns:
+        str | None: 시스템 유형 문자열 또는 판별 불가 시 None
+    """
+    has_aio = any(ct in CHASSIS_TYPES_ALL_IN_ONE for ct in chassis_types)
+    has_portable = any(ct in CHASSIS_TYPES_PORTABLE for ct in chassis_types)
+    has_desktop = any(ct in CHASSIS_TYPES_DESKTOP for ct in chassis_types)
+
+    if has_aio and not (has_portable or has_desktop):
+        return SYSTEM_TYPE_ALL_IN_ONE
+    if has_portable and not (has_aio or has_desktop):
+        return SYSTEM_TYPE_LAPTOP
+    if has_desktop and not (has_aio or has_portable):
+        return SYSTEM_TYPE_DESKTOP
+    return None
+
+
 def collect_system_type(wmi_conn=None, wmi_available: bool | None = None) -> str | None:
     """
     시스템 유형(데스크탑/노트북/올인원 PC)을 판별한다.
@@ -165,25 +266,18 @@ def collect_system_type(wmi_conn=None, wmi_available: bool | None = None) -> str
 
         chassis_types: list[int] = []
         try:
-            enclosures = wmi_conn.Win32_SystemEnclosure()
+            enclosures = query_wmi(wmi_conn, "Win32_SystemEnclosure", ENCLOSURE_FIELDS)
             if enclosures:
                 chassis_types = list(enclosures[0].ChassisTypes or [])
         except Exception as e:
             logger.warning(f"SystemEnclosure 조회 실패: {e}")
 
         if chassis_types:
-            has_aio = any(ct in CHASSIS_TYPES_ALL_IN_ONE for ct in chassis_types)
-            has_portable = any(ct in CHASSIS_TYPES_PORTABLE for ct in chassis_types)
-            has_desktop = any(ct in CHASSIS_TYPES_DESKTOP for ct in chassis_types)
-
-            if has_aio and not (has_portable or has_desktop):
-                return SYSTEM_TYPE_ALL_IN_ONE
-            if has_portable and not (has_aio or has_desktop):
-                return SYSTEM_TYPE_LAPTOP
-            if has_desktop and not (has_aio or has_portable):
-                return SYSTEM_TYPE_DESKTOP
+            system_type = _classify_chassis_types(chassis_types)
+            if system_type:
+                return system_type
         else:
-            systems = wmi_conn.Win32_ComputerSystem()
+            systems = query_wmi(wmi_conn, "Win32_ComputerSystem", COMPUTER_SYSTEM_FIELDS)
             if systems:
                 pc_system_type = int(getattr(systems[0], "PCSystemType", 0) or 0)
                 pc_system_type_ex = int(getattr(systems[0], "PCSystemTypeEx", 0) or 0)
@@ -197,19 +291,53 @@ def collect_system_type(wmi_conn=None, wmi_available: bool | None = None) -> str
     return SYSTEM_TYPE_UNKNOWN
 
 
+def _positive_int(value) -> int | None:
+    """
+    양의 정수로 변환한다. (없음/0/음수/파싱 불가면 None)
+    """
+    try:
+        number = int(value)
+    except (TypeError, ValueError):
+        return None
+    return number if number > 0 else None
+
+
+def _sum_positive(rows, field: str) -> int | None:
+    """
+    여러 행(소켓별 Win32_Processor 등)의 양의 정수 속성을 합산한다. (값이 하나도 없으면 None)
+    """
+    values = [v for v in (_positive_int(getattr(row, field, None)) for row in rows) if v is not None]
+    return sum(values) if values else None
+
+
 def collect_cpu(wmi_conn=None, wmi_available: bool | None = None) -> str | None:
+    """
+    CPU 정보 수집 (collect_cpu_spec()의 표시 문자열 어댑터)
+
+    Args:
+        wmi_conn: WMI 연결 객체 (None이면 새로 생성, 성능 최적화를 위해 재사용 권장)
+        wmi_available: WMI 사용 가능 여부(미지정 시 내부에서 판별)
+
+    Returns:
+        str | None: CPU 이름 또는 실패 시 None
+    """
+    return to_category_result(CATEGORY_CPU, collect_cpu_spec(wmi_conn, wmi_available))
+
+
+def collect_cpu_spec(wmi_conn=None, wmi_available: bool | None = None) -> CpuSpec | None:
     """
     CPU 정보 수집
     
     Windows에서는 WMI Win32_Processor를 사용하고
     실패 시 platform.processor()를 fallback으로 사용
+    코어/스레드 수는 소켓별 값을 합산하고, 최대 클럭은 첫 번째 프로세서 값을 사용
     
     Args:
         wmi_conn: WMI 연결 객체 (None이면 새로 생성, 성능 최적화를 위해 재사용 권장)
         wmi_available: WMI 사용 가능 여부(미지정 시 내부에서 판별)
     
     Returns:
-        str | None: CPU 이름 또는 실패 시 None
+        CpuSpec | None: CPU 모델 또는 실패 시 None
     """
     try:
         if wmi_available is None:
@@ -219,17 +347,24 @@ def collect_cpu(wmi_conn=None, wmi_available: bool | None = None) -> str | None:
             wmi_attempted = True
             if wmi_conn is None:
                 wmi_conn = wmi.WMI()
-            processors = wmi_conn.Win32_Processor()
+            processors = query_wmi(wmi_conn, "Win32_Processor", PROCESSOR_FIELDS)
             if processors:
                 cpu_name = (processors[0].Name or "").strip()
                 if cpu_name:
-                    return cpu_name
+                    return CpuSpec(
+                        name=cpu_name,
+                        cores=_sum_positive(processors, "NumberOfCores"),
+                        threads=_sum_positive(processors, "NumberOfLogicalProcessors"),
+                        max_clock_mhz=_positive_int(getattr(processors[0], "MaxClockSpeed", None)),
+                    )
             if wmi_attempted:
                 logger.info("CPU: WMI 응답은 있으나 이름 미제공")
-                return INFO_NOT_PROVIDED
+                return CpuSpec(name=INFO_NOT_PROVIDED, cores=None, threads=None, max_clock_mhz=None)
         logger.debug("CPU: WMI 값을 얻지 못해 platform.processor()로 대체")
         cpu_name = platform.processor()
-        return cpu_name.strip() if cpu_name and cpu_name.strip() else None
+        if not cpu_name or not cpu_name.strip():
+            return None
+        return CpuSpec(name=cpu_name.strip(), cores=None, threads=os.cpu_count(), max_clock_mhz=None)
     except Exception as e:
         logger.exception("CPU 정보 수집 실패")
         return None
@@ -237,7 +372,7 @@ def collect_cpu(wmi_conn=None, wmi_available: bool | None = None) -> str | None:
 
 def collect_ram(wmi_conn=None, wmi_available: bool | None = None) -> tuple[str, list[str]] | None:
     """
-    RAM 정보 수집
+    RAM 정보 수집 (collect_ram_spec()의 표시 문자열 어댑터)
     
     Windows WMI Win32_PhysicalMemory를 사용하여 교체형 메모리 모듈의
     용량, 제조사, 속도 수집
@@ -258,65 +393,98 @@ def collect_ram(wmi_conn=None, wmi_available: bool | None = None) -> tuple[str,
             실패: None
         }
     """
-    ram_list : list[str] = []
-    total_gb : float = 0.0
-    wmi_total_gb : float = 0.0
-    replaceable_seen = False
+    return to_category_result(CATEGORY_RAM, collect_ram_spec(wmi_conn, wmi_available))
+
+
+def collect_ram_spec(wmi_conn=None, wmi_available: bool | None = None) -> RamSpec | None:
+    """
+    Win32_PhysicalMemory로 RAM 모델을 수집한다.
+
+    Args:
+        wmi_conn: WMI 연결 객체 (None이면 새로 생성, 성능 최적화를 위해 재사용 권장)
+        wmi_available: WMI 사용 가능 여부(미지정 시 내부에서 판별)
+
+    Returns:
+        RamSpec | None: RAM 모델 또는 실패 시 None
+    """
     if wmi_available is None:
         wmi_available = _is_windows_wmi_available()
-    wmi_attempted = False
         
     try:
-        if wmi_available:
-            wmi_attempted = True
-            if wmi_conn is None:
-                wmi_conn = wmi.WMI()
-            memory_modules = wmi_conn.Win32_PhysicalMemory() or []
-            
-            for mem in memory_modules:
-                try:
-                    size_bytes = int(mem.Capacity or 0)
-                    if size_bytes > 0:
-                        wmi_total_gb += size_bytes / (1024 ** 3)
-                    if not _is_replaceable_ram(mem):
-                        continue
-                    replaceable_seen = True
-                    if size_bytes <= 0:
-                        continue
-                    size_gb = size_bytes / (1024 ** 3)
-                    speed = mem.Speed or "알 수 없음"
-                    manufacturer = mem.Manufacturer or ""
-                    part_number = mem.PartNumber or ""
-                    brand_display = resolve_ram_brand_display(manufacturer, part_number)
-
-                    ram_list.append(f"{brand_display} {speed}MHz {size_gb:.0f}GB")
-                    
-                    total_gb += size_gb
-                    
-                except Exception as e:
-                    logger.warning(f"RAM 모듈 정보 수집 중 오류: {e}")
-                    continue
-        total_gb = wmi_total_gb
-        if total_gb <= 0:
+        if not wmi_available:
             return None
+        if wmi_conn is None:
+            wmi_conn = wmi.WMI()
+        memory_modules = query_wmi(wmi_conn, "Win32_PhysicalMemory", PHYSICAL_MEMORY_FIELDS)
+        return _build_ram_spec(memory_modules)
+    except Exception:
+        logger.exception("RAM 수집 전체 실패")
+        return None
 
-        if not wmi_attempted:
-            logger.info("RAM: WMI 미사용 → 총 용량만 반환")
-            return f"{total_gb:.0f}GB", ["모듈 정보 미제공"]
 
-        if replaceable_seen and not ram_list:
-            logger.info("RAM: 교체형 모듈 정보 없음 → 모듈 정보 미제공 표시")
-            return f"{total_gb:.0f}GB", ["모듈 정보 미제공"]
+def _build_ram_spec(memory_modules) -> RamSpec | None:
+    """
+    메모리 모듈 목록으로 RAM 모델을 만든다.
 
-        if not replaceable_seen:
-            logger.info("RAM: 교체형 모듈 없음 → 총 용량만 반환")
-            return f"{total_gb:.0f}GB", []
+    용량이 0인 교체형 모듈도 목록에 남겨 "교체형은 있으나 모듈 정보 없음"을 구분할 수 있게 한다.
 
-        return f"{total_gb:.0f}GB", ram_list
-    except Exception:
-        logger.exception("RAM 수집 전체 실패")
+    Args:
+        memory_modules: Capacity/Speed/Manufacturer/PartNumber/FormFactor/DeviceLocator/BankLabel
+            속성을 가진 객체 목록 (Win32_PhysicalMemory 또는 SMBIOS Type 17)
+
+    Returns:
+        RamSpec | None: RAM 모델 (총 용량이 0이면 None)
+    """
+    modules: list[MemoryModuleSpec] = []
+    total_bytes = 0
+
+    for mem in memory_modules:
+        try:
+            size_bytes = int(mem.Capacity or 0)
+            if size_bytes > 0:
+                total_bytes += size_bytes
+            modules.append(MemoryModuleSpec(
+                manufacturer=mem.Manufacturer or "",
+                part_number=mem.PartNumber or "",
+                capacity_bytes=max(size_bytes, 0),
+                speed_mhz=_positive_int(mem.Speed),
+                form_factor=int(getattr(mem, "FormFactor", 0) or 0),
+                replaceable=_is_replaceable_ram(mem),
+            ))
+        except Exception as e:
+            logger.warning(f"RAM 모듈 정보 수집 중 오류: {e}")
+            continue
+
+    if total_bytes <= 0:
         return None
 
+    ram = RamSpec(total_bytes=total_bytes, modules=tuple(modules), modules_known=True)
+    replaceable = ram.replaceable_modules
+    if not replaceable:
+        logger.info("RAM: 교체형 모듈 없음 → 총 용량만 반환")
+    elif not any(m.capacity_bytes > 0 for m in replaceable):
+        logger.info("RAM: 교체형 모듈 정보 없음 → 모듈 정보 미제공 표시")
+    return ram
+
+
+def _format_baseboard(manufacturer: str, product: str, version: str) -> str:
+    """
+    메인보드 표시 문자열을 만든다. 버전이 "x.x" 같은 기본값이면 생략한다.
+
+    Args:
+        manufacturer: 제조사
+        product: 제품명
+        version: 버전
+
+    Returns:
+        str: 메인보드 표시 문자열
+    """
+    if version and version.strip() and version.strip() != "x.x":
+        return f"{manufacturer} {product} {version}".strip()
+    logger.debug("M/B: Version이 기본값(x.x)이라 생략")
+    return f"{manufacturer} {product}".strip()
+
+
 def collect_baseboard(wmi_conn=None, wmi_available: bool | None = None) -> str | None:
     """
     메인보드 정보 수집
@@ -337,16 +505,13 @@ def collect_baseboard(wmi_conn=None, wmi_available: bool | None = None) -> str |
         if wmi_available:
             if wmi_conn is None:
                 wmi_conn = wmi.WMI()
-            boards = wmi_conn.Win32_BaseBoard()
+            boards = query_wmi(wmi_conn, "Win32_BaseBoard", BASEBOARD_FIELDS)
             if boards:
-                manufacturer = boards[0].Manufacturer or ""
-                product = boards[0].Product or ""
-                version = boards[0].Version or ""
-                if version and version.strip() and version.strip() != "x.x":
-                    return f"{manufacturer} {product} {version}".strip()
-                else:
-                    logger.debug("M/B: Version이 기본값(x.x)이라 생략")
-                    return f"{manufacturer} {product}".strip()
+                return _format_baseboard(
+                    boards[0].Manufacturer or "",
+                    boards[0].Product or "",
+                    boards[0].Version or "",
+                )
             else:
                 logger.info("M/B: Win32_BaseBoard 결과가 비어있음")
                 
@@ -357,7 +522,94 @@ def collect_baseboard(wmi_conn=None, wmi_available: bool | None = None) -> str |
     return None
 
 
+def _parse_pnp_device_id(pnp_device_id) -> tuple | None:
+    """
+    Win32_VideoController.PNPDeviceID에서 PCI ID를 추출한다. (PCI 장치가 아니면 None)
+    """
+    from core import pci_ids
+
+    return pci_ids.parse_pnp_device_id(str(pnp_device_id) if pnp_device_id else None)
+
+
+def _pci_device_name(pci: tuple | None) -> str | None:
+    """
+    PCI ID로 GPU 장치 이름을 조회한다. (Name이 비어 있을 때만 사용, 색인 미등록이면 None)
+    """
+    if pci is None:
+        return None
+    from core import pci_ids
+
+    return pci_ids.gpu_device_name(*pci)
+
+
+def _pci_vendor_name(pci: tuple) -> str:
+    """
+    PCI ID로 GPU 벤더 이름을 조회한다. (AdapterCompatibility가 비어 있을 때만 사용)
+    """
+    from core import pci_ids
+
+    return pci_ids.gpu_vendor_name(pci[0])
+
+
 def collect_gpu(wmi_conn=None, wmi_available: bool | None = None) -> list[str] | None:
+    """
+    GPU 정보 수집 (collect_gpu_specs()의 표시 문자열 어댑터)
+
+    Args:
+        wmi_conn: WMI 연결 객체 (None이면 새로 생성, DXGI 실패 시 WMI fallback에서 사용)
+        wmi_available: WMI 사용 가능 여부(미지정 시 내부에서 판별)
+
+    Returns:
+        list[str] | None: GPU 정보 문자열 리스트 또는 실패 시 None
+            예: ["NVIDIA GeForce RTX 3050 (6GB / NVIDIA)", "Intel UHD Graphics (Intel)"]
+    """
+    return to_category_result(CATEGORY_VGA, collect_gpu_specs(wmi_conn, wmi_available))
+
+
+def _gpu_spec_from_wmi_row(gpu) -> GpuSpec:
+    """
+    Win32_VideoController 행을 GPU 모델로 변환한다.
+
+    AdapterRAM은 32비트라 4GB 이상에서 잘리거나 음수일 수 있으므로
+    1GB 미만/음수는 로그만 남기고 그대로 두며, 표기 여부는 표시 규칙(core.gpu_format)이 결정한다.
+    """
+    pci = _parse_pnp_device_id(getattr(gpu, "PNPDeviceID", None))
+    name = (gpu.Name or "").strip() or _pci_device_name(pci) or INFO_NOT_PROVIDED
+    adapter_ram = gpu.AdapterRAM or 0
+    if not adapter_ram:
+        logger.info(f"GPU: AdapterRAM 미제공/0 | Name={name}")
+    elif adapter_ram < (1024 ** 3):
+        logger.info(f"GPU: AdapterRAM 비정상 값 | {adapter_ram} | Name={name}")
+
+    manufacturer = ""
+    if hasattr(gpu, 'AdapterCompatibility') and gpu.AdapterCompatibility:
+        manufacturer = str(gpu.AdapterCompatibility).strip()
+    elif pci is not None:
+        manufacturer = _pci_vendor_name(pci)
+
+    return GpuSpec(
+        name=name,
+        vendor=manufacturer,
+        dedicated_vram_bytes=max(int(adapter_ram), 0),
+        vendor_id=pci[0] if pci is not None else 0,
+        device_id=pci[1] if pci is not None else 0,
+    )
+
+
+def _gpu_spec_from_dxgi(gpu) -> GpuSpec:
+    """
+    DXGI 어댑터 정보를 GPU 모델로 변환한다.
+    """
+    return GpuSpec(
+        name=gpu.name,
+        vendor=gpu.vendor,
+        dedicated_vram_bytes=gpu.dedicated_vram_bytes,
+        vendor_id=gpu.vendor_id,
+        device_id=gpu.device_id,
+    )
+
+
+def collect_gpu_specs(wmi_conn=None, wmi_available: bool | None = None) -> tuple[GpuSpec, ...] | None:
     """
     GPU 정보 수집
 
@@ -373,87 +625,198 @@ def collect_gpu(wmi_conn=None, wmi_available: bool | None = None) -> list[str] |
         wmi_available: WMI 사용 가능 여부(미지정 시 내부에서 판별)
 
     Returns:
-        list[str] | None: GPU 정보 문자열 리스트 또는 실패 시 None
-            예: ["NVIDIA GeForce RTX 3050 (6.0GB / NVIDIA)", "Intel UHD Graphics (Intel)"]
+        tuple[GpuSpec, ...] | None: GPU 모델 튜플 (DXGI는 전용 VRAM 내림차순, WMI는 조회 순서)
+            - WMI 조회는 되었으나 GPU 정보 없음: 빈 튜플
+            - 실패: None
     """
     if wmi_available is None:
         wmi_available = _is_windows_wmi_available()
     wmi_attempted = False
 
     # --- 1) DXGI 우선 ---
-    if (
-        platform.system() == "Windows"
-        and is_dxgi_available()
-        and collect_gpu_dxgi_strings is not None
-    ):
+    gpu_dxgi = _load_dxgi() if platform.system() == "Windows" else None
+    if gpu_dxgi is not None and gpu_dxgi.is_dxgi_available():
         try:
-            dxgi_list = collect_gpu_dxgi_strings(logger=logger)
+            dxgi_list = gpu_dxgi.collect_gpu_dxgi_physical(logger=logger)
             if dxgi_list:
-                return dxgi_list
+                return tuple(_gpu_spec_from_dxgi(g) for g in dxgi_list)
         except Exception:
             # DXGI가 어떤 이유로든 실패하면 WMI로 폴백
             logger.exception("GPU: DXGI 수집 실패. WMI로 폴백합니다.")
     
     # --- 2) WMI fallback ---
-    gpu_list: list[str] = []
+    gpu_list: list[GpuSpec] = []
     try:
         if wmi_available:
             wmi_attempted = True
             if wmi_conn is None:
                 wmi_conn = wmi.WMI()
-            gpus = wmi_conn.Win32_VideoController()
+            gpus = query_wmi(wmi_conn, "Win32_VideoController", VIDEO_CONTROLLER_FIELDS)
             logger.info(f"GPU: Win32_VideoController {len(gpus)}개 감지")
-            
-            if not gpus:
-                return [INFO_NOT_PROVIDED]
 
             for gpu in gpus:
                 try:
-                    name = (gpu.Name or "").strip() or INFO_NOT_PROVIDED
-                    adapter_ram = gpu.AdapterRAM or 0
-                    if adapter_ram:
-                        if adapter_ram <= 0 or adapter_ram < (1024 ** 3):
-                            logger.info(f"GPU: AdapterRAM 비정상 값 | {adapter_ram} | Name={name}")
-                            memory_str = ""
-                        else:
-                            memory_gb = adapter_ram / (1024 ** 3)
-                            memory_str = f"{memory_gb:.0f}GB"
-                    else:
-                        logger.info(f"GPU: AdapterRAM 미제공/0 | Name={name}")
-                        memory_str = ""
-                    
-                    manufacturer = ""
-                    if hasattr(gpu, 'AdapterCompatibility') and gpu.AdapterCompatibility:
-                        manufacturer = str(gpu.AdapterCompatibility).strip()
-                    
-                    if memory_str and manufacturer:
-                        gpu_str = f"{name} ({memory_str} / {manufacturer})"
-                    elif memory_str:
-                        gpu_str = f"{name} ({memory_str})"
-                    elif manufacturer:
-                        gpu_str = f"{name} ({manufacturer})"
-                    else:
-                        gpu_str = name
-                    
-                    gpu_list.append(gpu_str)
+                    gpu_list.append(_gpu_spec_from_wmi_row(gpu))
                 except Exception as e:
                     logger.warning(f"GPU 정보 수집 중 오류: {e}")
                     continue
     except Exception as e:
         logger.exception("GPU 정보 수집 실패")
     
-    if gpu_list:
-        return gpu_list
-    if wmi_attempted:
-        return [INFO_NOT_PROVIDED]
+    if gpu_list or wmi_attempted:
+        return tuple(gpu_list)
     return None
 
 
+def _int_or_none(value) -> int | None:
+    """
+    정수로 변환한다. (없음/파싱 불가면 None)
+    """
+    try:
+        return int(value) if value is not None else None
+    except (TypeError, ValueError):
+        return None
+
+
+def _build_disk_specs(disks) -> tuple[DiskSpec, ...]:
+    """
+    디스크 목록을 SSD/HDD로 분류한 디스크 모델로 만든다.
+
+    MediaType으로 SSD(4)/HDD(3)를 우선 구분하고,
+    Unknown(0)/None이면 BusType/SeekPenalty/RotationRate로 보조 판단한다.
+    분류할 수 없는 디스크는 오분류 방지를 위해 표시에서 제외한다.
+
+    Args:
+        disks: FriendlyName/Model/Size/MediaType/BusType/SeekPenalty/RotationRate 속성을 가진 객체 목록
+
+    Returns:
+        tuple[DiskSpec, ...]: 디스크 모델 튜플 (분류 불가 디스크는 kind=None)
+    """
+    specs: list[DiskSpec] = []
+    ssd_count = 0
+    hdd_count = 0
+    unknown_list: list[str] = []
+
+    for disk in disks:
+        try:
+            name = getattr(disk, "FriendlyName", None) or getattr(disk, "Model", None) or "알 수 없음"
+            name = str(name).strip() if name else "알 수 없음"
+
+            size = getattr(disk, "Size", None)
+            size_bytes = int(size) if size is not None else 0
+            storage_str = f"{name} ({size_bytes / BYTES_PER_GB:.2f}GB)"
+
+            media_type = getattr(disk, "MediaType", None)
+            bus_type = getattr(disk, "BusType", None)
+
+            def _spec(kind):
+                return DiskSpec(
+                    name=name,
+                    size_bytes=size_bytes,
+                    kind=kind,
+                    media_type=_int_or_none(media_type),
+                    bus_type=_int_or_none(bus_type),
+                )
+
+            if media_type == MEDIA_TYPE_SSD:
+                specs.append(_spec(DISK_KIND_SSD))
+                ssd_count += 1
+                logger.info(f"디스크 ({name}): MediaType={MEDIA_TYPE_SSD} → SSD")
+                continue
+
+            if media_type == MEDIA_TYPE_HDD:
+                specs.append(_spec(DISK_KIND_HDD))
+                hdd_count += 1
+                logger.info(f"디스크 ({name}): MediaType={MEDIA_TYPE_HDD} → HDD")
+                continue
+
+            if media_type in (MEDIA_TYPE_UNKNOWN, None):
+                seek_penalty = getattr(disk, "SeekPenalty", None)
+                rotation_rate = getattr(disk, "RotationRate", None)
+
+                is_ssd: bool | None = None
+
+                if bus_type == BUS_TYPE_NVME:
+                    is_ssd = True
+                    logger.info(f"디스크 ({name}): MediaType={media_type}, BusType=NVMe → SSD")
+
+                if is_ssd is None and seek_penalty is False:
+                    is_ssd = True
+                    logger.info(f"디스크 ({name}): MediaType={media_type}, SeekPenalty=False → SSD")
+
+                if is_ssd is None and rotation_rate is not None:
+                    try:
+                        rotation_rate_int = int(rotation_rate)
+                        if rotation_rate_int >= ROTATION_RATE_HDD_THRESHOLD:
+                            is_ssd = False
+                            logger.info(
+                                f"디스크 ({name}): MediaType={media_type}, RotationRate={rotation_rate_int} → HDD"
+                            )
+                    except (ValueError, TypeError) as e:
+                        logger.debug(
+                            f"RotationRate 파싱 실패: {rotation_rate} ({type(rotation_rate)}): {e}"
+                        )
+
+                if is_ssd is True:
+                    specs.append(_spec(DISK_KIND_SSD))
+                    ssd_count += 1
+                    continue
+                if is_ssd is False:
+                    specs.append(_spec(DISK_KIND_HDD))
+                    hdd_count += 1
+                    continue
+
+                specs.append(_spec(None))
+                unknown_list.append(storage_str)
+                logger.debug(
+                    f"디스크 분류 불가(표시 제외): {storage_str}"
+                    f"MediaType={media_type}, BusType={bus_type}, SeekPenalty={seek_penalty}, RotationRate={rotation_rate}"
+                )
+                continue
+
+            specs.append(_spec(None))
+            unknown_list.append(storage_str)
+            logger.debug(f"디스크 MediaType 비정상(표시 제외): {storage_str} | MediaType={media_type}")
+
+        except Exception as e:
+            logger.warning(f"디스크 정보 수집 중 오류: {e}")
+            continue
+
+    if unknown_list:
+        logger.debug(f"분류 불가 디스크 {len(unknown_list)} (표시 제외)개")
+        
+    if not ssd_count and not hdd_count and unknown_list:
+        logger.info("Storage: 디스크 감지됨 but 분류 불가 → 표시 제외(오분류 방지)")
+    else:
+        logger.info(f"Storage: SSD {ssd_count}개 / HDD {hdd_count}개 / Unknown {len(unknown_list)}개(표시 제외)")
+
+    return tuple(specs)
+
+
 def collect_storage(
     wmi_conn=None,
     wmi_storage=None,
     wmi_available: bool | None = None,
 ) -> tuple[list[str], list[str]] | None:
+    """
+    저장장치 정보 수집 (collect_storage_spec()의 표시 문자열 어댑터)
+
+    Args:
+        wmi_conn: WMI 연결 객체 (사용 안 함, 호환성용)
+        wmi_storage: Storage 네임스페이스 WMI 연결 객체 (재사용용)
+        wmi_available: WMI 사용 가능 여부(미지정 시 내부에서 판별)
+
+    Returns:
+        tuple[list[str], list[str]] | None: (ssd_list, hdd_list) 또는 실패 시 None
+    """
+    return to_category_result(CATEGORY_STORAGE, collect_storage_spec(wmi_conn, wmi_storage, wmi_available))
+
+
+def collect_storage_spec(
+    wmi_conn=None,
+    wmi_storage=None,
+    wmi_available: bool | None = None,
+) -> tuple[DiskSpec, ...] | None:
     """
     저장장치 정보 수집 및 SSD/HDD 구분
 
@@ -470,12 +833,8 @@ def collect_storage(
         wmi_available: WMI 사용 가능 여부(미지정 시 내부에서 판별)
 
     Returns:
-        tuple[list[str], list[str]] | None: (ssd_list, hdd_list) 또는 실패 시 None
+        tuple[DiskSpec, ...] | None: 디스크 모델 튜플 (디스크 없음은 빈 튜플) 또는 실패 시 None
     """
-    ssd_list: list[str] = []
-    hdd_list: list[str] = []
-    unknown_list: list[str] = []
-
     if wmi_available is None:
         wmi_available = _is_windows_wmi_available()
     if not wmi_available:
@@ -484,102 +843,522 @@ def collect_storage(
     try:
         if wmi_storage is None:
             return None
-        disks = wmi_storage.MSFT_PhysicalDisk() or []
-        if not disks:
-            return [INFO_NOT_PROVIDED], [INFO_NOT_PROVIDED]
+        disks = query_wmi(wmi_storage, "MSFT_PhysicalDisk", PHYSICAL_DISK_FIELDS)
+        return _build_disk_specs(disks)
+    except Exception as e:
+        logger.warning("Storage 네임스페이스 접근 실패 (권한/WMI 서비스/OS 상태에 따라 발생할 수 있음)", exc_info=True)
+        return None
+
+
+def _open_wmi(namespace: str):
+    """
+    네임스페이스 WMI 연결을 새로 만든다.
 
-        for disk in disks:
-            try:
-                name = getattr(disk, "FriendlyName", None) or getattr(disk, "Model", None) or "알 수 없음"
-                name = str(name).strip() if name else "알 수 없음"
+    Args:
+        namespace: WMI 네임스페이스
 
-                size = getattr(disk, "Size", None)
-                size_gb = (int(size) / BYTES_PER_GB) if size is not None else 0.0
+    Returns:
+        wmi.WMI 연결 객체
+    """
+    if namespace == DEFAULT_NAMESPACE:
+        return wmi.WMI()
+    return wmi.WMI(namespace=namespace)
 
-                storage_str = f"{name} ({size_gb:.2f}GB)"
 
-                media_type = getattr(disk, "MediaType", None)
+def _wmi_connection(namespace: str, memo: WmiQueryMemo) -> MemoizedWmiConnection:
+    """
+    수집에 사용할 WMI 연결을 반환한다.
 
-                if media_type == MEDIA_TYPE_SSD:
-                    ssd_list.append(storage_str)
-                    logger.info(f"디스크 ({name}): MediaType={MEDIA_TYPE_SSD} → SSD")
-                    continue
+    풀 사용 시에는 첫 조회 때 호출한 스레드의 풀 연결을 사용하는 핸들을 반환하므로
+    조회하지 않는 네임스페이스의 연결은 만들어지지 않는다.
 
-                if media_type == MEDIA_TYPE_HDD:
-                    hdd_list.append(storage_str)
-                    logger.info(f"디스크 ({name}): MediaType={MEDIA_TYPE_HDD} → HDD")
-                    continue
+    Args:
+        namespace: WMI 네임스페이스
+        memo: 수집 1회 범위의 WMI 조회 메모
 
-                if media_type in (MEDIA_TYPE_UNKNOWN, None):
-                    bus_type = getattr(disk, "BusType", None)
-                    seek_penalty = getattr(disk, "SeekPenalty", None)
-                    rotation_rate = getattr(disk, "RotationRate", None)
-
-                    is_ssd: bool | None = None
-
-                    if bus_type == BUS_TYPE_NVME:
-                        is_ssd = True
-                        logger.info(f"디스크 ({name}): MediaType={media_type}, BusType=NVMe → SSD")
-
-                    if is_ssd is None and seek_penalty is False:
-                        is_ssd = True
-                        logger.info(f"디스크 ({name}): MediaType={media_type}, SeekPenalty=False → SSD")
-
-                    if is_ssd is None and rotation_rate is not None:
-                        try:
-                            rotation_rate_int = int(rotation_rate)
-                            if rotation_rate_int >= ROTATION_RATE_HDD_THRESHOLD:
-                                is_ssd = False
-                                logger.info(
-                                    f"디스크 ({name}): MediaType={media_type}, RotationRate={rotation_rate_int} → HDD"
-                                )
-                        except (ValueError, TypeError) as e:
-                            logger.debug(
-                                f"RotationRate 파싱 실패: {rotation_rate} ({type(rotation_rate)}): {e}"
-                            )
+    Returns:
+        MemoizedWmiConnection: 조회 메모를 거치는 연결
 
-                    if is_ssd is True:
-                        ssd_list.append(storage_str)
-                        continue
-                    if is_ssd is False:
-                        hdd_list.append(storage_str)
-                        continue
-
-                    unknown_list.append(storage_str)
-                    logger.debug(
-                        f"디스크 분류 불가(표시 제외): {storage_str}"
-                        f"MediaType={media_type}, BusType={bus_type}, SeekPenalty={seek_penalty}, RotationRate={rotation_rate}"
-                    )
-                    continue
+    Raises:
+        풀을 사용하지 않을 때 연결 생성에서 발생한 예외
+    """
+    if WMI_POOL_ENABLED:
+        conn = wmi_pool.default_pool().connection(namespace, lambda: _open_wmi(namespace))
+    else:
+        conn = _open_wmi(namespace)
+    return MemoizedWmiConnection(conn, namespace, memo)
 
-                unknown_list.append(storage_str)
-                logger.debug(f"디스크 MediaType 비정상(표시 제외): {storage_str} | MediaType={media_type}")
 
-            except Exception as e:
-                logger.warning(f"Storage 네임스페이스 디스크 정보 수집 중 오류: {e}")
-                continue
+@contextmanager
+def _com_apartment():
+    """
+    현재 스레드에 COM 아파트먼트를 초기화하고 종료 시 해제한다.
 
-    except Exception as e:
-        logger.warning("Storage 네임스페이스 접근 실패 (권한/WMI 서비스/OS 상태에 따라 발생할 수 있음)", exc_info=True)
+    WMI COM 객체는 생성된 아파트먼트 밖에서 사용할 수 없으므로
+    워커 스레드마다 개별 초기화가 필요하다. pythoncom이 없으면 아무것도 하지 않는다.
+    풀 사용 시 이 스레드의 풀 연결은 이 아파트먼트에서 만들어졌으므로 해제 전에 버린다.
+    (같은 스레드가 다음 아파트먼트에서 해제된 아파트먼트의 COM 프록시를 재사용하지 않도록)
+
+    Args:
+        없음
+
+    Returns:
+        None
+    """
+    pythoncom = None
+    if platform.system() == "Windows":
+        try:
+            import pythoncom  # type: ignore
+        except ImportError:
+            pythoncom = None
+
+    if pythoncom is not None:
+        pythoncom.CoInitialize()
+    try:
+        yield
+    finally:
+        if WMI_POOL_ENABLED:
+            wmi_pool.release_default_pool_thread()
+        if pythoncom is not None:
+            pythoncom.CoUninitialize()
+
+
+def _collect_category_smbios(category: str):
+    """
+    SMBIOS 테이블로 카테고리를 수집한다.
+
+    테이블을 읽을 수 없거나 해당 정보가 없으면 None을 반환하여 WMI 경로로 폴백한다.
+
+    Args:
+        category: SMBIOS_CATEGORIES 중 하나
+
+    Returns:
+        카테고리 모델 값 또는 None
+    """
+    if not SMBIOS_ENABLED or category not in SMBIOS_CATEGORIES:
         return None
+    from core import smbios
 
-    if unknown_list:
-        logger.debug(f"분류 불가 디스크 {len(unknown_list)} (표시 제외)개")
-        
-    if not ssd_list and not hdd_list and unknown_list:
-        logger.info("Storage: 디스크 감지됨 but 분류 불가 → 표시 제외(오분류 방지)")
-        return [INFO_NOT_PROVIDED], [INFO_NOT_PROVIDED]
-    logger.info(f"Storage: SSD {len(ssd_list)}개 / HDD {len(hdd_list)}개 / Unknown {len(unknown_list)}개(표시 제외)")
+    tables = smbios.load_system_tables()
+    if tables is None:
+        return None
 
-    return ssd_list, hdd_list
+    try:
+        if category == CATEGORY_SYSTEM_TYPE:
+            chassis_types = [ct for c in tables.chassis for ct in c.ChassisTypes]
+            if not chassis_types:
+                return None
+            return _classify_chassis_types(chassis_types) or SYSTEM_TYPE_UNKNOWN
+        if category == CATEGORY_RAM:
+            return _build_ram_spec(tables.installed_memory)
+        if category == CATEGORY_MAINBOARD:
+            if not tables.baseboards:
+                return None
+            board = tables.baseboards[0]
+            return _format_baseboard(board.Manufacturer, board.Product, board.Version) or None
+    except Exception:
+        logger.exception("SMBIOS 기반 수집 실패: %s", category)
+    return None
 
 
-def collect_all_specs() -> dict:
+def _collect_category(category: str, wmi_conn, wmi_storage, wmi_available: bool):
+    """
+    카테고리 이름에 해당하는 모델 수집 함수를 호출한다.
+
+    Args:
+        category: SPEC_CATEGORIES 중 하나
+        wmi_conn: 기본 네임스페이스 WMI 연결 객체 (None 가능)
+        wmi_storage: Storage 네임스페이스 WMI 연결 객체 (None 가능)
+        wmi_available: WMI 사용 가능 여부
+
+    Returns:
+        카테고리 모델 값 (core.spec_model 참고)
+    """
+    if category == CATEGORY_SYSTEM_TYPE:
+        return collect_system_type(wmi_conn, wmi_available)
+    if category == CATEGORY_CPU:
+        return collect_cpu_spec(wmi_conn, wmi_available)
+    if category == CATEGORY_RAM:
+        return collect_ram_spec(wmi_conn, wmi_available)
+    if category == CATEGORY_MAINBOARD:
+        return collect_baseboard(wmi_conn, wmi_available)
+    if category == CATEGORY_VGA:
+        return collect_gpu_specs(wmi_conn, wmi_available)
+    if category == CATEGORY_STORAGE:
+        return collect_storage_spec(wmi_conn, wmi_storage, wmi_available)
+    raise ValueError(f"알 수 없는 수집 카테고리: {category}")
+
+
+def _collect_category_with_own_connection(category: str, wmi_available: bool, memo: WmiQueryMemo):
+    """
+    현재 스레드 전용 WMI 연결을 만들어 카테고리 하나를 수집한다.
+
+    SMBIOS로 수집할 수 있는 카테고리는 WMI 연결을 만들지 않는다.
+    - storage: Storage 네임스페이스 연결만 생성
+    - vga: DXGI 우선이므로 연결을 만들지 않음 (WMI 폴백 시 풀 연결 사용, 풀 미사용 시 collect_gpu 내부에서 생성)
+    - 그 외: 기본 네임스페이스 연결 생성
+    - 풀 사용 시 연결은 첫 조회 때 생성되어 같은 워커 스레드의 다음 수집에서 재사용된다.
+
+    Args:
+        category: SPEC_CATEGORIES 중 하나
+        wmi_available: WMI 사용 가능 여부
+        memo: 수집 1회 범위의 WMI 조회 메모
+
+    Returns:
+        카테고리 모델 값
+    """
+    value = _collect_category_smbios(category)
+    if value is not None:
+        return value
+
+    wmi_conn = None
+    wmi_storage = None
+    if wmi_available:
+        try:
+            if category == CATEGORY_STORAGE:
+                wmi_storage = _wmi_connection(STORAGE_NAMESPACE, memo)
+            elif WMI_POOL_ENABLED or category != CATEGORY_VGA:
+                wmi_conn = _wmi_connection(DEFAULT_NAMESPACE, memo)
+        except Exception as e:
+            logger.warning("WMI 연결 생성 실패(%s), 함수 내부에서 재시도: %s", category, e)
+    return _collect_category(category, wmi_conn, wmi_storage, wmi_available)
+
+
+def _collect_category_in_worker(category: str, wmi_available: bool, memo: WmiQueryMemo):
+    """
+    워커 스레드에서 카테고리 하나를 수집한다.
+
+    풀 사용 시에는 상주 워커(wmi_pool.ApartmentWorker)가 스레드 전체를 COM 아파트먼트로 감싸고
+    풀 연결이 이 호출 이후에도 남으므로 아파트먼트를 다시 초기화하지 않는다.
+    풀 미사용 시에는 일회용 스레드이므로 여기서 아파트먼트를 초기화하며,
+    WMI 연결은 아파트먼트가 해제되기 전에 정리되도록 별도 함수(_collect_category_with_own_connection) 안에서만 보관한다.
+
+    Args:
+        category: SPEC_CATEGORIES 중 하나
+        wmi_available: WMI 사용 가능 여부
+        memo: 수집 1회 범위의 WMI 조회 메모 (스레드 간 공유, 결과는 COM 객체가 아닌 WmiRow)
+
+    Returns:
+        카테고리 모델 값
+    """
+    started = time.perf_counter()
+    if WMI_POOL_ENABLED:
+        value = _collect_category_with_own_connection(category, wmi_available, memo)
+    else:
+        with _com_apartment():
+            value = _collect_category_with_own_connection(category, wmi_available, memo)
+    logger.info("카테고리 수집 완료 | %s | %.0fms", category, (time.perf_counter() - started) * 1000)
+    return value
+
+
+def _category_timeout(category: str, category_timeouts: dict | None) -> float:
+    """
+    카테고리 제한 시간(초)을 반환한다.
+
+    Args:
+        category: SPEC_CATEGORIES 중 하나
+        category_timeouts: 호출 측 개별 제한 시간 (없으면 CATEGORY_TIMEOUTS_S)
+
+    Returns:
+        float: 제한 시간(초)
+    """
+    timeouts = CATEGORY_TIMEOUTS_S if category_timeouts is None else category_timeouts
+    return timeouts.get(category, CATEGORY_TIMEOUT_S)
+
+
+def _log_timeout(category: str, started: float) -> None:
+    """
+    카테고리 시간 초과를 경과 시간과 함께 로그로 남긴다.
+    """
+    logger.warning("카테고리 수집 시간 초과 | %s | %.0fms", category, (time.perf_counter() - started) * 1000)
+
+
+def _iter_sequential(
+    categories: tuple[str, ...],
+    wmi_available: bool,
+    memo: WmiQueryMemo,
+    deadline_s: float,
+    durations_ms: dict | None = None,
+) -> Iterator[tuple[str, object]]:
+    """
+    WMI 연결 2개를 공유하며 카테고리를 순차 수집하고 하나씩 반환한다.
+
+    연결은 수집할 카테고리가 사용하는 네임스페이스만 만들며,
+    풀 사용 시에는 호출 스레드의 풀 연결을 첫 조회 때 만들어 같은 아파트먼트 안의 다음 수집에서 재사용한다.
+    (호출 측이 수집마다 _com_apartment()로 감싸면 아파트먼트 해제 시 함께 버려짐)
+
+    COM 연결을 공유하므로 진행 중인 호출은 중단할 수 없고,
+    카테고리 사이에서 전체 제한 시간만 확인한다. 초과 시 남은 카테고리는 TIMED_OUT으로 반환한다.
+
+    Args:
+        categories: 수집할 카테고리 목록
+        wmi_available: WMI 사용 가능 여부
+        memo: 수집 1회 범위의 WMI 조회 메모
+        deadline_s: 수집 1회 전체 제한 시간(초)
+        durations_ms: 카테고리별 소요 시간(ms)을 기록할 딕셔너리 (None이면 기록 안 함)
+
+    Yields:
+        tuple[str, object]: (카테고리, 카테고리 모델 값 또는 TIMED_OUT)
+    """
+    sweep_started = time.perf_counter()
+    wmi_conn = None
+    wmi_storage = None
+
+    try:
+        if wmi_available:
+            if any(category != CATEGORY_STORAGE for category in categories):
+                wmi_conn = _wmi_connection(DEFAULT_NAMESPACE, memo)
+            if CATEGORY_STORAGE in categories:
+                wmi_storage = _wmi_connection(STORAGE_NAMESPACE, memo)
+    except Exception as e:
+        logger.warning("WMI 연결 생성 실패, 각 함수에서 개별 연결 시도: %s", e)
+
+    for category in categories:
+        if time.perf_counter() - sweep_started >= deadline_s:
+            _log_timeout(category, sweep_started)
+            yield category, TIMED_OUT
+            continue
+        started = time.perf_counter()
+        value = _collect_category_smbios(category)
+        if value is None:
+            value = _collect_category(category, wmi_conn, wmi_storage, wmi_available)
+        elapsed_ms = (time.perf_counter() - started) * 1000
+        logger.info("카테고리 수집 완료 | %s | %.0fms", category, elapsed_ms)
+        if durations_ms is not None:
+            durations_ms[category] = elapsed_ms
+        yield category, value
+
+
+def _iter_linux(categories: tuple[str, ...], durations_ms: dict | None = None) -> Iterator[tuple[str, object]]:
+    """
+    Linux procfs/sysfs 백엔드로 카테고리를 순차 수집하고 하나씩 반환한다.
+
+    파일 읽기만 하므로 전체 수집이 수 ms 안에 끝나 스레드/제한 시간을 사용하지 않는다.
+
+    Args:
+        categories: 수집할 카테고리 목록
+        durations_ms: 카테고리별 소요 시간(ms)을 기록할 딕셔너리 (None이면 기록 안 함)
+
+    Yields:
+        tuple[str, object]: (카테고리, 카테고리 모델 값)
+    """
+    from core import linux_backend
+
+    for category in categories:
+        started = time.perf_counter()
+        try:
+            value = linux_backend.collect_category_model(category)
+        except Exception:
+            logger.exception("카테고리 수집 실패(Linux): %s", category)
+            value = None
+        elapsed_ms = (time.perf_counter() - started) * 1000
+        logger.info("카테고리 수집 완료 | %s | %.1fms", category, elapsed_ms)
+        if durations_ms is not None:
+            durations_ms[category] = elapsed_ms
+        yield category, value
+
+
+def _parallel_worker(category: str, wmi_available: bool, memo: WmiQueryMemo, results: queue.Queue) -> None:
+    """
+    워커 스레드 본문: 카테고리 하나를 수집해 결과 큐에 넣는다. 예외는 None(정보 없음)으로 보고한다.
+    """
+    try:
+        value = _collect_category_in_worker(category, wmi_available, memo)
+    except Exception:
+        logger.exception("카테고리 병렬 수집 실패: %s", category)
+        value = None
+    results.put((category, value))
+
+
+def _iter_parallel(
+    categories: tuple[str, ...],
+    wmi_available: bool,
+    memo: WmiQueryMemo,
+    category_timeouts: dict | None,
+    deadline_s: float,
+    durations_ms: dict | None = None,
+) -> Iterator[tuple[str, object]]:
+    """
+    카테고리마다 워커 스레드(개별 COM 아파트먼트/WMI 연결)로 병렬 수집하고
+    완료되는 순서대로 반환한다.
+    풀 사용 시 워커는 카테고리별 상주 스레드라 아파트먼트와 WMI 연결이 다음 수집에서 재사용된다.
+
+    전체 소요 시간이 카테고리 합계가 아닌 가장 느린 카테고리에 수렴한다.
+    워커에서 예외가 발생한 카테고리는 None(정보 없음)으로 반환한다.
+    카테고리 제한 시간 또는 전체 제한 시간을 넘긴 카테고리는 기다리지 않고 TIMED_OUT으로 반환한다.
+    멈춘 WMI 호출은 중단할 수 없으므로 워커는 데몬 스레드로 두고 늦게 도착한 결과는 버린다.
+
+    Args:
+        categories: 수집할 카테고리 목록
+        wmi_available: WMI 사용 가능 여부
+        memo: 수집 1회 범위의 WMI 조회 메모
+        category_timeouts: 카테고리별 제한 시간 (None이면 CATEGORY_TIMEOUTS_S)
+        deadline_s: 수집 1회 전체 제한 시간(초)
+        durations_ms: 카테고리별 소요 시간(ms)을 기록할 딕셔너리 (시간 초과는 초과 시점까지의 시간)
+
+    Yields:
+        tuple[str, object]: (카테고리, 카테고리 모델 값 또는 TIMED_OUT)
+    """
+    results: queue.Queue = queue.Queue()
+    started = time.perf_counter()
+    sweep_deadline = started + deadline_s
+    deadlines = {}
+    for category in categories:
+        deadlines[category] = min(started + _category_timeout(category, category_timeouts), sweep_deadline)
+        if WMI_POOL_ENABLED:
+            wmi_pool.default_pool().submit(
+                category, _com_apartment, _parallel_worker, category, wmi_available, memo, results
+            )
+            continue
+        threading.Thread(
+            target=_parallel_worker,
+            args=(category, wmi_available, memo, results),
+            name=f"spec-collect-{category}",
+            daemon=True,
+        ).start()
+
+    while deadlines:
+        remaining = min(deadlines.values()) - time.perf_counter()
+        try:
+            category, value = results.get(timeout=max(0.0, remaining))
+        except queue.Empty:
+            now = time.perf_counter()
+            for category in [c for c, d in deadlines.items() if d <= now]:
+                del deadlines[category]
+                _log_timeout(category, started)
+                if durations_ms is not None:
+                    durations_ms[category] = (now - started) * 1000
+                yield category, TIMED_OUT
+            continue
+        if deadlines.pop(category, None) is not None:
+            # 모든 워커가 동시에 시작하므로 시작 시점부터 도착까지가 카테고리 소요 시간
+            if durations_ms is not None:
+                durations_ms[category] = (time.perf_counter() - started) * 1000
+            yield category, value
+
+
+def iter_category_results(
+    parallel: bool | None = None,
+    categories: tuple[str, ...] = SPEC_CATEGORIES,
+    category_timeouts: dict | None = None,
+    deadline_s: float | None = None,
+) -> Iterator[tuple[str, object]]:
+    """
+    카테고리별 수집 결과를 표시 문자열 형식으로 완료되는 순서대로 하나씩 반환한다. (스트리밍 수집)
+
+    iter_category_models()의 결과를 core.spec_model.to_category_result()로 변환한다.
+    결과는 core.spec_schema.merge_category_result()로 사양 딕셔너리에 병합할 수 있다.
+
+    Args:
+        parallel: 병렬 수집 여부 (None이면 PARALLEL_COLLECTION_DEFAULT)
+        categories: 수집할 카테고리 목록 (기본값: 전체)
+        category_timeouts: 카테고리별 제한 시간(초) (None이면 CATEGORY_TIMEOUTS_S, 없는 카테고리는 CATEGORY_TIMEOUT_S)
+        deadline_s: 수집 1회 전체 제한 시간(초) (None이면 SWEEP_DEADLINE_S)
+
+    Yields:
+        tuple[str, object]: (카테고리, collect_*() 반환값 또는 TIMED_OUT)
+    """
+    for category, value in iter_category_models(
+        parallel=parallel, categories=categories, category_timeouts=category_timeouts, deadline_s=deadline_s
+    ):
+        yield category, to_category_result(category, value)
+
+
+def iter_category_models(
+    parallel: bool | None = None,
+    categories: tuple[str, ...] = SPEC_CATEGORIES,
+    category_timeouts: dict | None = None,
+    deadline_s: float | None = None,
+    durations_ms: dict | None = None,
+) -> Iterator[tuple[str, object]]:
+    """
+    카테고리별 모델(core.spec_model)을 완료되는 순서대로 하나씩 반환한다. (스트리밍 수집)
+
+    병렬 모드에서는 빠른 카테고리(CPU/M/B 등)가 느린 카테고리(storage)를 기다리지 않는다.
+    제한 시간을 넘긴 카테고리는 core.spec_schema.TIMED_OUT으로 반환된다.
+    WMI를 사용할 수 없는 Linux에서는 core.linux_backend(/proc, /sys)로 수집한다.
+
+    Args:
+        parallel: 병렬 수집 여부 (None이면 PARALLEL_COLLECTION_DEFAULT)
+        categories: 수집할 카테고리 목록 (기본값: 전체)
+        category_timeouts: 카테고리별 제한 시간(초) (None이면 CATEGORY_TIMEOUTS_S, 없는 카테고리는 CATEGORY_TIMEOUT_S)
+        deadline_s: 수집 1회 전체 제한 시간(초) (None이면 SWEEP_DEADLINE_S)
+        durations_ms: 카테고리별 소요 시간(ms)을 기록할 딕셔너리 (None이면 기록 안 함)
+
+    Yields:
+        tuple[str, object]: (카테고리, 카테고리 모델 값 또는 TIMED_OUT)
+    """
+    if parallel is None:
+        parallel = PARALLEL_COLLECTION_DEFAULT
+    if deadline_s is None:
+        deadline_s = SWEEP_DEADLINE_S
+    wmi_available = _is_windows_wmi_available()
+    if not wmi_available and _is_linux_backend_available():
+        yield from _iter_linux(tuple(categories), durations_ms)
+        return
+    memo = WmiQueryMemo()
+    if parallel:
+        results = _iter_parallel(tuple(categories), wmi_available, memo, category_timeouts, deadline_s, durations_ms)
+    else:
+        results = _iter_sequential(tuple(categories), wmi_available, memo, deadline_s, durations_ms)
+    yield from results
+    memo.log_summary()
+    if WMI_POOL_ENABLED and wmi_available:
+        wmi_pool.default_pool().log_summary()
+
+
+def collect_spec_model(
+    parallel: bool | None = None,
+    categories: tuple[str, ...] = SPEC_CATEGORIES,
+    category_timeouts: dict | None = None,
+    deadline_s: float | None = None,
+    durations_ms: dict | None = None,
+) -> SystemSpecs:
+    """
+    시스템 사양을 타입 모델로 수집한다.
+
+    표시 문자열 대신 원시 값(바이트, MHz, PCI ID)이 필요한 호출 측(JSON 출력 등)에서 사용한다.
+    SystemSpecs.to_specs_dict()는 collect_all_specs()와 같은 사양 딕셔너리를 만든다.
+
+    Args:
+        parallel: 병렬 수집 여부 (None이면 PARALLEL_COLLECTION_DEFAULT)
+        categories: 수집할 카테고리 목록 (기본값: 전체, 나머지는 None)
+        category_timeouts: 카테고리별 제한 시간(초) (None이면 CATEGORY_TIMEOUTS_S)
+        deadline_s: 수집 1회 전체 제한 시간(초) (None이면 SWEEP_DEADLINE_S)
+        durations_ms: 카테고리별 소요 시간(ms)을 기록할 딕셔너리 (None이면 기록 안 함)
+
+    Returns:
+        SystemSpecs: 카테고리 모델 묶음 (시간 초과 카테고리는 timed_out에 기록)
+    """
+    specs = SystemSpecs()
+    for category, value in iter_category_models(
+        parallel=parallel,
+        categories=categories,
+        category_timeouts=category_timeouts,
+        deadline_s=deadline_s,
+        durations_ms=durations_ms,
+    ):
+        specs.merge(category, value)
+    return specs
+
+
+def collect_all_specs(
+    parallel: bool | None = None,
+    category_timeouts: dict | None = None,
+    deadline_s: float | None = None,
+) -> dict:
     """
     모든 시스템 사양을 수집하여 딕셔너리로 반환
-    WMI 연결을 재사용하여 성능 최적화 (5번 연결 → 2번 연결)
     
     CPU, RAM, 메인보드, GPU, SSD, HDD 정보를 각각의 collect_*() 함수로 수집
+    - parallel=True: 카테고리별 워커 스레드에서 개별 COM 아파트먼트/WMI 연결로 병렬 수집
+    - parallel=False: WMI 연결을 재사용하여 순차 수집 (5번 연결 → 2번 연결)
+    - 제한 시간을 넘긴 카테고리는 None으로 두고 "timed_out" 키에 카테고리 목록을 기록 (부분 결과)
+    
+    Args:
+        parallel: 병렬 수집 여부 (None이면 PARALLEL_COLLECTION_DEFAULT)
+        category_timeouts: 카테고리별 제한 시간(초) (None이면 CATEGORY_TIMEOUTS_S)
+        deadline_s: 수집 1회 전체 제한 시간(초) (None이면 SWEEP_DEADLINE_S)
     
     Returns:
         dict: {
@@ -589,47 +1368,29 @@ def collect_all_specs() -> dict:
             "mainboard": str | None,
             "vga": list[str] | None,
             "ssd": list[str] | None,
-            "hdd": list[str] | None
+            "hdd": list[str] | None,
+            "timed_out": list[str]  # 시간 초과 카테고리가 있을 때만
         }
     """
-    logger.info("시스템 사양 수집 시작")
-    
-    # WMI 연결을 한 번만 생성하여 재사용 (성능 최적화)
-    wmi_available = _is_windows_wmi_available()
-    wmi_conn = None
-    wmi_storage = None
-    
-    try:
-        if wmi_available:
-            wmi_conn = wmi.WMI()
-            wmi_storage = wmi.WMI(namespace=STORAGE_NAMESPACE)
-    except Exception as e:
-        logger.warning("WMI 연결 생성 실패, 각 함수에서 개별 연결 시도: %s", e)
-    
-    # WMI 연결을 재사용하여 수집
-    system_type = collect_system_type(wmi_conn, wmi_available)
-    cpu = collect_cpu(wmi_conn, wmi_available)
-    ram = collect_ram(wmi_conn, wmi_available)
-    mainboard = collect_baseboard(wmi_conn, wmi_available)
-    vga = collect_gpu(wmi_conn, wmi_available)
-    storage = collect_storage(wmi_conn, wmi_storage, wmi_available)
-    if storage is None:
-        ssd, hdd = None, None
-    else:
-        ssd, hdd = storage
-    
-    specs = {
-        "system_type": system_type,
-        "cpu": cpu,
-        "ram": ram,
-        "mainboard": mainboard,
-        "vga": vga,
-        "ssd": ssd,
-        "hdd": hdd
-    }
+    if parallel is None:
+        parallel = PARALLEL_COLLECTION_DEFAULT
+    logger.info("시스템 사양 수집 시작 (%s)", "병렬" if parallel else "순차")
+    started = time.perf_counter()
+
+    specs = empty_specs()
+    for category, value in iter_category_results(
+        parallel=parallel, category_timeouts=category_timeouts, deadline_s=deadline_s
+    ):
+        merge_category_result(specs, category, value)
     
-    logger.info("시스템 사양 수집 완료")
+    logger.info("시스템 사양 수집 완료 | %.0fms", (time.perf_counter() - started) * 1000)
+    if specs.get(TIMED_OUT_KEY):
+        logger.warning("시스템 사양 부분 수집 | 시간 초과: %s", ", ".join(specs[TIMED_OUT_KEY]))
     
+    ram = specs["ram"]
+    vga = specs["vga"]
+    ssd = specs["ssd"]
+    hdd = specs["hdd"]
     ram_count = len(ram[1]) if ram else 0
     vga_count = len(vga) if vga else 0
     ssd_count = len(ssd) if ssd else 0
@@ -637,4 +1398,4 @@ def collect_all_specs() -> dict:
     logger.info(
     "시스템 사양 수집 요약 | "
     f"RAM={ram_count}개, VGA={vga_count}개, SSD={ssd_count}개, HDD={hdd_count}개")
-    return specs
\ No newline at end of file
+    return specs
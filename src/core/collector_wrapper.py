@@ -9,10 +9,15 @@
 - 책임: 함수 기반 collector를 객체 인터페이스로 변환
 - 비책임: 실제 수집 로직 (기존 collector 함수에 위임)
 - 사용처: CachedSpecCollector의 delegate로 사용
+- core.collector(wmi/pywin32 포함)는 최초 수집 시점에 import (첫 화면 표시 지연 방지)
 """
 
+from __future__ import annotations
+
+from typing import Iterator
+
 from core.interfaces import ISpecCollector
-from core import collector
+from core.spec_schema import SPEC_CATEGORIES, empty_specs, merge_category_result
 
 
 class CollectorWrapper:
@@ -23,6 +28,15 @@ class CollectorWrapper:
     - 비책임: 실제 수집 로직 (collector 모듈에 위임)
     - 사용처: CachedSpecCollector의 delegate로 사용
     """
+
+    def __init__(self, parallel: bool | None = None):
+        """
+        CollectorWrapper 초기화
+
+        Args:
+            parallel: 카테고리 병렬 수집 여부 (None이면 collector 기본값)
+        """
+        self._parallel = parallel
     
     def collect_all_specs(self) -> dict:
         """
@@ -39,7 +53,36 @@ class CollectorWrapper:
                 "hdd": list[str]
             }
         """
-        return collector.collect_all_specs()
+        from core import collector
+        return collector.collect_all_specs(parallel=self._parallel)
+
+    def collect(self, categories: tuple[str, ...] = SPEC_CATEGORIES) -> dict:
+        """
+        지정한 카테고리의 collect_*() 함수만 호출하여 사양 딕셔너리로 반환
+
+        Args:
+            categories: 수집할 카테고리 목록
+
+        Returns:
+            dict: collect_all_specs() 반환 형식의 딕셔너리 (지정하지 않은 카테고리는 None)
+        """
+        specs = empty_specs()
+        for category, value in self.iter_category_results(categories):
+            merge_category_result(specs, category, value)
+        return specs
+
+    def iter_category_results(self, categories: tuple[str, ...] = SPEC_CATEGORIES) -> Iterator[tuple[str, object]]:
+        """
+        카테고리별 수집 결과를 완료되는 순서대로 반환
+        
+        Args:
+            categories: 수집할 카테고리 목록 (기본값: 전체)
+
+        Yields:
+            tuple[str, object]: (카테고리, 수집 결과)
+        """
+        from core import collector
+        return collector.iter_category_results(parallel=self._parallel, categories=tuple(categories))
 
 
 def _collect_specs_via_wrapper(wrapper: ISpecCollector) -> dict:
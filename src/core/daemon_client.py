@@ -0,0 +1,300 @@
+# 본 소스코드는 내부 사용 및 유지보수 목적에 한해 제공됩니다.
+# 무단 재배포 및 상업적 재사용은 허용되지 않습니다.
+# core/daemon_client.py
+
+from __future__ import annotations
+
+"""
+상주 사양 데몬(core.spec_daemon) 클라이언트
+로컬 IPC 엔드포인트(Windows 명명 파이프 / Linux Unix 도메인 소켓)로 캐시된 사양을 요청
+
+- 책임: 엔드포인트 결정, 요청/응답(JSON 한 줄) 송수신, 데몬 미기동 시 폴백 수집기 사용
+- 비책임: 수집/갱신 정책 (core.spec_daemon 담당)
+- 사용처: spec_cli --daemon, main.py --use-daemon (DaemonSpecCollector)
+- asyncio/collector를 import하지 않아 GUI/CLI에서 가볍게 사용 가능
+
+프로토콜 (요청 1줄 → 응답 1줄, UTF-8 JSON):
+    {"op": "get", "fresh": false}  → {"ok": true, "generation": n, "collected_at": epoch,
+                                      "specs": 사양 딕셔너리, "raw": SystemSpecs.to_dict()}
+    {"op": "invalidate"}           → {"ok": true, "generation": n}
+    {"op": "invalidate", "categories": ["storage"]}
+                                   → 지정한 카테고리만 재수집해 직전 결과에 병합
+    {"op": "stats"}                → {"ok": true, "stats": {...}}
+    {"op": "ping"}                 → {"ok": true, "protocol": PROTOCOL_VERSION}
+    실패 응답                       → {"ok": false, "error": 메시지}
+"""
+
+import json
+import logging
+import os
+import socket
+import time
+
+from core.refresh_scheduler import collect_categories
+from core.spec_schema import SPEC_CATEGORIES, restore_json_specs
+
+logger = logging.getLogger(__name__)
+
+PROTOCOL_VERSION = 1
+# 엔드포인트 덮어쓰기 환경 변수 (테스트/다중 인스턴스용)
+ENDPOINT_ENV = "PC_SPEC_VIEWER_SPECD"
+PIPE_ENDPOINT = r"\\.\pipe\PC_Spec_Viewer.specd"
+SOCKET_FILE_NAME = "pc_spec_viewer.specd.sock"
+# 첫 수집(최대 SWEEP_DEADLINE_S)을 기다릴 수 있도록 여유 있게 설정
+DEFAULT_CLIENT_TIMEOUT_S = 40.0
+# 명명 파이프가 모두 사용 중일 때 재시도 간격/횟수
+PIPE_BUSY_RETRY_S = 0.05
+PIPE_BUSY_RETRIES = 40
+
+OP_GET = "get"
+OP_INVALIDATE = "invalidate"
+OP_STATS = "stats"
+OP_PING = "ping"
+
+
+class DaemonUnavailableError(ConnectionError):
+    """
+    데몬에 연결할 수 없거나 응답이 올바르지 않을 때 발생
+    """
+
+
+def default_endpoint() -> str:
+    """
+    플랫폼 기본 IPC 엔드포인트를 반환한다.
+
+    - 환경 변수 PC_SPEC_VIEWER_SPECD가 있으면 그 값
+    - Windows: 명명 파이프 \\\\.\\pipe\\PC_Spec_Viewer.specd
+    - 그 외: $XDG_RUNTIME_DIR/pc_spec_viewer.specd.sock (없으면 임시 디렉토리 + uid)
+
+    Returns:
+        str: 엔드포인트 경로
+    """
+    override = os.environ.get(ENDPOINT_ENV)
+    if override:
+        return override
+    if os.name == "nt":
+        return PIPE_ENDPOINT
+    runtime_dir = os.environ.get("XDG_RUNTIME_DIR")
+    if runtime_dir and os.path.isdir(runtime_dir):
+        return os.path.join(runtime_dir, SOCKET_FILE_NAME)
+    import tempfile
+
+    return os.path.join(tempfile.gettempdir(), f"{SOCKET_FILE_NAME}.{os.getuid()}")
+
+
+class SpecDaemonClient:
+    """
+    상주 사양 데몬 동기 클라이언트
+
+    - 책임: 요청마다 연결 1회 생성, JSON 한 줄 송수신, 오류를 DaemonUnavailableError로 변환
+    - 비책임: 재시도 정책/폴백 (DaemonSpecCollector 담당)
+    - 사용처: DaemonSpecCollector, spec_cli --daemon, Scripts/bench/bench_daemon.py
+    - Windows 명명 파이프는 파일 API로 읽으므로 timeout_s는 연결 대기에만 적용됨
+    """
+
+    def __init__(self, endpoint: str | None = None, timeout_s: float = DEFAULT_CLIENT_TIMEOUT_S):
+        """
+        SpecDaemonClient 초기화
+
+        Args:
+            endpoint: IPC 엔드포인트 (None이면 default_endpoint())
+            timeout_s: 연결/응답 대기 시간(초)
+        """
+        self._endpoint = endpoint or default_endpoint()
+        self._timeout_s = timeout_s
+
+    @property
+    def endpoint(self) -> str:
+        """IPC 엔드포인트"""
+        return self._endpoint
+
+    def request(self, op: str, **fields) -> dict:
+        """
+        요청 1개를 보내고 응답을 반환한다.
+
+        Args:
+            op: OP_GET / OP_INVALIDATE / OP_STATS / OP_PING
+            **fields: 요청 추가 필드
+
+        Returns:
+            dict: 응답 딕셔너리 (ok가 True인 경우만)
+
+        Raises:
+            DaemonUnavailableError: 연결 실패, 응답 없음/손상, ok=False 응답
+        """
+        message = dict(fields, op=op)
+        line = (json.dumps(message) + "\n").encode("utf-8")
+        try:
+            if os.name == "nt":
+                raw = self._exchange_pipe(line)
+            else:
+                raw = self._exchange_socket(line)
+        except OSError as e:
+            raise DaemonUnavailableError(f"사양 데몬 연결 실패({self._endpoint}): {e}") from e
+
+        try:
+            response = json.loads(raw.decode("utf-8"))
+        except ValueError as e:
+            raise DaemonUnavailableError(f"사양 데몬 응답 손상: {e}") from e
+        if not isinstance(response, dict) or not response.get("ok"):
+            error = response.get("error") if isinstance(response, dict) else response
+            raise DaemonUnavailableError(f"사양 데몬 요청 실패({op}): {error}")
+        return response
+
+    def _exchange_socket(self, line: bytes) -> bytes:
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        try:
+            sock.settimeout(self._timeout_s)
+            sock.connect(self._endpoint)
+            sock.sendall(line)
+            with sock.makefile("rb") as f:
+                raw = f.readline()
+        finally:
+            sock.close()
+        if not raw:
+            raise ConnectionResetError("응답 없이 연결 종료")
+        return raw
+
+    def _exchange_pipe(self, line: bytes) -> bytes:
+        deadline = time.monotonic() + self._timeout_s
+        for attempt in range(PIPE_BUSY_RETRIES + 1):
+            try:
+                pipe = open(self._endpoint, "r+b", buffering=0)
+                break
+            except OSError as e:
+                # ERROR_PIPE_BUSY(231): 모든 인스턴스가 사용 중 → 잠시 후 재시도
+                if getattr(e, "winerror", None) != 231 or attempt == PIPE_BUSY_RETRIES or time.monotonic() > deadline:
+                    raise
+                time.sleep(PIPE_BUSY_RETRY_S)
+        with pipe:
+            pipe.write(line)
+            chunks = []
+            while True:
+                chunk = pipe.read(65536)
+                if not chunk:
+                    break
+                chunks.append(chunk)
+                if chunk.endswith(b"\n"):
+                    break
+        raw = b"".join(chunks)
+        if not raw:
+            raise ConnectionResetError("응답 없이 연결 종료")
+        return raw
+
+    def ping(self) -> bool:
+        """
+        데몬 응답 여부를 반환한다.
+
+        Returns:
+            bool: 응답하면 True
+        """
+        try:
+            return self.request(OP_PING).get("protocol") == PROTOCOL_VERSION
+        except DaemonUnavailableError:
+            return False
+
+    def get(self, fresh: bool = False) -> dict:
+        """
+        데몬의 최신 수집 결과 응답을 반환한다.
+
+        Args:
+            fresh: True이면 데몬이 무효화 후 새로 수집한 결과를 기다림
+
+        Returns:
+            dict: get 응답 (specs, raw, generation, collected_at)
+        """
+        return self.request(OP_GET, fresh=fresh)
+
+    def get_specs(self, fresh: bool = False) -> dict:
+        """
+        collect_all_specs() 반환 형식의 사양 딕셔너리를 반환한다.
+
+        Args:
+            fresh: True이면 새로 수집한 결과를 기다림
+
+        Returns:
+            dict: 사양 딕셔너리
+        """
+        return restore_json_specs(self.get(fresh=fresh)["specs"])
+
+    def invalidate(self, categories: tuple[str, ...] | None = None) -> int:
+        """
+        데몬 캐시를 무효화한다. (데몬이 즉시 재수집 시작)
+
+        Args:
+            categories: 다시 수집할 카테고리 (None이면 전체)
+
+        Returns:
+            int: 무효화 시점의 세대 번호
+        """
+        fields = {"categories": list(categories)} if categories else {}
+        return int(self.request(OP_INVALIDATE, **fields).get("generation", 0))
+
+    def stats(self) -> dict:
+        """
+        데몬 통계를 반환한다.
+
+        Returns:
+            dict: 수집 횟수, 요청 수, 세대 번호 등
+        """
+        return self.request(OP_STATS).get("stats", {})
+
+
+class DaemonSpecCollector:
+    """
+    상주 데몬에서 사양을 받아오는 ISpecCollector 구현
+
+    - 책임: 데몬 요청, 데몬 미기동/오류 시 폴백 수집기로 수집
+    - 비책임: 캐시 (데몬이 메모리에 보관, 필요 시 CachedSpecCollector로 감쌈)
+    - 사용처: main.py --use-daemon
+    """
+
+    def __init__(self, fallback=None, client: SpecDaemonClient | None = None):
+        """
+        DaemonSpecCollector 초기화
+
+        Args:
+            fallback: 데몬을 사용할 수 없을 때 사용할 ISpecCollector (None이면 예외 전파)
+            client: 데몬 클라이언트 (None이면 기본 엔드포인트)
+        """
+        self._fallback = fallback
+        self._client = client or SpecDaemonClient()
+
+    def collect_all_specs(self) -> dict:
+        """
+        데몬의 사양을 반환한다. (데몬 미기동 시 폴백 수집)
+
+        Returns:
+            dict: collect_all_specs() 반환 형식의 딕셔너리
+        """
+        started = time.perf_counter()
+        try:
+            specs = self._client.get_specs()
+        except DaemonUnavailableError as e:
+            if self._fallback is None:
+                raise
+            logger.info("사양 데몬 사용 불가 → 직접 수집: %s", e)
+            return self._fallback.collect_all_specs()
+        logger.info("사양 데몬 응답 | %.1fms", (time.perf_counter() - started) * 1000)
+        return specs
+
+    def collect(self, categories: tuple[str, ...] = SPEC_CATEGORIES) -> dict:
+        """
+        지정한 카테고리를 데몬에서 무효화한 뒤 재수집된 사양을 반환한다. (데몬 미기동 시 지정한 카테고리만 폴백 수집)
+
+        데몬은 해당 카테고리만 다시 수집해 직전 결과에 병합하므로 응답에는 모든 카테고리가 들어 있다.
+
+        Args:
+            categories: 수집할 카테고리 목록
+
+        Returns:
+            dict: collect_all_specs() 반환 형식의 딕셔너리
+        """
+        try:
+            self._client.invalidate(tuple(categories))
+            return self._client.get_specs()
+        except DaemonUnavailableError as e:
+            if self._fallback is None:
+                raise
+            logger.info("사양 데몬 사용 불가 → 직접 수집(%s): %s", ", ".join(categories), e)
+            return collect_categories(self._fallback, categories)
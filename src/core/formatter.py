@@ -10,15 +10,36 @@ from __future__ import annotations
 
 - format_specs_text(): 클립보드 복사용 일반 텍스트 생성
 - format_specs_html(): QTextEdit.setHtml()용 HTML 생성
+- display_*(): core.spec_model 모델 → 사양 딕셔너리 표시 문자열 (수집 결과 표기 규칙)
 - controller.py에서 호출되어 View에 표시될 형식으로 변환
 """
 import logging
 from typing import Any
 
+from core.spec_schema import is_timed_out
+
 logger = logging.getLogger(__name__)
 INFO_NOT_PROVIDED = "확인되지 않음(모듈 정보 미제공)"
 NOT_INSTALLED = "장착되지 않음"
 SYSTEM_TYPE_UNKNOWN = "유형 미확정"
+PENDING = "수집 중..."
+TIMED_OUT_TEXT = "정보 없음(응답 시간 초과)"
+# 수집 결과 자체에 들어가는 표기 (core.collector.INFO_NOT_PROVIDED와 같은 값)
+MODULE_INFO_NOT_PROVIDED = "모듈 정보 미제공"
+UNKNOWN_SPEED = "알 수 없음"
+BYTES_PER_GB = 1024 ** 3
+
+# HTML 표시 순서 및 라벨 (키는 collect_all_specs() 반환 딕셔너리 키)
+SPEC_SECTIONS = ("system_type", "cpu", "ram", "mainboard", "vga", "ssd", "hdd")
+SECTION_LABELS = {
+    "system_type": "PC 유형",
+    "cpu": "CPU",
+    "ram": "RAM",
+    "mainboard": "M/B",
+    "vga": "VGA",
+    "ssd": "SSD",
+    "hdd": "HDD",
+}
 
 
 def safe_str(value: Any) -> str:
@@ -106,6 +127,93 @@ def to_gb(bytes_value: int | float) -> float:
         return 0.0
 
 
+def display_memory_module(module) -> str:
+    """
+    메모리 모듈 모델을 표시 문자열로 변환한다.
+
+    Args:
+        module: core.spec_model.MemoryModuleSpec
+
+    Returns:
+        str: "브랜드 속도MHz 용량GB" (예: "Samsung 5600MHz 16GB")
+    """
+    from core.ram_brand import resolve_ram_brand_display
+
+    brand = resolve_ram_brand_display(module.manufacturer, module.part_number)
+    speed = module.speed_mhz or UNKNOWN_SPEED
+    return f"{brand} {speed}MHz {module.capacity_bytes / BYTES_PER_GB:.0f}GB"
+
+
+def display_ram(ram) -> tuple[str, list[str]]:
+    """
+    RAM 모델을 collect_ram() 반환 형식으로 변환한다.
+
+    Args:
+        ram: core.spec_model.RamSpec
+
+    Returns:
+        tuple[str, list[str]]: (총 용량, 교체형 모듈 표시 목록)
+            - 교체형 모듈 없음(온보드만): 빈 목록
+            - 모듈 정보를 읽을 수 없음: ["모듈 정보 미제공"]
+    """
+    total = f"{ram.total_bytes / BYTES_PER_GB:.0f}GB"
+    if not ram.modules_known:
+        return total, [MODULE_INFO_NOT_PROVIDED]
+    replaceable = ram.replaceable_modules
+    if not replaceable:
+        return total, []
+    items = [display_memory_module(m) for m in replaceable if m.capacity_bytes > 0]
+    return total, items or [MODULE_INFO_NOT_PROVIDED]
+
+
+def display_gpus(gpus) -> list[str]:
+    """
+    GPU 모델 목록을 collect_gpu() 반환 형식으로 변환한다. (수집 경로의 정렬 순서 유지)
+
+    Args:
+        gpus: core.spec_model.GpuSpec 튜플
+
+    Returns:
+        list[str]: GPU 표시 문자열 목록 (GPU 미감지 시 ["모듈 정보 미제공"])
+    """
+    from core.gpu_format import format_gpu_line
+
+    if not gpus:
+        return [MODULE_INFO_NOT_PROVIDED]
+    return [format_gpu_line(g) for g in gpus]
+
+
+def display_disk(disk) -> str:
+    """
+    디스크 모델을 표시 문자열로 변환한다.
+
+    Args:
+        disk: core.spec_model.DiskSpec
+
+    Returns:
+        str: "이름 (용량GB)" (소수점 둘째 자리)
+    """
+    return f"{disk.name} ({disk.size_bytes / BYTES_PER_GB:.2f}GB)"
+
+
+def display_disks(disks) -> tuple[list[str], list[str]]:
+    """
+    디스크 모델 목록을 collect_storage() 반환 형식으로 변환한다.
+
+    Args:
+        disks: core.spec_model.DiskSpec 튜플
+
+    Returns:
+        tuple[list[str], list[str]]: (ssd_list, hdd_list)
+            분류된 디스크가 하나도 없으면 (["모듈 정보 미제공"], ["모듈 정보 미제공"])
+    """
+    ssd_list = [display_disk(d) for d in disks if d.kind == "ssd"]
+    hdd_list = [display_disk(d) for d in disks if d.kind == "hdd"]
+    if not ssd_list and not hdd_list:
+        return [MODULE_INFO_NOT_PROVIDED], [MODULE_INFO_NOT_PROVIDED]
+    return ssd_list, hdd_list
+
+
 def format_ram_lines(ram_items: list[str]) -> str:
     """
     RAM 항목 리스트를 포맷팅된 텍스트로 변환
@@ -136,7 +244,53 @@ def format_storage_lines(storage_items: list[str]) -> str:
     return "\n".join(storage_items)
 
 
-def format_specs_text(specs: dict) -> str:
+def _text_list_section(label: str, items) -> list[str]:
+    """
+    목록 항목(VGA/SSD/HDD) 텍스트 줄을 만든다.
+    """
+    if items is None:
+        return [f"{label} : {INFO_NOT_PROVIDED}"]
+    if items:
+        return [f"{label} :"] + [f"  {item}" for item in items]
+    return [f"{label} : {NOT_INSTALLED}"]
+
+
+def _text_ram_section(ram) -> list[str]:
+    """
+    RAM 텍스트 줄을 만든다.
+    """
+    if ram is None:
+        return [f"RAM : {INFO_NOT_PROVIDED}"]
+    if not ram:
+        return [f"RAM : {NOT_INSTALLED}"]
+    total_gb_text, ram_list = ram
+    lines = ["RAM :"]
+    if total_gb_text and total_gb_text != NOT_INSTALLED:
+        lines.append(f"  총 용량 : {total_gb_text}")
+    if not ram_list:
+        lines.append("  메인보드 내장 메모리 (온보드)")
+    else:
+        lines.extend(f"  {item}" for item in ram_list)
+    return lines
+
+
+def _text_section(specs: dict, section: str) -> list[str]:
+    """
+    사양 키 하나의 텍스트 줄을 만든다.
+    """
+    label = "PC 유형" if section == "system_type" else SECTION_LABELS[section]
+    if is_timed_out(specs, section):
+        return [f"{label} : {TIMED_OUT_TEXT}"]
+    if section == "system_type":
+        return [f"{label} : {_format_system_type(specs.get(section))}"]
+    if section == "ram":
+        return _text_ram_section(specs.get(section, []))
+    if section in ("vga", "ssd", "hdd"):
+        return _text_list_section(label, specs.get(section, []))
+    return [f"{label} : {safe_str(specs.get(section))}"]
+
+
+def format_specs_text(specs: dict, sections: tuple[str, ...] = SPEC_SECTIONS) -> str:
     """
     사양 딕셔너리를 일반 텍스트 형식으로 변환
     
@@ -145,72 +299,12 @@ def format_specs_text(specs: dict) -> str:
     
     Args:
         specs: collect_all_specs() 반환 형식의 딕셔너리
+        sections: 출력할 사양 키와 순서 (기본값: 전체, 헤드리스 CLI의 카테고리 선택에 사용)
         
     Returns:
-        str: 포맷팅된 텍스트 문자열
+        str: 포맷팅된 텍스트 문자열 (항목 사이는 빈 줄)
     """
-    lines = []
-    
-    system_type = _format_system_type(specs.get("system_type"))
-    lines.append(f"PC 유형 : {system_type}")
-    lines.append("")
-    lines.append(f"CPU : {safe_str(specs.get('cpu'))}")
-    lines.append("")
-    
-    ram = specs.get('ram', [])
-    if ram is None:
-        lines.append(f"RAM : {INFO_NOT_PROVIDED}")
-    elif ram:
-        total_gb_text, ram_list = ram
-        lines.append("RAM :")
-        if total_gb_text and total_gb_text != NOT_INSTALLED:
-            lines.append(f"  총 용량 : {total_gb_text}")
-        if not ram_list:
-            lines.append("  메인보드 내장 메모리 (온보드)")
-        else:
-            for item in ram_list:
-                lines.append(f"  {item}")
-    else:
-        lines.append(f"RAM : {NOT_INSTALLED}")
-    lines.append("")
-    
-    lines.append(f"M/B : {safe_str(specs.get('mainboard'))}")
-    lines.append("")
-    
-    vga_items = specs.get('vga', [])
-    if vga_items is None:
-        lines.append(f"VGA : {INFO_NOT_PROVIDED}")
-    elif vga_items:
-        lines.append("VGA :")
-        for vga in vga_items:
-            lines.append(f"  {vga}")
-    else:
-        lines.append(f"VGA : {NOT_INSTALLED}")
-    lines.append("")
-    
-    ssd_items = specs.get('ssd', [])
-    if ssd_items is None:
-        lines.append(f"SSD : {INFO_NOT_PROVIDED}")
-    elif ssd_items:
-        lines.append("SSD :")
-        for ssd in ssd_items:
-            lines.append(f"  {ssd}")
-    else:
-        lines.append(f"SSD : {NOT_INSTALLED}")
-    lines.append("")
-    
-    hdd_items = specs.get('hdd', [])
-    if hdd_items is None:
-        lines.append(f"HDD : {INFO_NOT_PROVIDED}")
-    elif hdd_items:
-        lines.append("HDD :")
-        for hdd in hdd_items:
-            lines.append(f"  {hdd}")
-    else:
-        lines.append(f"HDD : {NOT_INSTALLED}")
-    
-    
-    return "\n".join(lines)
+    return "\n\n".join("\n".join(_text_section(specs, section)) for section in sections)
 
 def _render_single_row(label: str, value: str, add_sep: bool = True) -> str:
     """
@@ -272,9 +366,17 @@ def _render_list_rows(label: str, items: list[str], add_sep: bool = True) -> str
     return "\n".join(rows)
 
 
-def build_spec_html(spec: dict, accent_color: str = "#B4B7CB5A") -> str:
+def _render_spec_head(accent_color: str) -> str:
+    """
+    사양 HTML 문서의 머리(스타일 + 표 시작)를 생성한다.
+
+    Args:
+        accent_color: 구분선 색상
 
-    html = f"""<!DOCTYPE HTML>
+    Returns:
+        str: HTML 문자열
+    """
+    return f"""<!DOCTYPE HTML>
 <html>
 <head>
 <meta charset="utf-8"/>
@@ -335,52 +437,101 @@ tr.sep-row td {{
 <table>
 """
 
-    system_type = _format_system_type(spec.get("system_type"))
-    html += _render_single_row("PC 유형", system_type, add_sep=True)
-    html += _render_single_row("CPU", spec.get("cpu"), add_sep=True)
-    ram = spec.get("ram")
-    if ram:
-        total_str, ram_list = ram
-        ram_list = compress_items_xn(ram_list)
-
-        if not ram_list:
-            ram_items = [f"총 용량 : {total_str}", "메인보드 내장 메모리 (온보드)"]
-        else:
-            ram_items = [f"총 용량 : {total_str}"] + ram_list
-        html += _render_list_rows("RAM", ram_items, add_sep=True)
-    else:
-        html += _render_single_row("RAM", None, add_sep=True)
-    html += _render_single_row("M/B", spec.get("mainboard"), add_sep=True)
-    vga_items = spec.get("vga", [])
-    if vga_items is None:
-        vga_items = [INFO_NOT_PROVIDED]
-    html += _render_list_rows("VGA", vga_items, add_sep=True)
 
-    ssd_items = spec.get("ssd", [])
-    if ssd_items is None:
-        ssd_items = [INFO_NOT_PROVIDED]
-    html += _render_list_rows("SSD", ssd_items, add_sep=True)
+def render_spec_section(section: str, spec: dict, pending: bool = False) -> str:
+    """
+    사양 HTML의 단일 섹션(행 묶음)을 생성한다.
+
+    점진 렌더링 시 수집이 끝난 섹션만 다시 생성하기 위해 분리되어 있다.
 
-    hdd_items = spec.get("hdd", [])
-    if hdd_items is None:
-        hdd_items = [INFO_NOT_PROVIDED]
-    html += _render_list_rows("HDD", hdd_items, add_sep=False)
+    Args:
+        section: SPEC_SECTIONS 중 하나
+        spec: 사양 딕셔너리 (일부 키만 있어도 됨)
+        pending: True이면 값 대신 수집 중 표시
 
-    return html
+    Returns:
+        str: HTML 문자열 (시간 초과 섹션은 TIMED_OUT_TEXT 표시)
+    """
+    add_sep = section != SPEC_SECTIONS[-1]
+    label = SECTION_LABELS[section]
 
+    if pending:
+        return _render_single_row(label, PENDING, add_sep=add_sep)
 
+    if is_timed_out(spec, section):
+        return _render_single_row(label, TIMED_OUT_TEXT, add_sep=add_sep)
 
-def format_specs_html(specs: dict, accent_color: str = "#4b7bec") -> str:
+    if section == "system_type":
+        return _render_single_row(label, _format_system_type(spec.get("system_type")), add_sep=add_sep)
+
+    if section == "ram":
+        ram = spec.get("ram")
+        if ram:
+            total_str, ram_list = ram
+            ram_list = compress_items_xn(ram_list)
+
+            if not ram_list:
+                ram_items = [f"총 용량 : {total_str}", "메인보드 내장 메모리 (온보드)"]
+            else:
+                ram_items = [f"총 용량 : {total_str}"] + ram_list
+            return _render_list_rows(label, ram_items, add_sep=add_sep)
+        return _render_single_row(label, None, add_sep=add_sep)
+
+    if section in ("vga", "ssd", "hdd"):
+        items = spec.get(section, [])
+        if items is None:
+            items = [INFO_NOT_PROVIDED]
+        return _render_list_rows(label, items, add_sep=add_sep)
+
+    return _render_single_row(label, spec.get(section), add_sep=add_sep)
+
+
+def assemble_spec_html(sections: dict, accent_color: str = "#B4B7CB5A") -> str:
+    """
+    섹션별 HTML 조각을 SPEC_SECTIONS 순서로 이어 붙여 완전한 문서를 만든다.
+
+    Args:
+        sections: 섹션 이름 → render_spec_section() 결과
+        accent_color: 구분선 색상
+
+    Returns:
+        str: 완전한 HTML 문서 문자열
+    """
+    return _render_spec_head(accent_color) + "".join(sections.get(s, "") for s in SPEC_SECTIONS)
+
+
+def build_spec_html(spec: dict, accent_color: str = "#B4B7CB5A", pending=()) -> str:
+    """
+    사양 딕셔너리 전체를 HTML 문서로 변환한다.
+
+    Args:
+        spec: 사양 딕셔너리
+        accent_color: 구분선 색상
+        pending: 수집 중으로 표시할 섹션 이름 목록
+
+    Returns:
+        str: 완전한 HTML 문서 문자열
+    """
+    sections = {
+        section: render_spec_section(section, spec, pending=section in pending)
+        for section in SPEC_SECTIONS
+    }
+    return assemble_spec_html(sections, accent_color)
+
+
+
+def format_specs_html(specs: dict, accent_color: str = "#4b7bec", pending=()) -> str:
     """
     사양 딕셔너리를 HTML 형식으로 변환
     
     build_spec_html()의 공개 API 별칭
     
     Args:
-        specs: collect_all_specs() 반환 형식의 딕셔너리
+        specs: collect_all_specs() 반환 형식의 딕셔너리 (일부 키만 있어도 됨)
         accent_color: 구분선 색상 (기본값: "#4b7bec")
+        pending: 수집 중으로 표시할 사양 키 목록 (기본값: 없음)
         
     Returns:
         str: 완전한 HTML 문서 문자열
     """
-    return build_spec_html(specs, accent_color)
+    return build_spec_html(specs, accent_color, pending)
@@ -9,10 +9,10 @@
 - 책임: 함수 기반 formatter를 객체 인터페이스로 변환
 - 비책임: 실제 포맷팅 로직 (기존 formatter 함수에 위임)
 - 사용처: Controller에서 ISpecFormatter 구현체로 주입
+- core.formatter는 최초 포맷팅 시점에 import (첫 화면 표시 지연 방지)
 """
 
 from core.interfaces import ISpecFormatter
-from core import formatter
 
 
 class FormatterWrapper:
@@ -34,6 +34,7 @@ class FormatterWrapper:
         Returns:
             str: 포맷팅된 텍스트 문자열
         """
+        from core import formatter
         return formatter.format_specs_text(specs)
     
     def format_specs_html(self, specs: dict, accent_color: str = "#4b7bec") -> str:
@@ -47,5 +48,34 @@ class FormatterWrapper:
         Returns:
             str: 완전한 HTML 문서 문자열
         """
+        from core import formatter
         return formatter.format_specs_html(specs, accent_color)
-
+    
+    def render_spec_section(self, section: str, specs: dict, pending: bool = False) -> str:
+        """
+        사양 키 하나에 해당하는 HTML 조각 생성
+        
+        Args:
+            section: 사양 키 (예: "cpu", "ssd")
+            specs: 사양 딕셔너리 (일부 키만 있어도 됨)
+            pending: True이면 수집 중 표시
+            
+        Returns:
+            str: HTML 조각 문자열
+        """
+        from core import formatter
+        return formatter.render_spec_section(section, specs, pending)
+    
+    def assemble_spec_html(self, sections: dict, accent_color: str = "#4b7bec") -> str:
+        """
+        섹션별 HTML 조각으로 완전한 HTML 문서 조립
+        
+        Args:
+            sections: 사양 키 → HTML 조각
+            accent_color: 구분선 색상 (기본값: "#4b7bec")
+            
+        Returns:
+            str: 완전한 HTML 문서 문자열
+        """
+        from core import formatter
+        return formatter.assemble_spec_html(sections, accent_color)
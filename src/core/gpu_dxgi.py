@@ -16,6 +16,9 @@ import ctypes
 from ctypes import wintypes
 from dataclasses import dataclass
 
+from core import pci_ids
+from core.gpu_format import MIN_VRAM_BYTES, format_gpu_strings
+
 # ------------------------------------------------------------
 # Public API
 # ------------------------------------------------------------
@@ -56,6 +59,9 @@ class DxgiGpu:
     vendor: str
     dedicated_vram_bytes: int  # DedicatedVideoMemory
     shared_sys_bytes: int      # SharedSystemMemory
+    vendor_id: int = 0
+    device_id: int = 0
+    subsys_id: int = 0         # 상위 16비트 서브시스템 디바이스, 하위 16비트 서브시스템 벤더
 
 
 def collect_gpu_dxgi_raw(logger=None) -> list[DxgiGpu]:
@@ -163,8 +169,9 @@ def collect_gpu_dxgi_raw(logger=None) -> list[DxgiGpu]:
             hr_desc = get_desc(ctypes.cast(adapter, ctypes.c_void_p), ctypes.byref(desc))
 
             if not _hr_failed(hr_desc):
-                name = (desc.Description or "").strip() or "알 수 없음"
-                vendor = _vendor_name(int(desc.VendorId))
+                vendor_id, device_id, subsys_id = int(desc.VendorId), int(desc.DeviceId), int(desc.SubSysId)
+                name = (desc.Description or "").strip() or _device_name(vendor_id, device_id, subsys_id)
+                vendor = _vendor_name(vendor_id)
                 dedicated = int(desc.DedicatedVideoMemory)
                 shared = int(desc.SharedSystemMemory)
 
@@ -172,7 +179,10 @@ def collect_gpu_dxgi_raw(logger=None) -> list[DxgiGpu]:
                     name=name,
                     vendor=vendor,
                     dedicated_vram_bytes=dedicated,
-                    shared_sys_bytes=shared
+                    shared_sys_bytes=shared,
+                    vendor_id=vendor_id,
+                    device_id=device_id,
+                    subsys_id=subsys_id,
                 ))
             else:
                 if logger:
@@ -190,23 +200,16 @@ def collect_gpu_dxgi_raw(logger=None) -> list[DxgiGpu]:
     return gpus
 
 
-def collect_gpu_dxgi_strings(
-    logger=None,
-    min_vram_bytes: int = 1024 ** 3,
-    sort_by_vram_desc: bool = True,
-) -> list[str]:
+def collect_gpu_dxgi_physical(logger=None, sort_by_vram_desc: bool = True) -> list[DxgiGpu]:
     """
-    DXGI 기반 GPU 표시 문자열을 반환한다.
-
-    VRAM 기준 필터링 및 정렬 정책을 적용한다.
+    DXGI 어댑터 중 물리 GPU만 반환한다. (Microsoft 가상 어댑터 제외)
 
     Args:
         logger: 로깅용 객체(옵션)
-        min_vram_bytes: VRAM 표기 최소 기준
         sort_by_vram_desc: 전용 VRAM 내림차순 정렬 여부
 
     Returns:
-        list[str]: GPU 표시 문자열 목록
+        list[DxgiGpu]: 물리 GPU 목록
     """
     gpus = collect_gpu_dxgi_raw(logger=logger)
     if not gpus:
@@ -219,20 +222,31 @@ def collect_gpu_dxgi_strings(
         and "microsoft" not in g.name.lower()
     ]
 
-    if not gpus:
-        return []
-
     if sort_by_vram_desc:
-        gpus = sorted(gpus, key=lambda x: x.dedicated_vram_bytes, reverse=True)
+        gpus.sort(key=lambda x: x.dedicated_vram_bytes, reverse=True)
+    return gpus
 
-    out: list[str] = []
-    for g in gpus:
-        if g.dedicated_vram_bytes >= min_vram_bytes:
-            out.append(f"{g.name} ({_bytes_to_gb_str(g.dedicated_vram_bytes)} / {g.vendor})")
-        else:
-            out.append(f"{g.name} ({g.vendor})" if g.vendor else g.name)
 
-    return out
+def collect_gpu_dxgi_strings(
+    logger=None,
+    min_vram_bytes: int = MIN_VRAM_BYTES,
+    sort_by_vram_desc: bool = True,
+) -> list[str]:
+    """
+    DXGI 기반 GPU 표시 문자열을 반환한다.
+
+    VRAM 기준 필터링 및 정렬 정책을 적용한다. (core.gpu_format.format_gpu_strings)
+
+    Args:
+        logger: 로깅용 객체(옵션)
+        min_vram_bytes: VRAM 표기 최소 기준
+        sort_by_vram_desc: 전용 VRAM 내림차순 정렬 여부
+
+    Returns:
+        list[str]: GPU 표시 문자열 목록
+    """
+    gpus = collect_gpu_dxgi_physical(logger=logger, sort_by_vram_desc=sort_by_vram_desc)
+    return format_gpu_strings(gpus, min_vram_bytes=min_vram_bytes, sort_by_vram_desc=False)
 
 
 # ------------------------------------------------------------
@@ -346,39 +360,36 @@ class DXGI_ADAPTER_DESC(ctypes.Structure):
 DXGI_ERROR_NOT_FOUND = 0x887A0002  # unsigned
 
 
-_VENDOR_MAP = {
-    0x10DE: "NVIDIA",
-    0x1002: "AMD",
-    0x1022: "AMD",
-    0x8086: "Intel",
-    0x1414: "Microsoft",
-}
-
-
 def _vendor_name(vendor_id: int) -> str:
     """
     벤더 ID를 표시용 이름으로 변환한다.
 
+    주요 벤더는 짧은 이름, 그 외는 PCI ID 색인의 벤더 이름을 사용한다.
+
     Args:
         vendor_id: PCI 벤더 ID
 
     Returns:
         str: 벤더 표시 문자열
     """
-    return _VENDOR_MAP.get(vendor_id, f"VEN_{vendor_id:04X}")
+    return pci_ids.gpu_vendor_name(vendor_id)
 
 
-def _bytes_to_gb_str(b: int) -> str:
+def _device_name(vendor_id: int, device_id: int, subsys_id: int) -> str:
     """
-    바이트 값을 GB 문자열로 변환한다.
+    어댑터 설명이 비어 있을 때 PCI ID 색인으로 장치 이름을 만든다.
 
     Args:
-        b: 바이트 값
+        vendor_id: PCI 벤더 ID
+        device_id: PCI 디바이스 ID
+        subsys_id: DXGI SubSysId
 
     Returns:
-        str: GB 표기 문자열
+        str: 장치 표시 문자열 (색인에 없으면 "알 수 없음")
     """
-    return f"{(b / (1024 ** 3)):.0f}GB"
+    subvendor_id = (subsys_id & 0xFFFF) if subsys_id else None
+    subdevice_id = (subsys_id >> 16) if subsys_id else None
+    return pci_ids.gpu_device_name(vendor_id, device_id, subvendor_id, subdevice_id) or "알 수 없음"
 
 
 def _hr_failed(hr: int) -> bool:
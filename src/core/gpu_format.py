@@ -0,0 +1,70 @@
+# 본 소스코드는 내부 사용 및 유지보수 목적에 한해 제공됩니다.
+# 무단 재배포 및 상업적 재사용은 허용되지 않습니다.
+# core/gpu_format.py
+
+from __future__ import annotations
+
+"""
+GPU 표시 문자열 정책
+플랫폼별 GPU 수집 결과(DXGI, Linux sysfs)에 같은 정렬/VRAM 표기 규칙을 적용
+
+- 책임: 전용 VRAM 내림차순 정렬, min_vram_bytes 미만 VRAM 표기 생략, "이름 (VRAM / 벤더)" 문자열 생성
+- 비책임: GPU 수집, 가상 어댑터 판별 (각 수집 모듈 담당)
+- 사용처: core.gpu_dxgi.collect_gpu_dxgi_strings(), core.formatter.display_gpus() (모든 수집 경로의 GPU 표기)
+- ctypes/Windows 의존성이 없어 모든 플랫폼에서 import 가능
+"""
+
+# VRAM 표기 최소 기준 (iGPU 등 공유 메모리 어댑터는 표기 생략)
+MIN_VRAM_BYTES = 1024 ** 3
+
+
+def bytes_to_gb_str(b: int) -> str:
+    """
+    바이트 값을 GB 문자열로 변환한다.
+
+    Args:
+        b: 바이트 값
+
+    Returns:
+        str: GB 표기 문자열
+    """
+    return f"{(b / (1024 ** 3)):.0f}GB"
+
+
+def format_gpu_line(gpu, min_vram_bytes: int = MIN_VRAM_BYTES) -> str:
+    """
+    GPU 하나의 표시 문자열을 만든다.
+
+    Args:
+        gpu: name, vendor, dedicated_vram_bytes 속성을 가진 GPU 객체
+        min_vram_bytes: VRAM 표기 최소 기준
+
+    Returns:
+        str: "이름 (VRAM / 벤더)", "이름 (VRAM)", "이름 (벤더)" 또는 "이름"
+    """
+    if gpu.dedicated_vram_bytes >= min_vram_bytes:
+        vram = bytes_to_gb_str(gpu.dedicated_vram_bytes)
+        return f"{gpu.name} ({vram} / {gpu.vendor})" if gpu.vendor else f"{gpu.name} ({vram})"
+    return f"{gpu.name} ({gpu.vendor})" if gpu.vendor else gpu.name
+
+
+def format_gpu_strings(
+    gpus: list,
+    min_vram_bytes: int = MIN_VRAM_BYTES,
+    sort_by_vram_desc: bool = True,
+) -> list[str]:
+    """
+    GPU 목록을 표시 문자열 목록으로 변환한다.
+
+    Args:
+        gpus: name, vendor, dedicated_vram_bytes 속성을 가진 GPU 객체 목록
+        min_vram_bytes: VRAM 표기 최소 기준
+        sort_by_vram_desc: 전용 VRAM 내림차순 정렬 여부
+
+    Returns:
+        list[str]: GPU 표시 문자열 목록
+    """
+    if sort_by_vram_desc:
+        gpus = sorted(gpus, key=lambda x: x.dedicated_vram_bytes, reverse=True)
+
+    return [format_gpu_line(g, min_vram_bytes) for g in gpus]
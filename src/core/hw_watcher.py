@@ -0,0 +1,454 @@
+# 본 소스코드는 내부 사용 및 유지보수 목적에 한해 제공됩니다.
+# 무단 재배포 및 상업적 재사용은 허용되지 않습니다.
+# core/hw_watcher.py
+
+from __future__ import annotations
+
+"""
+하드웨어 변경 감시
+장치 추가/제거 알림을 구독해 영향받는 카테고리(storage/vga)만 다시 수집하도록 알림 (주기 재수집 없음)
+
+- 책임: 이벤트 공급원 실행, 짧은 시간 안의 연속 이벤트를 카테고리 단위로 모아 한 번에 전달, 집계
+- 비책임: 재수집 (on_change 콜백을 받은 Controller/SpecDaemon 담당)
+- 사용처: main.py (GUI), spec_cli --serve --watch-hardware (SpecDaemon)
+
+이벤트 공급원 (core.interfaces.IHardwareEventSource):
+    - UeventSource: Linux 커널 uevent(netlink) — /sys/block(SUBSYSTEM=block), /sys/class/drm(SUBSYSTEM=drm)
+    - WmiEventSource: Windows WMI __InstanceOperationEvent (MSFT_PhysicalDisk, Win32_VideoController 클래스마다 구독 1개)
+    - QueueEventSource: push()로 이벤트를 직접 넣는 공급원 (검증 스크립트/수동 트리거)
+- 감시 스레드는 소켓/WMI 이벤트/조건 변수에서 블로킹하므로 대기 중 이 프로세스의 CPU 사용은 없음
+- 단, WMI 내장 이벤트는 WMI 서비스가 WITHIN 간격마다 클래스를 열거해 비교하는 폴링 방식이므로
+  Windows에서는 WMI 서비스(WmiPrvSE) 쪽에 구독 수 × 클래스 열거 비용이 WMI_EVENT_WITHIN_S마다 발생
+"""
+
+import logging
+import os
+import queue
+import socket
+import threading
+import time
+from typing import Callable
+
+from core.spec_schema import CATEGORY_STORAGE, CATEGORY_VGA, SPEC_CATEGORIES
+
+logger = logging.getLogger(__name__)
+
+# 연속 이벤트(디스크 + 파티션들)를 모으는 시간(초)
+DEBOUNCE_S = 0.3
+# 종료 시 감시 스레드를 기다리는 최대 시간(초)
+STOP_TIMEOUT_S = 2.0
+
+ACTION_ADD = "add"
+ACTION_REMOVE = "remove"
+ACTION_CHANGE = "change"
+
+# Linux netlink 커널 uevent
+NETLINK_KOBJECT_UEVENT = 15
+UEVENT_KERNEL_GROUP = 1
+UEVENT_BUFFER_BYTES = 64 * 1024
+# SUBSYSTEM → (카테고리, 반응할 ACTION)
+# drm의 change는 모니터 연결/해제(커넥터)이므로 GPU 목록과 무관하여 무시
+UEVENT_SUBSYSTEMS = {
+    "block": (CATEGORY_STORAGE, (ACTION_ADD, ACTION_REMOVE, ACTION_CHANGE)),
+    "drm": (CATEGORY_VGA, (ACTION_ADD, ACTION_REMOVE)),
+}
+
+# Windows WMI 내장 이벤트 (네임스페이스, 클래스, 카테고리)
+WMI_WATCH_CLASSES = (
+    (r"root\Microsoft\Windows\Storage", "MSFT_PhysicalDisk", CATEGORY_STORAGE),
+    (r"root\cimv2", "Win32_VideoController", CATEGORY_VGA),
+)
+# 생성/삭제/수정을 한 구독으로 받는 내장 이벤트 (클래스마다 구독 1개 = 서비스 폴링 1개)
+WMI_NOTIFICATION_TYPE = "Operation"
+# 이벤트 클래스(__CLASS, wmi 모듈의 event_type) → 동작 (수정 이벤트는 장치 목록과 무관하여 무시)
+WMI_EVENT_ACTIONS = {"creation": ACTION_ADD, "deletion": ACTION_REMOVE}
+# WMI 서비스의 내장 이벤트 확인 간격(초) (WITHIN 절, 서비스가 이 간격마다 클래스를 열거)
+WMI_EVENT_WITHIN_S = 1
+# 종료 요청 확인을 위한 이벤트 대기 시간(ms)
+WMI_WAIT_TIMEOUT_MS = 1000
+
+
+class HardwareEvent:
+    """
+    하드웨어 변경 이벤트 1건
+
+    - 책임: 카테고리/동작/장치 정보 보관
+    - 비책임: 해석 (공급원 담당)
+    - 사용처: IHardwareEventSource → HardwareWatcher
+    """
+
+    __slots__ = ("category", "action", "detail", "received_mono")
+
+    def __init__(self, category: str, action: str = ACTION_CHANGE, detail: str = ""):
+        """
+        HardwareEvent 초기화
+
+        Args:
+            category: SPEC_CATEGORIES 중 하나
+            action: ACTION_ADD/ACTION_REMOVE/ACTION_CHANGE
+            detail: 장치 정보 (로그용, 예: "sdb", "MSFT_PhysicalDisk")
+        """
+        if category not in SPEC_CATEGORIES:
+            raise ValueError(f"알 수 없는 수집 카테고리: {category}")
+        self.category = category
+        self.action = action
+        self.detail = detail
+        self.received_mono = time.monotonic()
+
+    def __repr__(self) -> str:
+        return f"HardwareEvent({self.category!r}, {self.action!r}, {self.detail!r})"
+
+
+def parse_uevent(data: bytes) -> HardwareEvent | None:
+    """
+    커널 uevent 메시지를 해석한다.
+
+    메시지 형식: "ACTION@DEVPATH\\0KEY=VALUE\\0..." (SUBSYSTEM/DEVNAME/DEVTYPE 사용)
+    파티션과 가상 블록 장치(loop/zram/dm 등)는 무시한다.
+
+    Args:
+        data: netlink 수신 바이트
+
+    Returns:
+        HardwareEvent | None: 감시 대상 장치 이벤트가 아니면 None
+    """
+    fields = {}
+    for item in data.split(b"\0")[1:]:
+        key, sep, value = item.partition(b"=")
+        if sep:
+            fields[key.decode("ascii", "replace")] = value.decode("utf-8", "replace")
+    target = UEVENT_SUBSYSTEMS.get(fields.get("SUBSYSTEM", ""))
+    action = fields.get("ACTION", "")
+    if target is None or action not in target[1]:
+        return None
+    category = target[0]
+    devname = fields.get("DEVNAME", "") or os.path.basename(fields.get("DEVPATH", ""))
+    if category == CATEGORY_STORAGE:
+        from core.linux_backend import VIRTUAL_BLOCK_PREFIXES
+
+        if fields.get("DEVTYPE") != "disk" or devname.startswith(VIRTUAL_BLOCK_PREFIXES):
+            return None
+    elif category == CATEGORY_VGA:
+        # card0 등 GPU 장치만 (card0-HDMI-A-1 커넥터, renderD128 제외)
+        name = os.path.basename(devname)
+        if not name.startswith("card") or "-" in name:
+            return None
+    return HardwareEvent(category, action, devname)
+
+
+class QueueEventSource:
+    """
+    push()로 넣은 이벤트를 전달하는 공급원
+
+    - 책임: 다른 스레드에서 넣은 이벤트를 run()에서 순서대로 전달
+    - 비책임: 운영체제 알림 구독
+    - 사용처: Scripts/bench/bench_hw_watcher.py, 수동 트리거
+    """
+
+    _CLOSE = object()
+
+    def __init__(self):
+        self._queue: queue.Queue = queue.Queue()
+
+    def push(self, category: str, action: str = ACTION_CHANGE, detail: str = "") -> None:
+        """
+        이벤트를 넣는다. (스레드 안전)
+
+        Args:
+            category: SPEC_CATEGORIES 중 하나
+            action: 동작
+            detail: 장치 정보
+
+        Returns:
+            None
+        """
+        self._queue.put(HardwareEvent(category, action, detail))
+
+    def run(self, emit: Callable[[HardwareEvent], None]) -> None:
+        """
+        close()까지 이벤트를 기다려 emit()으로 전달한다. (블로킹)
+        """
+        while True:
+            event = self._queue.get()
+            if event is self._CLOSE:
+                return
+            emit(event)
+
+    def close(self) -> None:
+        """
+        run()을 끝낸다.
+        """
+        self._queue.put(self._CLOSE)
+
+
+class UeventSource:
+    """
+    Linux 커널 uevent(netlink)로 블록/DRM 장치 추가·제거를 받는 공급원
+
+    - 책임: NETLINK_KOBJECT_UEVENT 소켓 구독, 메시지 해석 (parse_uevent)
+    - 비책임: 장치 정보 수집 (core.linux_backend)
+    - 사용처: default_event_source() (Linux)
+    - sysfs는 inotify 이벤트를 만들지 않으므로 udev와 같은 커널 uevent를 직접 구독
+    """
+
+    def __init__(self):
+        """
+        UeventSource 초기화 (소켓 생성/바인드)
+
+        Raises:
+            OSError: netlink 소켓을 열 수 없음 (컨테이너/권한 제한 등)
+        """
+        self._sock = socket.socket(socket.AF_NETLINK, socket.SOCK_DGRAM, NETLINK_KOBJECT_UEVENT)
+        try:
+            self._sock.bind((0, UEVENT_KERNEL_GROUP))
+        except OSError:
+            self._sock.close()
+            raise
+        self._wake_r, self._wake_w = os.pipe()
+        self._closed = False
+
+    def run(self, emit: Callable[[HardwareEvent], None]) -> None:
+        """
+        close()까지 uevent를 기다려 감시 대상 이벤트만 emit()으로 전달한다. (블로킹)
+        """
+        import select
+
+        try:
+            while not self._closed:
+                readable, _, _ = select.select([self._sock, self._wake_r], [], [])
+                if self._wake_r in readable:
+                    return
+                try:
+                    data = self._sock.recv(UEVENT_BUFFER_BYTES)
+                except OSError as e:
+                    # 수신 버퍼 초과(ENOBUFS) 시 일부 이벤트를 잃었으므로 두 카테고리 모두 알림
+                    logger.warning("uevent 수신 실패: %s", e)
+                    emit(HardwareEvent(CATEGORY_STORAGE, ACTION_CHANGE, "uevent 유실"))
+                    emit(HardwareEvent(CATEGORY_VGA, ACTION_CHANGE, "uevent 유실"))
+                    continue
+                event = parse_uevent(data)
+                if event is not None:
+                    emit(event)
+        finally:
+            self._sock.close()
+            os.close(self._wake_r)
+
+    def close(self) -> None:
+        """
+        run()을 끝낸다. (다른 스레드에서 호출)
+        """
+        if self._closed:
+            return
+        self._closed = True
+        try:
+            os.write(self._wake_w, b"x")
+        finally:
+            os.close(self._wake_w)
+
+
+class WmiEventSource:
+    """
+    Windows WMI 내장 이벤트로 물리 디스크/비디오 컨트롤러 추가·제거를 받는 공급원
+
+    - 책임: 클래스마다 COM 아파트먼트와 연결을 가진 대기 스레드 실행, 이벤트 클래스를 추가/제거로 변환
+    - 비책임: 장치 정보 수집 (core.collector)
+    - 사용처: default_event_source() (Windows, wmi 사용 가능)
+    - WMI_WAIT_TIMEOUT_MS마다 대기에서 깨어 종료 요청만 확인
+    - 이벤트 확인은 WMI 서비스가 WMI_EVENT_WITHIN_S마다 클래스를 열거하는 폴링이므로
+      생성/삭제를 따로 구독하지 않고 __InstanceOperationEvent 하나로 받아 폴링 수를 클래스 수로 제한
+    """
+
+    def __init__(self):
+        self._closed = threading.Event()
+
+    def run(self, emit: Callable[[HardwareEvent], None]) -> None:
+        """
+        close()까지 WMI 이벤트를 기다려 emit()으로 전달한다. (블로킹)
+        """
+        threads = []
+        for namespace, class_name, category in WMI_WATCH_CLASSES:
+            thread = threading.Thread(
+                target=self._watch,
+                args=(namespace, class_name, category, emit),
+                name=f"hw-watch-{class_name}",
+                daemon=True,
+            )
+            thread.start()
+            threads.append(thread)
+        self._closed.wait()
+        for thread in threads:
+            thread.join(WMI_WAIT_TIMEOUT_MS / 1000 * 2)
+
+    def close(self) -> None:
+        """
+        run()을 끝낸다. (다른 스레드에서 호출)
+        """
+        self._closed.set()
+
+    def _watch(self, namespace, class_name, category, emit) -> None:
+        from core import collector
+
+        with collector._com_apartment():
+            try:
+                conn = collector.wmi.WMI(namespace=namespace)
+                watcher = conn.watch_for(
+                    notification_type=WMI_NOTIFICATION_TYPE, wmi_class=class_name, delay_secs=WMI_EVENT_WITHIN_S
+                )
+            except Exception as e:
+                logger.warning("WMI 이벤트 구독 실패 | %s | %s", class_name, e)
+                return
+            logger.info("WMI 이벤트 구독 | %s", class_name)
+            while not self._closed.is_set():
+                try:
+                    instance = watcher(timeout_ms=WMI_WAIT_TIMEOUT_MS)
+                except collector.wmi.x_wmi_timed_out:
+                    continue
+                except Exception as e:
+                    logger.warning("WMI 이벤트 대기 실패 | %s | %s", class_name, e)
+                    return
+                action = WMI_EVENT_ACTIONS.get(getattr(instance, "event_type", None))
+                if action is None:
+                    continue
+                detail = getattr(instance, "FriendlyName", None) or getattr(instance, "Name", None) or class_name
+                emit(HardwareEvent(category, action, str(detail)))
+
+
+def default_event_source():
+    """
+    현재 플랫폼의 하드웨어 변경 이벤트 공급원을 만든다.
+
+    Returns:
+        IHardwareEventSource | None: 공급원 (지원하지 않거나 구독할 수 없으면 None)
+    """
+    if os.name == "nt":
+        from core import collector
+
+        if not collector._load_wmi():
+            logger.info("하드웨어 변경 감시 미사용 (wmi 모듈 없음)")
+            return None
+        return WmiEventSource()
+    if hasattr(socket, "AF_NETLINK"):
+        try:
+            return UeventSource()
+        except OSError as e:
+            logger.info("하드웨어 변경 감시 미사용 (uevent 구독 실패: %s)", e)
+            return None
+    logger.info("하드웨어 변경 감시 미사용 (지원하지 않는 플랫폼)")
+    return None
+
+
+class HardwareWatcher:
+    """
+    이벤트 공급원을 실행하고 변경된 카테고리를 모아 콜백으로 전달
+
+    - 책임: 공급원/전달 스레드 수명 관리, DEBOUNCE_S 동안의 이벤트를 카테고리 집합으로 병합, 집계
+    - 비책임: 재수집 (on_change 콜백 담당, 전달 스레드에서 호출되므로 GUI는 시그널로 넘겨야 함)
+    - 사용처: Controller (GUI), SpecDaemon
+    """
+
+    def __init__(self, source, debounce_s: float = DEBOUNCE_S):
+        """
+        HardwareWatcher 초기화
+
+        Args:
+            source: IHardwareEventSource 구현체
+            debounce_s: 첫 이벤트 후 추가 이벤트를 모으는 시간(초)
+        """
+        self._source = source
+        self._debounce_s = debounce_s
+        self._cond = threading.Condition()
+        self._pending: set = set()
+        self._stopped = False
+        self._threads: list = []
+        self.events = 0
+        self.dispatches = 0
+        self.coalesced = 0
+
+    def start(self, on_change: Callable[[tuple], None]) -> None:
+        """
+        감시를 시작한다.
+
+        Args:
+            on_change: 변경된 카테고리 튜플(SPEC_CATEGORIES 순서)을 받는 콜백 (전달 스레드에서 호출)
+
+        Returns:
+            None
+        """
+        self._threads = [
+            threading.Thread(target=self._run_source, name="hw-watch-source", daemon=True),
+            threading.Thread(target=self._dispatch_loop, args=(on_change,), name="hw-watch-dispatch", daemon=True),
+        ]
+        for thread in self._threads:
+            thread.start()
+        logger.info("하드웨어 변경 감시 시작 | %s", type(self._source).__name__)
+
+    def stop(self, timeout_s: float = STOP_TIMEOUT_S) -> None:
+        """
+        감시를 종료한다. (모으는 중이던 이벤트는 전달하지 않음)
+
+        Args:
+            timeout_s: 스레드 종료 대기 최대 시간(초)
+
+        Returns:
+            None
+        """
+        with self._cond:
+            if self._stopped:
+                return
+            self._stopped = True
+            self._cond.notify_all()
+        try:
+            self._source.close()
+        except Exception:
+            logger.debug("이벤트 공급원 종료 실패", exc_info=True)
+        deadline = time.monotonic() + timeout_s
+        for thread in self._threads:
+            thread.join(max(0.0, deadline - time.monotonic()))
+        logger.info("하드웨어 변경 감시 종료 | %s", self.stats())
+
+    def stats(self) -> dict:
+        """
+        이벤트/전달 집계를 반환한다.
+
+        Returns:
+            dict: {"events": 받은 이벤트 수, "dispatches": 콜백 호출 수, "coalesced": 병합되어 생략된 이벤트 수}
+        """
+        with self._cond:
+            return {"events": self.events, "dispatches": self.dispatches, "coalesced": self.coalesced}
+
+    def _on_event(self, event: HardwareEvent) -> None:
+        with self._cond:
+            self.events += 1
+            if event.category in self._pending:
+                self.coalesced += 1
+            self._pending.add(event.category)
+            self._cond.notify_all()
+        logger.info("하드웨어 변경 이벤트 | %s %s %s", event.category, event.action, event.detail)
+
+    def _run_source(self) -> None:
+        try:
+            self._source.run(self._on_event)
+        except Exception:
+            logger.exception("하드웨어 변경 이벤트 공급원 실패")
+
+    def _dispatch_loop(self, on_change: Callable[[tuple], None]) -> None:
+        while True:
+            with self._cond:
+                while not self._pending and not self._stopped:
+                    self._cond.wait()
+                if self._stopped:
+                    return
+                deadline = time.monotonic() + self._debounce_s
+                remaining = self._debounce_s
+                while remaining > 0 and not self._stopped:
+                    self._cond.wait(remaining)
+                    remaining = deadline - time.monotonic()
+                if self._stopped:
+                    return
+                categories = tuple(c for c in SPEC_CATEGORIES if c in self._pending)
+                self._pending.clear()
+                self.dispatches += 1
+            try:
+                on_change(categories)
+            except Exception:
+                logger.exception("하드웨어 변경 처리 실패 | %s", ", ".join(categories))
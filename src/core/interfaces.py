@@ -8,12 +8,19 @@ SOLID 원칙의 ISP(Interface Segregation)와 DIP(Dependency Inversion)를 준
 
 - ISpecCollector: 시스템 사양 수집 인터페이스
 - ISpecFormatter: 사양 데이터 포맷팅 인터페이스
+- IStreamingSpecCollector: 카테고리별 스트리밍 수집 인터페이스 (선택 구현)
+- IIncrementalSpecFormatter: 섹션 단위 HTML 생성 인터페이스 (선택 구현)
+- IHardwareEventSource: 하드웨어 변경 알림 공급원 인터페이스 (core.hw_watcher)
 - 성능 최적화 구현체는 이 인터페이스를 구현하여 기존 코드와 호환
 
 - controller.py에서 인터페이스에 의존하여 구현체 교체 가능
 - core/collector.py, core/formatter.py는 기본 구현체로 유지
 """
 
+from typing import Callable, Iterator
+
+from core.spec_schema import SPEC_CATEGORIES
+
 try:
     from typing import Protocol
 except ImportError:
@@ -46,6 +53,40 @@ class ISpecCollector(Protocol):
         """
         ...
 
+    def collect(self, categories: tuple[str, ...] = SPEC_CATEGORIES) -> dict:
+        """
+        지정한 카테고리만 수집하여 사양 딕셔너리로 반환 (선택 재수집)
+
+        구현하지 않은 수집기는 collect_all_specs()로 대체된다. (core.refresh_scheduler 참고)
+
+        Args:
+            categories: 수집할 카테고리 목록 (core.spec_schema.SPEC_CATEGORIES 중 일부)
+
+        Returns:
+            dict: collect_all_specs() 반환 형식의 딕셔너리
+                (지정하지 않은 카테고리의 값은 의미 없음, 시간 초과 시 "timed_out" 포함)
+        """
+        ...
+
+
+class IStreamingSpecCollector(Protocol):
+    """
+    카테고리별 스트리밍 수집 인터페이스
+    
+    - 책임: 카테고리 수집 결과를 완료 순서대로 반환하는 메서드 정의
+    - 비책임: 결과 병합 (core.spec_schema.merge_category_result 사용)
+    - 사용처: Controller의 점진 렌더링 (구현체가 제공할 때만 사용)
+    """
+    
+    def iter_category_results(self) -> Iterator[tuple[str, object]]:
+        """
+        카테고리별 수집 결과를 완료되는 순서대로 반환
+        
+        Yields:
+            tuple[str, object]: (core.spec_schema.SPEC_CATEGORIES 중 하나, 수집 결과)
+        """
+        ...
+
 
 class ISpecFormatter(Protocol):
     """
@@ -80,3 +121,65 @@ class ISpecFormatter(Protocol):
             str: 완전한 HTML 문서 문자열
         """
         ...
+
+
+class IIncrementalSpecFormatter(Protocol):
+    """
+    섹션 단위 HTML 생성 인터페이스
+    
+    - 책임: 사양 키 단위 HTML 조각 생성 및 문서 조립 메서드 정의
+    - 비책임: 전체 문서 일괄 생성 (ISpecFormatter 담당)
+    - 사용처: Controller의 점진 렌더링 (구현체가 제공할 때만 사용)
+    """
+    
+    def render_spec_section(self, section: str, specs: dict, pending: bool = False) -> str:
+        """
+        사양 키 하나에 해당하는 HTML 조각 생성
+        
+        Args:
+            section: 사양 키 (예: "cpu", "ssd")
+            specs: 사양 딕셔너리 (일부 키만 있어도 됨)
+            pending: True이면 수집 중 표시
+            
+        Returns:
+            str: HTML 조각 문자열
+        """
+        ...
+    
+    def assemble_spec_html(self, sections: dict, accent_color: str = "#4b7bec") -> str:
+        """
+        섹션별 HTML 조각으로 완전한 HTML 문서 조립
+        
+        Args:
+            sections: 사양 키 → HTML 조각
+            accent_color: 구분선 색상 (기본값: "#4b7bec")
+            
+        Returns:
+            str: 완전한 HTML 문서 문자열
+        """
+        ...
+
+
+class IHardwareEventSource(Protocol):
+    """
+    하드웨어 변경 알림 공급원 인터페이스
+
+    - 책임: 운영체제 알림(또는 가짜 이벤트 흐름)을 core.hw_watcher.HardwareEvent로 전달
+    - 비책임: 이벤트 병합/재수집 (core.hw_watcher.HardwareWatcher 담당)
+    - 사용처: HardwareWatcher (UeventSource, WmiEventSource, QueueEventSource)
+    """
+
+    def run(self, emit: Callable[[object], None]) -> None:
+        """
+        close()가 호출될 때까지 이벤트를 기다려 emit()으로 전달 (전용 스레드에서 블로킹)
+
+        Args:
+            emit: HardwareEvent를 받는 콜백
+        """
+        ...
+
+    def close(self) -> None:
+        """
+        run()을 끝내도록 요청 (다른 스레드에서 호출)
+        """
+        ...
@@ -0,0 +1,317 @@
+# 본 소스코드는 내부 사용 및 유지보수 목적에 한해 제공됩니다.
+# 무단 재배포 및 상업적 재사용은 허용되지 않습니다.
+# core/isolated_collector.py
+
+from __future__ import annotations
+
+"""
+자식 프로세스 격리 수집 엔진
+WMI/DXGI COM 호출을 별도 프로세스에서 실행하여 네이티브 크래시/멈춤이 UI 프로세스로 번지지 않게 함
+
+- 책임: 수집 프로세스 사전 기동, 파이프를 통한 카테고리 결과 수신, 제한 시간 초과 시 프로세스 강제 종료
+- 비책임: 실제 수집 로직 (자식 프로세스에서 core.collector 사용), 캐시 (CachedSpecCollector가 감쌈)
+- 사용처: main.py에서 --isolated-collect 옵션일 때 CollectorWrapper 대신 사용
+- 메시지는 marshal로 직렬화 (사양 값은 str/list/tuple/None뿐이므로 pickle보다 작고 빠름)
+- 수집 요청마다 번호를 붙이고 결과 메시지에 되돌려 받아, 소비자가 중간에 멈춘 이전 수집의 남은 메시지는 버림
+"""
+
+import logging
+import marshal
+import multiprocessing
+import threading
+import time
+from typing import Iterator
+
+from core.spec_schema import SPEC_CATEGORIES, TIMED_OUT, empty_specs, merge_category_result
+
+logger = logging.getLogger(__name__)
+
+# 부모가 수집 1회를 기다리는 최대 시간(초) — 자식의 SWEEP_DEADLINE_S보다 약간 길게
+ISOLATED_DEADLINE_S = 35.0
+# 자식 프로세스 종료 대기 시간(초)
+CHILD_JOIN_TIMEOUT_S = 1.0
+
+# 파이프 메시지 종류
+_MSG_COLLECT = "collect"
+_MSG_CATEGORY = "category"
+_MSG_TIMED_OUT = "timed_out"
+_MSG_DONE = "done"
+_MSG_ERROR = "error"
+_MSG_LOG = "log"
+
+
+class IsolatedCollectionError(RuntimeError):
+    """자식 프로세스의 수집 함수가 예외로 실패함 (시간 초과/프로세스 비정상 종료와 구분)"""
+
+
+def _encode(message: tuple) -> bytes:
+    return marshal.dumps(message)
+
+
+def _decode(data: bytes) -> tuple:
+    return marshal.loads(data)
+
+
+class _PipeLogHandler(logging.Handler):
+    """
+    자식 프로세스 로그를 파이프로 부모에게 전달하는 핸들러 (로그 파일은 부모만 기록)
+    """
+
+    def __init__(self, conn, send_lock: threading.Lock):
+        super().__init__(level=logging.INFO)
+        self._conn = conn
+        self._send_lock = send_lock
+
+    def emit(self, record: logging.LogRecord) -> None:
+        try:
+            data = _encode((_MSG_LOG, record.levelno, record.name, record.getMessage()))
+            with self._send_lock:
+                self._conn.send_bytes(data)
+        except Exception:
+            pass
+
+
+def _child_main(conn, parallel: bool | None) -> None:
+    """
+    자식 프로세스 본문: 수집 요청을 받을 때마다 카테고리 결과를 순서대로 전송한다.
+
+    부모가 파이프를 닫으면(EOF) WMI 연결 풀을 정리하고 종료한다.
+
+    Args:
+        conn: 부모와 연결된 Connection
+        parallel: 카테고리 병렬 수집 여부
+
+    Returns:
+        None
+    """
+    send_lock = threading.Lock()
+    root = logging.getLogger()
+    root.setLevel(logging.INFO)
+    root.addHandler(_PipeLogHandler(conn, send_lock))
+
+    def _send(message: tuple) -> None:
+        data = _encode(message)
+        with send_lock:
+            conn.send_bytes(data)
+
+    while True:
+        try:
+            request = _decode(conn.recv_bytes())
+        except (EOFError, OSError):
+            from core.wmi_pool import close_default_pool
+
+            close_default_pool()
+            return
+        if request[0] != _MSG_COLLECT:
+            continue
+        _, sweep_id, categories = request
+
+        try:
+            from core import collector
+
+            for category, value in collector.iter_category_results(parallel=parallel, categories=tuple(categories)):
+                if value is TIMED_OUT:
+                    _send((_MSG_TIMED_OUT, sweep_id, category))
+                else:
+                    _send((_MSG_CATEGORY, sweep_id, category, value))
+            _send((_MSG_DONE, sweep_id))
+        except Exception as e:
+            _send((_MSG_ERROR, sweep_id, f"{type(e).__name__}: {e}"))
+
+
+class IsolatedSpecCollector:
+    """
+    자식 프로세스에서 사양을 수집하는 ISpecCollector/IStreamingSpecCollector 구현
+
+    - 책임: 수집 프로세스 수명 관리, 제한 시간 초과/비정상 종료 시 부분 결과 반환
+    - 비책임: 캐시 (제한 시간 초과 카테고리는 TIMED_OUT으로 반환되어 캐시/Controller가 처리)
+    - 사용처: main.py에서 CachedSpecCollector의 delegate로 주입
+    """
+
+    def __init__(self, parallel: bool | None = None, deadline_s: float = ISOLATED_DEADLINE_S):
+        """
+        IsolatedSpecCollector 초기화
+
+        Args:
+            parallel: 자식 프로세스의 카테고리 병렬 수집 여부 (None이면 collector 기본값)
+            deadline_s: 수집 1회를 기다리는 최대 시간(초)
+        """
+        self._parallel = parallel
+        self._deadline_s = deadline_s
+        self._ctx = multiprocessing.get_context("spawn")
+        self._lock = threading.Lock()
+        self._process = None
+        self._conn = None
+        self._sweep_id = 0
+
+    def start(self) -> None:
+        """
+        수집 프로세스를 미리 기동한다. (이미 실행 중이면 아무것도 하지 않음)
+
+        기동/모듈 import 비용이 창 생성과 겹치도록 앱 시작 직후 호출한다.
+
+        Returns:
+            None
+        """
+        with self._lock:
+            self._ensure_started()
+
+    def close(self) -> None:
+        """
+        수집 프로세스를 종료한다.
+
+        진행 중인 수집을 기다리지 않도록 잠금 없이 종료하며,
+        수집 중이던 iter_category_results()는 부분 결과를 반환하고 끝난다.
+
+        Returns:
+            None
+        """
+        self._kill("종료 요청")
+
+    def collect_all_specs(self) -> dict:
+        """
+        모든 시스템 사양을 자식 프로세스에서 수집하여 반환
+
+        Returns:
+            dict: collect_all_specs() 반환 형식의 딕셔너리 (시간 초과 시 "timed_out" 포함)
+        """
+        return self.collect(SPEC_CATEGORIES)
+
+    def collect(self, categories: tuple[str, ...] = SPEC_CATEGORIES) -> dict:
+        """
+        지정한 카테고리만 자식 프로세스에서 수집하여 반환
+
+        Args:
+            categories: 수집할 카테고리 목록
+
+        Returns:
+            dict: collect_all_specs() 반환 형식의 딕셔너리 (지정하지 않은 카테고리는 None)
+        """
+        specs = empty_specs()
+        for category, value in self.iter_category_results(categories):
+            merge_category_result(specs, category, value)
+        return specs
+
+    def iter_category_results(self, categories: tuple[str, ...] = SPEC_CATEGORIES) -> Iterator[tuple[str, object]]:
+        """
+        카테고리별 수집 결과를 자식 프로세스에서 받는 순서대로 반환
+
+        제한 시간을 넘기거나 자식 프로세스가 비정상 종료되면 프로세스를 정리하고
+        받지 못한 카테고리는 TIMED_OUT으로 반환한다. (다음 수집 시 새 프로세스를 기동)
+
+        Args:
+            categories: 수집할 카테고리 목록 (기본값: 전체)
+
+        Yields:
+            tuple[str, object]: (카테고리, 수집 결과 또는 TIMED_OUT)
+
+        Raises:
+            IsolatedCollectionError: 자식 프로세스의 수집이 예외로 실패함 (프로세스는 유지)
+        """
+        with self._lock:
+            started = time.perf_counter()
+            remaining = list(categories)
+            for category, value in self._iter_from_child(started, categories):
+                if category in remaining:
+                    remaining.remove(category)
+                    yield category, value
+            for category in remaining:
+                yield category, TIMED_OUT
+            logger.info(
+                "격리 수집 완료 | %.0fms | 누락 %d개",
+                (time.perf_counter() - started) * 1000, len(remaining),
+            )
+
+    def _iter_from_child(self, started: float, categories: tuple[str, ...]) -> Iterator[tuple[str, object]]:
+        """
+        자식 프로세스에 수집을 요청하고 결과 메시지를 반환한다. (self._lock 보유 상태에서 호출)
+
+        이전 수집을 소비자가 중간에 멈췄으면 자식은 그 수집의 메시지를 계속 보내므로
+        요청 번호가 다른 결과 메시지는 버린다.
+        """
+        self._sweep_id += 1
+        sweep_id = self._sweep_id
+        try:
+            self._ensure_started()
+            conn = self._conn
+            conn.send_bytes(_encode((_MSG_COLLECT, sweep_id, tuple(categories))))
+        except Exception as e:
+            logger.warning("수집 프로세스 요청 실패: %s", e)
+            self._kill("요청 실패")
+            return
+
+        deadline = started + self._deadline_s
+        while True:
+            timeout = deadline - time.perf_counter()
+            try:
+                if timeout <= 0 or not conn.poll(timeout):
+                    logger.warning(
+                        "수집 프로세스 시간 초과 | %.0fms", (time.perf_counter() - started) * 1000
+                    )
+                    self._kill("시간 초과")
+                    return
+                message = _decode(conn.recv_bytes())
+            except (EOFError, OSError) as e:
+                logger.warning("수집 프로세스 비정상 종료 | exitcode=%s | %s", self._exitcode(), e)
+                self._kill("비정상 종료")
+                return
+
+            kind = message[0]
+            if kind == _MSG_LOG:
+                logging.getLogger(message[2]).log(message[1], "[수집 프로세스] %s", message[3])
+                continue
+            if message[1] != sweep_id:
+                logger.debug("이전 수집 메시지 무시 | %s | 요청 %s (현재 %s)", kind, message[1], sweep_id)
+                continue
+            if kind == _MSG_CATEGORY:
+                yield message[2], message[3]
+            elif kind == _MSG_TIMED_OUT:
+                yield message[2], TIMED_OUT
+            elif kind == _MSG_DONE:
+                return
+            elif kind == _MSG_ERROR:
+                raise IsolatedCollectionError(f"수집 프로세스 수집 실패: {message[2]}")
+
+    def _ensure_started(self) -> None:
+        """
+        수집 프로세스가 없거나 종료되었으면 새로 기동한다. (self._lock 보유 상태에서 호출)
+        """
+        if self._process is not None and self._process.is_alive():
+            return
+        self._kill("재기동")
+        parent_conn, child_conn = self._ctx.Pipe(duplex=True)
+        process = self._ctx.Process(
+            target=_child_main,
+            args=(child_conn, self._parallel),
+            name="spec-collect-child",
+            daemon=True,
+        )
+        process.start()
+        child_conn.close()
+        self._process = process
+        self._conn = parent_conn
+        logger.info("수집 프로세스 기동 | pid=%s", process.pid)
+
+    def _exitcode(self):
+        return self._process.exitcode if self._process is not None else None
+
+    def _kill(self, reason: str) -> None:
+        """
+        수집 프로세스와 파이프를 정리한다.
+        """
+        conn, process = self._conn, self._process
+        self._conn, self._process = None, None
+        if conn is not None:
+            try:
+                conn.close()
+            except OSError:
+                pass
+        if process is None:
+            return
+        if process.is_alive():
+            process.terminate()
+            process.join(CHILD_JOIN_TIMEOUT_S)
+            if process.is_alive():
+                process.kill()
+                process.join(CHILD_JOIN_TIMEOUT_S)
+            logger.info("수집 프로세스 종료 | %s | pid=%s", reason, process.pid)
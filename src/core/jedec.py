@@ -0,0 +1,171 @@
+# 본 소스코드는 내부 사용 및 유지보수 목적에 한해 제공됩니다.
+# 무단 재배포 및 상업적 재사용은 허용되지 않습니다.
+# core/jedec.py
+
+from __future__ import annotations
+
+"""
+JEDEC JEP106 제조사 ID 디코딩
+BIOS/SMBIOS가 Manufacturer 자리에 넣는 16진 코드("80CE", "7F7F7F0B" 등)를 제조사 이름으로 변환
+
+- 책임: 16진 제조사 코드 파싱(뱅크/ID, 홀수 패리티 검증), 뱅크·ID → 이름 O(1) 조회
+- 비책임: 표기용 브랜드 결정 (core.ram_brand 담당)
+- 사용처: core.ram_brand
+- 표는 최초 조회 시점에 한 번만 딕셔너리로 구성 (import 비용 없음)
+"""
+
+import threading
+
+# JEP106 뱅크 수 (연속 코드 0x7F 개수 + 1)
+MAX_BANKS = 16
+CONTINUATION_CODE = 0x7F
+
+# "뱅크 ID(패리티 포함, 16진) 이름" — 메모리 모듈/DRAM 제조사 중심
+_JEP106_DATA = """
+1 01 AMD
+1 02 AMI
+1 04 Fujitsu
+1 07 Hitachi
+1 0D Mostek
+1 0E Freescale
+1 10 NEC
+1 15 NXP
+1 1C Mitsubishi
+1 1F Atmel
+1 20 STMicroelectronics
+1 2C Micron Technology
+1 45 SanDisk
+1 89 Intel
+1 97 Texas Instruments
+1 98 Kioxia
+1 AD SK hynix
+1 B3 IDT
+1 C1 Infineon
+1 C2 Macronix
+1 CE Samsung
+1 DA Winbond
+2 4F Transcend
+2 7A Apacer
+2 94 Smart Modular
+2 98 Kingston
+2 BA PNY
+3 9E Corsair
+3 FE Elpida
+4 0B Nanya
+5 43 Ramaxel
+5 CB ADATA
+5 CD G.Skill
+5 EF Team Group
+6 02 Patriot
+6 51 Qimonda
+6 9B Crucial
+"""
+
+_table_lock = threading.Lock()
+_table: dict[int, str] | None = None
+
+
+def _has_odd_parity(value: int) -> bool:
+    return bin(value).count("1") % 2 == 1
+
+
+def _key(bank: int, vendor_id: int) -> int:
+    return (bank << 8) | vendor_id
+
+
+def _load_table() -> dict[int, str]:
+    """
+    JEP106 표를 최초 호출 시 한 번만 구성한다.
+
+    Returns:
+        dict[int, str]: (뱅크 << 8 | ID) → 제조사 이름
+    """
+    global _table
+    if _table is None:
+        with _table_lock:
+            if _table is None:
+                table = {}
+                for line in _JEP106_DATA.strip().splitlines():
+                    bank, vendor_id, name = line.split(" ", 2)
+                    table[_key(int(bank), int(vendor_id, 16))] = name
+                _table = table
+    return _table
+
+
+def _parse_hex_bytes(value: str) -> list[int] | None:
+    """
+    "0x80CE", "80 CE", "7F-7F-0B" 같은 문자열을 바이트 목록으로 변환한다.
+    """
+    text = value.strip().upper()
+    if text.startswith("0X"):
+        text = text[2:]
+    text = text.replace(" ", "").replace("-", "").replace(":", "")
+    if not text or len(text) % 2 or len(text) > 32:
+        return None
+    try:
+        return list(bytes.fromhex(text))
+    except ValueError:
+        return None
+
+
+def decode_manufacturer_id(value: str | None) -> tuple[int, int] | None:
+    """
+    16진 제조사 코드를 (뱅크, ID)로 해석한다.
+
+    지원 형식:
+        - 연속 코드: "7F7F7F0B", "7F7F7F0B00000000" (0x7F 개수 + 1 = 뱅크)
+        - SMBIOS/WMI 2바이트: "80CE" (상위 바이트 = 연속 코드 개수 + 패리티 비트, 하위 바이트 = ID)
+        - 바이트 순서가 뒤집힌 2바이트: "CE80", "CE00"
+        - 1바이트: "CE" (뱅크 1)
+
+    Args:
+        value: 제조사 코드 문자열 (None 가능)
+
+    Returns:
+        tuple[int, int] | None: (1부터 시작하는 뱅크, 패리티 포함 ID) 또는 해석 불가 시 None
+    """
+    if not value:
+        return None
+    data = _parse_hex_bytes(value)
+    if not data:
+        return None
+
+    if data[0] == CONTINUATION_CODE:
+        count = 0
+        while count < len(data) and data[count] == CONTINUATION_CODE:
+            count += 1
+        if count >= len(data) or count >= MAX_BANKS or any(data[count + 1:]):
+            return None
+        bank, vendor_id = count + 1, data[count]
+    else:
+        # 뒤쪽 0 채움 제거 ("CE00000000000000" → "CE")
+        while len(data) > 1 and data[-1] == 0:
+            data.pop()
+        if len(data) == 1:
+            bank, vendor_id = 1, data[0]
+        elif len(data) == 2:
+            bank, vendor_id = (data[0] & 0x7F) + 1, data[1]
+            if bank > MAX_BANKS or not _has_odd_parity(vendor_id):
+                bank, vendor_id = (data[1] & 0x7F) + 1, data[0]
+        else:
+            return None
+
+    if bank > MAX_BANKS or vendor_id == CONTINUATION_CODE or not _has_odd_parity(vendor_id):
+        return None
+    return bank, vendor_id
+
+
+def lookup_manufacturer(value: str | None) -> str | None:
+    """
+    16진 제조사 코드를 JEP106 제조사 이름으로 변환한다.
+
+    Args:
+        value: 제조사 코드 문자열 (None 가능)
+
+    Returns:
+        str | None: 제조사 이름 또는 코드가 아니거나 표에 없으면 None
+    """
+    decoded = decode_manufacturer_id(value)
+    if decoded is None:
+        return None
+    return _load_table().get(_key(*decoded))
@@ -0,0 +1,597 @@
+# 본 소스코드는 내부 사용 및 유지보수 목적에 한해 제공됩니다.
+# 무단 재배포 및 상업적 재사용은 허용되지 않습니다.
+# core/linux_backend.py
+
+from __future__ import annotations
+
+"""
+Linux 사양 수집 백엔드
+/proc, /sys 파일을 직접 읽어 WMI 없이 CPU/RAM/M/B/시스템 유형/GPU/저장장치를 수집
+
+- 책임: procfs/sysfs 파일 읽기, collect_all_specs()와 같은 사양 스키마로 변환
+- 비책임: SSD/HDD·섀시 분류 규칙 (core.collector의 규칙을 그대로 사용), GPU 표기 규칙 (core.gpu_format)
+- 사용처: core.collector.iter_category_models()에서 Linux일 때 WMI 대신 사용 (collect_category_model)
+- collect_*()/collect_category()는 모델을 표시 문자열로 바꾸는 어댑터 (core.spec_model.to_category_result)
+- root 인자로 가짜 sysfs 트리를 지정할 수 있음 (Scripts/bench/fake_sysfs.py)
+"""
+
+import logging
+import math
+import os
+import re
+from dataclasses import dataclass
+
+from core import collector
+from core.spec_schema import (
+    CATEGORY_CPU,
+    CATEGORY_MAINBOARD,
+    CATEGORY_RAM,
+    CATEGORY_STORAGE,
+    CATEGORY_SYSTEM_TYPE,
+    CATEGORY_VGA,
+)
+from core.spec_model import CpuSpec, GpuSpec, RamSpec, to_category_result
+from core.wmi_query import WmiRow
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_ROOT = "/"
+DMI_ID_DIR = "sys/class/dmi/id"
+DMI_TABLE_PATH = "sys/firmware/dmi/tables/DMI"
+BLOCK_DIR = "sys/block"
+DRM_CLASS_DIR = "sys/class/drm"
+PCI_DEVICES_DIR = "sys/bus/pci/devices"
+CPU_MAX_FREQ_PATH = "sys/devices/system/cpu/cpu0/cpufreq/cpuinfo_max_freq"
+SECTOR_BYTES = 512
+
+# 물리 디스크가 아닌 블록 장치 접두어 (device 링크 검사 전 빠르게 제외)
+VIRTUAL_BLOCK_PREFIXES = ("loop", "ram", "zram", "dm-", "md", "sr", "fd", "nbd")
+
+# /proc/cpuinfo에서 CPU 이름으로 사용할 키 (x86 → ARM 순)
+CPUINFO_NAME_KEYS = ("model name", "Hardware", "Processor", "cpu model")
+
+# PCI 기본 클래스 0x03: 디스플레이 컨트롤러 (VGA 0x0300, 3D 0x0302 등)
+PCI_BASE_CLASS_DISPLAY = 0x03
+
+# 가상 어댑터 벤더 ID (DXGI 수집의 Microsoft 가상 GPU 제외와 같은 정책)
+VIRTUAL_GPU_VENDOR_IDS = frozenset({
+    0x1414,  # Microsoft Hyper-V
+    0x1AF4,  # virtio-gpu
+    0x1B36,  # QEMU QXL
+    0x1234,  # QEMU 표준 VGA
+    0x15AD,  # VMware SVGA
+    0x80EE,  # VirtualBox
+})
+
+# 전용 VRAM 크기 노드 (PCI 장치 디렉토리 기준, 위에서부터 우선)
+PCI_VRAM_NODES = (
+    "mem_info_vram_total",                   # amdgpu
+    "tile0/physical_vram_size_bytes",        # xe
+)
+# 전용 VRAM 크기 노드 (DRM 카드 디렉토리 기준)
+DRM_VRAM_NODES = ("lmem_total_bytes",)       # i915 (DG2 등 외장)
+
+_DRM_CARD_RE = re.compile(r"card[0-9]+")
+
+
+def _path(root: str, relative: str) -> str:
+    return os.path.join(root, relative)
+
+
+def _read_text(path: str) -> str | None:
+    """
+    파일 전체를 읽어 앞뒤 공백을 제거해 반환한다. 없거나 읽을 수 없으면 None.
+    """
+    try:
+        with open(path, "r", encoding="utf-8", errors="replace") as f:
+            return f.read().strip()
+    except OSError:
+        return None
+
+
+def is_available(root: str = DEFAULT_ROOT) -> bool:
+    """
+    procfs를 읽을 수 있는 Linux 환경인지 확인한다.
+
+    Args:
+        root: 파일 시스템 루트 (테스트용 가짜 트리 지정 가능)
+
+    Returns:
+        bool: /proc/cpuinfo가 있으면 True
+    """
+    return os.path.exists(_path(root, "proc/cpuinfo"))
+
+
+def collect_cpu(root: str = DEFAULT_ROOT) -> str | None:
+    """
+    /proc/cpuinfo에서 CPU 이름을 수집한다. (collect_cpu_spec()의 표시 문자열 어댑터)
+
+    Args:
+        root: 파일 시스템 루트
+
+    Returns:
+        str | None: CPU 이름 또는 실패 시 None
+    """
+    return to_category_result(CATEGORY_CPU, collect_cpu_spec(root))
+
+
+def collect_cpu_spec(root: str = DEFAULT_ROOT) -> CpuSpec | None:
+    """
+    /proc/cpuinfo와 cpufreq에서 CPU 모델을 수집한다.
+
+    이름은 첫 번째 프로세서 블록에서 읽고, 스레드 수는 프로세서 블록 수,
+    코어 수는 (physical id, core id) 조합 수로 계산한다. (항목이 없는 아키텍처는 None)
+
+    Args:
+        root: 파일 시스템 루트
+
+    Returns:
+        CpuSpec | None: CPU 모델 또는 실패 시 None
+    """
+    text = _read_text(_path(root, "proc/cpuinfo"))
+    if not text:
+        return None
+
+    blocks = []
+    for block in text.split("\n\n"):
+        fields = {}
+        for line in block.splitlines():
+            key, sep, value = line.partition(":")
+            if sep:
+                fields.setdefault(key.strip(), value.strip())
+        if fields:
+            blocks.append(fields)
+    if not blocks:
+        return None
+
+    first = blocks[0]
+    name = next((first[key] for key in CPUINFO_NAME_KEYS if first.get(key)), None)
+    if name is None:
+        logger.info("CPU: /proc/cpuinfo에 이름 항목 없음")
+        name = collector.INFO_NOT_PROVIDED
+
+    processors = [b for b in blocks if "processor" in b]
+    core_ids = {(b.get("physical id"), b["core id"]) for b in processors if "core id" in b}
+    max_khz = _read_int(_path(root, CPU_MAX_FREQ_PATH))
+    return CpuSpec(
+        name=name,
+        cores=len(core_ids) or None,
+        threads=len(processors) or None,
+        max_clock_mhz=max_khz // 1000 or None,
+    )
+
+
+def _load_smbios(root: str):
+    """
+    SMBIOS 테이블을 읽는다. (실제 루트는 프로세스 캐시 사용, 가짜 트리는 매번 파싱)
+    """
+    from core import smbios
+
+    if root == DEFAULT_ROOT:
+        return smbios.load_system_tables()
+    try:
+        with open(_path(root, DMI_TABLE_PATH), "rb") as f:
+            return smbios.parse_tables(f.read())
+    except OSError:
+        return None
+
+
+def collect_ram(root: str = DEFAULT_ROOT) -> tuple[str, list[str]] | None:
+    """
+    RAM 정보를 수집한다. (collect_ram_spec()의 표시 문자열 어댑터)
+
+    Args:
+        root: 파일 시스템 루트
+
+    Returns:
+        tuple[str, list[str]] | None: ("32GB", [...]) 또는 실패 시 None
+    """
+    return to_category_result(CATEGORY_RAM, collect_ram_spec(root))
+
+
+def collect_ram_spec(root: str = DEFAULT_ROOT) -> RamSpec | None:
+    """
+    RAM 모델을 수집한다.
+
+    SMBIOS 테이블(root 권한 필요)을 읽을 수 있으면 모듈별 정보를 Windows와 같은 규칙으로 만들고,
+    아니면 /proc/meminfo의 MemTotal로 총 용량만 반환한다.
+    MemTotal은 커널 예약 영역만큼 실장 용량보다 작으므로 GB 단위로 올림한다.
+
+    Args:
+        root: 파일 시스템 루트
+
+    Returns:
+        RamSpec | None: RAM 모델 (MemTotal만 읽은 경우 modules_known=False) 또는 실패 시 None
+    """
+    tables = _load_smbios(root)
+    if tables is not None:
+        ram = collector._build_ram_spec(tables.installed_memory)
+        if ram is not None:
+            return ram
+
+    text = _read_text(_path(root, "proc/meminfo"))
+    if not text:
+        return None
+
+    for line in text.splitlines():
+        if line.startswith("MemTotal:"):
+            try:
+                total_kb = int(line.split()[1])
+            except (IndexError, ValueError):
+                break
+            total_gb = math.ceil(total_kb * 1024 / collector.BYTES_PER_GB)
+            if total_gb <= 0:
+                return None
+            return RamSpec(total_bytes=total_gb * collector.BYTES_PER_GB, modules=(), modules_known=False)
+
+    logger.info("RAM: /proc/meminfo에 MemTotal 없음")
+    return None
+
+
+def _read_dmi(root: str, names: tuple[str, ...]) -> dict:
+    """
+    /sys/class/dmi/id 아래 파일 여러 개를 읽는다. (없는 항목은 빈 문자열)
+    """
+    base = _path(root, DMI_ID_DIR)
+    return {name: _read_text(os.path.join(base, name)) or "" for name in names}
+
+
+def collect_baseboard(root: str = DEFAULT_ROOT) -> str | None:
+    """
+    /sys/class/dmi/id/board_*에서 메인보드 정보를 수집한다.
+
+    Args:
+        root: 파일 시스템 루트
+
+    Returns:
+        str | None: 메인보드 정보 또는 실패 시 None
+    """
+    dmi = _read_dmi(root, ("board_vendor", "board_name", "board_version"))
+    if not dmi["board_vendor"] and not dmi["board_name"]:
+        logger.info("M/B: DMI board 정보 없음")
+        return None
+    return collector._format_baseboard(dmi["board_vendor"], dmi["board_name"], dmi["board_version"])
+
+
+def collect_system_type(root: str = DEFAULT_ROOT) -> str | None:
+    """
+    /sys/class/dmi/id/chassis_type으로 시스템 유형을 판별한다.
+
+    Args:
+        root: 파일 시스템 루트
+
+    Returns:
+        str | None: 시스템 유형 문자열 (판별 불가 시 SYSTEM_TYPE_UNKNOWN)
+    """
+    value = _read_dmi(root, ("chassis_type",))["chassis_type"]
+    try:
+        chassis_types = [int(value)] if value else []
+    except ValueError:
+        logger.warning(f"chassis_type 파싱 실패: {value}")
+        chassis_types = []
+    return collector._classify_chassis_types(chassis_types) or collector.SYSTEM_TYPE_UNKNOWN
+
+
+def _read_block_disk(block_dir: str, name: str) -> WmiRow | None:
+    """
+    /sys/block/<name>을 MSFT_PhysicalDisk와 같은 속성을 가진 WmiRow로 변환한다.
+
+    sysfs는 회전 여부(rotational)만 제공하므로 회전 디스크는 RotationRate를
+    HDD 판정 임계값으로, 비회전 디스크는 SeekPenalty=False로 매핑한다.
+    """
+    disk_dir = os.path.join(block_dir, name)
+    if not os.path.exists(os.path.join(disk_dir, "device")):
+        return None
+
+    try:
+        size_bytes = int(_read_text(os.path.join(disk_dir, "size")) or 0) * SECTOR_BYTES
+    except ValueError:
+        size_bytes = 0
+    if size_bytes <= 0:
+        return None
+
+    rotational = _read_text(os.path.join(disk_dir, "queue", "rotational"))
+    model = _read_text(os.path.join(disk_dir, "device", "model"))
+    vendor = _read_text(os.path.join(disk_dir, "device", "vendor"))
+    friendly_name = model or name
+    if vendor and model and vendor.upper() not in ("ATA", "NVME") and not model.startswith(vendor):
+        friendly_name = f"{vendor} {model}"
+
+    return WmiRow(
+        FriendlyName=friendly_name,
+        Model=model,
+        Size=size_bytes,
+        MediaType=collector.MEDIA_TYPE_UNKNOWN,
+        BusType=collector.BUS_TYPE_NVME if name.startswith("nvme") else None,
+        SeekPenalty=False if rotational == "0" else None,
+        RotationRate=collector.ROTATION_RATE_HDD_THRESHOLD if rotational == "1" else None,
+    )
+
+
+def collect_storage(root: str = DEFAULT_ROOT) -> tuple[list[str], list[str]] | None:
+    """
+    /sys/block에서 물리 디스크를 찾아 SSD/HDD로 분류한다. (collect_storage_spec()의 표시 문자열 어댑터)
+
+    Args:
+        root: 파일 시스템 루트
+
+    Returns:
+        tuple[list[str], list[str]] | None: (ssd_list, hdd_list) 또는 실패 시 None
+    """
+    return to_category_result(CATEGORY_STORAGE, collect_storage_spec(root))
+
+
+def collect_storage_spec(root: str = DEFAULT_ROOT) -> tuple | None:
+    """
+    /sys/block에서 물리 디스크를 찾아 디스크 모델로 만든다.
+
+    Args:
+        root: 파일 시스템 루트
+
+    Returns:
+        tuple[DiskSpec, ...] | None: 디스크 모델 튜플 (디스크 없음은 빈 튜플) 또는 실패 시 None
+    """
+    block_dir = _path(root, BLOCK_DIR)
+    try:
+        names = sorted(os.listdir(block_dir))
+    except OSError as e:
+        logger.warning(f"/sys/block 조회 실패: {e}")
+        return None
+
+    disks = []
+    for name in names:
+        if name.startswith(VIRTUAL_BLOCK_PREFIXES):
+            continue
+        try:
+            disk = _read_block_disk(block_dir, name)
+        except Exception as e:
+            logger.warning(f"블록 장치 정보 수집 중 오류({name}): {e}")
+            continue
+        if disk is not None:
+            disks.append(disk)
+
+    return collector._build_disk_specs(disks)
+
+
+@dataclass(frozen=True)
+class LinuxGpu:
+    """
+    sysfs로 수집한 GPU 정보를 담는다.
+
+    - 책임: 어댑터 메타데이터 보관 (DxgiGpu와 같은 표기용 속성)
+    - 비책임: 수집/포맷팅 로직
+    - 사용처: collect_gpu_specs() 내부 (GpuSpec으로 변환)
+    """
+    name: str
+    vendor: str
+    dedicated_vram_bytes: int
+    vendor_id: int
+    device_id: int
+    pci_address: str
+
+
+def _read_hex(path: str) -> int | None:
+    """
+    sysfs의 "0x10de" 형식 값을 정수로 읽는다. 없거나 형식이 다르면 None.
+    """
+    text = _read_text(path)
+    if not text:
+        return None
+    try:
+        return int(text, 16)
+    except ValueError:
+        return None
+
+
+def _read_pci_class(device_dir: str) -> int | None:
+    """
+    PCI class 값을 읽는다. 모든 PCI 장치에 대해 호출되므로 텍스트 래퍼 없이 raw fd로 읽는다.
+    """
+    try:
+        fd = os.open(os.path.join(device_dir, "class"), os.O_RDONLY)
+    except OSError:
+        return None
+    try:
+        return int(os.read(fd, 32), 16)
+    except (OSError, ValueError):
+        return None
+    finally:
+        os.close(fd)
+
+
+def _read_int(path: str) -> int:
+    text = _read_text(path)
+    try:
+        return int(text) if text else 0
+    except ValueError:
+        return 0
+
+
+def _load_pci_ids(root: str):
+    """
+    PCI ID 색인을 연다. (실제 루트는 번들 색인 캐시 사용, 가짜 트리는 root 아래 색인 사용)
+
+    Returns:
+        tuple: (색인 또는 None, 호출자가 닫아야 하는지 여부)
+    """
+    from core import pci_ids
+
+    if root == DEFAULT_ROOT:
+        return pci_ids.get_database(), False
+    try:
+        return pci_ids.PciIdDatabase(_path(root, pci_ids.PCI_IDS_RESOURCE)), True
+    except (OSError, ValueError):
+        return None, False
+
+
+def _read_pci_gpu(address: str, device_dir: str, card_dir: str | None, pci_db) -> LinuxGpu | None:
+    """
+    PCI 장치 디렉토리가 디스플레이 컨트롤러이면 LinuxGpu로 변환한다.
+
+    Args:
+        address: PCI 주소 (예: "0000:01:00.0")
+        device_dir: /sys/bus/pci/devices/<주소> 또는 /sys/class/drm/cardN/device
+        card_dir: DRM 카드 디렉토리 (PCI 경로로만 찾았으면 None)
+        pci_db: PCI ID 색인 (None 가능)
+
+    Returns:
+        LinuxGpu | None: GPU 정보 또는 디스플레이 장치가 아니면 None
+    """
+    from core import pci_ids
+
+    pci_class = _read_pci_class(device_dir)
+    if pci_class is None or pci_class >> 16 != PCI_BASE_CLASS_DISPLAY:
+        return None
+    vendor_id = _read_hex(os.path.join(device_dir, "vendor"))
+    device_id = _read_hex(os.path.join(device_dir, "device"))
+    if vendor_id is None or device_id is None:
+        return None
+
+    vram = 0
+    for node in PCI_VRAM_NODES:
+        vram = _read_int(os.path.join(device_dir, node))
+        if vram:
+            break
+    if not vram and card_dir is not None:
+        for node in DRM_VRAM_NODES:
+            vram = _read_int(os.path.join(card_dir, node))
+            if vram:
+                break
+
+    subvendor_id = _read_hex(os.path.join(device_dir, "subsystem_vendor"))
+    subdevice_id = _read_hex(os.path.join(device_dir, "subsystem_device"))
+    if pci_db is not None:
+        name = pci_ids.gpu_device_name(vendor_id, device_id, subvendor_id, subdevice_id, db=pci_db)
+        vendor = pci_ids.gpu_vendor_name(vendor_id, db=pci_db)
+    else:
+        name = None
+        vendor = pci_ids.PREFERRED_VENDOR_NAMES.get(vendor_id) or f"VEN_{vendor_id:04X}"
+
+    return LinuxGpu(
+        name=name or f"PCI {vendor_id:04X}:{device_id:04X}",
+        vendor=vendor,
+        dedicated_vram_bytes=vram,
+        vendor_id=vendor_id,
+        device_id=device_id,
+        pci_address=address,
+    )
+
+
+def collect_gpu(root: str = DEFAULT_ROOT) -> list[str] | None:
+    """
+    sysfs에서 GPU를 수집한다. (collect_gpu_specs()의 표시 문자열 어댑터)
+
+    Args:
+        root: 파일 시스템 루트
+
+    Returns:
+        list[str] | None: GPU 표시 문자열 목록 또는 sysfs를 읽을 수 없으면 None
+    """
+    return to_category_result(CATEGORY_VGA, collect_gpu_specs(root))
+
+
+def collect_gpu_specs(root: str = DEFAULT_ROOT) -> tuple[GpuSpec, ...] | None:
+    """
+    /sys/class/drm/card*/device와 /sys/bus/pci/devices에서 GPU를 수집한다.
+
+    DRM 드라이버가 붙은 카드를 먼저 찾고, 드라이버가 없는 디스플레이 클래스 PCI 장치(연산 전용 GPU 등)를
+    보충한다. 가상 어댑터는 제외하고, DXGI 수집과 같이 전용 VRAM 내림차순으로 정렬한다.
+
+    Args:
+        root: 파일 시스템 루트
+
+    Returns:
+        tuple[GpuSpec, ...] | None: GPU 모델 튜플 (물리 GPU 없음은 빈 튜플) 또는 sysfs를 읽을 수 없으면 None
+    """
+    drm_dir = _path(root, DRM_CLASS_DIR)
+    pci_dir = _path(root, PCI_DEVICES_DIR)
+    try:
+        cards = sorted(name for name in os.listdir(drm_dir) if _DRM_CARD_RE.fullmatch(name))
+    except OSError:
+        cards = []
+    try:
+        addresses = sorted(os.listdir(pci_dir))
+    except OSError:
+        addresses = []
+    if not cards and not addresses:
+        logger.info("GPU: /sys/class/drm, /sys/bus/pci 조회 불가")
+        return None
+
+    # DRM 카드 → PCI 주소 (device 링크 대상 이름), PCI 장치 목록과 주소로 중복 제거
+    candidates = []
+    for card in cards:
+        device_dir = os.path.join(drm_dir, card, "device")
+        candidates.append((os.path.basename(os.path.realpath(device_dir)), device_dir, os.path.join(drm_dir, card)))
+    candidates += [(address, os.path.join(pci_dir, address), None) for address in addresses]
+
+    pci_db, owns_db = _load_pci_ids(root)
+    gpus: dict[str, LinuxGpu] = {}
+    try:
+        for address, device_dir, card_dir in candidates:
+            if address in gpus:
+                continue
+            try:
+                gpu = _read_pci_gpu(address, device_dir, card_dir, pci_db)
+            except Exception as e:
+                logger.warning(f"GPU 정보 수집 중 오류({device_dir}): {e}")
+                continue
+            if gpu is not None:
+                gpus[address] = gpu
+    finally:
+        if owns_db:
+            pci_db.close()
+
+    found = sorted(gpus.values(), key=lambda g: g.pci_address)
+    physical = [g for g in found if g.vendor_id not in VIRTUAL_GPU_VENDOR_IDS]
+    logger.info(f"GPU(sysfs): 디스플레이 장치 {len(found)}개 감지, 가상 어댑터 {len(found) - len(physical)}개 제외")
+    physical.sort(key=lambda g: g.dedicated_vram_bytes, reverse=True)
+    return tuple(
+        GpuSpec(
+            name=g.name,
+            vendor=g.vendor,
+            dedicated_vram_bytes=g.dedicated_vram_bytes,
+            vendor_id=g.vendor_id,
+            device_id=g.device_id,
+        )
+        for g in physical
+    )
+
+
+def collect_category(category: str, root: str = DEFAULT_ROOT):
+    """
+    카테고리 이름에 해당하는 Linux 수집 결과를 표시 문자열 형식으로 반환한다.
+
+    Args:
+        category: SPEC_CATEGORIES 중 하나
+        root: 파일 시스템 루트
+
+    Returns:
+        카테고리별 collect_*() 반환값
+    """
+    return to_category_result(category, collect_category_model(category, root))
+
+
+def collect_category_model(category: str, root: str = DEFAULT_ROOT):
+    """
+    카테고리 이름에 해당하는 Linux 모델 수집 함수를 호출한다.
+
+    Args:
+        category: SPEC_CATEGORIES 중 하나
+        root: 파일 시스템 루트
+
+    Returns:
+        카테고리 모델 값 (core.spec_model 참고)
+    """
+    if category == CATEGORY_SYSTEM_TYPE:
+        return collect_system_type(root)
+    if category == CATEGORY_CPU:
+        return collect_cpu_spec(root)
+    if category == CATEGORY_RAM:
+        return collect_ram_spec(root)
+    if category == CATEGORY_MAINBOARD:
+        return collect_baseboard(root)
+    if category == CATEGORY_VGA:
+        return collect_gpu_specs(root)
+    if category == CATEGORY_STORAGE:
+        return collect_storage_spec(root)
+    raise ValueError(f"알 수 없는 수집 카테고리: {category}")
@@ -0,0 +1,411 @@
+# 본 소스코드는 내부 사용 및 유지보수 목적에 한해 제공됩니다.
+# 무단 재배포 및 상업적 재사용은 허용되지 않습니다.
+# core/pci_ids.py
+
+from __future__ import annotations
+
+"""
+PCI ID 데이터베이스 (pci.ids 변환 바이너리 색인)
+벤더/디바이스/서브시스템 ID를 이름으로 변환하여 DXGI·WMI·Linux GPU 표기에 사용
+
+- 책임: pci.ids 텍스트 → 정렬된 바이너리 색인 변환(build_index), 색인 mmap + bisect 조회, GPU 표기용 이름 결정
+- 비책임: GPU 수집 (core.gpu_dxgi, core.collector, core.linux_backend 담당)
+- 사용처: core.gpu_dxgi, core.collector.collect_gpu() WMI 폴백, Scripts/build_pci_ids.py
+- 색인 파일은 첫 GPU 표기 시점에 한 번만 mmap (시작 시 파일 접근/텍스트 파싱 없음)
+- 색인 파일이 없으면 PREFERRED_VENDOR_NAMES와 "VEN_xxxx" 표기로 동작
+
+색인 형식 (리틀 엔디언):
+    헤더: magic(8) | 벤더 수 | 디바이스 수 | 서브시스템 수 | 문자열 영역 크기 (각 u32)
+    표 3개(벤더 → 디바이스 → 서브시스템): 정렬된 u64 키 배열, u32 문자열 오프셋 배열 (8바이트 정렬)
+    문자열 영역: u16 길이 + UTF-8 바이트 (중복 이름은 한 번만 저장)
+    키: 벤더 = ven, 디바이스 = ven << 16 | dev, 서브시스템 = ven << 48 | dev << 32 | subven << 16 | subdev
+"""
+
+import bisect
+import logging
+import mmap
+import re
+import struct
+import sys
+import threading
+from typing import Iterable
+
+logger = logging.getLogger(__name__)
+
+PCI_IDS_RESOURCE = "assets/pci_ids.bin"
+INDEX_MAGIC = b"PCIIDX01"
+
+_HEADER = struct.Struct("<8s4I")
+_KEY = struct.Struct("<Q")
+_OFFSET = struct.Struct("<I")
+_LENGTH = struct.Struct("<H")
+
+# 표기 이름이 pci.ids 정식 명칭보다 우선하는 벤더 (기존 DXGI 표기 유지)
+PREFERRED_VENDOR_NAMES = {
+    0x10DE: "NVIDIA",
+    0x1002: "AMD",
+    0x1022: "AMD",
+    0x8086: "Intel",
+    0x1414: "Microsoft",
+}
+
+# "PCI\VEN_10DE&DEV_2484&SUBSYS_87C11043&REV_A1" (Win32_VideoController.PNPDeviceID)
+_PNP_DEVICE_ID_RE = re.compile(
+    r"VEN_([0-9A-F]{4})&DEV_([0-9A-F]{4})(?:&SUBSYS_([0-9A-F]{4})([0-9A-F]{4}))?",
+    re.IGNORECASE,
+)
+
+
+def _align8(size: int) -> int:
+    return (size + 7) & ~7
+
+
+def vendor_key(vendor_id: int) -> int:
+    return vendor_id & 0xFFFF
+
+
+def device_key(vendor_id: int, device_id: int) -> int:
+    return (vendor_id & 0xFFFF) << 16 | (device_id & 0xFFFF)
+
+
+def subsystem_key(vendor_id: int, device_id: int, subvendor_id: int, subdevice_id: int) -> int:
+    return device_key(vendor_id, device_id) << 32 | device_key(subvendor_id, subdevice_id)
+
+
+def parse_pci_ids(lines: Iterable[str]) -> tuple[dict[int, str], dict[int, str], dict[int, str]]:
+    """
+    pci.ids 텍스트의 벤더/디바이스/서브시스템 항목을 키 → 이름 딕셔너리로 변환한다.
+
+    디바이스 클래스 목록("C xx")이 시작되면 중단한다.
+
+    Args:
+        lines: pci.ids 텍스트 줄 목록
+
+    Returns:
+        tuple[dict, dict, dict]: (벤더, 디바이스, 서브시스템) 키 → 이름
+    """
+    vendors: dict[int, str] = {}
+    devices: dict[int, str] = {}
+    subsystems: dict[int, str] = {}
+    vendor_id = device_id = None
+
+    for raw in lines:
+        line = raw.rstrip("\r\n")
+        if not line.strip() or line.lstrip().startswith("#"):
+            continue
+        if line.startswith("C "):
+            break
+        try:
+            if line.startswith("\t\t"):
+                if vendor_id is None or device_id is None:
+                    continue
+                ids, _, name = line[2:].partition("  ")
+                subvendor, subdevice = ids.split()
+                subsystems[subsystem_key(vendor_id, device_id, int(subvendor, 16), int(subdevice, 16))] = name.strip()
+            elif line.startswith("\t"):
+                if vendor_id is None:
+                    continue
+                ids, _, name = line[1:].partition("  ")
+                device_id = int(ids, 16)
+                devices[device_key(vendor_id, device_id)] = name.strip()
+            else:
+                ids, _, name = line.partition("  ")
+                vendor_id, device_id = int(ids, 16), None
+                vendors[vendor_key(vendor_id)] = name.strip()
+        except ValueError:
+            logger.debug(f"pci.ids 줄 해석 실패: {line!r}")
+    return vendors, devices, subsystems
+
+
+def build_index(lines: Iterable[str]) -> bytes:
+    """
+    pci.ids 텍스트를 바이너리 색인으로 변환한다.
+
+    Args:
+        lines: pci.ids 텍스트 줄 목록
+
+    Returns:
+        bytes: PciIdDatabase가 읽는 색인 바이트
+    """
+    tables = parse_pci_ids(lines)
+
+    strings = bytearray()
+    string_offsets: dict[str, int] = {}
+
+    def _intern(name: str) -> int:
+        offset = string_offsets.get(name)
+        if offset is None:
+            data = name.encode("utf-8")[:0xFFFF]
+            offset = string_offsets[name] = len(strings)
+            strings.extend(_LENGTH.pack(len(data)))
+            strings.extend(data)
+        return offset
+
+    body = bytearray()
+    for table in tables:
+        keys = sorted(table)
+        body.extend(struct.pack(f"<{len(keys)}Q", *keys))
+        body.extend(struct.pack(f"<{len(keys)}I", *(_intern(table[k]) for k in keys)))
+        body.extend(bytes(_align8(len(body)) - len(body)))
+
+    header = _HEADER.pack(INDEX_MAGIC, len(tables[0]), len(tables[1]), len(tables[2]), len(strings))
+    return header + bytes(body) + bytes(strings)
+
+
+class _KeyArray:
+    """
+    빅 엔디언 플랫폼용 u64 키 시퀀스 (bisect 대상, 리틀 엔디언에서는 memoryview.cast 사용)
+    """
+
+    __slots__ = ("_buf", "_base", "_count")
+
+    def __init__(self, buf, base: int, count: int):
+        self._buf = buf
+        self._base = base
+        self._count = count
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __getitem__(self, index: int) -> int:
+        return _KEY.unpack_from(self._buf, self._base + index * 8)[0]
+
+
+class PciIdDatabase:
+    """
+    mmap으로 연 PCI ID 색인 조회기
+
+    - 책임: 정렬된 키 배열 이진 탐색으로 이름 조회 (조회당 수 µs, 파일 전체를 읽지 않음)
+    - 비책임: 색인 생성 (build_index / Scripts/build_pci_ids.py 담당)
+    - 사용처: get_database()로 프로세스당 하나만 생성
+    """
+
+    def __init__(self, path: str):
+        """
+        PciIdDatabase 초기화
+
+        Args:
+            path: 색인 파일 경로
+
+        Raises:
+            OSError: 파일을 열 수 없을 때
+            ValueError: 색인 형식이 아닐 때
+        """
+        with open(path, "rb") as f:
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            self._tables = self._load_tables()
+        except Exception:
+            self._mmap.close()
+            raise
+
+    def _load_tables(self) -> list[tuple]:
+        buf = self._mmap
+        if len(buf) < _HEADER.size:
+            raise ValueError("PCI ID 색인이 너무 짧음")
+        magic, vendor_count, device_count, subsystem_count, strings_size = _HEADER.unpack_from(buf, 0)
+        if magic != INDEX_MAGIC:
+            raise ValueError(f"PCI ID 색인 형식 불일치: {magic!r}")
+
+        counts = (vendor_count, device_count, subsystem_count)
+        strings_pos = _HEADER.size
+        for count in counts:
+            strings_pos = _align8(strings_pos + count * 12)
+        if strings_pos + strings_size > len(buf):
+            raise ValueError("PCI ID 색인이 잘림")
+
+        view = memoryview(buf)
+        tables = []
+        pos = _HEADER.size
+        for count in counts:
+            offsets_pos = pos + count * 8
+            if sys.byteorder == "little":
+                keys = view[pos:offsets_pos].cast("Q")
+            else:
+                keys = _KeyArray(buf, pos, count)
+            tables.append((keys, offsets_pos))
+            pos = _align8(offsets_pos + count * 4)
+        self._strings_pos = strings_pos
+        return tables
+
+    @property
+    def entry_counts(self) -> tuple[int, int, int]:
+        """
+        (벤더, 디바이스, 서브시스템) 항목 수
+        """
+        return tuple(len(keys) for keys, _ in self._tables)
+
+    def close(self) -> None:
+        """
+        mmap을 닫는다.
+
+        Returns:
+            None
+        """
+        self._tables = []
+        try:
+            self._mmap.close()
+        except BufferError:
+            # 캐스팅한 memoryview가 남아 있으면 프로세스 종료 시 해제
+            pass
+
+    def _lookup(self, table: int, key: int) -> str | None:
+        keys, offsets_pos = self._tables[table]
+        index = bisect.bisect_left(keys, key)
+        if index >= len(keys) or keys[index] != key:
+            return None
+        offset = self._strings_pos + _OFFSET.unpack_from(self._mmap, offsets_pos + index * 4)[0]
+        (length,) = _LENGTH.unpack_from(self._mmap, offset)
+        return self._mmap[offset + 2:offset + 2 + length].decode("utf-8", "replace")
+
+    def vendor_name(self, vendor_id: int) -> str | None:
+        """
+        벤더 이름을 조회한다.
+
+        Args:
+            vendor_id: PCI 벤더 ID
+
+        Returns:
+            str | None: pci.ids 벤더 이름 또는 없으면 None
+        """
+        return self._lookup(0, vendor_key(vendor_id))
+
+    def device_name(self, vendor_id: int, device_id: int) -> str | None:
+        """
+        디바이스 이름을 조회한다.
+
+        Args:
+            vendor_id: PCI 벤더 ID
+            device_id: PCI 디바이스 ID
+
+        Returns:
+            str | None: pci.ids 디바이스 이름 또는 없으면 None
+        """
+        return self._lookup(1, device_key(vendor_id, device_id))
+
+    def subsystem_name(self, vendor_id: int, device_id: int, subvendor_id: int, subdevice_id: int) -> str | None:
+        """
+        서브시스템(보드 제조사 제품) 이름을 조회한다.
+
+        Args:
+            vendor_id: PCI 벤더 ID
+            device_id: PCI 디바이스 ID
+            subvendor_id: 서브시스템 벤더 ID
+            subdevice_id: 서브시스템 디바이스 ID
+
+        Returns:
+            str | None: pci.ids 서브시스템 이름 또는 없으면 None
+        """
+        return self._lookup(2, subsystem_key(vendor_id, device_id, subvendor_id, subdevice_id))
+
+
+_db_lock = threading.Lock()
+_db_loaded = False
+_db: PciIdDatabase | None = None
+
+
+def get_database() -> PciIdDatabase | None:
+    """
+    번들 색인(assets/pci_ids.bin)을 최초 호출 시 한 번만 연다.
+
+    Returns:
+        PciIdDatabase | None: 색인 또는 파일이 없거나 손상되었으면 None
+    """
+    global _db, _db_loaded
+    if not _db_loaded:
+        with _db_lock:
+            if not _db_loaded:
+                from core.path_utils import resource_path
+
+                path = resource_path(PCI_IDS_RESOURCE)
+                try:
+                    _db = PciIdDatabase(str(path))
+                    logger.info(f"PCI ID 색인 로드: {path}")
+                except FileNotFoundError:
+                    logger.info(f"PCI ID 색인 없음: {path}")
+                except (OSError, ValueError) as e:
+                    logger.warning(f"PCI ID 색인 로드 실패: {e}")
+                _db_loaded = True
+    return _db
+
+
+def parse_pnp_device_id(pnp_device_id: str | None) -> tuple[int, int, int | None, int | None] | None:
+    """
+    Win32 PNPDeviceID에서 PCI ID를 추출한다.
+
+    Args:
+        pnp_device_id: "PCI\\VEN_10DE&DEV_2484&SUBSYS_87C11043&REV_A1" 형식 문자열
+
+    Returns:
+        tuple | None: (벤더, 디바이스, 서브시스템 벤더, 서브시스템 디바이스) 또는 PCI 장치가 아니면 None
+    """
+    if not pnp_device_id:
+        return None
+    match = _PNP_DEVICE_ID_RE.search(pnp_device_id)
+    if match is None:
+        return None
+    vendor_id, device_id = int(match.group(1), 16), int(match.group(2), 16)
+    if match.group(3) is None:
+        return vendor_id, device_id, None, None
+    # SUBSYS_ddddvvvv: 앞 4자리가 서브시스템 디바이스, 뒤 4자리가 서브시스템 벤더
+    return vendor_id, device_id, int(match.group(4), 16), int(match.group(3), 16)
+
+
+def gpu_vendor_name(vendor_id: int, db: PciIdDatabase | None = None) -> str:
+    """
+    GPU 벤더 표기 문자열을 반환한다.
+
+    Args:
+        vendor_id: PCI 벤더 ID
+        db: 조회할 색인 (None이면 번들 색인)
+
+    Returns:
+        str: PREFERRED_VENDOR_NAMES → pci.ids 벤더 이름 → "VEN_xxxx" 순
+    """
+    preferred = PREFERRED_VENDOR_NAMES.get(vendor_id)
+    if preferred:
+        return preferred
+    if db is None:
+        db = get_database()
+    name = db.vendor_name(vendor_id) if db is not None else None
+    return name or f"VEN_{vendor_id:04X}"
+
+
+def gpu_device_name(
+    vendor_id: int,
+    device_id: int,
+    subvendor_id: int | None = None,
+    subdevice_id: int | None = None,
+    db: PciIdDatabase | None = None,
+) -> str | None:
+    """
+    GPU 장치 표기 이름을 반환한다. (드라이버가 이름을 주지 않을 때 사용)
+
+    pci.ids 디바이스 이름의 대괄호 안 제품명("GA104 [GeForce RTX 3070]" → "GeForce RTX 3070")을
+    우선 사용하며, 서브시스템 이름이 있으면 그것을 사용한다.
+
+    Args:
+        vendor_id: PCI 벤더 ID
+        device_id: PCI 디바이스 ID
+        subvendor_id: 서브시스템 벤더 ID (없으면 None)
+        subdevice_id: 서브시스템 디바이스 ID (없으면 None)
+        db: 조회할 색인 (None이면 번들 색인)
+
+    Returns:
+        str | None: 장치 이름 또는 색인이 없거나 미등록이면 None
+    """
+    if db is None:
+        db = get_database()
+    if db is None:
+        return None
+    if subvendor_id is not None and subdevice_id is not None:
+        name = db.subsystem_name(vendor_id, device_id, subvendor_id, subdevice_id)
+        if name:
+            return name
+    name = db.device_name(vendor_id, device_id)
+    if not name:
+        return None
+    start, end = name.find("["), name.rfind("]")
+    if 0 <= start < end:
+        return name[start + 1:end].strip() or name
+    return name
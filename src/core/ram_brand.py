@@ -6,12 +6,17 @@ WMI/SMBIOS 문자열과 PartNumber 패턴으로 보수적으로 판정하기 위
 
 - Windows WMI Win32_PhysicalMemory 수집 결과를 보정할 때 사용된다.
 - core.collector에서 RAM 표기용 브랜드 문자열 생성에 사용된다.
+- Manufacturer가 JEDEC 16진 코드("80CE" 등)이면 core.jedec의 JEP106 표로 해석한다.
 """
 
 from __future__ import annotations
 
 import re
 from enum import Enum
+from functools import lru_cache
+from typing import Iterable
+
+from core import jedec
 
 
 class RamBrand(str, Enum):
@@ -28,11 +33,88 @@ class RamBrand(str, Enum):
     MICRON = "Micron"
     KINGSTON = "Kingston"
     ADATA = "ADATA"
+    G_SKILL = "G.Skill"
+    CORSAIR = "Corsair"
+    TEAM_GROUP = "Team Group"
+    PATRIOT = "Patriot"
+    NANYA = "Nanya"
+    ELPIDA = "Elpida"
+    TRANSCEND = "Transcend"
+    APACER = "Apacer"
+    PNY = "PNY"
+    RAMAXEL = "Ramaxel"
+    SMART_MODULAR = "Smart Modular"
+    QIMONDA = "Qimonda"
+    INFINEON = "Infineon"
     UNKNOWN = "Unknown"
 
 
+# 브랜드별 Manufacturer 별칭 (정규화 문자열 부분 일치, 위에서부터 우선)
+# JEDEC 코드로 얻은 제조사 이름도 같은 표로 브랜드를 결정한다.
+VENDOR_CATALOG: tuple[tuple[RamBrand, tuple[str, ...]], ...] = (
+    (RamBrand.SAMSUNG, ("samsung",)),
+    (RamBrand.SK_HYNIX, ("skhynix", "hynix", "hyundai")),
+    (RamBrand.MICRON, ("micron", "crucial")),
+    (RamBrand.KINGSTON, ("kingston",)),
+    (RamBrand.ADATA, ("adata",)),
+    (RamBrand.G_SKILL, ("gskill",)),
+    (RamBrand.CORSAIR, ("corsair",)),
+    (RamBrand.TEAM_GROUP, ("teamgroup",)),
+    (RamBrand.PATRIOT, ("patriot",)),
+    (RamBrand.NANYA, ("nanya",)),
+    (RamBrand.ELPIDA, ("elpida",)),
+    (RamBrand.TRANSCEND, ("transcend",)),
+    (RamBrand.APACER, ("apacer",)),
+    (RamBrand.PNY, ("pny",)),
+    (RamBrand.RAMAXEL, ("ramaxel",)),
+    (RamBrand.SMART_MODULAR, ("smartmodular",)),
+    (RamBrand.QIMONDA, ("qimonda",)),
+    (RamBrand.INFINEON, ("infineon",)),
+)
+
+
+# PartNumber 접두 패턴 (대문자 PartNumber 앞부분에 match, 위에서부터 우선)
+# 모두 heuristic이며 Manufacturer로 확정하지 못했을 때만 사용한다.
+# TODO: ADATA 추가 패턴/내부 코드 매핑 확장 포인트
+PART_NUMBER_PATTERNS: tuple[tuple[RamBrand, str], ...] = (
+    (RamBrand.MICRON, r"M(?:T|TA|PT)[0-9A-Z]"),
+    (RamBrand.MICRON, r"CT[0-9]+G[0-9]"),                # Crucial (CT16G4DFRA32A, CT16G48C40U5)
+    (RamBrand.SAMSUNG, r"M(?:378|391|393|386|471|474|321|323|324|425)[A-Z][0-9A-Z]"),  # DDR3~DDR5 모듈
+    (RamBrand.SK_HYNIX, r"HM[ACTP][0-9A-Z]"),            # HMA(DDR4)/HMC(DDR5)/HMT(DDR3)
+    (RamBrand.KINGSTON, r"(?:KVR|KF)[0-9A-Z]"),
+    (RamBrand.KINGSTON, r"99[0-9]{5}"),
+    (RamBrand.ADATA, r"AD[23][0-9A-Z]"),                 # 보수적
+    (RamBrand.ADATA, r"AX[34]U[0-9A-Z]"),
+    (RamBrand.G_SKILL, r"F[345]-[0-9]{4}"),              # F4-3200C16D-16GVKB
+    (RamBrand.CORSAIR, r"CM(?:[KTWDH]|S[XO]?)[0-9]+GX[345]"),  # CMK16GX4M2B3200C16, CMSX8GX4M1A2400C16
+)
+
+# resolve_ram_brand_display() LRU 캐시 크기 (재고 일괄 재분류 시 반복되는 조합 재사용)
+RESOLVE_CACHE_SIZE = 4096
+
 INVALID_MANUFACTURERS = {"", "unknown", "0000", "0", "null", "na", "n/a"}
 
+_NON_ALNUM_RE = re.compile(r"[^a-z0-9]+")
+_HEX4_RE = re.compile(r"[0-9a-f]{4}")
+
+
+def _compile_part_number_matcher(patterns: tuple[tuple[RamBrand, str], ...]):
+    """
+    PartNumber 패턴 표를 이름 있는 그룹의 단일 alternation 정규식으로 컴파일한다.
+
+    Args:
+        patterns: (브랜드, 정규식) 목록
+
+    Returns:
+        tuple[re.Pattern, dict[str, RamBrand]]: 컴파일된 정규식, 그룹 이름 → 브랜드
+    """
+    groups = {f"p{i}": brand for i, (brand, _) in enumerate(patterns)}
+    alternation = "|".join(f"(?P<p{i}>{pattern})" for i, (_, pattern) in enumerate(patterns))
+    return re.compile(alternation), groups
+
+
+_PART_NUMBER_RE, _PART_NUMBER_GROUPS = _compile_part_number_matcher(PART_NUMBER_PATTERNS)
+
 
 def _normalize_text(value: str | None) -> str:
     """
@@ -46,7 +128,7 @@ def _normalize_text(value: str | None) -> str:
     """
     if not value:
         return ""
-    return re.sub(r"[^a-z0-9]+", "", value.lower())
+    return _NON_ALNUM_RE.sub("", value.lower())
 
 
 def _is_invalid_manufacturer(value: str | None) -> bool:
@@ -64,38 +146,53 @@ def _is_invalid_manufacturer(value: str | None) -> bool:
     stripped = value.strip().lower()
     if stripped in INVALID_MANUFACTURERS:
         return True
-    return re.fullmatch(r"[0-9a-f]{4}", stripped) is not None
+    return _HEX4_RE.fullmatch(stripped) is not None
+
+
+def _match_vendor_catalog(name: str) -> RamBrand | None:
+    """
+    제조사 이름을 VENDOR_CATALOG 별칭과 비교해 브랜드를 찾는다.
+
+    Args:
+        name: 제조사 이름
+
+    Returns:
+        RamBrand | None: 일치 브랜드 또는 None
+    """
+    norm = _normalize_text(name)
+    for brand, aliases in VENDOR_CATALOG:
+        if any(alias in norm for alias in aliases):
+            return brand
+    return None
 
 
 def _detect_by_manufacturer(manufacturer: str | None) -> RamBrand | None:
     """
     Manufacturer 기반 확정 판별.
 
+    JEDEC 16진 코드이면 JEP106 제조사 이름으로 변환한 뒤 판별한다.
+
     Args:
         manufacturer: Manufacturer 문자열 (None 가능)
 
     Returns:
         RamBrand | None: 확정 브랜드 또는 None
     """
+    jedec_name = jedec.lookup_manufacturer(manufacturer)
+    if jedec_name:
+        return _match_vendor_catalog(jedec_name)
+
     if _is_invalid_manufacturer(manufacturer):
         return None
-
-    norm = _normalize_text(manufacturer)
-    if "samsung" in norm:
-        return RamBrand.SAMSUNG
-    if "skhynix" in norm or "hynix" in norm:
-        return RamBrand.SK_HYNIX
-    if "micron" in norm or "crucial" in norm:
-        return RamBrand.MICRON
-    if "kingston" in norm:
-        return RamBrand.KINGSTON
-    return None
+    return _match_vendor_catalog(manufacturer)
 
 
 def _detect_by_part_number(part_number: str | None) -> RamBrand | None:
     """
     PartNumber 기반 보조 판별(heuristic).
 
+    PART_NUMBER_PATTERNS를 컴파일한 단일 정규식으로 한 번만 매칭한다.
+
     Args:
         part_number: PartNumber 문자열 (None 가능)
 
@@ -105,26 +202,10 @@ def _detect_by_part_number(part_number: str | None) -> RamBrand | None:
     if not part_number:
         return None
 
-    pn = part_number.strip().upper()
-
-    # Micron heuristic
-    if re.match(r"^M(T|TA|PT)[0-9A-Z]", pn):
-        return RamBrand.MICRON  # heuristic
-
-    # Kingston heuristic
-    if re.match(r"^(KVR|KF)[0-9A-Z]", pn):
-        return RamBrand.KINGSTON  # heuristic
-    if re.match(r"^99[0-9]{5}", pn):
-        return RamBrand.KINGSTON  # heuristic
-
-    # ADATA heuristic (보수적)
-    if re.match(r"^AD[23][0-9A-Z]", pn):
-        return RamBrand.ADATA  # heuristic
-    if re.match(r"^AX[34]U[0-9A-Z]", pn):
-        return RamBrand.ADATA  # heuristic
-
-    # TODO: ADATA 추가 패턴/내부 코드 매핑 확장 포인트
-    return None
+    match = _PART_NUMBER_RE.match(part_number.strip().upper())
+    if match is None:
+        return None
+    return _PART_NUMBER_GROUPS[match.lastgroup]
 
 
 def detect_ram_brand(manufacturer: str | None, part_number: str | None) -> RamBrand:
@@ -150,9 +231,10 @@ def detect_ram_brand(manufacturer: str | None, part_number: str | None) -> RamBr
     return RamBrand.UNKNOWN
 
 
+@lru_cache(maxsize=RESOLVE_CACHE_SIZE)
 def resolve_ram_brand_display(manufacturer: str | None, part_number: str | None) -> str:
     """
-    UI 표기용 브랜드 문자열을 반환한다.
+    UI 표기용 브랜드 문자열을 반환한다. (입력 조합별 LRU 캐시)
 
     Args:
         manufacturer: Manufacturer 문자열 (None 가능)
@@ -164,6 +246,33 @@ def resolve_ram_brand_display(manufacturer: str | None, part_number: str | None)
     brand = detect_ram_brand(manufacturer, part_number)
     if brand != RamBrand.UNKNOWN:
         return brand.value
+    jedec_name = jedec.lookup_manufacturer(manufacturer)
+    if jedec_name:
+        return jedec_name
     if _is_invalid_manufacturer(manufacturer):
         return RamBrand.UNKNOWN.value
     return (manufacturer or "").strip() or RamBrand.UNKNOWN.value
+
+
+def resolve_many(pairs: Iterable[tuple[str | None, str | None]]) -> list[str]:
+    """
+    (Manufacturer, PartNumber) 목록의 UI 표기용 브랜드 문자열을 한 번에 반환한다.
+
+    같은 조합은 호출 안에서 한 번만 판별하므로 LRU 캐시 크기를 넘는 대량 재분류에도 적합하다.
+
+    Args:
+        pairs: (Manufacturer, PartNumber) 목록
+
+    Returns:
+        list[str]: 입력 순서와 같은 브랜드 문자열 목록
+    """
+    resolve = resolve_ram_brand_display.__wrapped__
+    seen: dict[tuple, str] = {}
+    results = []
+    for manufacturer, part_number in pairs:
+        key = (manufacturer, part_number)
+        display = seen.get(key)
+        if display is None:
+            display = seen[key] = resolve(manufacturer, part_number)
+        results.append(display)
+    return results
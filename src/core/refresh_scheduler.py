@@ -0,0 +1,310 @@
+# 본 소스코드는 내부 사용 및 유지보수 목적에 한해 제공됩니다.
+# 무단 재배포 및 상업적 재사용은 허용되지 않습니다.
+# core/refresh_scheduler.py
+
+from __future__ import annotations
+
+"""
+카테고리별 TTL 기반 선택 재수집 스케줄러
+CPU/메인보드/RAM은 세션 중 거의 바뀌지 않지만 storage(USB/외장 디스크)와 vga(eGPU, 드라이버 재설정)는 바뀔 수 있으므로
+카테고리마다 마지막 수집 시각과 TTL을 비교해 만료된 카테고리의 collect_*()만 다시 호출한다.
+
+- 책임: 카테고리별 수집 시각/TTL 관리, 만료 카테고리 선택 수집과 병합, 생략한 작업 집계
+- 비책임: 실제 수집 (ISpecCollector.collect()에 위임), 화면 갱신 (Controller 담당)
+- 사용처: Controller.refresh_specs() (수동 재수집, 다른 실행의 --refresh 요청, 하드웨어 변경 감지 시 invalidate() 후 재수집)
+
+TTL 설정 (환경 변수, 초 단위):
+    PC_SPEC_VIEWER_REFRESH_TTL="storage=30,vga=300"
+"""
+
+import logging
+import os
+import threading
+import time
+from typing import Callable
+
+from core.spec_schema import (
+    CATEGORY_CPU,
+    CATEGORY_MAINBOARD,
+    CATEGORY_RAM,
+    CATEGORY_STORAGE,
+    CATEGORY_SYSTEM_TYPE,
+    CATEGORY_VGA,
+    SPEC_CATEGORIES,
+    TIMED_OUT,
+    TIMED_OUT_KEY,
+    category_value,
+    merge_category_result,
+)
+
+logger = logging.getLogger(__name__)
+
+REFRESH_TTL_ENV = "PC_SPEC_VIEWER_REFRESH_TTL"
+# 카테고리별 기본 TTL(초) — 세션 중 바뀌지 않는 하드웨어는 길게, 핫플러그 가능한 장치는 짧게
+DEFAULT_CATEGORY_TTLS_S = {
+    CATEGORY_SYSTEM_TYPE: 6 * 3600.0,
+    CATEGORY_CPU: 6 * 3600.0,
+    CATEGORY_RAM: 6 * 3600.0,
+    CATEGORY_MAINBOARD: 6 * 3600.0,
+    CATEGORY_VGA: 600.0,
+    CATEGORY_STORAGE: 60.0,
+}
+
+
+def collect_categories(collector, categories: tuple[str, ...]) -> dict:
+    """
+    수집기로 지정한 카테고리만 수집한다.
+
+    collect()를 구현하지 않은 수집기는 collect_all_specs()로 전체를 수집한다.
+
+    Args:
+        collector: ISpecCollector 구현체
+        categories: 수집할 카테고리 목록
+
+    Returns:
+        dict: collect_all_specs() 반환 형식의 딕셔너리
+    """
+    collect = getattr(collector, "collect", None)
+    if collect is None:
+        return collector.collect_all_specs()
+    return collect(tuple(categories))
+
+
+def parse_ttls(text: str) -> dict:
+    """
+    "storage=30,vga=300" 형식의 TTL 설정을 해석한다.
+
+    Args:
+        text: 카테고리=초 목록 (쉼표 구분)
+
+    Returns:
+        dict: 카테고리 → TTL(초)
+
+    Raises:
+        ValueError: 알 수 없는 카테고리 또는 잘못된 값
+    """
+    ttls = {}
+    for item in text.split(","):
+        item = item.strip()
+        if not item:
+            continue
+        category, sep, value = item.partition("=")
+        category = category.strip()
+        if not sep or category not in SPEC_CATEGORIES:
+            raise ValueError(f"잘못된 TTL 설정: {item!r}")
+        ttl = float(value)
+        if ttl < 0:
+            raise ValueError(f"TTL은 0 이상이어야 합니다: {item!r}")
+        ttls[category] = ttl
+    return ttls
+
+
+def ttls_from_env() -> dict:
+    """
+    환경 변수(PC_SPEC_VIEWER_REFRESH_TTL)의 TTL 설정을 반환한다. (없거나 잘못되면 빈 딕셔너리)
+
+    Returns:
+        dict: 카테고리 → TTL(초)
+    """
+    text = os.environ.get(REFRESH_TTL_ENV, "")
+    if not text:
+        return {}
+    try:
+        return parse_ttls(text)
+    except ValueError as e:
+        logger.warning(f"{REFRESH_TTL_ENV} 무시: {e}")
+        return {}
+
+
+class RefreshScheduler:
+    """
+    카테고리별 TTL이 지난 카테고리만 다시 수집하는 스케줄러
+
+    - 책임: mark_collected()/refresh()로 수집 시각 기록, 만료 카테고리 판정, 결과 병합, 생략 집계
+    - 비책임: 수집 실행 스레드 관리 (Controller의 워커에서 refresh() 호출)
+    - 사용처: main.py에서 생성해 Controller에 주입
+    - 시간 초과된 카테고리는 수집 시각을 갱신하지 않아 다음 재수집 대상이 됨
+    """
+
+    def __init__(
+        self,
+        collector,
+        ttls: dict | None = None,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """
+        RefreshScheduler 초기화
+
+        Args:
+            collector: 선택 수집에 사용할 ISpecCollector 구현체 (collect()가 없으면 전체 수집)
+            ttls: 카테고리별 TTL(초) 덮어쓰기 (None이면 DEFAULT_CATEGORY_TTLS_S)
+            clock: 단조 시계 함수 (검증 스크립트에서 교체)
+
+        Raises:
+            ValueError: 알 수 없는 카테고리
+        """
+        self._collector = collector
+        self._ttls = dict(DEFAULT_CATEGORY_TTLS_S)
+        for category, ttl in (ttls or {}).items():
+            if category not in SPEC_CATEGORIES:
+                raise ValueError(f"알 수 없는 카테고리: {category}")
+            self._ttls[category] = float(ttl)
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._collected_at: dict = {}
+        self._skipped_by_category = {category: 0 for category in SPEC_CATEGORIES}
+        self.refreshes = 0
+        self.categories_collected = 0
+        self.categories_skipped = 0
+
+    @property
+    def ttls(self) -> dict:
+        """카테고리별 TTL(초)"""
+        return dict(self._ttls)
+
+    def mark_collected(self, specs: dict) -> None:
+        """
+        전체 수집 결과를 받은 시점을 모든 카테고리의 수집 시각으로 기록한다.
+
+        Args:
+            specs: 전체 수집 결과 (시간 초과 카테고리는 기록하지 않음)
+
+        Returns:
+            None
+        """
+        timed_out = specs.get(TIMED_OUT_KEY) or ()
+        now = self._clock()
+        with self._lock:
+            for category in SPEC_CATEGORIES:
+                if category not in timed_out:
+                    self._collected_at[category] = now
+
+    def age_s(self, category: str) -> float | None:
+        """
+        카테고리의 마지막 수집 후 경과 시간(초)을 반환한다.
+
+        Args:
+            category: SPEC_CATEGORIES 중 하나
+
+        Returns:
+            float | None: 경과 시간 (수집한 적 없으면 None)
+        """
+        with self._lock:
+            collected_at = self._collected_at.get(category)
+        if collected_at is None:
+            return None
+        return self._clock() - collected_at
+
+    def stale_categories(self) -> tuple[str, ...]:
+        """
+        TTL이 지났거나 수집한 적 없는 카테고리를 반환한다.
+
+        Returns:
+            tuple[str, ...]: SPEC_CATEGORIES 순서의 만료 카테고리
+        """
+        now = self._clock()
+        with self._lock:
+            return tuple(
+                category
+                for category in SPEC_CATEGORIES
+                if category not in self._collected_at
+                or now - self._collected_at[category] >= self._ttls[category]
+            )
+
+    def invalidate(self, categories: tuple[str, ...]) -> None:
+        """
+        카테고리의 수집 시각을 지워 TTL과 관계없이 다음 refresh()의 수집 대상으로 만든다.
+
+        Args:
+            categories: 하드웨어 변경 등으로 값이 바뀌었을 수 있는 카테고리
+
+        Returns:
+            None
+        """
+        with self._lock:
+            for category in categories:
+                self._collected_at.pop(category, None)
+
+    def refresh(self, specs: dict, force: bool = False) -> dict:
+        """
+        만료된 카테고리만 수집해 specs에 병합한 새 사양 딕셔너리를 반환한다.
+
+        만료된 카테고리가 없으면 수집하지 않고 specs의 복사본을 반환한다.
+        시간 초과된 카테고리는 specs의 값을 유지한다. (specs에서도 시간 초과였으면 시간 초과로 기록)
+
+        Args:
+            specs: 현재 표시 중인 사양 딕셔너리
+            force: True이면 TTL과 관계없이 모든 카테고리를 수집
+
+        Returns:
+            dict: 병합된 사양 딕셔너리
+        """
+        categories = SPEC_CATEGORIES if force else self.stale_categories()
+        skipped = [category for category in SPEC_CATEGORIES if category not in categories]
+        merged = dict(specs)
+        merged.pop(TIMED_OUT_KEY, None)
+        timed_out = []
+
+        started = time.perf_counter()
+        if categories:
+            fresh = collect_categories(self._collector, categories)
+            now = self._clock()
+            for category in categories:
+                value = category_value(fresh, category)
+                if value is TIMED_OUT:
+                    timed_out.append(category)
+                    if category_value(specs, category) is not TIMED_OUT:
+                        continue
+                merge_category_result(merged, category, value)
+            with self._lock:
+                for category in categories:
+                    if category not in timed_out:
+                        self._collected_at[category] = now
+        for category in skipped:
+            if category_value(specs, category) is TIMED_OUT:
+                merge_category_result(merged, category, TIMED_OUT)
+
+        with self._lock:
+            self.refreshes += 1
+            self.categories_collected += len(categories)
+            self.categories_skipped += len(skipped)
+            for category in skipped:
+                self._skipped_by_category[category] += 1
+        logger.info(
+            "선택 재수집 | %.0fms | 수집: %s | 생략: %s | 시간 초과: %s | 누적 수집 %d개, 생략 %d개",
+            (time.perf_counter() - started) * 1000,
+            ", ".join(categories) or "없음",
+            ", ".join(skipped) or "없음",
+            ", ".join(timed_out) or "없음",
+            self.categories_collected,
+            self.categories_skipped,
+        )
+        return merged
+
+    def stats(self) -> dict:
+        """
+        재수집 횟수와 생략한 작업 집계를 반환한다.
+
+        Returns:
+            dict: {
+                "refreshes": int,
+                "categories_collected": int,
+                "categories_skipped": int,
+                "skipped_by_category": dict[str, int],
+                "ages_s": dict[str, float | None],
+                "ttls_s": dict[str, float],
+            }
+        """
+        now = self._clock()
+        with self._lock:
+            return {
+                "refreshes": self.refreshes,
+                "categories_collected": self.categories_collected,
+                "categories_skipped": self.categories_skipped,
+                "skipped_by_category": dict(self._skipped_by_category),
+                "ages_s": {
+                    category: (None if category not in self._collected_at else round(now - self._collected_at[category], 3))
+                    for category in SPEC_CATEGORIES
+                },
+                "ttls_s": dict(self._ttls),
+            }
@@ -0,0 +1,204 @@
+# 본 소스코드는 내부 사용 및 유지보수 목적에 한해 제공됩니다.
+# 무단 재배포 및 상업적 재사용은 허용되지 않습니다.
+# core/single_instance.py
+
+from __future__ import annotations
+
+"""
+사용자별 단일 인스턴스 보장
+두 번째 실행은 실행 중인 창을 앞으로 가져오도록(선택적으로 재수집) 요청한 뒤 바로 종료
+
+- 책임: 잠금 파일(QLockFile)로 첫 인스턴스 판정, QLocalServer/QLocalSocket 전달 채널
+- 비책임: 창 활성화/재수집 처리 (activation_requested 시그널을 받은 Controller 담당)
+- 사용처: main.py (QApplication/MainWindow 생성 전에 acquire()/hand_off() 호출)
+
+프로토콜 (요청 1줄 → 응답 1줄):
+    b"activate\\n" 또는 b"refresh\\n" → b"ok\\n"
+"""
+
+import getpass
+import logging
+import os
+import re
+import time
+
+from PyQt5.QtCore import QDir, QLockFile, QObject, pyqtSignal
+from PyQt5.QtNetwork import QLocalServer, QLocalSocket
+
+logger = logging.getLogger(__name__)
+
+APP_KEY = "PC_Spec_Viewer"
+MESSAGE_ACTIVATE = b"activate"
+MESSAGE_REFRESH = b"refresh"
+REPLY_OK = b"ok"
+# 첫 인스턴스가 잠금 후 서버를 열기 전일 수 있으므로 연결을 재시도할 시간(ms)
+HANDOFF_CONNECT_TIMEOUT_MS = 2000
+HANDOFF_RETRY_INTERVAL_S = 0.05
+# 첫 인스턴스 응답 대기 시간(ms) (GUI 스레드가 멈춘 인스턴스 판별)
+HANDOFF_REPLY_TIMEOUT_MS = 1500
+# AllowSetForegroundWindow: 모든 프로세스에 포그라운드 전환 허용
+ASFW_ANY = -1
+
+
+def instance_key() -> str:
+    """
+    사용자별 인스턴스 키를 반환한다. (로컬 서버 이름/잠금 파일 이름)
+
+    Windows 명명 파이프는 세션 간에 공유되므로 사용자 이름을 포함한다.
+
+    Returns:
+        str: 예) "PC_Spec_Viewer.alice"
+    """
+    try:
+        user = getpass.getuser()
+    except Exception:
+        user = str(os.getpid()) if not hasattr(os, "getuid") else str(os.getuid())
+    return f"{APP_KEY}.{re.sub(r'[^0-9A-Za-z_.-]', '_', user)}"
+
+
+class SingleInstanceGuard(QObject):
+    """
+    단일 인스턴스 잠금과 실행 중 인스턴스로의 전달을 담당
+
+    - 책임: acquire()로 첫 인스턴스 여부 판정, 두 번째 실행의 hand_off(), 첫 인스턴스의 listen()
+    - 비책임: 요청 처리 (activation_requested 시그널 구독자 담당)
+    - 사용처: main.py
+    - 잠금은 프로세스 종료 시 OS가 정리하지 않아도 PID 기준으로 오래된 잠금을 판별함
+    """
+
+    # 다른 실행이 활성화를 요청함 (True이면 재수집도 요청)
+    activation_requested = pyqtSignal(bool)
+
+    def __init__(self, key: str | None = None, parent: QObject | None = None):
+        """
+        SingleInstanceGuard 초기화
+
+        Args:
+            key: 인스턴스 키 (None이면 instance_key())
+            parent: 부모 QObject
+        """
+        super().__init__(parent)
+        self._key = key or instance_key()
+        self._lock = QLockFile(os.path.join(QDir.tempPath(), f"{self._key}.lock"))
+        # 기본값(30초)이면 오래 실행 중인 인스턴스의 잠금을 오래된 것으로 판단하므로 PID 기준만 사용
+        self._lock.setStaleLockTime(0)
+        self._server: QLocalServer | None = None
+
+    @property
+    def key(self) -> str:
+        """인스턴스 키"""
+        return self._key
+
+    def acquire(self) -> bool:
+        """
+        단일 인스턴스 잠금을 시도한다.
+
+        Returns:
+            bool: 첫 인스턴스이면 True (이후 listen() 호출)
+        """
+        if self._lock.tryLock(0):
+            return True
+        if self._lock.error() == QLockFile.LockFailedError:
+            logger.info("다른 인스턴스가 실행 중 | %s", self._key)
+        else:
+            logger.warning("단일 인스턴스 잠금 실패(오류 %d) | %s", self._lock.error(), self._key)
+        return False
+
+    def hand_off(self, refresh: bool = False) -> bool:
+        """
+        실행 중인 인스턴스에 활성화(선택적으로 재수집)를 요청한다. (QApplication 불필요)
+
+        Args:
+            refresh: True이면 재수집도 요청
+
+        Returns:
+            bool: 실행 중인 인스턴스가 요청을 받았으면 True
+        """
+        _allow_foreground_switch()
+        socket = QLocalSocket()
+        deadline = time.monotonic() + HANDOFF_CONNECT_TIMEOUT_MS / 1000
+        while True:
+            socket.connectToServer(self._key)
+            if socket.waitForConnected(HANDOFF_CONNECT_TIMEOUT_MS):
+                break
+            if time.monotonic() >= deadline:
+                logger.warning("실행 중인 인스턴스 연결 실패: %s", socket.errorString())
+                return False
+            time.sleep(HANDOFF_RETRY_INTERVAL_S)
+
+        socket.write((MESSAGE_REFRESH if refresh else MESSAGE_ACTIVATE) + b"\n")
+        socket.waitForBytesWritten(HANDOFF_REPLY_TIMEOUT_MS)
+        reply = b""
+        if socket.waitForReadyRead(HANDOFF_REPLY_TIMEOUT_MS):
+            reply = bytes(socket.readLine()).strip()
+        socket.disconnectFromServer()
+        if reply != REPLY_OK:
+            logger.warning("실행 중인 인스턴스가 응답하지 않음")
+            return False
+        return True
+
+    def listen(self) -> bool:
+        """
+        다른 실행의 요청을 받을 로컬 서버를 연다. (acquire() 성공 후, QApplication 생성 후 호출)
+
+        Returns:
+            bool: 서버를 열었으면 True
+        """
+        # 잠금을 가진 상태이므로 남아 있는 서버(비정상 종료한 이전 실행의 소켓 파일)는 정리해도 안전함
+        QLocalServer.removeServer(self._key)
+        server = QLocalServer(self)
+        server.setSocketOptions(QLocalServer.UserAccessOption)
+        if not server.listen(self._key):
+            logger.warning("단일 인스턴스 서버 시작 실패: %s", server.errorString())
+            return False
+        server.newConnection.connect(self._on_new_connection)
+        self._server = server
+        logger.info("단일 인스턴스 서버 시작 | %s", server.fullServerName())
+        return True
+
+    def release(self) -> None:
+        """
+        서버를 닫고 잠금을 해제한다.
+
+        Returns:
+            None
+        """
+        if self._server is not None:
+            self._server.close()
+            self._server = None
+        self._lock.unlock()
+
+    def _on_new_connection(self) -> None:
+        while self._server is not None and self._server.hasPendingConnections():
+            connection = self._server.nextPendingConnection()
+            connection.readyRead.connect(lambda c=connection: self._on_ready_read(c))
+            connection.disconnected.connect(connection.deleteLater)
+
+    def _on_ready_read(self, connection: QLocalSocket) -> None:
+        if not connection.canReadLine():
+            return
+        message = bytes(connection.readLine()).strip()
+        if message not in (MESSAGE_ACTIVATE, MESSAGE_REFRESH):
+            logger.warning("알 수 없는 단일 인스턴스 요청: %r", message[:32])
+            connection.disconnectFromServer()
+            return
+        connection.write(REPLY_OK + b"\n")
+        connection.flush()
+        logger.info("다른 실행의 활성화 요청 | 재수집=%s", message == MESSAGE_REFRESH)
+        self.activation_requested.emit(message == MESSAGE_REFRESH)
+
+
+def _allow_foreground_switch() -> None:
+    """
+    Windows: 실행 중인 인스턴스가 창을 앞으로 가져올 수 있도록 포그라운드 전환을 허용한다.
+
+    사용자가 실행한 두 번째 프로세스가 포그라운드 권한을 가지므로 여기서 넘겨준다.
+    """
+    if os.name != "nt":
+        return
+    try:
+        import ctypes
+
+        ctypes.windll.user32.AllowSetForegroundWindow(ASFW_ANY)
+    except Exception:
+        logger.debug("AllowSetForegroundWindow 호출 실패", exc_info=True)
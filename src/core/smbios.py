@@ -0,0 +1,407 @@
+# 본 소스코드는 내부 사용 및 유지보수 목적에 한해 제공됩니다.
+# 무단 재배포 및 상업적 재사용은 허용되지 않습니다.
+# core/smbios.py
+
+from __future__ import annotations
+
+"""
+SMBIOS(DMI) 원시 테이블 파서
+펌웨어 테이블을 한 번 읽어 메인보드/섀시/프로세서/메모리 정보를 디코딩
+
+- 책임: 원시 테이블 읽기(Windows RSMB, Linux /sys/firmware/dmi/tables/DMI), memoryview 기반 구조체 파싱
+- 비책임: 표시 문자열 생성/분류 (core.collector의 규칙 사용)
+- 사용처: core.collector(system_type/ram/mainboard), core.linux_backend(ram)
+- 디코딩 결과는 Win32_* WMI 클래스와 같은 속성 이름의 WmiRow로 반환 (기존 판정 로직 재사용)
+"""
+
+import logging
+import platform
+import struct
+import threading
+
+from core.wmi_query import WmiRow
+
+logger = logging.getLogger(__name__)
+
+LINUX_DMI_TABLE_PATH = "/sys/firmware/dmi/tables/DMI"
+# GetSystemFirmwareTable 공급자 시그니처 'RSMB'
+RSMB_SIGNATURE = 0x52534D42
+# RawSMBIOSData 헤더 (Used20CallingMethod, Major, Minor, DmiRevision, Length)
+RAW_SMBIOS_HEADER = struct.Struct("<BBBBI")
+
+TYPE_BASEBOARD = 2
+TYPE_CHASSIS = 3
+TYPE_PROCESSOR = 4
+TYPE_MEMORY_DEVICE = 17
+TYPE_END_OF_TABLE = 127
+
+# Type 17 Size 필드 특수값
+MEMORY_SIZE_UNKNOWN = 0xFFFF
+MEMORY_SIZE_EXTENDED = 0x7FFF
+MEMORY_SIZE_KB_FLAG = 0x8000
+MEMORY_SPEED_EXTENDED = 0xFFFF
+
+# SMBIOS Type 17 Form Factor → Win32_PhysicalMemory.FormFactor
+SMBIOS_TO_WIN32_FORM_FACTOR = {
+    0x01: 1,    # Other
+    0x02: 0,    # Unknown
+    0x03: 7,    # SIMM
+    0x04: 2,    # SIP
+    0x06: 3,    # DIP
+    0x07: 4,    # ZIP
+    0x08: 6,    # Proprietary Card
+    0x09: 8,    # DIMM
+    0x0A: 9,    # TSOP
+    0x0C: 11,   # RIMM
+    0x0D: 12,   # SODIMM
+    0x0E: 13,   # SRIMM
+    0x0F: 8,    # FB-DIMM
+    0x10: 16,   # Die (온보드)
+}
+
+_WORD = struct.Struct("<H")
+_DWORD = struct.Struct("<I")
+
+
+class SmbiosStructure:
+    """
+    SMBIOS 구조체 하나 (원본 버퍼를 참조하며 복사하지 않음)
+
+    - 책임: 서식 영역의 BYTE/WORD/DWORD 읽기, 문자열 집합 조회
+    - 비책임: 타입별 의미 해석 (decode_*() 담당)
+    - 사용처: iter_structures()
+    """
+
+    __slots__ = ("type", "handle", "_formatted", "_raw", "_strings_start", "_strings_end")
+
+    def __init__(
+        self,
+        struct_type: int,
+        handle: int,
+        formatted: memoryview,
+        raw: bytes,
+        strings_start: int,
+        strings_end: int,
+    ):
+        self.type = struct_type
+        self.handle = handle
+        self._formatted = formatted
+        self._raw = raw
+        self._strings_start = strings_start
+        self._strings_end = strings_end
+
+    @property
+    def length(self) -> int:
+        """서식 영역 길이"""
+        return len(self._formatted)
+
+    def byte(self, offset: int) -> int | None:
+        """서식 영역 BYTE (범위 밖이면 None)"""
+        if offset + 1 > len(self._formatted):
+            return None
+        return self._formatted[offset]
+
+    def word(self, offset: int) -> int | None:
+        """서식 영역 WORD (범위 밖이면 None)"""
+        if offset + 2 > len(self._formatted):
+            return None
+        return _WORD.unpack_from(self._formatted, offset)[0]
+
+    def dword(self, offset: int) -> int | None:
+        """서식 영역 DWORD (범위 밖이면 None)"""
+        if offset + 4 > len(self._formatted):
+            return None
+        return _DWORD.unpack_from(self._formatted, offset)[0]
+
+    def string(self, offset: int) -> str:
+        """
+        서식 영역 offset의 문자열 번호(1부터)에 해당하는 문자열을 반환한다.
+
+        Args:
+            offset: 문자열 번호가 기록된 BYTE 오프셋
+
+        Returns:
+            str: 문자열 (번호 0/범위 밖/필드 없음이면 빈 문자열)
+        """
+        index = self.byte(offset)
+        if not index:
+            return ""
+        raw = self._raw
+        start = self._strings_start
+        limit = self._strings_end
+        for _ in range(index - 1):
+            end = raw.find(b"\x00", start, limit)
+            if end < 0 or end == start:
+                return ""
+            start = end + 1
+        end = raw.find(b"\x00", start, limit)
+        if end <= start:
+            return ""
+        return raw[start:end].decode("ascii", errors="replace").strip()
+
+
+def iter_structures(table: bytes | bytearray | memoryview, types: set[int] | None = None):
+    """
+    원시 SMBIOS 테이블을 구조체 단위로 순회한다.
+
+    서식 영역은 memoryview 조각으로, 문자열 집합은 원본 버퍼 오프셋으로만 참조한다.
+
+    Args:
+        table: 구조체가 이어진 원시 테이블 (헤더 제외)
+        types: 반환할 구조체 타입 (None이면 전체)
+
+    Yields:
+        SmbiosStructure: 구조체
+    """
+    raw = bytes(table) if isinstance(table, memoryview) else table
+    view = memoryview(raw)
+    size = len(raw)
+    offset = 0
+    while offset + 4 <= size:
+        struct_type = raw[offset]
+        length = raw[offset + 1]
+        if length < 4 or offset + length > size:
+            logger.debug("SMBIOS 구조체 길이 비정상 | type=%s offset=%d length=%d", struct_type, offset, length)
+            return
+        # 문자열 집합은 서식 영역 뒤에서 이중 NUL로 끝남
+        end = raw.find(b"\x00\x00", offset + length)
+        if end < 0:
+            return
+        if types is None or struct_type in types:
+            yield SmbiosStructure(
+                struct_type,
+                _WORD.unpack_from(raw, offset + 2)[0],
+                view[offset:offset + length],
+                raw,
+                offset + length,
+                end + 1,
+            )
+        if struct_type == TYPE_END_OF_TABLE:
+            return
+        offset = end + 2
+
+
+def decode_baseboard(s: SmbiosStructure) -> WmiRow:
+    """
+    Type 2(Baseboard)를 Win32_BaseBoard 속성 이름으로 디코딩한다.
+    """
+    return WmiRow(
+        Manufacturer=s.string(0x04),
+        Product=s.string(0x05),
+        Version=s.string(0x06),
+    )
+
+
+def decode_chassis(s: SmbiosStructure) -> WmiRow:
+    """
+    Type 3(System Enclosure)를 Win32_SystemEnclosure 속성 이름으로 디코딩한다.
+
+    최상위 비트(섀시 잠금 여부)는 제외하고 유형 코드만 사용한다.
+    """
+    chassis_type = s.byte(0x05)
+    return WmiRow(
+        Manufacturer=s.string(0x04),
+        ChassisTypes=[chassis_type & 0x7F] if chassis_type else [],
+    )
+
+
+def decode_processor(s: SmbiosStructure) -> WmiRow:
+    """
+    Type 4(Processor)를 Win32_Processor 속성 이름으로 디코딩한다.
+    """
+    return WmiRow(
+        SocketDesignation=s.string(0x04),
+        Manufacturer=s.string(0x07),
+        Name=s.string(0x10),
+        MaxClockSpeed=s.word(0x14) or 0,
+        CurrentClockSpeed=s.word(0x16) or 0,
+    )
+
+
+def _memory_capacity_bytes(s: SmbiosStructure) -> int | None:
+    """
+    Type 17 Size/Extended Size 필드에서 용량(바이트)을 계산한다. (알 수 없으면 None, 빈 슬롯은 0)
+    """
+    size = s.word(0x0C)
+    if size is None or size == MEMORY_SIZE_UNKNOWN:
+        return None
+    if size == MEMORY_SIZE_EXTENDED:
+        extended_mb = s.dword(0x1C)
+        if extended_mb is None:
+            return None
+        return (extended_mb & 0x7FFFFFFF) * 1024 * 1024
+    if size & MEMORY_SIZE_KB_FLAG:
+        return (size & 0x7FFF) * 1024
+    return size * 1024 * 1024
+
+
+def decode_memory_device(s: SmbiosStructure) -> WmiRow:
+    """
+    Type 17(Memory Device)를 Win32_PhysicalMemory 속성 이름으로 디코딩한다.
+
+    Capacity가 0이면 빈 슬롯, None이면 알 수 없는 크기이다.
+    """
+    speed = s.word(0x15) or 0
+    if speed == MEMORY_SPEED_EXTENDED:
+        speed = s.dword(0x54) or 0
+    return WmiRow(
+        Capacity=_memory_capacity_bytes(s),
+        Speed=speed or None,
+        Manufacturer=s.string(0x17),
+        PartNumber=s.string(0x1A),
+        FormFactor=SMBIOS_TO_WIN32_FORM_FACTOR.get(s.byte(0x0E) or 0, 0),
+        DeviceLocator=s.string(0x10),
+        BankLabel=s.string(0x11),
+    )
+
+
+class SmbiosTables:
+    """
+    디코딩된 SMBIOS 정보 모음
+
+    - 책임: Type 2/3/4/17 디코딩 결과 보관
+    - 비책임: 원시 테이블 읽기
+    - 사용처: core.collector, core.linux_backend
+    """
+
+    def __init__(self, baseboards: list, chassis: list, processors: list, memory_devices: list):
+        self.baseboards = baseboards
+        self.chassis = chassis
+        self.processors = processors
+        self.memory_devices = memory_devices
+
+    @property
+    def installed_memory(self) -> list:
+        """크기를 아는 장착된(비어 있지 않은) 메모리 장치 목록"""
+        return [m for m in self.memory_devices if m.Capacity]
+
+
+_DECODERS = {
+    TYPE_BASEBOARD: decode_baseboard,
+    TYPE_CHASSIS: decode_chassis,
+    TYPE_PROCESSOR: decode_processor,
+    TYPE_MEMORY_DEVICE: decode_memory_device,
+}
+
+
+def parse_tables(table: bytes | bytearray | memoryview) -> SmbiosTables:
+    """
+    원시 SMBIOS 테이블에서 Type 2/3/4/17을 한 번에 디코딩한다.
+
+    Args:
+        table: 구조체가 이어진 원시 테이블 (RawSMBIOSData 헤더 제외)
+
+    Returns:
+        SmbiosTables: 디코딩 결과
+    """
+    decoded = {struct_type: [] for struct_type in _DECODERS}
+    for s in iter_structures(table, set(_DECODERS)):
+        try:
+            decoded[s.type].append(_DECODERS[s.type](s))
+        except Exception as e:
+            logger.debug("SMBIOS 구조체 디코딩 실패 | type=%d handle=0x%04X | %s", s.type, s.handle, e)
+    return SmbiosTables(
+        baseboards=decoded[TYPE_BASEBOARD],
+        chassis=decoded[TYPE_CHASSIS],
+        processors=decoded[TYPE_PROCESSOR],
+        memory_devices=decoded[TYPE_MEMORY_DEVICE],
+    )
+
+
+def strip_raw_smbios_header(data: bytes) -> bytes | None:
+    """
+    GetSystemFirmwareTable('RSMB') 결과에서 RawSMBIOSData 헤더를 제거한다.
+
+    Args:
+        data: RSMB 원시 데이터
+
+    Returns:
+        bytes | None: 구조체 테이블 또는 형식 오류 시 None
+    """
+    if len(data) < RAW_SMBIOS_HEADER.size:
+        return None
+    length = RAW_SMBIOS_HEADER.unpack_from(data, 0)[4]
+    start = RAW_SMBIOS_HEADER.size
+    if start + length > len(data):
+        return None
+    return data[start:start + length]
+
+
+def _read_windows_table() -> bytes | None:
+    """
+    kernel32.GetSystemFirmwareTable('RSMB')로 원시 테이블을 읽는다. (관리자 권한 불필요)
+    """
+    import ctypes
+
+    kernel32 = ctypes.windll.kernel32
+    get_table = kernel32.GetSystemFirmwareTable
+    get_table.argtypes = [ctypes.c_uint32, ctypes.c_uint32, ctypes.c_void_p, ctypes.c_uint32]
+    get_table.restype = ctypes.c_uint32
+
+    size = get_table(RSMB_SIGNATURE, 0, None, 0)
+    if not size:
+        return None
+    buf = ctypes.create_string_buffer(size)
+    written = get_table(RSMB_SIGNATURE, 0, buf, size)
+    if not written or written > size:
+        return None
+    return strip_raw_smbios_header(buf.raw[:written])
+
+
+def _read_linux_table() -> bytes | None:
+    """
+    /sys/firmware/dmi/tables/DMI를 읽는다. (일반적으로 root 권한 필요)
+    """
+    try:
+        with open(LINUX_DMI_TABLE_PATH, "rb") as f:
+            return f.read()
+    except OSError as e:
+        logger.debug(f"DMI 테이블 읽기 실패: {e}")
+        return None
+
+
+def read_raw_table() -> bytes | None:
+    """
+    현재 OS에서 원시 SMBIOS 테이블을 읽는다.
+
+    Returns:
+        bytes | None: 구조체 테이블 또는 읽기 실패 시 None
+    """
+    system = platform.system()
+    try:
+        if system == "Windows":
+            return _read_windows_table()
+        if system == "Linux":
+            return _read_linux_table()
+    except Exception as e:
+        logger.info(f"SMBIOS 테이블 읽기 실패: {e}")
+    return None
+
+
+_tables_lock = threading.Lock()
+_tables_loaded = False
+_tables: SmbiosTables | None = None
+
+
+def load_system_tables() -> SmbiosTables | None:
+    """
+    현재 시스템의 SMBIOS 테이블을 읽고 디코딩한다.
+
+    펌웨어 테이블은 부팅 중 바뀌지 않으므로 프로세스당 한 번만 읽는다.
+
+    Returns:
+        SmbiosTables | None: 디코딩 결과 또는 읽기 실패 시 None
+    """
+    global _tables_loaded, _tables
+    with _tables_lock:
+        if not _tables_loaded:
+            raw = read_raw_table()
+            _tables = parse_tables(raw) if raw else None
+            _tables_loaded = True
+            if _tables is not None:
+                logger.info(
+                    "SMBIOS 테이블 로드 | M/B %d, 섀시 %d, CPU %d, 메모리 슬롯 %d",
+                    len(_tables.baseboards), len(_tables.chassis),
+                    len(_tables.processors), len(_tables.memory_devices),
+                )
+        return _tables
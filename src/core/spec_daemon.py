@@ -0,0 +1,600 @@
+# 본 소스코드는 내부 사용 및 유지보수 목적에 한해 제공됩니다.
+# 무단 재배포 및 상업적 재사용은 허용되지 않습니다.
+# core/spec_daemon.py
+
+from __future__ import annotations
+
+"""
+상주 사양 데몬 (asyncio 서버)
+한 번 수집한 사양을 메모리에 보관하고 로컬 IPC 엔드포인트로 여러 클라이언트에 제공
+
+- 책임: IPC 서버(Linux Unix 도메인 소켓 / Windows 명명 파이프), 동시 요청의 수집 1회 공유(single-flight),
+        무효화 후 재수집, 선택적 주기 갱신, 응답 바이트 세대별 1회 직렬화
+- 비책임: 실제 수집 (core.collector.collect_spec_model), 클라이언트 (core.daemon_client),
+          HTTP 프로토콜 처리 (core.spec_http, http_port 지정 시),
+          메모리 매핑 스냅샷 게시 형식 (core.spec_snapshot, snapshot_publisher 지정 시),
+          하드웨어 변경 이벤트 구독 (core.hw_watcher, hardware_watcher 지정 시)
+- 사용처: spec_cli --serve, Scripts/bench/bench_daemon.py, Scripts/bench/bench_http.py
+- 프로토콜은 core.daemon_client 모듈 설명 참고
+
+갱신 정책:
+    - 기동 직후 1회 수집 (첫 클라이언트가 오기 전에 결과 준비)
+    - invalidate 요청/SpecDaemon.invalidate() 호출 시 즉시 백그라운드 재수집,
+      재수집이 끝날 때까지 get 요청은 새 결과를 기다림 (무효화된 값은 반환하지 않음)
+    - 카테고리를 지정한 무효화(하드웨어 변경 감지, invalidate 요청의 categories)는
+      해당 카테고리만 다시 수집해 직전 결과에 병합
+    - refresh_interval_s가 있으면 주기적으로 백그라운드 재수집 (그동안 기존 결과 제공)
+    - 시간 초과 카테고리가 있는 부분 결과는 제공하되 PARTIAL_RETRY_S 후 재수집
+    - 폴링 측 재수집 요청(HTTP /specs?refresh=1)은 min_refresh_interval_s 안에 한 번만 수집하고
+      수집 중에 들어온 요청은 진행 중인 수집 결과를 함께 기다림
+"""
+
+import asyncio
+import json
+import logging
+import os
+import socket
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from core.daemon_client import (
+    OP_GET,
+    OP_INVALIDATE,
+    OP_PING,
+    OP_STATS,
+    PROTOCOL_VERSION,
+    default_endpoint,
+)
+from core.spec_schema import SPEC_CATEGORIES, TIMED_OUT
+
+logger = logging.getLogger(__name__)
+
+# 요청 1줄 최대 크기 (요청은 작은 JSON뿐)
+MAX_REQUEST_BYTES = 64 * 1024
+# 부분 결과(시간 초과 포함) 재수집 지연(초)
+PARTIAL_RETRY_S = 60.0
+# 서버 종료 시 클라이언트 처리 대기 시간(초)
+SHUTDOWN_TIMEOUT_S = 2.0
+# 폴링 측 재수집 요청 최소 간격(초) (연속 폴링이 WMI 조회를 반복하지 않도록)
+MIN_REFRESH_INTERVAL_S = 30.0
+
+
+def _collect_model(parallel: bool | None, durations_ms: dict, categories: tuple[str, ...] = SPEC_CATEGORIES):
+    """
+    기본 수집 함수: 수집 스레드에 COM 아파트먼트를 초기화하고 collect_spec_model()을 호출한다.
+
+    순차 수집이 이 스레드에 만든 풀 연결은 아파트먼트 해제 시 함께 버려진다. (collector._com_apartment 참고)
+    """
+    from core import collector
+
+    with collector._com_apartment():
+        return collector.collect_spec_model(parallel=parallel, categories=categories, durations_ms=durations_ms)
+
+
+def _merge_models(base, fresh, categories: tuple[str, ...]):
+    """
+    일부 카테고리만 새로 수집한 모델을 직전 모델에 병합한 새 SystemSpecs를 만든다.
+
+    새로 수집하다 시간 초과된 카테고리는 직전 값을 유지한다. (직전에도 시간 초과였으면 시간 초과)
+
+    Args:
+        base: 직전 SystemSpecs
+        fresh: categories만 수집한 SystemSpecs
+        categories: 새로 수집한 카테고리
+
+    Returns:
+        SystemSpecs: 병합된 모델 (base/fresh는 변경하지 않음)
+    """
+    from core.spec_model import SystemSpecs
+
+    merged = SystemSpecs()
+    for category in SPEC_CATEGORIES:
+        source = fresh if category in categories and category not in fresh.timed_out else base
+        merged.merge(category, TIMED_OUT if category in source.timed_out else getattr(source, category))
+    return merged
+
+
+def _encode_line(message: dict) -> bytes:
+    return (json.dumps(message, ensure_ascii=False) + "\n").encode("utf-8")
+
+
+class Snapshot:
+    """
+    수집 결과 1세대 (게시 후 변경하지 않음)
+
+    - 책임: 모델/카테고리별 소요 시간/세대 정보 보관, IPC get 응답 바이트 보관
+    - 비책임: 수집, 전송
+    - 사용처: SpecDaemon, core.spec_http (http_entity에 HTTP 응답 본문을 세대별 1회 캐시)
+    """
+
+    __slots__ = ("generation", "collected_at", "collected_mono", "model", "category_ms", "get_line", "http_entity")
+
+    def __init__(self, generation: int, model, category_ms: dict):
+        """
+        Snapshot 초기화
+
+        Args:
+            generation: 세대 번호 (1부터 증가)
+            model: core.spec_model.SystemSpecs
+            category_ms: 카테고리별 소요 시간(ms)
+        """
+        self.generation = generation
+        self.collected_at = time.time()
+        self.collected_mono = time.monotonic()
+        self.model = model
+        self.category_ms = category_ms
+        self.get_line = _encode_line({
+            "ok": True,
+            "op": OP_GET,
+            "generation": generation,
+            "collected_at": self.collected_at,
+            "specs": model.to_specs_dict(),
+            "raw": model.to_dict(),
+        })
+        self.http_entity = None
+
+    @property
+    def age_s(self) -> float:
+        """수집 후 경과 시간(초)"""
+        return time.monotonic() - self.collected_mono
+
+
+class SpecDaemon:
+    """
+    사양 수집 결과를 로컬 IPC로 제공하는 상주 서버
+
+    - 책임: 클라이언트 연결 처리, 수집 1회 공유, 무효화/주기 갱신, 통계
+    - 비책임: 수집 로직, 디스크 캐시
+    - 사용처: spec_cli --serve (serve_forever), 벤치마크 (스레드에서 실행)
+    - 수집은 전용 스레드 1개에서 실행하여 이벤트 루프를 막지 않음
+    """
+
+    def __init__(
+        self,
+        endpoint: str | None = None,
+        collect_fn=None,
+        parallel: bool | None = None,
+        refresh_interval_s: float | None = None,
+        http_port: int | None = None,
+        min_refresh_interval_s: float = MIN_REFRESH_INTERVAL_S,
+        snapshot_publisher=None,
+        hardware_watcher=None,
+    ):
+        """
+        SpecDaemon 초기화
+
+        Args:
+            endpoint: IPC 엔드포인트 (None이면 core.daemon_client.default_endpoint())
+            collect_fn: (카테고리별 소요 시간(ms) 딕셔너리, 수집할 카테고리 튜플)을 받아
+                소요 시간을 채우고 SystemSpecs를 반환하는 수집 함수 (None이면 collect_spec_model)
+            parallel: 기본 수집 함수의 병렬 수집 여부
+            refresh_interval_s: 주기 갱신 간격(초) (None이면 무효화될 때만 재수집)
+            http_port: localhost HTTP 포트 (None이면 HTTP 미사용, 0이면 임의 포트)
+            min_refresh_interval_s: 폴링 측 재수집 요청 최소 간격(초)
+            snapshot_publisher: 수집 결과를 메모리 매핑 파일에도 게시할 core.spec_snapshot.SnapshotPublisher
+            hardware_watcher: 변경된 카테고리만 무효화할 core.hw_watcher.HardwareWatcher (서버 실행 중에만 감시)
+        """
+        self._endpoint = endpoint or default_endpoint()
+        self._collect_fn = collect_fn or (
+            lambda durations_ms, categories: _collect_model(parallel, durations_ms, categories)
+        )
+        self._refresh_interval_s = refresh_interval_s
+        self._http_port = http_port
+        self._http_address: tuple | None = None
+        self._min_refresh_interval_s = min_refresh_interval_s
+        self._snapshot_publisher = snapshot_publisher
+        self._hardware_watcher = hardware_watcher
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="specd-collect")
+
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._servers: list = []
+        self._stopped: asyncio.Event | None = None
+        self._ready = threading.Event()
+        self._tasks: set = set()
+
+        self._snapshot: Snapshot | None = None
+        self._generation = 0
+        self._stale = True
+        self._invalidations = 0
+        # 다음 수집에서 다시 수집할 카테고리 (비어 있으면 전체)
+        self._pending_categories: set = set()
+        self._collect_task: asyncio.Task | None = None
+        self._last_error: str | None = None
+        self._retry_handle = None
+
+        self._stats = {
+            "collections": 0,
+            "partial_collections": 0,
+            "collect_failures": 0,
+            "requests": 0,
+            "clients": 0,
+            "waited_requests": 0,
+            "refresh_requests": 0,
+            "refresh_rate_limited": 0,
+            "last_collect_ms": None,
+        }
+
+    @property
+    def endpoint(self) -> str:
+        """IPC 엔드포인트"""
+        return self._endpoint
+
+    @property
+    def http_address(self) -> tuple | None:
+        """HTTP 서버 (호스트, 포트) (기동 전이거나 HTTP 미사용이면 None)"""
+        return self._http_address
+
+    @property
+    def last_error(self) -> str | None:
+        """마지막 수집 실패 메시지 (성공하면 None)"""
+        return self._last_error
+
+    @property
+    def ready(self) -> threading.Event:
+        """서버가 연결을 받을 준비가 되면 설정되는 이벤트 (다른 스레드에서 기다릴 때 사용)"""
+        return self._ready
+
+    # ------------------------------------------------------------
+    # 수명 주기
+    # ------------------------------------------------------------
+
+    def serve_forever(self) -> None:
+        """
+        새 이벤트 루프를 만들고 stop()이 호출될 때까지 서버를 실행한다. (블로킹)
+
+        Windows는 명명 파이프에 ProactorEventLoop가 필요하므로 직접 생성한다.
+
+        Returns:
+            None
+        """
+        loop = asyncio.ProactorEventLoop() if sys.platform == "win32" else asyncio.new_event_loop()
+        try:
+            loop.run_until_complete(self._run())
+        finally:
+            loop.run_until_complete(loop.shutdown_asyncgens())
+            loop.close()
+            self._executor.shutdown(wait=False)
+
+    def stop(self) -> None:
+        """
+        서버를 종료한다. (다른 스레드에서 호출 가능)
+
+        Returns:
+            None
+        """
+        loop = self._loop
+        if loop is not None and not loop.is_closed():
+            loop.call_soon_threadsafe(self._stopped.set)
+
+    def invalidate(self, categories: tuple[str, ...] | None = None) -> None:
+        """
+        수집 결과를 무효화하고 재수집을 시작한다. (다른 스레드에서 호출 가능, 하드웨어 변경 감지 등)
+
+        Args:
+            categories: 다시 수집할 카테고리 (None이면 전체)
+
+        Returns:
+            None
+        """
+        loop = self._loop
+        if loop is not None and not loop.is_closed():
+            loop.call_soon_threadsafe(self._invalidate, categories)
+
+    async def _run(self) -> None:
+        self._loop = asyncio.get_event_loop()
+        self._stopped = asyncio.Event()
+        await self._start_servers()
+        if self._http_port is not None:
+            await self._start_http_server()
+        self._install_signal_handlers()
+        logger.info("사양 데몬 시작 | %s", self._endpoint)
+        self._ready.set()
+
+        self._start_collect()
+        refresher = None
+        if self._refresh_interval_s:
+            refresher = self._spawn(self._refresh_periodically(self._refresh_interval_s))
+        if self._hardware_watcher is not None:
+            self._hardware_watcher.start(self.invalidate)
+        try:
+            await self._stopped.wait()
+        finally:
+            logger.info("사양 데몬 종료 | %s", self._endpoint)
+            if self._hardware_watcher is not None:
+                self._hardware_watcher.stop()
+            if refresher is not None:
+                refresher.cancel()
+            if self._retry_handle is not None:
+                self._retry_handle.cancel()
+            for server in self._servers:
+                server.close()
+            self._remove_socket_file()
+            pending = [t for t in self._tasks if not t.done()]
+            for task in pending:
+                task.cancel()
+            if pending:
+                await asyncio.wait(pending, timeout=SHUTDOWN_TIMEOUT_S)
+            self._ready.clear()
+
+    async def _start_servers(self) -> None:
+        if sys.platform == "win32":
+            loop = self._loop
+
+            def _factory():
+                reader = asyncio.StreamReader(limit=MAX_REQUEST_BYTES)
+                return asyncio.StreamReaderProtocol(reader, self._handle_client)
+
+            # PipeServer는 연결마다 새 파이프 인스턴스를 만들어 다음 클라이언트를 받음
+            self._servers = await loop.start_serving_pipe(_factory, self._endpoint)
+            return
+
+        self._prepare_socket_path()
+        server = await asyncio.start_unix_server(self._handle_client, path=self._endpoint, limit=MAX_REQUEST_BYTES)
+        os.chmod(self._endpoint, 0o600)
+        self._servers = [server]
+
+    async def _start_http_server(self) -> None:
+        from core.spec_http import SpecHttpFrontend, start_http_server
+
+        server = await start_http_server(SpecHttpFrontend(self), self._http_port)
+        self._servers.append(server)
+        self._http_address = server.sockets[0].getsockname()[:2]
+        logger.info("사양 데몬 HTTP 시작 | http://%s:%d", *self._http_address)
+
+    def _install_signal_handlers(self) -> None:
+        """
+        메인 스레드에서 실행 중이면 SIGTERM/SIGINT로 정상 종료하도록 한다. (소켓 파일 정리)
+        """
+        if sys.platform == "win32" or threading.current_thread() is not threading.main_thread():
+            return
+        import signal
+
+        for signum in (signal.SIGTERM, signal.SIGINT):
+            self._loop.add_signal_handler(signum, self._stopped.set)
+
+    def _prepare_socket_path(self) -> None:
+        """
+        이전 실행이 남긴 소켓 파일을 정리한다. 다른 데몬이 응답 중이면 기동하지 않는다.
+        """
+        if not os.path.exists(self._endpoint):
+            os.makedirs(os.path.dirname(self._endpoint) or ".", exist_ok=True)
+            return
+        probe = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        try:
+            probe.settimeout(0.5)
+            probe.connect(self._endpoint)
+        except OSError:
+            os.unlink(self._endpoint)
+            return
+        finally:
+            probe.close()
+        raise RuntimeError(f"이미 실행 중인 사양 데몬이 있습니다: {self._endpoint}")
+
+    def _remove_socket_file(self) -> None:
+        if sys.platform == "win32":
+            return
+        try:
+            os.unlink(self._endpoint)
+        except OSError:
+            pass
+
+    def _spawn(self, coro) -> asyncio.Task:
+        task = self._loop.create_task(coro)
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+        return task
+
+    # ------------------------------------------------------------
+    # 수집 / 무효화
+    # ------------------------------------------------------------
+
+    def _invalidate(self, categories: tuple[str, ...] | None = None) -> None:
+        self._invalidations += 1
+        self._stale = True
+        categories = tuple(categories or SPEC_CATEGORIES)
+        self._pending_categories.update(categories)
+        logger.info("사양 데몬 무효화 | 세대 %d | %s", self._generation, ", ".join(categories))
+        self._start_collect(())
+
+    def _start_collect(self, categories: tuple[str, ...] = SPEC_CATEGORIES) -> asyncio.Task:
+        """
+        진행 중인 수집이 없으면 시작하고, 있으면 그 작업을 반환한다. (single-flight)
+
+        Args:
+            categories: 새로 시작할 때 수집할 카테고리 (무효화로 쌓인 카테고리와 합침,
+                둘 다 비어 있거나 직전 결과가 없으면 전체)
+        """
+        if self._collect_task is None or self._collect_task.done():
+            self._pending_categories.update(categories)
+            self._collect_task = self._spawn(self._collect())
+        return self._collect_task
+
+    async def _collect(self) -> None:
+        invalidations = self._invalidations
+        base = self._snapshot
+        pending, self._pending_categories = self._pending_categories, set()
+        if base is None or not pending:
+            pending = SPEC_CATEGORIES
+        categories = tuple(c for c in SPEC_CATEGORIES if c in pending)
+        partial = len(categories) < len(SPEC_CATEGORIES)
+        self._last_error = None
+        started = time.perf_counter()
+        durations_ms: dict = {}
+        try:
+            model = await self._loop.run_in_executor(self._executor, self._collect_fn, durations_ms, categories)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            self._stats["collect_failures"] += 1
+            self._last_error = f"{type(e).__name__}: {e}"
+            # 다음 수집에서 같은 카테고리를 다시 수집
+            self._pending_categories.update(categories)
+            logger.exception("사양 데몬 수집 실패")
+            return
+        elapsed_ms = (time.perf_counter() - started) * 1000
+        timed_out = model.timed_out
+        if partial:
+            self._stats["partial_collections"] += 1
+            model = _merge_models(base.model, model, categories)
+            durations_ms = dict(base.category_ms, **durations_ms)
+        self._publish(model, durations_ms, elapsed_ms, categories)
+        # 수집 중 무효화가 들어왔으면 이번 결과도 오래된 것으로 보고 다시 수집
+        if self._invalidations != invalidations:
+            self._stale = True
+            self._loop.call_soon(self._start_collect, ())
+        elif timed_out:
+            self._schedule_retry(PARTIAL_RETRY_S)
+
+    def _publish(self, model, durations_ms: dict, elapsed_ms: float, categories: tuple[str, ...]) -> None:
+        """
+        새 수집 결과를 Snapshot으로 게시한다. (get 응답 바이트는 여기서 1회 직렬화)
+        """
+        self._generation += 1
+        self._snapshot = Snapshot(self._generation, model, durations_ms)
+        self._stale = False
+        if self._snapshot_publisher is not None:
+            try:
+                self._snapshot_publisher.publish_model(model)
+            except (OSError, ValueError) as e:
+                logger.warning(f"사양 스냅샷 게시 실패: {e}")
+        self._stats["collections"] += 1
+        self._stats["last_collect_ms"] = round(elapsed_ms, 1)
+        logger.info(
+            "사양 데몬 수집 완료 | 세대 %d | %.0fms | %s%s", self._generation, elapsed_ms,
+            "전체" if len(categories) == len(SPEC_CATEGORIES) else ", ".join(categories),
+            f" | 시간 초과: {', '.join(model.timed_out)}" if model.timed_out else "",
+        )
+
+    def _schedule_retry(self, delay_s: float) -> None:
+        if self._retry_handle is not None:
+            self._retry_handle.cancel()
+        self._retry_handle = self._loop.call_later(delay_s, self._start_collect)
+
+    async def _refresh_periodically(self, interval_s: float) -> None:
+        while True:
+            await asyncio.sleep(interval_s)
+            self._start_collect()
+
+    def _request_refresh(self) -> asyncio.Task | None:
+        """
+        폴링 측 재수집 요청을 처리한다.
+
+        수집 중이면 그 작업을 공유하고, 마지막 수집이 min_refresh_interval_s 이내이면 수집하지 않는다.
+
+        Returns:
+            asyncio.Task | None: 기다릴 수집 작업 (간격 제한으로 생략하면 None)
+        """
+        self._stats["refresh_requests"] += 1
+        if self._collect_task is not None and not self._collect_task.done():
+            return self._collect_task
+        snapshot = self._snapshot
+        if snapshot is not None and snapshot.age_s < self._min_refresh_interval_s:
+            self._stats["refresh_rate_limited"] += 1
+            return None
+        return self._start_collect()
+
+    async def snapshot(self, fresh: bool = False, refresh: bool = False) -> Snapshot | None:
+        """
+        현재 수집 결과를 반환한다. 결과가 없거나 무효화되었으면 재수집을 기다린다. (이벤트 루프에서 호출)
+
+        Args:
+            fresh: True이면 무효화 후 새로 수집한 결과를 기다림 (간격 제한 없음)
+            refresh: True이면 간격 제한을 적용해 재수집 (폴링 측 요청)
+
+        Returns:
+            Snapshot | None: 수집 결과 (수집에 한 번도 성공하지 못했으면 None, last_error 참고)
+        """
+        if fresh:
+            self._invalidate()
+        elif refresh:
+            task = self._request_refresh()
+            if task is not None:
+                await asyncio.shield(task)
+        waited = False
+        while self._snapshot is None or self._stale:
+            waited = True
+            await asyncio.shield(self._start_collect(()))
+            if self._last_error is not None:
+                # 재수집 실패 시 직전 결과라도 제공
+                break
+        if waited:
+            self._stats["waited_requests"] += 1
+        return self._snapshot
+
+    # ------------------------------------------------------------
+    # 클라이언트 처리
+    # ------------------------------------------------------------
+
+    async def _handle_client(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        self._stats["clients"] += 1
+        try:
+            while True:
+                try:
+                    line = await reader.readline()
+                except (asyncio.LimitOverrunError, ValueError):
+                    writer.write(_encode_line({"ok": False, "error": "요청이 너무 큽니다"}))
+                    break
+                if not line:
+                    break
+                writer.write(await self._dispatch(line))
+                await writer.drain()
+        except (ConnectionError, OSError) as e:
+            logger.debug(f"사양 데몬 클라이언트 연결 종료: {e}")
+        except asyncio.CancelledError:
+            pass
+        finally:
+            try:
+                writer.close()
+            except Exception:
+                pass
+
+    async def _dispatch(self, line: bytes) -> bytes:
+        self._stats["requests"] += 1
+        try:
+            request = json.loads(line.decode("utf-8"))
+            op = request.get("op")
+        except (ValueError, AttributeError):
+            return _encode_line({"ok": False, "error": "요청 형식 오류"})
+
+        if op == OP_GET:
+            snapshot = await self.snapshot(fresh=bool(request.get("fresh")))
+            if snapshot is None:
+                return _encode_line({"ok": False, "error": self._last_error or "수집 결과 없음"})
+            return snapshot.get_line
+        if op == OP_INVALIDATE:
+            categories = request.get("categories")
+            if categories is not None and (
+                not isinstance(categories, list) or not categories or any(c not in SPEC_CATEGORIES for c in categories)
+            ):
+                return _encode_line({"ok": False, "error": f"잘못된 카테고리: {categories}"})
+            self._invalidate(tuple(categories) if categories else None)
+            return _encode_line({"ok": True, "op": op, "generation": self._generation})
+        if op == OP_STATS:
+            return _encode_line({"ok": True, "op": op, "stats": self.stats()})
+        if op == OP_PING:
+            return _encode_line({"ok": True, "op": op, "protocol": PROTOCOL_VERSION})
+        return _encode_line({"ok": False, "error": f"알 수 없는 요청: {op}"})
+
+    def stats(self) -> dict:
+        """
+        데몬 통계를 반환한다.
+
+        Returns:
+            dict: 수집/요청 횟수, 세대 번호, 결과 경과 시간(초), 카테고리별 소요 시간(ms), 마지막 오류
+        """
+        snapshot = self._snapshot
+        stats = dict(self._stats)
+        stats.update(
+            generation=self._generation,
+            stale=self._stale,
+            age_s=round(snapshot.age_s, 1) if snapshot is not None else None,
+            category_ms={c: round(ms, 3) for c, ms in snapshot.category_ms.items()} if snapshot is not None else {},
+            timed_out=list(snapshot.model.timed_out) if snapshot is not None else [],
+            collecting=self._collect_task is not None and not self._collect_task.done(),
+            last_error=self._last_error,
+        )
+        if self._hardware_watcher is not None:
+            stats["hardware_watcher"] = self._hardware_watcher.stats()
+        return stats
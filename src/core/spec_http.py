@@ -0,0 +1,349 @@
+# 본 소스코드는 내부 사용 및 유지보수 목적에 한해 제공됩니다.
+# 무단 재배포 및 상업적 재사용은 허용되지 않습니다.
+# core/spec_http.py
+
+from __future__ import annotations
+
+"""
+상주 사양 데몬의 localhost HTTP/JSON 엔드포인트 (asyncio, 표준 라이브러리만 사용)
+같은 PC의 자산 관리 수집기가 GUI/CLI 대신 폴링할 수 있도록 제공
+
+- 책임: HTTP/1.1 요청 파싱(GET/HEAD, keep-alive), 라우팅, ETag/If-None-Match(304), 메트릭 텍스트 생성
+- 비책임: 수집/재수집 간격 제한/수집 공유 (core.spec_daemon.SpecDaemon 담당)
+- 사용처: SpecDaemon(http_port=...) (spec_cli --serve --http-port)
+- 127.0.0.1에만 바인드하고, 브라우저 DNS 리바인딩을 막기 위해 Host 헤더가 로컬 주소가 아니면 거부
+
+경로:
+    GET /specs            → 200 {"specs": collect_all_specs() 형식, "raw": SystemSpecs.to_dict(), "timed_out": [...]}
+                            If-None-Match가 ETag와 같으면 304
+    GET /specs?refresh=1  → 재수집 후 응답 (최소 간격 이내면 현재 결과, 동시 요청은 수집 1회 공유)
+    GET /healthz          → 200 {"status": "ok" | "stale" | "partial"}, 결과가 없으면 503
+    GET /metrics          → Prometheus 텍스트 형식 (카테고리별 수집 시간, 요청/수집 횟수)
+"""
+
+import asyncio
+import hashlib
+import json
+import logging
+from urllib.parse import parse_qs, urlsplit
+
+from core.spec_schema import TIMED_OUT_KEY
+
+logger = logging.getLogger(__name__)
+
+HTTP_HOST = "127.0.0.1"
+# 요청 줄/헤더 1줄 최대 크기, 헤더 최대 개수
+MAX_LINE_BYTES = 8 * 1024
+MAX_HEADERS = 64
+# keep-alive 연결 유휴 제한 시간(초)
+IDLE_TIMEOUT_S = 15.0
+LOCAL_HOST_NAMES = ("127.0.0.1", "localhost", "[::1]")
+METRIC_PREFIX = "pc_spec_viewer"
+
+JSON_CONTENT_TYPE = "application/json; charset=utf-8"
+METRICS_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+_REASONS = {
+    200: "OK",
+    304: "Not Modified",
+    400: "Bad Request",
+    403: "Forbidden",
+    404: "Not Found",
+    405: "Method Not Allowed",
+    503: "Service Unavailable",
+}
+
+
+class _BadRequest(Exception):
+    """요청 형식 오류 (400 응답 후 연결 종료)"""
+
+
+def _json_bytes(document: dict) -> bytes:
+    return json.dumps(document, ensure_ascii=False).encode("utf-8")
+
+
+def specs_entity(snapshot) -> tuple[bytes, str]:
+    """
+    /specs 응답 본문과 ETag를 반환한다. (Snapshot마다 1회 생성 후 재사용)
+
+    ETag는 본문 내용의 해시이므로 재수집 결과가 같으면 값이 바뀌지 않는다.
+    (수집 시각/세대는 본문이 아닌 Age/X-Spec-Generation 헤더로 전달)
+
+    Args:
+        snapshot: core.spec_daemon.Snapshot
+
+    Returns:
+        tuple[bytes, str]: (본문, 따옴표 포함 ETag)
+    """
+    if snapshot.http_entity is None:
+        model = snapshot.model
+        specs = model.to_specs_dict()
+        specs.pop(TIMED_OUT_KEY, None)
+        body = _json_bytes({"specs": specs, "raw": model.to_dict(), "timed_out": list(model.timed_out)})
+        snapshot.http_entity = (body, f'"{hashlib.sha1(body).hexdigest()}"')
+    return snapshot.http_entity
+
+
+def _etag_matches(header: str | None, etag: str) -> bool:
+    """
+    If-None-Match 헤더가 ETag와 일치하는지 확인한다. (목록, *, 약한 비교 W/ 지원)
+    """
+    if not header:
+        return False
+    for candidate in header.split(","):
+        candidate = candidate.strip()
+        if candidate == "*" or candidate == etag or candidate == "W/" + etag:
+            return True
+    return False
+
+
+def _metric_line(name: str, value, labels: dict | None = None) -> str:
+    label_text = ""
+    if labels:
+        label_text = "{" + ",".join(f'{k}="{v}"' for k, v in labels.items()) + "}"
+    return f"{METRIC_PREFIX}_{name}{label_text} {value}"
+
+
+class SpecHttpFrontend:
+    """
+    SpecDaemon 결과를 HTTP로 제공하는 요청 처리기
+
+    - 책임: 연결별 요청 반복 처리, 경로별 응답 생성, HTTP 요청 통계
+    - 비책임: 수집 결과 보관/갱신 (SpecDaemon.snapshot())
+    - 사용처: start_http_server()
+    """
+
+    def __init__(self, daemon):
+        """
+        SpecHttpFrontend 초기화
+
+        Args:
+            daemon: core.spec_daemon.SpecDaemon
+        """
+        self._daemon = daemon
+        self._stats = {"requests": 0, "not_modified": 0, "rejected": 0}
+        self._routes = {
+            "/specs": self._get_specs,
+            "/healthz": self._get_healthz,
+            "/metrics": self._get_metrics,
+        }
+
+    async def handle_connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        """
+        연결 1개의 요청을 keep-alive가 끝날 때까지 처리한다.
+
+        Args:
+            reader: 요청 스트림
+            writer: 응답 스트림
+        """
+        try:
+            keep_alive = True
+            while keep_alive:
+                try:
+                    request = await asyncio.wait_for(self._read_request(reader), IDLE_TIMEOUT_S)
+                except asyncio.TimeoutError:
+                    break
+                except _BadRequest as e:
+                    writer.write(self._response(400, _json_bytes({"error": str(e)}), JSON_CONTENT_TYPE, keep_alive=False))
+                    break
+                if request is None:
+                    break
+                method, target, version, headers = request
+                keep_alive = self._keep_alive(version, headers)
+                writer.write(await self._dispatch(method, target, headers, keep_alive))
+                await writer.drain()
+        except (ConnectionError, OSError) as e:
+            logger.debug(f"HTTP 연결 종료: {e}")
+        except asyncio.CancelledError:
+            pass
+        finally:
+            try:
+                writer.close()
+            except Exception:
+                pass
+
+    async def _read_request(self, reader: asyncio.StreamReader):
+        """
+        요청 줄과 헤더를 읽는다. 연결이 닫혔으면 None.
+        """
+        try:
+            line = await reader.readline()
+            if not line:
+                return None
+            parts = line.decode("latin-1").split()
+            if len(parts) != 3 or not parts[2].startswith("HTTP/1."):
+                raise _BadRequest("요청 줄 형식 오류")
+            headers = {}
+            while True:
+                line = await reader.readline()
+                if line in (b"\r\n", b"\n"):
+                    break
+                if not line or len(headers) >= MAX_HEADERS:
+                    raise _BadRequest("헤더 형식 오류")
+                name, sep, value = line.decode("latin-1").partition(":")
+                if not sep:
+                    raise _BadRequest("헤더 형식 오류")
+                headers[name.strip().lower()] = value.strip()
+        except (asyncio.LimitOverrunError, ValueError) as e:
+            raise _BadRequest("요청이 너무 큽니다") from e
+        # GET/HEAD 본문은 사용하지 않지만 keep-alive 다음 요청과 섞이지 않도록 버림
+        length = headers.get("content-length", "0")
+        if not length.isdigit() or int(length) > MAX_LINE_BYTES:
+            raise _BadRequest("지원하지 않는 요청 본문")
+        if int(length):
+            await reader.readexactly(int(length))
+        return parts[0], parts[1], parts[2], headers
+
+    @staticmethod
+    def _keep_alive(version: str, headers: dict) -> bool:
+        connection = headers.get("connection", "").lower()
+        if version == "HTTP/1.0":
+            return connection == "keep-alive"
+        return connection != "close"
+
+    async def _dispatch(self, method: str, target: str, headers: dict, keep_alive: bool) -> bytes:
+        self._stats["requests"] += 1
+        if not self._is_local_host(headers.get("host")):
+            self._stats["rejected"] += 1
+            return self._response(403, _json_bytes({"error": "허용되지 않은 Host"}), JSON_CONTENT_TYPE, keep_alive)
+        url = urlsplit(target)
+        handler = self._routes.get(url.path)
+        if handler is None:
+            return self._response(404, _json_bytes({"error": "없는 경로"}), JSON_CONTENT_TYPE, keep_alive)
+        if method not in ("GET", "HEAD"):
+            return self._response(
+                405, _json_bytes({"error": "GET/HEAD만 지원"}), JSON_CONTENT_TYPE, keep_alive,
+                extra_headers={"Allow": "GET, HEAD"},
+            )
+        status, body, content_type, extra_headers = await handler(parse_qs(url.query), headers)
+        return self._response(status, body, content_type, keep_alive, extra_headers, head=method == "HEAD")
+
+    def _is_local_host(self, host: str | None) -> bool:
+        if not host:
+            return True
+        name = host.rsplit(":", 1)[0] if not host.endswith("]") else host
+        return name.lower() in LOCAL_HOST_NAMES
+
+    async def _get_specs(self, query: dict, headers: dict):
+        refresh = query.get("refresh", ["0"])[-1] not in ("", "0", "false")
+        snapshot = await self._daemon.snapshot(refresh=refresh)
+        if snapshot is None:
+            return 503, _json_bytes({"error": self._daemon.last_error or "수집 결과 없음"}), JSON_CONTENT_TYPE, None
+        body, etag = specs_entity(snapshot)
+        extra_headers = {
+            "ETag": etag,
+            "Cache-Control": "no-cache",
+            "Age": str(int(snapshot.age_s)),
+            "X-Spec-Generation": str(snapshot.generation),
+        }
+        if _etag_matches(headers.get("if-none-match"), etag):
+            self._stats["not_modified"] += 1
+            return 304, b"", None, extra_headers
+        return 200, body, JSON_CONTENT_TYPE, extra_headers
+
+    async def _get_healthz(self, query: dict, headers: dict):
+        stats = self._daemon.stats()
+        code = 200
+        if stats["generation"] == 0:
+            status, code = ("starting" if stats["last_error"] is None else "error"), 503
+        elif stats["stale"]:
+            status = "stale"
+        elif stats["timed_out"]:
+            status = "partial"
+        else:
+            status = "ok"
+        document = {
+            "status": status,
+            "generation": stats["generation"],
+            "age_s": stats["age_s"],
+            "collecting": stats["collecting"],
+            "timed_out": stats["timed_out"],
+            "last_error": stats["last_error"],
+        }
+        return code, _json_bytes(document), JSON_CONTENT_TYPE, {"Cache-Control": "no-store"}
+
+    async def _get_metrics(self, query: dict, headers: dict):
+        return 200, self.render_metrics().encode("utf-8"), METRICS_CONTENT_TYPE, {"Cache-Control": "no-store"}
+
+    def render_metrics(self) -> str:
+        """
+        Prometheus 텍스트 형식 메트릭을 만든다.
+
+        Returns:
+            str: 메트릭 텍스트
+        """
+        stats = self._daemon.stats()
+        lines = [
+            f"# TYPE {METRIC_PREFIX}_collections_total counter",
+            _metric_line("collections_total", stats["collections"]),
+            f"# TYPE {METRIC_PREFIX}_collect_failures_total counter",
+            _metric_line("collect_failures_total", stats["collect_failures"]),
+            f"# TYPE {METRIC_PREFIX}_refresh_requests_total counter",
+            _metric_line("refresh_requests_total", stats["refresh_requests"]),
+            f"# TYPE {METRIC_PREFIX}_refresh_rate_limited_total counter",
+            _metric_line("refresh_rate_limited_total", stats["refresh_rate_limited"]),
+            f"# TYPE {METRIC_PREFIX}_requests_total counter",
+            _metric_line("requests_total", stats["requests"], {"transport": "ipc"}),
+            _metric_line("requests_total", self._stats["requests"], {"transport": "http"}),
+            f"# TYPE {METRIC_PREFIX}_http_not_modified_total counter",
+            _metric_line("http_not_modified_total", self._stats["not_modified"]),
+            f"# TYPE {METRIC_PREFIX}_http_rejected_total counter",
+            _metric_line("http_rejected_total", self._stats["rejected"]),
+            f"# TYPE {METRIC_PREFIX}_generation gauge",
+            _metric_line("generation", stats["generation"]),
+        ]
+        if stats["last_collect_ms"] is not None:
+            lines += [
+                f"# TYPE {METRIC_PREFIX}_last_collect_seconds gauge",
+                _metric_line("last_collect_seconds", round(stats["last_collect_ms"] / 1000, 6)),
+            ]
+        if stats["age_s"] is not None:
+            lines += [
+                f"# TYPE {METRIC_PREFIX}_result_age_seconds gauge",
+                _metric_line("result_age_seconds", stats["age_s"]),
+            ]
+        category_ms = stats.get("category_ms") or {}
+        if category_ms:
+            lines.append(f"# TYPE {METRIC_PREFIX}_category_collect_seconds gauge")
+            for category, elapsed_ms in category_ms.items():
+                lines.append(_metric_line("category_collect_seconds", round(elapsed_ms / 1000, 6), {"category": category}))
+            lines.append(f"# TYPE {METRIC_PREFIX}_category_timed_out gauge")
+            for category in category_ms:
+                lines.append(_metric_line("category_timed_out", int(category in stats["timed_out"]), {"category": category}))
+        return "\n".join(lines) + "\n"
+
+    def _response(
+        self,
+        status: int,
+        body: bytes,
+        content_type: str | None,
+        keep_alive: bool,
+        extra_headers: dict | None = None,
+        head: bool = False,
+    ) -> bytes:
+        headers = [f"HTTP/1.1 {status} {_REASONS[status]}", "Server: PC_Spec_Viewer-specd"]
+        if content_type is not None:
+            headers.append(f"Content-Type: {content_type}")
+        if status != 304:
+            headers.append(f"Content-Length: {len(body)}")
+        for name, value in (extra_headers or {}).items():
+            headers.append(f"{name}: {value}")
+        headers.append("Connection: keep-alive" if keep_alive else "Connection: close")
+        head_bytes = ("\r\n".join(headers) + "\r\n\r\n").encode("latin-1")
+        if head or status == 304:
+            return head_bytes
+        return head_bytes + body
+
+
+async def start_http_server(frontend: SpecHttpFrontend, port: int):
+    """
+    127.0.0.1에 HTTP 서버를 연다.
+
+    Args:
+        frontend: 요청 처리기
+        port: 포트 (0이면 임의 포트)
+
+    Returns:
+        asyncio.AbstractServer: 서버 (종료 시 close())
+    """
+    return await asyncio.start_server(frontend.handle_connection, host=HTTP_HOST, port=port, limit=MAX_LINE_BYTES)
@@ -0,0 +1,307 @@
+# 본 소스코드는 내부 사용 및 유지보수 목적에 한해 제공됩니다.
+# 무단 재배포 및 상업적 재사용은 허용되지 않습니다.
+# core/spec_model.py
+
+from __future__ import annotations
+
+"""
+타입이 있는 사양 모델
+수집 결과를 표시 문자열이 아닌 원시 값(바이트, MHz, PCI ID)으로 보관
+
+- 책임: CPU/메모리 모듈/GPU/디스크 모델 정의, 카테고리 모델 ↔ 기존 사양 딕셔너리 변환(어댑터),
+        원시 값 그대로의 직렬화(to_dict/from_dict)
+- 비책임: 수집 (core.collector, core.linux_backend), 표시 문자열 규칙 (core.formatter)
+- 사용처: core.collector.iter_category_models()/collect_spec_model(),
+          iter_category_results()/collect_all_specs()는 to_category_result()로 기존 형식 유지
+- 모든 모델은 __slots__ + frozen dataclass (인스턴스 dict 없음, 값 비교/해시 가능)
+- system_type/mainboard는 단일 문자열이므로 모델 없이 str 그대로 사용
+
+카테고리별 모델 값:
+    system_type: str | None
+    cpu: CpuSpec | None
+    ram: RamSpec | None
+    mainboard: str | None
+    vga: tuple[GpuSpec, ...] | None   (빈 튜플 = GPU 미감지)
+    storage: tuple[DiskSpec, ...] | None   (빈 튜플 = 디스크 미감지)
+"""
+
+from dataclasses import dataclass
+
+from core.spec_schema import (
+    CATEGORY_CPU,
+    CATEGORY_MAINBOARD,
+    CATEGORY_RAM,
+    CATEGORY_STORAGE,
+    CATEGORY_SYSTEM_TYPE,
+    CATEGORY_VGA,
+    SPEC_CATEGORIES,
+    TIMED_OUT,
+    TIMED_OUT_KEY,
+    empty_specs,
+    merge_category_result,
+)
+
+DISK_KIND_SSD = "ssd"
+DISK_KIND_HDD = "hdd"
+
+
+@dataclass(frozen=True)
+class CpuSpec:
+    """
+    CPU 정보
+
+    - 책임: 프로세서 이름과 코어/스레드/최대 클럭 보관 (제공되지 않은 값은 None)
+    - 비책임: 표시 문자열 생성
+    - 사용처: cpu 카테고리 모델 값
+    """
+    __slots__ = ("name", "cores", "threads", "max_clock_mhz")
+    name: str
+    cores: int | None
+    threads: int | None
+    max_clock_mhz: int | None
+
+
+@dataclass(frozen=True)
+class MemoryModuleSpec:
+    """
+    메모리 모듈 하나의 정보 (Win32_PhysicalMemory 또는 SMBIOS Type 17)
+
+    - 책임: 원시 용량/속도/제조사 코드 보관, 교체형 여부 보관
+    - 비책임: 브랜드 표기 결정 (core.ram_brand), 표시 문자열 생성 (core.formatter)
+    - 사용처: RamSpec.modules
+    """
+    __slots__ = ("manufacturer", "part_number", "capacity_bytes", "speed_mhz", "form_factor", "replaceable")
+    manufacturer: str
+    part_number: str
+    capacity_bytes: int
+    speed_mhz: int | None
+    form_factor: int
+    replaceable: bool
+
+
+@dataclass(frozen=True)
+class RamSpec:
+    """
+    RAM 정보
+
+    - 책임: 총 용량(바이트)과 모듈 목록 보관
+    - 비책임: 표시 문자열 생성
+    - 사용처: ram 카테고리 모델 값
+    - modules_known=False: 모듈 정보를 읽을 수 없어 총 용량만 있음 (예: Linux /proc/meminfo)
+    """
+    __slots__ = ("total_bytes", "modules", "modules_known")
+    total_bytes: int
+    modules: tuple
+    modules_known: bool
+
+    @property
+    def replaceable_modules(self) -> tuple:
+        """
+        교체형 모듈 목록 (온보드 메모리 제외)
+        """
+        return tuple(m for m in self.modules if m.replaceable)
+
+
+@dataclass(frozen=True)
+class GpuSpec:
+    """
+    GPU 정보 (DXGI / Win32_VideoController / Linux sysfs)
+
+    - 책임: 이름, 벤더 표기, 전용 VRAM(바이트), PCI ID 보관 (알 수 없으면 0)
+    - 비책임: 정렬/표시 문자열 생성
+    - 사용처: vga 카테고리 모델 값 (수집 경로의 정렬 순서 유지)
+    """
+    __slots__ = ("name", "vendor", "dedicated_vram_bytes", "vendor_id", "device_id")
+    name: str
+    vendor: str
+    dedicated_vram_bytes: int
+    vendor_id: int
+    device_id: int
+
+
+@dataclass(frozen=True)
+class DiskSpec:
+    """
+    물리 디스크 정보
+
+    - 책임: 이름, 용량(바이트), SSD/HDD 분류 결과, 분류 근거 값 보관
+    - 비책임: 분류 규칙 (core.collector._build_disk_specs)
+    - 사용처: storage 카테고리 모델 값
+    - kind: DISK_KIND_SSD / DISK_KIND_HDD / None(분류 불가, 표시 제외)
+    """
+    __slots__ = ("name", "size_bytes", "kind", "media_type", "bus_type")
+    name: str
+    size_bytes: int
+    kind: str | None
+    media_type: int | None
+    bus_type: int | None
+
+
+_MODEL_TYPES = {cls.__name__: cls for cls in (CpuSpec, MemoryModuleSpec, RamSpec, GpuSpec, DiskSpec)}
+_MODEL_CLASSES = tuple(_MODEL_TYPES.values())
+
+
+def _encode(value):
+    if isinstance(value, _MODEL_CLASSES):
+        data = {"type": type(value).__name__}
+        for field in value.__slots__:
+            data[field] = _encode(getattr(value, field))
+        return data
+    if isinstance(value, (tuple, list)):
+        return [_encode(v) for v in value]
+    return value
+
+
+def _decode(value):
+    if isinstance(value, dict) and value.get("type") in _MODEL_TYPES:
+        cls = _MODEL_TYPES[value["type"]]
+        return cls(**{field: _decode(value.get(field)) for field in cls.__slots__})
+    if isinstance(value, list):
+        return tuple(_decode(v) for v in value)
+    return value
+
+
+def model_to_dict(value):
+    """
+    카테고리 모델 값을 JSON 직렬화 가능한 값으로 변환한다. (원시 값 그대로, 손실 없음)
+
+    Args:
+        value: 카테고리 모델 값 (모델, 모델 튜플, str, None)
+
+    Returns:
+        dict | list | str | None: 모델은 {"type": 클래스 이름, 필드...} 딕셔너리
+    """
+    return _encode(value)
+
+
+def model_from_dict(data):
+    """
+    model_to_dict() 결과를 카테고리 모델 값으로 되돌린다.
+
+    Args:
+        data: model_to_dict() 반환값
+
+    Returns:
+        카테고리 모델 값 (리스트는 튜플로 복원)
+    """
+    return _decode(data)
+
+
+def to_category_result(category: str, value):
+    """
+    카테고리 모델 값을 기존 collect_*() 반환 형식(표시 문자열)으로 변환한다.
+
+    ISpecCollector/IStreamingSpecCollector 계약과 캐시·파이프 형식을 유지하기 위한 어댑터이다.
+    표시 문자열은 core.formatter의 display_*() 규칙으로 만든다.
+
+    Args:
+        category: SPEC_CATEGORIES 중 하나
+        value: 카테고리 모델 값 또는 TIMED_OUT
+
+    Returns:
+        collect_*() 반환 형식의 값 (TIMED_OUT은 그대로)
+    """
+    if value is None or value is TIMED_OUT:
+        return value
+    from core import formatter
+
+    if category == CATEGORY_CPU:
+        return value.name
+    if category == CATEGORY_RAM:
+        return formatter.display_ram(value)
+    if category == CATEGORY_VGA:
+        return formatter.display_gpus(value)
+    if category == CATEGORY_STORAGE:
+        return formatter.display_disks(value)
+    if category in (CATEGORY_SYSTEM_TYPE, CATEGORY_MAINBOARD):
+        return value
+    raise ValueError(f"알 수 없는 수집 카테고리: {category}")
+
+
+class SystemSpecs:
+    """
+    수집 1회의 카테고리 모델 묶음
+
+    - 책임: 카테고리 모델 보관, 기존 사양 딕셔너리 변환, 원시 값 직렬화/비교
+    - 비책임: 수집, 표시 문자열 규칙
+    - 사용처: core.collector.collect_spec_model() 반환 타입
+    """
+
+    __slots__ = ("system_type", "cpu", "ram", "mainboard", "vga", "storage", "timed_out")
+
+    def __init__(self):
+        for category in SPEC_CATEGORIES:
+            setattr(self, category, None)
+        self.timed_out = ()
+
+    def merge(self, category: str, value) -> None:
+        """
+        카테고리 모델 값을 병합한다. (TIMED_OUT이면 값은 None, timed_out에 기록)
+
+        Args:
+            category: SPEC_CATEGORIES 중 하나
+            value: 카테고리 모델 값 또는 TIMED_OUT
+
+        Returns:
+            None
+        """
+        if category not in SPEC_CATEGORIES:
+            raise ValueError(f"알 수 없는 수집 카테고리: {category}")
+        if value is TIMED_OUT:
+            setattr(self, category, None)
+            if category not in self.timed_out:
+                self.timed_out = self.timed_out + (category,)
+            return
+        setattr(self, category, value)
+
+    def to_specs_dict(self) -> dict:
+        """
+        collect_all_specs() 반환 형식의 사양 딕셔너리로 변환한다.
+
+        Returns:
+            dict: 표시 문자열 사양 딕셔너리 (시간 초과 카테고리는 "timed_out" 키에 기록)
+        """
+        specs = empty_specs()
+        for category in SPEC_CATEGORIES:
+            if category in self.timed_out:
+                merge_category_result(specs, category, TIMED_OUT)
+            else:
+                merge_category_result(specs, category, to_category_result(category, getattr(self, category)))
+        return specs
+
+    def to_dict(self) -> dict:
+        """
+        원시 값 그대로의 JSON 직렬화 가능 딕셔너리로 변환한다.
+
+        Returns:
+            dict: 카테고리 → model_to_dict() 값, "timed_out" → 카테고리 목록
+        """
+        data = {category: model_to_dict(getattr(self, category)) for category in SPEC_CATEGORIES}
+        data[TIMED_OUT_KEY] = list(self.timed_out)
+        return data
+
+    @classmethod
+    def from_dict(cls, data: dict) -> SystemSpecs:
+        """
+        to_dict() 결과로 SystemSpecs를 복원한다.
+
+        Args:
+            data: to_dict() 반환값
+
+        Returns:
+            SystemSpecs: 복원된 모델
+        """
+        specs = cls()
+        for category in SPEC_CATEGORIES:
+            setattr(specs, category, model_from_dict(data.get(category)))
+        specs.timed_out = tuple(data.get(TIMED_OUT_KEY) or ())
+        return specs
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, SystemSpecs):
+            return NotImplemented
+        return all(getattr(self, name) == getattr(other, name) for name in self.__slots__)
+
+    def __repr__(self) -> str:
+        fields = ", ".join(f"{name}={getattr(self, name)!r}" for name in self.__slots__)
+        return f"SystemSpecs({fields})"
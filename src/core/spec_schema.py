@@ -0,0 +1,173 @@
+# 본 소스코드는 내부 사용 및 유지보수 목적에 한해 제공됩니다.
+# 무단 재배포 및 상업적 재사용은 허용되지 않습니다.
+# core/spec_schema.py
+
+from __future__ import annotations
+
+"""
+사양 딕셔너리 스키마와 수집 카테고리 정의
+collector(수집)와 controller/formatter(표시)가 공유하는 카테고리 ↔ 사양 키 매핑을 제공
+
+- SPEC_CATEGORIES: 수집 단위 (storage는 ssd/hdd 두 키로 병합됨)
+- SPEC_KEYS: collect_all_specs() 반환 딕셔너리의 키 순서
+- TIMED_OUT: 제한 시간을 넘긴 카테고리의 수집 결과 표식 (specs["timed_out"]에 기록됨)
+- 외부 의존성이 없어 GUI/CLI 어디서든 가볍게 import 가능
+"""
+
+CATEGORY_SYSTEM_TYPE = "system_type"
+CATEGORY_CPU = "cpu"
+CATEGORY_RAM = "ram"
+CATEGORY_MAINBOARD = "mainboard"
+CATEGORY_VGA = "vga"
+CATEGORY_STORAGE = "storage"
+SPEC_CATEGORIES = (
+    CATEGORY_SYSTEM_TYPE,
+    CATEGORY_CPU,
+    CATEGORY_RAM,
+    CATEGORY_MAINBOARD,
+    CATEGORY_VGA,
+    CATEGORY_STORAGE,
+)
+
+SPEC_KEYS = ("system_type", "cpu", "ram", "mainboard", "vga", "ssd", "hdd")
+
+# 제한 시간을 넘긴 카테고리 목록이 기록되는 키 (시간 초과가 없으면 키 자체가 없음)
+TIMED_OUT_KEY = "timed_out"
+
+
+class _TimedOut:
+    """
+    카테고리 수집 시간 초과 표식 (싱글턴 TIMED_OUT으로만 사용)
+    """
+
+    def __repr__(self) -> str:
+        return "TIMED_OUT"
+
+
+TIMED_OUT = _TimedOut()
+
+
+def empty_specs() -> dict:
+    """
+    모든 키가 None인 사양 딕셔너리를 반환한다.
+
+    Returns:
+        dict: collect_all_specs() 반환 형식의 빈 딕셔너리
+    """
+    return {key: None for key in SPEC_KEYS}
+
+
+def category_spec_keys(category: str) -> tuple[str, ...]:
+    """
+    카테고리가 채우는 사양 키 목록을 반환한다.
+
+    Args:
+        category: SPEC_CATEGORIES 중 하나
+
+    Returns:
+        tuple[str, ...]: 사양 키 목록 (storage → ("ssd", "hdd"))
+    """
+    if category == CATEGORY_STORAGE:
+        return ("ssd", "hdd")
+    return (category,)
+
+
+def category_of_spec_key(key: str) -> str:
+    """
+    사양 키를 채우는 카테고리를 반환한다. (category_spec_keys()의 역방향)
+
+    Args:
+        key: 사양 키 (예: "ssd")
+
+    Returns:
+        str: 카테고리 이름 (ssd/hdd → "storage")
+    """
+    if key in ("ssd", "hdd"):
+        return CATEGORY_STORAGE
+    return key
+
+
+def is_timed_out(specs: dict, key: str) -> bool:
+    """
+    사양 키에 해당하는 카테고리가 시간 초과로 수집되지 않았는지 확인한다.
+
+    Args:
+        specs: 사양 딕셔너리
+        key: 사양 키 또는 카테고리 이름
+
+    Returns:
+        bool: 시간 초과면 True
+    """
+    return category_of_spec_key(key) in (specs.get(TIMED_OUT_KEY) or ())
+
+
+def merge_category_result(specs: dict, category: str, value) -> None:
+    """
+    카테고리 수집 결과를 specs 딕셔너리에 병합한다.
+
+    storage 결과는 (ssd_list, hdd_list) 튜플이므로 ssd/hdd 키로 분리한다.
+    value가 TIMED_OUT이면 값은 None으로 두고 specs["timed_out"]에 카테고리를 기록한다.
+
+    Args:
+        specs: 병합 대상 사양 딕셔너리
+        category: SPEC_CATEGORIES 중 하나
+        value: 카테고리 수집 결과
+
+    Returns:
+        None
+    """
+    if value is TIMED_OUT:
+        for key in category_spec_keys(category):
+            specs[key] = None
+        timed_out = specs.setdefault(TIMED_OUT_KEY, [])
+        if category not in timed_out:
+            timed_out.append(category)
+        return
+    if category == CATEGORY_STORAGE:
+        if value is None:
+            specs["ssd"], specs["hdd"] = None, None
+        else:
+            specs["ssd"], specs["hdd"] = value
+        return
+    specs[category] = value
+
+
+def category_value(specs: dict, category: str):
+    """
+    사양 딕셔너리에서 카테고리 수집 결과 형태의 값을 꺼낸다.
+
+    merge_category_result()의 역연산이다.
+
+    Args:
+        specs: 사양 딕셔너리
+        category: SPEC_CATEGORIES 중 하나
+
+    Returns:
+        카테고리 수집 결과 (storage → (ssd, hdd) 또는 None, 시간 초과 → TIMED_OUT)
+    """
+    if is_timed_out(specs, category):
+        return TIMED_OUT
+    if category == CATEGORY_STORAGE:
+        ssd, hdd = specs.get("ssd"), specs.get("hdd")
+        if ssd is None and hdd is None:
+            return None
+        return ssd, hdd
+    return specs.get(category)
+
+
+def restore_json_specs(specs: dict) -> dict:
+    """
+    JSON에서 읽은 사양 딕셔너리를 collect_all_specs() 반환 형식으로 복원한다.
+
+    JSON은 tuple을 list로 저장하므로 ram 값을 tuple로 되돌린다.
+
+    Args:
+        specs: JSON에서 읽은 사양 딕셔너리
+
+    Returns:
+        dict: 복원된 사양 딕셔너리
+    """
+    ram = specs.get("ram")
+    if isinstance(ram, list) and len(ram) == 2:
+        specs["ram"] = (ram[0], list(ram[1] or []))
+    return specs
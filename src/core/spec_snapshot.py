@@ -0,0 +1,401 @@
+# 본 소스코드는 내부 사용 및 유지보수 목적에 한해 제공됩니다.
+# 무단 재배포 및 상업적 재사용은 허용되지 않습니다.
+# core/spec_snapshot.py
+
+from __future__ import annotations
+
+"""
+메모리 매핑 파일로 게시하는 최신 사양 스냅샷 (seqlock)
+로그인 스크립트/트레이 위젯처럼 최신 사양만 필요한 로컬 프로그램이 IPC 왕복 없이 읽도록 제공
+
+- 책임: 고정 위치 스냅샷 파일 생성/게시(SnapshotPublisher), 잠금 없는 읽기(SnapshotReader)
+- 비책임: 수집 (게시 측: core.spec_daemon, core.cached_collector)
+- 사용처: SpecDaemon(snapshot_publisher=...), CachedSpecCollector(publisher=...), spec_cli --snapshot
+- collector/PyQt5를 import하지 않아 가벼운 프로그램에서 바로 사용 가능
+
+파일 구조 (리틀 엔디언):
+    [0:64)   헤더: magic(8) layout(u32) capacity(u32) seq(u64) generation(u64) published_at(f64)
+                   length(u32) crc32(u32) + 예약
+    [64:64+capacity)  payload: UTF-8 JSON {"specs": collect_all_specs() 형식, "raw": SystemSpecs.to_dict() 또는 null}
+
+seqlock:
+    - 게시: seq를 홀수로 → payload/메타 기록 → seq를 짝수로 (게시자 간에는 잠금 파일로 직렬화)
+    - 읽기: seq(짝수) 읽기 → 메타/payload 복사 → seq 재확인, 바뀌었으면 재시도
+    - Python에서는 메모리 배리어를 직접 걸 수 없으므로 payload CRC32로 찢어진 읽기를 한 번 더 거름
+    - seq가 마지막 읽기와 같으면 payload를 복사/디코딩하지 않고 이전 결과를 반환
+"""
+
+import json
+import logging
+import mmap
+import os
+import struct
+import time
+import zlib
+
+from core.spec_schema import TIMED_OUT_KEY, restore_json_specs
+
+logger = logging.getLogger(__name__)
+
+SNAPSHOT_PATH_ENV = "PC_SPEC_VIEWER_SNAPSHOT"
+SNAPSHOT_FILE_NAME = "pc_spec_viewer.specs.snap"
+MAGIC = b"PCSPSNAP"
+LAYOUT_VERSION = 1
+HEADER_SIZE = 64
+# payload 최대 크기 (사양 JSON은 수 KB, 파일은 고정 크기로 만들어 재매핑이 필요 없게 함)
+DEFAULT_CAPACITY = 256 * 1024
+
+_PREFIX = struct.Struct("<8sII")      # magic, layout, capacity
+_SEQ = struct.Struct("<Q")
+_META = struct.Struct("<QdII")        # generation, published_at, length, crc32
+SEQ_OFFSET = _PREFIX.size             # 16 (8바이트 정렬)
+META_OFFSET = SEQ_OFFSET + _SEQ.size  # 24
+
+# 게시 중(seq 홀수)일 때 바로 재시도할 횟수, 이후에는 CPU를 양보하며 재시도
+# (게시자가 선점된 경우 회전만 하면 단일 코어에서 게시자가 진행하지 못함)
+READ_SPIN_RETRIES = 64
+# 재시도 최대 시간(초) (초과 시 이전 결과 또는 None)
+READ_RETRY_TIMEOUT_S = 0.1
+
+
+def default_snapshot_path() -> str:
+    """
+    플랫폼 기본 스냅샷 파일 경로를 반환한다.
+
+    - 환경 변수 PC_SPEC_VIEWER_SNAPSHOT이 있으면 그 값
+    - Windows: %LOCALAPPDATA%\\NanoMemory\\PC_Spec_Viewer\\pc_spec_viewer.specs.snap
+    - 그 외: $XDG_RUNTIME_DIR/pc_spec_viewer.specs.snap (없으면 임시 디렉토리 + uid)
+
+    Returns:
+        str: 스냅샷 파일 경로
+    """
+    override = os.environ.get(SNAPSHOT_PATH_ENV)
+    if override:
+        return override
+    if os.name == "nt":
+        from core.path_utils import user_data_dir
+
+        return str(user_data_dir(company="NanoMemory", app_name="PC_Spec_Viewer") / SNAPSHOT_FILE_NAME)
+    runtime_dir = os.environ.get("XDG_RUNTIME_DIR")
+    if runtime_dir and os.path.isdir(runtime_dir):
+        return os.path.join(runtime_dir, SNAPSHOT_FILE_NAME)
+    import tempfile
+
+    return os.path.join(tempfile.gettempdir(), f"{SNAPSHOT_FILE_NAME}.{os.getuid()}")
+
+
+class _PublishLock:
+    """
+    게시자 간 직렬화용 잠금 파일 (seqlock은 게시자 1명을 전제하므로 데몬/GUI 동시 게시를 막음)
+
+    읽기 측은 이 잠금을 사용하지 않는다.
+    """
+
+    def __init__(self, path: str):
+        fd = os.open(path, os.O_RDWR | os.O_CREAT | getattr(os, "O_BINARY", 0), 0o600)
+        self._file = os.fdopen(fd, "r+b")
+
+    def __enter__(self):
+        if os.name == "nt":
+            import msvcrt
+
+            self._file.seek(0)
+            # LK_LOCK: 최대 10초(1초 x 10회) 재시도 후 OSError
+            msvcrt.locking(self._file.fileno(), msvcrt.LK_LOCK, 1)
+        else:
+            import fcntl
+
+            fcntl.flock(self._file.fileno(), fcntl.LOCK_EX)
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if os.name == "nt":
+            import msvcrt
+
+            self._file.seek(0)
+            msvcrt.locking(self._file.fileno(), msvcrt.LK_UNLCK, 1)
+        else:
+            import fcntl
+
+            fcntl.flock(self._file.fileno(), fcntl.LOCK_UN)
+
+    def close(self) -> None:
+        self._file.close()
+
+
+class SnapshotPublisher:
+    """
+    수집 결과를 스냅샷 파일에 게시
+
+    - 책임: 파일 생성/헤더 초기화, seqlock 게시, 비정상 종료로 남은 홀수 seq 복구
+    - 비책임: 수집, 읽기
+    - 사용처: SpecDaemon, CachedSpecCollector
+    - 게시는 메모리 복사뿐이며 msync를 호출하지 않음 (읽기 측은 같은 페이지 캐시를 공유)
+    """
+
+    def __init__(self, path: str | None = None, capacity: int = DEFAULT_CAPACITY):
+        """
+        SnapshotPublisher 초기화 (파일을 만들고 매핑)
+
+        Args:
+            path: 스냅샷 파일 경로 (None이면 default_snapshot_path())
+            capacity: payload 최대 크기(bytes)
+
+        Raises:
+            OSError: 파일 생성/매핑 실패
+        """
+        self._path = path or default_snapshot_path()
+        self._lock = _PublishLock(self._path + ".lock")
+        self._generation = 0
+        os.makedirs(os.path.dirname(os.path.abspath(self._path)), exist_ok=True)
+        with self._lock:
+            fd = os.open(self._path, os.O_RDWR | os.O_CREAT | getattr(os, "O_BINARY", 0), 0o600)
+            try:
+                self._capacity = self._prepare_file(fd, capacity)
+                self._mm = mmap.mmap(fd, HEADER_SIZE + self._capacity, access=mmap.ACCESS_WRITE)
+            finally:
+                os.close(fd)
+            self._recover()
+
+    @property
+    def path(self) -> str:
+        """스냅샷 파일 경로"""
+        return self._path
+
+    @staticmethod
+    def _prepare_file(fd: int, capacity: int) -> int:
+        """
+        헤더가 올바르면 기존 용량을 유지하고, 아니면 파일을 새로 초기화한다.
+
+        기존 파일을 줄이거나 늘리지 않으므로 이미 매핑한 읽기 측이 다시 매핑할 필요가 없다.
+        """
+        size = os.fstat(fd).st_size
+        if size >= HEADER_SIZE:
+            os.lseek(fd, 0, os.SEEK_SET)
+            magic, layout, existing = _PREFIX.unpack(os.read(fd, _PREFIX.size))
+            if magic == MAGIC and layout == LAYOUT_VERSION and size >= HEADER_SIZE + existing:
+                return existing
+        os.ftruncate(fd, HEADER_SIZE + capacity)
+        os.lseek(fd, 0, os.SEEK_SET)
+        os.write(fd, _PREFIX.pack(MAGIC, LAYOUT_VERSION, capacity) + bytes(HEADER_SIZE - _PREFIX.size))
+        return capacity
+
+    def _recover(self) -> None:
+        """
+        게시 도중 종료되어 seq가 홀수로 남았으면 빈 스냅샷(length 0)으로 되돌린다.
+        """
+        seq = _SEQ.unpack_from(self._mm, SEQ_OFFSET)[0]
+        generation = _META.unpack_from(self._mm, META_OFFSET)[0]
+        self._generation = generation
+        if seq & 1:
+            logger.warning("스냅샷 게시 중단 흔적 복구 | %s", self._path)
+            _META.pack_into(self._mm, META_OFFSET, generation, 0.0, 0, 0)
+            _SEQ.pack_into(self._mm, SEQ_OFFSET, seq + 1)
+
+    def publish(self, specs: dict, raw: dict | None = None) -> int:
+        """
+        사양을 게시한다.
+
+        Args:
+            specs: collect_all_specs() 반환 형식의 딕셔너리
+            raw: SystemSpecs.to_dict() (없으면 None)
+
+        Returns:
+            int: 게시한 세대 번호 (payload가 용량을 넘으면 게시하지 않고 0)
+        """
+        specs = dict(specs)
+        specs.pop(TIMED_OUT_KEY, None)
+        payload = json.dumps({"specs": specs, "raw": raw}, ensure_ascii=False).encode("utf-8")
+        if len(payload) > self._capacity:
+            logger.warning("스냅샷 payload가 용량을 초과하여 게시 생략 | %d > %d", len(payload), self._capacity)
+            return 0
+
+        mm = self._mm
+        with self._lock:
+            seq = _SEQ.unpack_from(mm, SEQ_OFFSET)[0]
+            # 다른 게시자가 올린 세대 다음 번호 사용
+            generation = max(self._generation, _META.unpack_from(mm, META_OFFSET)[0]) + 1
+            _SEQ.pack_into(mm, SEQ_OFFSET, seq + 1)
+            mm[HEADER_SIZE:HEADER_SIZE + len(payload)] = payload
+            _META.pack_into(mm, META_OFFSET, generation, time.time(), len(payload), zlib.crc32(payload))
+            _SEQ.pack_into(mm, SEQ_OFFSET, seq + 2)
+        self._generation = generation
+        return generation
+
+    def publish_model(self, model) -> int:
+        """
+        SystemSpecs를 게시한다. (표시 문자열 + 원시 값)
+
+        Args:
+            model: core.spec_model.SystemSpecs
+
+        Returns:
+            int: 게시한 세대 번호
+        """
+        return self.publish(model.to_specs_dict(), model.to_dict())
+
+    def close(self) -> None:
+        """
+        매핑과 잠금 파일을 닫는다. (스냅샷 파일은 남겨 두어 읽기 측이 마지막 결과를 계속 읽을 수 있음)
+
+        Returns:
+            None
+        """
+        self._mm.close()
+        self._lock.close()
+
+
+class SnapshotRecord:
+    """
+    스냅샷 읽기 결과 (불변)
+
+    - 책임: 세대 번호/게시 시각/사양 딕셔너리/원시 값 보관
+    - 비책임: 읽기
+    - 사용처: SnapshotReader.read() 반환값
+    """
+
+    __slots__ = ("generation", "published_at", "specs", "raw")
+
+    def __init__(self, generation: int, published_at: float, specs: dict, raw: dict | None):
+        """
+        SnapshotRecord 초기화
+
+        Args:
+            generation: 세대 번호
+            published_at: 게시 시각 (epoch 초)
+            specs: collect_all_specs() 반환 형식의 딕셔너리
+            raw: SystemSpecs.to_dict() 또는 None
+        """
+        self.generation = generation
+        self.published_at = published_at
+        self.specs = specs
+        self.raw = raw
+
+    def to_model(self):
+        """
+        원시 값으로 SystemSpecs를 복원한다.
+
+        Returns:
+            core.spec_model.SystemSpecs | None: 원시 값이 없으면(GUI 게시) None
+        """
+        if self.raw is None:
+            return None
+        from core.spec_model import SystemSpecs
+
+        return SystemSpecs.from_dict(self.raw)
+
+
+class SnapshotReader:
+    """
+    스냅샷 파일을 잠금 없이 읽는 읽기 측
+
+    - 책임: 첫 읽기 시 파일 매핑(이후 시스템 호출 없음), seqlock 재시도, 세대가 같으면 이전 결과 재사용
+    - 비책임: 게시
+    - 사용처: 로그인 스크립트/트레이 위젯, spec_cli --snapshot, Scripts/bench/bench_snapshot.py
+    - 스레드 간 공유하지 말고 스레드마다 만들어 사용
+    """
+
+    def __init__(self, path: str | None = None):
+        """
+        SnapshotReader 초기화 (파일은 첫 read()에서 엶)
+
+        Args:
+            path: 스냅샷 파일 경로 (None이면 default_snapshot_path())
+        """
+        self._path = path or default_snapshot_path()
+        self._mm: mmap.mmap | None = None
+        self._capacity = 0
+        self._seq = -1
+        self._record: SnapshotRecord | None = None
+        self.retries = 0
+
+    @property
+    def path(self) -> str:
+        """스냅샷 파일 경로"""
+        return self._path
+
+    def _open(self) -> bool:
+        try:
+            with open(self._path, "rb") as f:
+                mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except (OSError, ValueError):
+            # 파일 없음(게시자 미실행) 또는 빈 파일
+            return False
+        if len(mm) < HEADER_SIZE:
+            mm.close()
+            return False
+        magic, layout, capacity = _PREFIX.unpack_from(mm, 0)
+        if magic != MAGIC or layout != LAYOUT_VERSION or len(mm) < HEADER_SIZE + capacity:
+            logger.warning("스냅샷 파일 형식 불일치 | %s", self._path)
+            mm.close()
+            return False
+        self._mm = mm
+        self._capacity = capacity
+        return True
+
+    def read(self) -> SnapshotRecord | None:
+        """
+        최신 스냅샷을 읽는다.
+
+        Returns:
+            SnapshotRecord | None: 게시된 스냅샷 (파일이 없거나 아직 게시 전이면 None)
+        """
+        if self._mm is None and not self._open():
+            return None
+        mm = self._mm
+        attempt = 0
+        deadline = None
+        while True:
+            seq = _SEQ.unpack_from(mm, SEQ_OFFSET)[0]
+            if seq == self._seq:
+                return self._record
+            if not seq & 1:
+                generation, published_at, length, crc = _META.unpack_from(mm, META_OFFSET)
+                if length <= self._capacity:
+                    payload = mm[HEADER_SIZE:HEADER_SIZE + length]
+                    if _SEQ.unpack_from(mm, SEQ_OFFSET)[0] == seq and zlib.crc32(payload) == crc:
+                        self._seq = seq
+                        self._record = self._decode(generation, published_at, payload)
+                        return self._record
+
+            # 게시 중이거나 읽는 도중 게시가 끼어듦 → 재시도
+            self.retries += 1
+            attempt += 1
+            if attempt < READ_SPIN_RETRIES:
+                continue
+            if deadline is None:
+                deadline = time.monotonic() + READ_RETRY_TIMEOUT_S
+            elif time.monotonic() > deadline:
+                logger.warning("스냅샷 읽기 재시도 시간 초과 | %s", self._path)
+                return self._record
+            time.sleep(0)
+
+    @staticmethod
+    def _decode(generation: int, published_at: float, payload: bytes) -> SnapshotRecord | None:
+        if not payload:
+            return None
+        document = json.loads(payload.decode("utf-8"))
+        return SnapshotRecord(generation, published_at, restore_json_specs(document["specs"]), document.get("raw"))
+
+    def read_specs(self) -> dict | None:
+        """
+        최신 사양 딕셔너리를 반환한다.
+
+        Returns:
+            dict | None: collect_all_specs() 반환 형식 (게시 전이면 None)
+        """
+        record = self.read()
+        return record.specs if record is not None else None
+
+    def close(self) -> None:
+        """
+        매핑을 닫는다.
+
+        Returns:
+            None
+        """
+        if self._mm is not None:
+            self._mm.close()
+            self._mm = None
+        self._seq = -1
+        self._record = None
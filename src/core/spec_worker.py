@@ -0,0 +1,169 @@
+# 본 소스코드는 내부 사용 및 유지보수 목적에 한해 제공됩니다.
+# 무단 재배포 및 상업적 재사용은 허용되지 않습니다.
+# core/spec_worker.py
+
+from __future__ import annotations
+
+"""
+사양 수집을 GUI 스레드 밖(QThreadPool)에서 실행하는 워커
+수집 결과/예외를 시그널로 GUI 스레드에 전달
+
+- SpecCollectWorker: 임의의 수집 함수를 백그라운드에서 실행하는 QRunnable
+- SpecStreamWorker: 카테고리별 스트리밍 수집 결과를 하나씩 전달하는 QRunnable
+- controller.py에서 초기 수집/백그라운드 재수집/점진 렌더링에 사용
+- cancel() 이후에는 결과 시그널을 발행하지 않음 (진행 중인 WMI 호출 자체는 중단할 수 없음)
+"""
+
+import logging
+import threading
+from typing import Callable, Iterator
+
+from PyQt5.QtCore import QObject, QRunnable, pyqtSignal
+
+from core.spec_schema import empty_specs, merge_category_result
+
+logger = logging.getLogger(__name__)
+
+
+class SpecWorkerSignals(QObject):
+    """
+    수집 워커 결과 전달용 시그널 모음
+
+    - 책임: 카테고리 결과/최종 결과/예외 시그널 정의
+    - 비책임: 수집 실행
+    - 사용처: SpecCollectWorker.signals, SpecStreamWorker.signals
+    """
+    category_ready = pyqtSignal(str, object)
+    finished = pyqtSignal(object)
+    failed = pyqtSignal(object)
+
+
+class _CancellableWorker(QRunnable):
+    """
+    취소 가능한 수집 워커 공통 기반
+
+    - 책임: 시그널 객체 보관, 취소/완료 상태 관리
+    - 비책임: 수집 실행 (하위 클래스의 _run 담당)
+    - 사용처: SpecCollectWorker, SpecStreamWorker
+    """
+
+    def __init__(self):
+        """
+        시그널 객체는 생성한 스레드(GUI 스레드)에 속하므로
+        슬롯은 GUI 스레드에서 호출된다.
+        """
+        super().__init__()
+        self.signals = SpecWorkerSignals()
+        self._cancel_event = threading.Event()
+        self._done_event = threading.Event()
+
+    def cancel(self) -> None:
+        """
+        취소를 요청한다. 이후 결과 시그널은 발행되지 않는다.
+
+        Returns:
+            None
+        """
+        self._cancel_event.set()
+
+    @property
+    def is_cancelled(self) -> bool:
+        """취소 요청 여부"""
+        return self._cancel_event.is_set()
+
+    @property
+    def is_done(self) -> bool:
+        """run() 종료 여부"""
+        return self._done_event.is_set()
+
+    def run(self) -> None:
+        """
+        하위 클래스의 _run()을 실행하고, 취소되지 않았을 때만 예외를 failed로 전달한다.
+
+        Returns:
+            None
+        """
+        try:
+            self._run()
+        except Exception as e:
+            logger.exception("백그라운드 사양 수집 실패")
+            if not self.is_cancelled:
+                self.signals.failed.emit(e)
+        finally:
+            self._done_event.set()
+
+    def _run(self) -> None:
+        raise NotImplementedError
+
+
+class SpecCollectWorker(_CancellableWorker):
+    """
+    수집 함수를 QThreadPool에서 실행하고 결과를 시그널로 전달
+
+    - 책임: 백그라운드 실행, 결과/예외 시그널 발행
+    - 비책임: 수집 로직, UI 갱신
+    - 사용처: Controller
+    """
+
+    def __init__(self, collect_fn: Callable[[], dict]):
+        """
+        SpecCollectWorker 초기화
+
+        Args:
+            collect_fn: 사양 딕셔너리를 반환하는 수집 함수
+        """
+        super().__init__()
+        self._collect_fn = collect_fn
+
+    def _run(self) -> None:
+        """
+        수집 함수를 실행하고 결과를 finished로 전달한다.
+
+        Returns:
+            None
+        """
+        specs = self._collect_fn()
+        if self.is_cancelled:
+            logger.info("취소된 수집 결과 폐기")
+            return
+        self.signals.finished.emit(specs)
+
+
+class SpecStreamWorker(_CancellableWorker):
+    """
+    스트리밍 수집 결과를 카테고리 단위로 GUI 스레드에 전달
+
+    - 책임: 백그라운드 실행, category_ready/finished/failed 시그널 발행
+    - 비책임: 수집 로직, UI 갱신
+    - 사용처: Controller 점진 렌더링
+    """
+
+    def __init__(self, iter_fn: Callable[[], Iterator[tuple[str, object]]]):
+        """
+        SpecStreamWorker 초기화
+
+        Args:
+            iter_fn: (카테고리, 결과)를 반환하는 이터레이터 생성 함수
+        """
+        super().__init__()
+        self._iter_fn = iter_fn
+
+    def _run(self) -> None:
+        """
+        카테고리가 완료될 때마다 category_ready를, 모두 끝나면 병합된 사양을 finished로 전달한다.
+
+        취소되면 다음 카테고리를 기다리지 않고 종료한다.
+
+        Returns:
+            None
+        """
+        specs = empty_specs()
+        for category, value in self._iter_fn():
+            if self.is_cancelled:
+                logger.info("스트리밍 수집 취소")
+                return
+            merge_category_result(specs, category, value)
+            self.signals.category_ready.emit(category, value)
+        if self.is_cancelled:
+            return
+        self.signals.finished.emit(specs)
@@ -0,0 +1,478 @@
+# 본 소스코드는 내부 사용 및 유지보수 목적에 한해 제공됩니다.
+# 무단 재배포 및 상업적 재사용은 허용되지 않습니다.
+# core/wmi_pool.py
+
+from __future__ import annotations
+
+"""
+수집 간에 재사용하는 WMI 연결 풀
+(네임스페이스, 스레드) 단위로 연결을 보관해 반복 재수집/상주 데몬에서 연결 생성 비용을 한 번만 지불
+
+- 책임: 연결 지연 생성, 유휴 후 재사용 전 점검(probe), RPC 오류 시 제거·재연결, 종료 시 정리, 생성/재사용 집계
+- 비책임: WMI 조회/메모이제이션 (core.wmi_query), COM 초기화 방식 (apartment 팩토리로 주입)
+- 사용처: core.collector (WMI_POOL_ENABLED, 아파트먼트 해제 시 release_default_pool_thread()),
+          종료 시 main.py/spec_cli/격리 수집 프로세스의 close_default_pool()
+- COM 연결은 만든 아파트먼트(스레드) 밖에서 사용할 수 없으므로 연결은 스레드 로컬로 보관하고,
+  병렬 수집 워커는 수집마다 새 스레드 대신 아파트먼트를 유지하는 상주 워커(ApartmentWorker)로 실행
+- wmi/pywin32를 import하지 않음 (연결 함수는 호출 측이 전달)
+"""
+
+import logging
+import queue
+import threading
+import time
+from typing import Callable
+
+from core.wmi_query import exception_hresults
+
+logger = logging.getLogger(__name__)
+
+# 이 시간(초) 이상 쓰지 않은 연결은 재사용 전에 점검 조회를 실행
+PROBE_IDLE_S = 30.0
+# 점검 조회 (모든 네임스페이스에 있는 시스템 클래스, 결과가 작음)
+PROBE_WQL = "SELECT Name FROM __NAMESPACE"
+# 종료 시 상주 워커를 기다리는 최대 시간(초)
+CLOSE_TIMEOUT_S = 1.0
+
+# 연결을 버리고 다시 만들어야 하는 HRESULT (WMI 서비스 재시작, 원격 프로시저 호출 실패, 아파트먼트 해제)
+RPC_S_SERVER_UNAVAILABLE = 0x800706BA
+RPC_S_CALL_FAILED = 0x800706BE
+RPC_S_CALL_FAILED_DNE = 0x800706BF
+RPC_E_DISCONNECTED = 0x80010108
+RPC_E_SERVER_DIED_DNE = 0x80010012
+CO_E_NOTINITIALIZED = 0x800401F0
+WBEM_E_TRANSPORT_FAILURE = 0x80041015
+WBEM_E_SHUTTING_DOWN = 0x80041033
+RECONNECT_HRESULTS = frozenset({
+    RPC_S_SERVER_UNAVAILABLE,
+    RPC_S_CALL_FAILED,
+    RPC_S_CALL_FAILED_DNE,
+    RPC_E_DISCONNECTED,
+    RPC_E_SERVER_DIED_DNE,
+    CO_E_NOTINITIALIZED,
+    WBEM_E_TRANSPORT_FAILURE,
+    WBEM_E_SHUTTING_DOWN,
+})
+
+
+def is_reconnect_error(exc: BaseException) -> bool:
+    """
+    연결을 버리고 다시 만들어야 하는 오류인지 판별한다.
+
+    Args:
+        exc: WMI 호출에서 발생한 예외
+
+    Returns:
+        bool: RECONNECT_HRESULTS에 해당하는 HRESULT가 있으면 True
+    """
+    return any(code in RECONNECT_HRESULTS for code in exception_hresults(exc))
+
+
+class _PoolEntry:
+    """
+    스레드 하나가 보관하는 네임스페이스별 연결
+    """
+
+    __slots__ = ("conn", "epoch", "last_used")
+
+    def __init__(self, conn, epoch: int):
+        self.conn = conn
+        self.epoch = epoch
+        self.last_used = time.monotonic()
+
+
+class WmiConnectionPool:
+    """
+    (네임스페이스, 스레드) 단위 WMI 연결 풀
+
+    - 책임: connection()으로 지연 연결 핸들 제공, 점검/제거/재연결, 상주 아파트먼트 워커 관리, 집계
+    - 비책임: COM 초기화 (워커 생성 시 apartment 팩토리 사용), 조회 결과 메모 (core.wmi_query)
+    - 사용처: core.collector (default_pool())
+    - 연결은 스레드 로컬로 보관되어 스레드가 끝나면 함께 사라지며, close()는 세대를 올려
+      다른 스레드의 연결도 다음 사용 시점에 그 스레드에서 버려지도록 함
+    """
+
+    def __init__(self, probe_idle_s: float | None = None):
+        """
+        WmiConnectionPool 초기화
+
+        Args:
+            probe_idle_s: 이 시간(초) 이상 유휴였던 연결은 재사용 전에 점검 (None이면 PROBE_IDLE_S, 0이면 매번 점검)
+        """
+        self._probe_idle_s = PROBE_IDLE_S if probe_idle_s is None else probe_idle_s
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._epoch = 0
+        self._workers: dict = {}
+        self.created = 0
+        self.reused = 0
+        self.probes = 0
+        self.probe_failures = 0
+        self.evictions = 0
+        self.connect_ms = 0.0
+
+    def connection(self, namespace: str, connect: Callable[[], object]) -> "PooledWmiConnection":
+        """
+        네임스페이스 연결 핸들을 반환한다. (실제 연결은 첫 조회 시 호출한 스레드에서 생성)
+
+        Args:
+            namespace: WMI 네임스페이스 (예: "root\\cimv2")
+            connect: 연결을 새로 만드는 함수 (예: lambda: wmi.WMI(namespace=namespace))
+
+        Returns:
+            PooledWmiConnection: 조회 시 현재 스레드의 풀 연결을 사용하는 핸들
+        """
+        return PooledWmiConnection(self, namespace, connect)
+
+    def checkout(self, namespace: str, connect: Callable[[], object]):
+        """
+        현재 스레드의 연결을 반환한다. 없거나 버려진 세대이면 새로 만들고, 오래 유휴였으면 점검한다.
+
+        Args:
+            namespace: WMI 네임스페이스
+            connect: 연결 생성 함수
+
+        Returns:
+            WMI 연결 객체
+
+        Raises:
+            연결 생성에서 발생한 예외
+        """
+        entries = self._entries()
+        key = namespace.lower()
+        entry = entries.get(key)
+        if entry is not None and entry.epoch != self._epoch:
+            del entries[key]
+            entry = None
+        if entry is not None:
+            if time.monotonic() - entry.last_used >= self._probe_idle_s and not self._probe(namespace, entry):
+                self.evict(namespace, "점검 실패")
+                entry = None
+            else:
+                with self._lock:
+                    self.reused += 1
+        if entry is None:
+            started = time.perf_counter()
+            conn = connect()
+            elapsed_ms = (time.perf_counter() - started) * 1000
+            entry = _PoolEntry(conn, self._epoch)
+            entries[key] = entry
+            with self._lock:
+                self.created += 1
+                self.connect_ms += elapsed_ms
+            logger.info(
+                "WMI 연결 생성 | %s | %s | %.0fms", namespace, threading.current_thread().name, elapsed_ms
+            )
+        entry.last_used = time.monotonic()
+        return entry.conn
+
+    def evict(self, namespace: str, reason: str) -> None:
+        """
+        현재 스레드의 네임스페이스 연결을 버린다. (다음 checkout()에서 재연결)
+
+        Args:
+            namespace: WMI 네임스페이스
+            reason: 로그에 남길 사유
+
+        Returns:
+            None
+        """
+        if self._entries().pop(namespace.lower(), None) is None:
+            return
+        with self._lock:
+            self.evictions += 1
+        logger.warning("WMI 연결 제거 | %s | %s | %s", namespace, threading.current_thread().name, reason)
+
+    def release_thread(self) -> None:
+        """
+        현재 스레드의 모든 연결을 버린다. (COM 아파트먼트 해제 전에 호출)
+
+        Returns:
+            None
+        """
+        self._entries().clear()
+
+    def submit(self, key: str, apartment, fn: Callable, *args) -> None:
+        """
+        key 전용 상주 워커(COM 아파트먼트 유지)에서 fn(*args)를 실행한다.
+
+        이전 작업이 아직 끝나지 않은(멈춘 WMI 호출) 워커는 기다리지 않고 새 워커로 교체하며,
+        교체된 워커는 진행 중인 호출이 끝나면 연결을 정리하고 종료한다.
+
+        Args:
+            key: 워커 식별자 (예: 카테고리 이름)
+            apartment: 워커 스레드 전체를 감쌀 COM 아파트먼트 컨텍스트 매니저 팩토리
+            fn: 실행할 함수
+            *args: fn 인자
+
+        Returns:
+            None
+        """
+        with self._lock:
+            worker = self._workers.get(key)
+            if worker is not None and worker.busy:
+                logger.warning("이전 작업이 끝나지 않은 수집 워커 교체 | %s", key)
+                worker.stop()
+                worker = None
+            if worker is None or not worker.alive:
+                worker = ApartmentWorker(f"spec-collect-{key}", self, apartment)
+                self._workers[key] = worker
+            worker.submit(fn, *args)
+
+    def close(self, timeout_s: float = CLOSE_TIMEOUT_S) -> None:
+        """
+        상주 워커를 종료하고 모든 연결을 버린다. (이후 사용하면 다시 지연 생성)
+
+        각 워커는 자기 스레드에서 연결을 정리한 뒤 아파트먼트를 해제하며,
+        멈춘 워커는 timeout_s까지만 기다린다.
+
+        Args:
+            timeout_s: 워커 종료 대기 최대 시간(초)
+
+        Returns:
+            None
+        """
+        with self._lock:
+            workers = list(self._workers.values())
+            self._workers.clear()
+            self._epoch += 1
+        for worker in workers:
+            worker.stop()
+        deadline = time.monotonic() + timeout_s
+        for worker in workers:
+            worker.join(max(0.0, deadline - time.monotonic()))
+        self.release_thread()
+        logger.info("WMI 연결 풀 종료 | %s", self.stats())
+
+    def stats(self) -> dict:
+        """
+        연결 생성/재사용 집계를 반환한다.
+
+        Returns:
+            dict: {"created", "reused", "connect_ms", "probes", "probe_failures", "evictions", "workers"}
+        """
+        with self._lock:
+            return {
+                "created": self.created,
+                "reused": self.reused,
+                "connect_ms": round(self.connect_ms, 1),
+                "probes": self.probes,
+                "probe_failures": self.probe_failures,
+                "evictions": self.evictions,
+                "workers": len(self._workers),
+            }
+
+    def log_summary(self) -> None:
+        """
+        연결 생성/재사용 집계를 로그로 남긴다.
+
+        Returns:
+            None
+        """
+        stats = self.stats()
+        logger.info(
+            "WMI 연결 풀 | 생성 %d회(누적 %.0fms), 재사용 %d회, 점검 %d회(실패 %d회), 제거 %d회",
+            stats["created"], stats["connect_ms"], stats["reused"],
+            stats["probes"], stats["probe_failures"], stats["evictions"],
+        )
+
+    def _entries(self) -> dict:
+        entries = getattr(self._local, "entries", None)
+        if entries is None:
+            entries = self._local.entries = {}
+        return entries
+
+    def _probe(self, namespace: str, entry: _PoolEntry) -> bool:
+        """
+        유휴였던 연결이 아직 쓸 수 있는지 가벼운 조회로 확인한다.
+        """
+        with self._lock:
+            self.probes += 1
+        try:
+            entry.conn.query(PROBE_WQL)
+            return True
+        except Exception as e:
+            with self._lock:
+                self.probe_failures += 1
+            logger.info("WMI 연결 점검 실패 | %s | %s", namespace, e)
+            return False
+
+
+class PooledWmiConnection:
+    """
+    호출한 스레드의 풀 연결로 조회를 위임하는 지연 연결 핸들
+
+    - 책임: 첫 사용 시 연결 생성, RPC 오류 시 연결 제거 후 1회 재시도
+    - 비책임: 조회 결과 변환/메모 (core.wmi_query.MemoizedWmiConnection이 감쌈)
+    - 사용처: core.collector의 수집 경로 (wmi.WMI() 연결 객체 대신 전달)
+    - 조회하지 않으면 연결을 만들지 않으므로 사용하지 않을 네임스페이스 연결 비용이 없음
+    """
+
+    def __init__(self, pool: WmiConnectionPool, namespace: str, connect: Callable[[], object]):
+        self._pool = pool
+        self._namespace = namespace
+        self._connect = connect
+
+    def query(self, wql: str):
+        """
+        WQL 조회 (RPC 오류 시 재연결 후 1회 재시도)
+        """
+        return self._call(lambda conn: conn.query(wql))
+
+    def __getattr__(self, name: str):
+        if name.startswith("_"):
+            raise AttributeError(name)
+        attr = getattr(self._pool.checkout(self._namespace, self._connect), name)
+        if not callable(attr):
+            return attr
+        return lambda *args, **kwargs: self._call(lambda conn: getattr(conn, name)(*args, **kwargs))
+
+    def _call(self, fn: Callable):
+        conn = self._pool.checkout(self._namespace, self._connect)
+        try:
+            return fn(conn)
+        except Exception as e:
+            if not is_reconnect_error(e):
+                raise
+            self._pool.evict(self._namespace, f"RPC 오류: {e}")
+        return fn(self._pool.checkout(self._namespace, self._connect))
+
+
+class ApartmentWorker:
+    """
+    COM 아파트먼트와 풀 연결을 수집 간에 유지하는 상주 워커 스레드
+
+    - 책임: 작업 큐 실행, 종료 시 자기 스레드의 풀 연결 정리 후 아파트먼트 해제
+    - 비책임: 제한 시간 관리 (호출 측이 결과 큐로 판단)
+    - 사용처: WmiConnectionPool.submit()
+    - 멈춘 WMI 호출이 프로세스 종료를 막지 않도록 데몬 스레드로 실행
+    """
+
+    def __init__(self, name: str, pool: WmiConnectionPool, apartment):
+        """
+        ApartmentWorker 초기화 (스레드 즉시 시작)
+
+        Args:
+            name: 스레드 이름
+            pool: 종료 시 연결을 정리할 풀
+            apartment: 스레드 전체를 감쌀 COM 아파트먼트 컨텍스트 매니저 팩토리
+        """
+        self._pool = pool
+        self._apartment = apartment
+        self._tasks: queue.Queue = queue.Queue()
+        self._pending = 0
+        self._pending_lock = threading.Lock()
+        self._thread = threading.Thread(target=self._run, name=name, daemon=True)
+        self._thread.start()
+
+    @property
+    def busy(self) -> bool:
+        """실행 중이거나 대기 중인 작업이 있으면 True"""
+        with self._pending_lock:
+            return self._pending > 0
+
+    @property
+    def alive(self) -> bool:
+        """스레드 실행 여부"""
+        return self._thread.is_alive()
+
+    def submit(self, fn: Callable, *args) -> None:
+        """
+        작업을 큐에 넣는다.
+
+        Args:
+            fn: 실행할 함수
+            *args: fn 인자
+
+        Returns:
+            None
+        """
+        with self._pending_lock:
+            self._pending += 1
+        self._tasks.put((fn, args))
+
+    def stop(self) -> None:
+        """
+        남은 작업을 마친 뒤 종료하도록 요청한다.
+
+        Returns:
+            None
+        """
+        self._tasks.put(None)
+
+    def join(self, timeout_s: float) -> None:
+        """
+        스레드 종료를 최대 timeout_s초 기다린다.
+
+        Args:
+            timeout_s: 대기 시간(초)
+
+        Returns:
+            None
+        """
+        self._thread.join(timeout_s)
+
+    def _run(self) -> None:
+        with self._apartment():
+            try:
+                while True:
+                    task = self._tasks.get()
+                    if task is None:
+                        return
+                    fn, args = task
+                    try:
+                        fn(*args)
+                    except Exception:
+                        logger.exception("수집 워커 작업 실패 | %s", self._thread.name)
+                    finally:
+                        with self._pending_lock:
+                            self._pending -= 1
+            finally:
+                self._pool.release_thread()
+
+
+_default_pool: WmiConnectionPool | None = None
+_default_pool_lock = threading.Lock()
+
+
+def default_pool() -> WmiConnectionPool:
+    """
+    프로세스 공용 연결 풀을 반환한다. (최초 호출 시 생성)
+
+    Returns:
+        WmiConnectionPool: 공용 풀
+    """
+    global _default_pool
+    with _default_pool_lock:
+        if _default_pool is None:
+            _default_pool = WmiConnectionPool()
+        return _default_pool
+
+
+def release_default_pool_thread() -> None:
+    """
+    현재 스레드가 공용 풀에 보관한 연결을 버린다. (COM 아파트먼트 해제 전에 호출, 공용 풀이 없으면 만들지 않음)
+
+    Returns:
+        None
+    """
+    pool = _default_pool
+    if pool is not None:
+        pool.release_thread()
+
+
+def close_default_pool(timeout_s: float = CLOSE_TIMEOUT_S) -> None:
+    """
+    공용 연결 풀을 종료한다. (생성된 적 없으면 아무것도 하지 않음)
+
+    Args:
+        timeout_s: 워커 종료 대기 최대 시간(초)
+
+    Returns:
+        None
+    """
+    global _default_pool
+    with _default_pool_lock:
+        pool, _default_pool = _default_pool, None
+    if pool is not None:
+        pool.close(timeout_s)
@@ -0,0 +1,291 @@
+# 본 소스코드는 내부 사용 및 유지보수 목적에 한해 제공됩니다.
+# 무단 재배포 및 상업적 재사용은 허용되지 않습니다.
+# core/wmi_query.py
+
+from __future__ import annotations
+
+"""
+WMI 클래스 조회 유틸리티
+필요한 속성만 SELECT하는 WQL 프로젝션 조회와 수집 1회 범위의 조회 결과 메모이제이션을 제공
+
+- query_wmi(): "SELECT <필드> FROM <클래스>" 조회, 실패 시 전체 열거로 폴백
+  (WQL/속성이 거부된 경우에만 해당 클래스의 프로젝션을 이후에도 생략, 일시적 오류는 그 조회만 폴백)
+- WmiQueryMemo/MemoizedWmiConnection: 같은 (네임스페이스, 클래스, 프로젝션)을 수집 1회에 한 번만 조회
+- 전체 속성 열거 대비 COM 마샬링 비용/왕복을 줄이기 위해 존재
+- core.collector의 collect_*() 함수에서 사용
+"""
+
+import logging
+import threading
+
+logger = logging.getLogger(__name__)
+
+# 프로젝션 조회 사용 여부 (False면 기존 전체 열거 방식)
+WMI_PROJECTION_ENABLED = True
+
+# 프로젝션 WQL이 거부된 클래스 — 구버전 OS(Win7)에서 없는 속성을 SELECT한 경우 등
+_projection_unsupported: set[str] = set()
+_projection_lock = threading.Lock()
+
+# 프로젝션 WQL 자체가 거부되었음을 뜻하는 HRESULT (이 경우에만 클래스를 _projection_unsupported에 기록)
+WBEM_E_NOT_SUPPORTED = 0x8004100C
+WBEM_E_INVALID_PROPERTY = 0x80041011
+WBEM_E_INVALID_QUERY = 0x80041017
+WBEM_E_INVALID_QUERY_TYPE = 0x80041018
+PROJECTION_REJECTED_HRESULTS = frozenset({
+    WBEM_E_NOT_SUPPORTED,
+    WBEM_E_INVALID_PROPERTY,
+    WBEM_E_INVALID_QUERY,
+    WBEM_E_INVALID_QUERY_TYPE,
+})
+# IDispatch 예외 (실제 오류 코드는 excepinfo의 scode)
+DISP_E_EXCEPTION = 0x80020009
+
+
+def exception_hresults(exc: BaseException) -> list[int]:
+    """
+    예외에서 HRESULT 후보를 꺼낸다. (pywintypes.com_error, wmi.x_wmi.com_error, 예외 체인)
+
+    Args:
+        exc: WMI 호출에서 발생한 예외
+
+    Returns:
+        list[int]: 부호 없는 32비트 HRESULT 목록 (DISP_E_EXCEPTION이면 excepinfo의 scode 포함)
+    """
+    codes = []
+    seen = set()
+    pending = [exc]
+    while pending:
+        e = pending.pop()
+        if e is None or id(e) in seen:
+            continue
+        seen.add(id(e))
+        hresult = getattr(e, "hresult", None)
+        args = getattr(e, "args", ())
+        if not isinstance(hresult, int) and args and isinstance(args[0], int):
+            hresult = args[0]
+        if isinstance(hresult, int):
+            codes.append(hresult & 0xFFFFFFFF)
+            excepinfo = args[2] if len(args) > 2 else None
+            if (hresult & 0xFFFFFFFF) == DISP_E_EXCEPTION and isinstance(excepinfo, tuple) and len(excepinfo) > 5:
+                if isinstance(excepinfo[5], int):
+                    codes.append(excepinfo[5] & 0xFFFFFFFF)
+        pending.extend([getattr(e, "com_error", None), e.__cause__, e.__context__])
+    return codes
+
+
+def is_projection_rejected(exc: BaseException) -> bool:
+    """
+    프로젝션 WQL이 거부된 오류(잘못된 쿼리/속성)인지 판별한다. (RPC/권한/시간 초과 등 일시적 오류는 False)
+
+    Args:
+        exc: 프로젝션 조회에서 발생한 예외
+
+    Returns:
+        bool: PROJECTION_REJECTED_HRESULTS에 해당하는 HRESULT가 있으면 True
+    """
+    return any(code in PROJECTION_REJECTED_HRESULTS for code in exception_hresults(exc))
+
+
+def build_wql(class_name: str, fields: tuple[str, ...] | None) -> str:
+    """
+    프로젝션 WQL 문자열을 생성한다.
+
+    Args:
+        class_name: WMI 클래스 이름
+        fields: 조회할 속성 목록 (None/빈 값이면 전체)
+
+    Returns:
+        str: WQL 문자열
+    """
+    projection = ", ".join(fields) if fields else "*"
+    return f"SELECT {projection} FROM {class_name}"
+
+
+class WmiRow:
+    """
+    WMI 인스턴스에서 필요한 속성만 복사한 일반 파이썬 객체
+
+    COM 객체는 생성된 아파트먼트(스레드) 밖에서 사용할 수 없으므로
+    병렬 수집 워커 간에 결과를 공유할 때는 이 객체로 변환한다.
+
+    - 책임: 속성 값 보관
+    - 비책임: WMI 조회
+    - 사용처: WmiQueryMemo
+    """
+
+    def __init__(self, **props):
+        self.__dict__.update(props)
+
+    def __repr__(self) -> str:
+        return f"WmiRow({self.__dict__!r})"
+
+
+def _safe_getattr(obj, name: str):
+    """
+    WMI 객체 속성을 읽고, 어떤 예외든 발생하면 None을 반환한다.
+    """
+    try:
+        return getattr(obj, name, None)
+    except Exception:
+        return None
+
+
+class _MemoEntry:
+    """
+    메모 항목 (동시에 같은 키를 요청한 스레드는 최초 조회 완료를 기다림)
+    """
+
+    def __init__(self):
+        self.ready = threading.Event()
+        self.rows: list = []
+        self.error: Exception | None = None
+
+
+class WmiQueryMemo:
+    """
+    수집 1회 범위의 WMI 조회 결과 메모
+
+    - 책임: (네임스페이스, 클래스, 프로젝션) 단위 결과 보관, 중복 조회 방지, 조회/절약 횟수 집계
+    - 비책임: WMI 연결 생성
+    - 사용처: core.collector.iter_category_results()에서 수집 1회마다 생성
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._entries: dict[tuple, _MemoEntry] = {}
+        self.queries = 0
+        self.saved = 0
+
+    def fetch(self, namespace: str, class_name: str, fields: tuple[str, ...], loader) -> list:
+        """
+        메모된 결과를 반환하고, 없으면 loader()로 조회해 저장한다.
+
+        Args:
+            namespace: WMI 네임스페이스
+            class_name: WMI 클래스 이름
+            fields: 조회 속성 목록
+            loader: 실제 조회 함수 (WmiRow 목록 반환)
+
+        Returns:
+            list: WmiRow 목록
+
+        Raises:
+            최초 조회에서 발생한 예외 (같은 수집 안에서는 재조회하지 않음)
+        """
+        key = (namespace.lower(), class_name, tuple(fields))
+        with self._lock:
+            entry = self._entries.get(key)
+            owner = entry is None
+            if owner:
+                entry = _MemoEntry()
+                self._entries[key] = entry
+                self.queries += 1
+            else:
+                self.saved += 1
+
+        if owner:
+            try:
+                entry.rows = loader()
+            except Exception as e:
+                entry.error = e
+            finally:
+                entry.ready.set()
+        else:
+            entry.ready.wait()
+
+        if entry.error is not None:
+            raise entry.error
+        return entry.rows
+
+    def log_summary(self) -> None:
+        """
+        조회/절약 횟수를 로그로 남긴다.
+
+        Returns:
+            None
+        """
+        logger.info("WMI 조회 메모 | 조회 %d회, 중복 절약 %d회", self.queries, self.saved)
+
+
+class MemoizedWmiConnection:
+    """
+    WMI 연결을 감싸 query_wmi() 조회를 WmiQueryMemo로 중복 제거
+
+    - 책임: 프로젝션 조회 결과를 WmiRow로 변환해 메모에 저장
+    - 비책임: 그 외 속성 접근 (원본 연결에 위임)
+    - 사용처: core.collector에서 수집 1회 동안 사용
+    """
+
+    def __init__(self, wmi_conn, namespace: str, memo: WmiQueryMemo):
+        self._conn = wmi_conn
+        self._namespace = namespace
+        self._memo = memo
+
+    def __getattr__(self, name: str):
+        return getattr(self._conn, name)
+
+    def fetch(self, class_name: str, fields: tuple[str, ...] | None) -> list:
+        """
+        속성 목록이 있으면 메모를 거쳐 조회하고, 없으면 원본 연결로 바로 조회한다.
+
+        Args:
+            class_name: WMI 클래스 이름
+            fields: 조회 속성 목록
+
+        Returns:
+            list: WmiRow 또는 WMI 인스턴스 목록
+        """
+        if not fields:
+            return _query_raw(self._conn, class_name, None)
+
+        def _load() -> list:
+            return [
+                WmiRow(**{f: _safe_getattr(obj, f) for f in fields})
+                for obj in _query_raw(self._conn, class_name, fields)
+            ]
+
+        return self._memo.fetch(self._namespace, class_name, fields, _load)
+
+
+def query_wmi(wmi_conn, class_name: str, fields: tuple[str, ...] | None = None) -> list:
+    """
+    WMI 클래스를 조회한다.
+
+    fields가 주어지면 해당 속성만 SELECT하고, 프로젝션 조회가 실패하면 전체 열거로 폴백한다.
+    WQL/속성이 거부된 경우에만 같은 클래스에 대해 이후 전체 열거만 사용한다.
+    wmi_conn이 MemoizedWmiConnection이면 수집 1회 안에서 같은 조회를 재사용한다.
+
+    Args:
+        wmi_conn: WMI 연결 객체
+        class_name: WMI 클래스 이름 (예: "Win32_Processor")
+        fields: 조회할 속성 목록
+
+    Returns:
+        list: WMI 인스턴스 목록
+
+    Raises:
+        전체 열거 조회에서 발생한 예외 (호출 측 collect_*()에서 처리)
+    """
+    if isinstance(wmi_conn, MemoizedWmiConnection):
+        return wmi_conn.fetch(class_name, fields)
+    return _query_raw(wmi_conn, class_name, fields)
+
+
+def _query_raw(wmi_conn, class_name: str, fields: tuple[str, ...] | None) -> list:
+    """
+    프로젝션 WQL(가능한 경우) 또는 전체 열거로 WMI 클래스를 조회한다.
+    """
+    if WMI_PROJECTION_ENABLED and fields and class_name not in _projection_unsupported:
+        wql = build_wql(class_name, fields)
+        try:
+            return list(wmi_conn.query(wql) or [])
+        except Exception as e:
+            if is_projection_rejected(e):
+                with _projection_lock:
+                    _projection_unsupported.add(class_name)
+                logger.info(f"WMI 프로젝션 조회 거부 → 이후 전체 열거 사용 | {wql} | {e}")
+            else:
+                logger.info(f"WMI 프로젝션 조회 실패 → 이번 조회만 전체 열거로 폴백 | {wql} | {e}")
+
+    return list(getattr(wmi_conn, class_name)() or [])
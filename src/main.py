@@ -10,19 +10,26 @@ QApplication 생성, View/Controller 초기화, 이벤트 루프 시작을 담
 
 - main() 함수에서 앱 전체 생명주기 관리
 - logger 설정 및 예외 처리
+- 사용자별 단일 인스턴스 보장 (두 번째 실행은 기존 창을 활성화하고 종료, --refresh 시 재수집)
 """
+import os
 import sys
 import logging
-import ctypes
+import multiprocessing
 from PyQt5.QtWidgets import QApplication
 from logger import setup_logging
 from ui.mainwindow_view import MainWindow
 from controller import Controller
+from core.cached_collector import CachedSpecCollector
+from core.collector_wrapper import CollectorWrapper
 from core.path_utils import user_data_dir
+from core.refresh_scheduler import RefreshScheduler, ttls_from_env
 from core.font_utils import apply_app_font
+from core.single_instance import SingleInstanceGuard
 
 def is_admin() -> bool:
     try:
+        import ctypes
         return ctypes.windll.shell32.IsUserAnAdmin()
     except Exception:
         return False
@@ -35,30 +42,105 @@ def main():
     예외 발생 시 전체 스택 트레이스를 로깅하고 앱 종료
     """
     
-    log_dir = user_data_dir(company="NanoMemory", app_name="PC_Spec_Viewer") / "logs"
+    data_dir = user_data_dir(company="NanoMemory", app_name="PC_Spec_Viewer")
+    log_dir = data_dir / "logs"
     setup_logging(log_dir, level=logging.INFO)
     logger = logging.getLogger(__name__)
     logger.info("앱 시작")
     logger.info(f"관리자 권한 실행 여부: {is_admin()}")
     
+    # 이미 실행 중이면 창 활성화(--refresh: 재수집)를 요청하고 창/폰트/WMI 초기화 없이 종료
+    guard = SingleInstanceGuard()
+    if not guard.acquire():
+        if guard.hand_off(refresh="--refresh" in sys.argv):
+            logger.info("실행 중인 인스턴스에 전달 후 종료")
+            return
+        logger.warning("실행 중인 인스턴스가 응답하지 않아 새로 실행합니다.")
+        guard = None
+
+    # --isolated-collect: WMI/DXGI 수집을 자식 프로세스에서 실행 (크래시/멈춤 격리)
+    isolated_collector = None
+    if "--isolated-collect" in sys.argv:
+        from core.isolated_collector import IsolatedSpecCollector
+
+        # 프로세스 기동 비용이 창 생성과 겹치도록 먼저 기동
+        isolated_collector = IsolatedSpecCollector()
+        isolated_collector.start()
+
     try:
         app = QApplication(sys.argv)
+        if guard is not None:
+            guard.listen()
         mainwindow_view = MainWindow()
         mainwindow_view.show_loading_overlay()
         mainwindow_view.show()
-        app.processEvents()
 
         apply_app_font()
         mainwindow_view.apply_font_refresh()
-        controller = Controller(mainwindow_view)
-        mainwindow_view.hide_loading_overlay()
+        delegate = isolated_collector or CollectorWrapper()
+        # --use-daemon: 상주 사양 데몬(spec_cli --serve)의 결과 사용, 데몬이 없으면 직접 수집
+        if "--use-daemon" in sys.argv:
+            from core.daemon_client import DaemonSpecCollector
+
+            delegate = DaemonSpecCollector(fallback=delegate)
+        # --no-cache: 캐시를 읽지 않고 강제로 새로 수집 (저장은 수행)
+        # --publish-snapshot: 수집/캐시 결과를 메모리 매핑 스냅샷으로 게시 (로그인 스크립트/트레이 위젯용)
+        publisher = None
+        if "--publish-snapshot" in sys.argv:
+            from core.spec_snapshot import SnapshotPublisher
+
+            try:
+                publisher = SnapshotPublisher()
+            except OSError as e:
+                logger.warning(f"사양 스냅샷 파일 생성 실패: {e}")
+        spec_collector = CachedSpecCollector(
+            delegate,
+            cache_dir=data_dir / "cache",
+            bypass="--no-cache" in sys.argv,
+            publisher=publisher,
+        )
+        # 디스크/GPU 추가·제거 알림을 구독해 해당 카테고리만 재수집 (--no-watch-hardware: 끄기)
+        hardware_watcher = None
+        if "--no-watch-hardware" not in sys.argv:
+            from core.hw_watcher import HardwareWatcher, default_event_source
+
+            source = default_event_source()
+            if source is not None:
+                hardware_watcher = HardwareWatcher(source)
+        # 마지막 캐시 사양을 즉시 표시하고 백그라운드에서 재수집 (stale-while-revalidate)
+        # 이후 재수집(F5, --refresh 전달)은 TTL이 지난 카테고리만 수집 (PC_SPEC_VIEWER_REFRESH_TTL로 조정)
+        controller = Controller(
+            mainwindow_view,
+            spec_collector=spec_collector,
+            stale_while_revalidate=True,
+            refresh_scheduler=RefreshScheduler(spec_collector, ttls=ttls_from_env()),
+            hardware_watcher=hardware_watcher,
+        )
+        if guard is not None:
+            guard.activation_requested.connect(controller.on_activation_requested)
         
+        # 사양 수집은 백그라운드 워커에서 진행되며, 첫 렌더링 시 오버레이가 닫힘
         exit_code = app.exec_()
         logger.info("앱 종료")
+        if guard is not None:
+            guard.release()
+        if isolated_collector is not None:
+            isolated_collector.close()
+        if not controller.shutdown(timeout_ms=1000):
+            # 멈춘 WMI 호출을 기다리지 않도록 즉시 프로세스 종료
+            logger.warning("응답 없는 사양 수집 작업이 있어 즉시 종료합니다.")
+            logging.shutdown()
+            os._exit(exit_code)
+        # 수집 워커 스레드의 WMI 연결을 각 아파트먼트에서 정리
+        from core.wmi_pool import close_default_pool
+
+        close_default_pool()
         sys.exit(exit_code)
     except Exception:
         logger.exception("앱 비정상 종료")
         raise
 
 if __name__ == "__main__":
+    # PyInstaller 빌드에서 수집 자식 프로세스가 main()을 다시 실행하지 않도록 함
+    multiprocessing.freeze_support()
     main()
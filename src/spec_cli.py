@@ -0,0 +1,286 @@
+# 본 소스코드는 내부 사용 및 유지보수 목적에 한해 제공됩니다.
+# 무단 재배포 및 상업적 재사용은 허용되지 않습니다.
+# spec_cli.py
+
+from __future__ import annotations
+
+"""
+헤드리스 CLI 진입점
+GUI 없이 사양을 수집해 텍스트 또는 JSON으로 stdout에 출력 (RMM/원격 스크립트 수집용)
+
+- 책임: 인자 파싱, 카테고리 선택/제외, collect_spec_model() 호출, 텍스트/JSON 출력,
+        상주 데몬 실행(--serve)/조회(--daemon)
+- 비책임: 수집 로직 (core.collector), 표시 문자열 규칙 (core.formatter)
+- 사용처: src 디렉토리에서 `python -m spec_cli` 또는 `python src/spec_cli.py`
+- PyQt5/폰트/UI 모듈을 import하지 않음 (Scripts/bench/import_report.py --module spec_cli로 검사)
+- 로그는 파일이 아닌 stderr로 출력 (stdout은 결과 전용)
+
+종료 코드:
+    0: 선택한 카테고리 중 하나 이상 수집됨
+    1: 수집된 카테고리 없음
+    2: 인자 오류
+"""
+
+import argparse
+import json
+import logging
+import sys
+
+from core.spec_schema import SPEC_CATEGORIES, SPEC_KEYS, category_spec_keys
+from version import __version__
+
+logger = logging.getLogger(__name__)
+
+OUTPUT_TEXT = "text"
+OUTPUT_JSON = "json"
+# 사양 키 별칭 (ssd/hdd는 storage 카테고리 하나로 수집됨)
+CATEGORY_ALIASES = {"ssd": "storage", "hdd": "storage", "gpu": "vga", "mb": "mainboard"}
+
+
+def _parse_categories(text: str) -> tuple[str, ...]:
+    """
+    쉼표로 구분된 카테고리 목록을 SPEC_CATEGORIES 이름으로 변환한다.
+
+    Args:
+        text: 예) "cpu,ram,ssd"
+
+    Returns:
+        tuple[str, ...]: 중복 없는 카테고리 목록 (입력 순서 유지)
+    """
+    categories: list[str] = []
+    for name in (part.strip().lower() for part in text.split(",")):
+        if not name:
+            continue
+        category = CATEGORY_ALIASES.get(name, name)
+        if category not in SPEC_CATEGORIES:
+            raise argparse.ArgumentTypeError(
+                f"알 수 없는 카테고리: {name} (사용 가능: {', '.join(SPEC_CATEGORIES)})"
+            )
+        if category not in categories:
+            categories.append(category)
+    return tuple(categories)
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """
+    CLI 인자 파서를 만든다.
+
+    Returns:
+        argparse.ArgumentParser: 인자 파서
+    """
+    parser = argparse.ArgumentParser(
+        prog="spec_cli",
+        description="PC 사양을 GUI 없이 수집해 stdout에 출력합니다.",
+    )
+    parser.add_argument(
+        "--format", choices=(OUTPUT_TEXT, OUTPUT_JSON), default=OUTPUT_TEXT,
+        help="출력 형식 (json은 표시 문자열과 원시 값(bytes/MHz/PCI ID)을 함께 출력)",
+    )
+    parser.add_argument(
+        "--categories", type=_parse_categories, default=SPEC_CATEGORIES,
+        help=f"수집할 카테고리, 쉼표 구분 (기본값: 전체 = {','.join(SPEC_CATEGORIES)})",
+    )
+    parser.add_argument(
+        "--skip", type=_parse_categories, default=(),
+        help="제외할 카테고리, 쉼표 구분 (예: storage,vga)",
+    )
+    parser.add_argument("--sequential", action="store_true", help="카테고리 병렬 수집 대신 순차 수집")
+    parser.add_argument("--timeout", type=float, default=None, help="수집 1회 전체 제한 시간(초)")
+    parser.add_argument("--verbose", action="store_true", help="수집 로그를 stderr에 INFO 수준으로 출력")
+    parser.add_argument("--serve", action="store_true", help="상주 사양 데몬을 포그라운드로 실행")
+    parser.add_argument(
+        "--daemon", action="store_true",
+        help="상주 데몬의 캐시된 결과를 출력 (데몬이 없으면 직접 수집)",
+    )
+    parser.add_argument("--fresh", action="store_true", help="--daemon: 데몬이 새로 수집한 결과를 기다림")
+    parser.add_argument(
+        "--snapshot", action="store_true",
+        help="게시된 메모리 매핑 스냅샷을 출력 (없으면 --daemon 또는 직접 수집)",
+    )
+    parser.add_argument(
+        "--publish-snapshot", action="store_true",
+        help="--serve: 수집 결과를 메모리 매핑 스냅샷 파일에도 게시",
+    )
+    parser.add_argument("--endpoint", default=None, help="데몬 소켓 경로/명명 파이프 이름 (기본값: 플랫폼 기본값)")
+    parser.add_argument(
+        "--refresh-interval", type=float, default=None,
+        help="--serve: 주기 재수집 간격(초) (기본값: 무효화될 때만 재수집)",
+    )
+    parser.add_argument(
+        "--http-port", type=int, default=None,
+        help="--serve: 127.0.0.1 HTTP 포트 (/specs, /healthz, /metrics) (기본값: HTTP 미사용)",
+    )
+    parser.add_argument(
+        "--watch-hardware", action="store_true",
+        help="--serve: 디스크/GPU 추가·제거 알림을 구독해 해당 카테고리만 재수집",
+    )
+    parser.add_argument("--version", action="version", version=f"%(prog)s {__version__}")
+    return parser
+
+
+def _write_stdout(text: str) -> None:
+    """
+    결과를 stdout에 쓴다.
+
+    파이프/리다이렉트(RMM 에이전트 수집)일 때는 콘솔 코드 페이지와 관계없이 UTF-8로 쓴다.
+    """
+    stream = sys.stdout
+    if stream.isatty() or not hasattr(stream, "buffer"):
+        stream.write(text + "\n")
+        stream.flush()
+        return
+    stream.buffer.write((text + "\n").encode("utf-8"))
+    stream.buffer.flush()
+
+
+def _render(model, categories: tuple[str, ...], output: str) -> str:
+    """
+    수집 결과를 출력 형식에 맞게 문자열로 만든다.
+
+    Args:
+        model: core.spec_model.SystemSpecs
+        categories: 수집한 카테고리 (출력 대상)
+        output: OUTPUT_TEXT 또는 OUTPUT_JSON
+
+    Returns:
+        str: 출력 문자열
+    """
+    specs = model.to_specs_dict()
+    keys = tuple(key for key in SPEC_KEYS if any(key in category_spec_keys(c) for c in categories))
+    if output == OUTPUT_TEXT:
+        from core.formatter import format_specs_text
+
+        return format_specs_text(specs, sections=keys)
+
+    raw = model.to_dict()
+    document = {
+        "version": __version__,
+        "specs": {key: specs[key] for key in keys},
+        "raw": {category: raw[category] for category in categories},
+        "timed_out": list(model.timed_out),
+    }
+    return json.dumps(document, ensure_ascii=False, indent=2)
+
+
+def _serve(args) -> int:
+    """
+    상주 데몬을 실행한다. (Ctrl+C 또는 종료 신호까지 블로킹)
+    """
+    from core.spec_daemon import SpecDaemon
+
+    publisher = None
+    hardware_watcher = None
+    try:
+        if args.publish_snapshot:
+            from core.spec_snapshot import SnapshotPublisher
+
+            publisher = SnapshotPublisher()
+        if args.watch_hardware:
+            from core.hw_watcher import HardwareWatcher, default_event_source
+
+            source = default_event_source()
+            if source is None:
+                logger.warning("하드웨어 변경 감시를 사용할 수 없어 무효화 요청/주기 갱신만 사용합니다.")
+            else:
+                hardware_watcher = HardwareWatcher(source)
+        SpecDaemon(
+            endpoint=args.endpoint,
+            parallel=not args.sequential,
+            refresh_interval_s=args.refresh_interval,
+            http_port=args.http_port,
+            snapshot_publisher=publisher,
+            hardware_watcher=hardware_watcher,
+        ).serve_forever()
+    except KeyboardInterrupt:
+        pass
+    except (RuntimeError, OSError) as e:
+        sys.stderr.write(f"{e}\n")
+        return 1
+    finally:
+        if publisher is not None:
+            publisher.close()
+        from core.wmi_pool import close_default_pool
+
+        close_default_pool()
+    return 0
+
+
+def _snapshot_model():
+    """
+    게시된 스냅샷을 SystemSpecs로 복원한다. 스냅샷이 없거나 원시 값이 없으면(GUI 게시) None.
+    """
+    from core.spec_snapshot import SnapshotReader
+
+    reader = SnapshotReader()
+    try:
+        record = reader.read()
+    finally:
+        reader.close()
+    model = record.to_model() if record is not None else None
+    if model is None:
+        logger.warning("사용할 수 있는 사양 스냅샷 없음 | %s", reader.path)
+    return model
+
+
+def _daemon_model(args):
+    """
+    데몬에서 수집 결과를 받아 SystemSpecs로 복원한다. 데몬을 사용할 수 없으면 None.
+    """
+    from core.daemon_client import DaemonUnavailableError, SpecDaemonClient
+    from core.spec_model import SystemSpecs
+
+    try:
+        response = SpecDaemonClient(args.endpoint).get(fresh=args.fresh)
+    except DaemonUnavailableError as e:
+        logger.warning("사양 데몬 사용 불가 → 직접 수집: %s", e)
+        return None
+    return SystemSpecs.from_dict(response["raw"])
+
+
+def main(argv: list[str] | None = None) -> int:
+    """
+    CLI 진입점
+
+    Args:
+        argv: 명령줄 인자 (None이면 sys.argv[1:])
+
+    Returns:
+        int: 종료 코드
+    """
+    args = build_parser().parse_args(argv)
+    logging.basicConfig(
+        stream=sys.stderr,
+        level=logging.INFO if args.verbose else logging.WARNING,
+        format="%(asctime)s | %(levelname)s | %(name)s | %(message)s",
+    )
+
+    categories = tuple(c for c in args.categories if c not in args.skip)
+    if not categories:
+        sys.stderr.write("수집할 카테고리가 없습니다.\n")
+        return 2
+
+    if args.serve:
+        return _serve(args)
+
+    model = _snapshot_model() if args.snapshot else None
+    if model is None and args.daemon:
+        model = _daemon_model(args)
+    if model is None:
+        from core import collector
+
+        model = collector.collect_spec_model(
+            parallel=not args.sequential,
+            categories=categories,
+            deadline_s=args.timeout,
+        )
+    _write_stdout(_render(model, categories, args.format))
+
+    collected = [c for c in categories if getattr(model, c) is not None]
+    if not collected:
+        logger.warning("수집된 카테고리 없음 | 요청: %s", ", ".join(categories))
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -12,9 +12,9 @@ from __future__ import annotations
 
 import logging
 import re
-from PyQt5.QtWidgets import QMainWindow, QLabel, QVBoxLayout, QWidget
-from PyQt5.QtGui import QIcon, QFont, QResizeEvent
-from PyQt5.QtCore import Qt, QSize
+from PyQt5.QtWidgets import QMainWindow, QLabel, QShortcut, QVBoxLayout, QWidget
+from PyQt5.QtGui import QIcon, QFont, QKeySequence, QResizeEvent, QCloseEvent
+from PyQt5.QtCore import Qt, QSize, pyqtSignal
 from .ui_mainwindow import Ui_MainWindow
 
 logger = logging.getLogger(__name__)
@@ -27,6 +27,11 @@ class MainWindow(QMainWindow):
     - 비책임: 사양 수집, 포맷팅, 이벤트 처리
     - 사용처: main.py에서 생성되어 Controller에 전달
     """
+    # 창이 닫히기 직전 발행 (Controller가 진행 중인 수집을 취소)
+    closing = pyqtSignal()
+    # 새로 고침 단축키 (F5: False → 만료된 카테고리만, Ctrl+F5: True → 전체 재수집)
+    refresh_requested = pyqtSignal(bool)
+
     def __init__(self):
         """
         메인 윈도우 UI를 초기화한다.
@@ -54,6 +59,9 @@ class MainWindow(QMainWindow):
         
         self.setWindowTitle("PC 사양 확인 프로그램")
 
+        QShortcut(QKeySequence(Qt.Key_F5), self, activated=lambda: self.refresh_requested.emit(False))
+        QShortcut(QKeySequence(Qt.CTRL + Qt.Key_F5), self, activated=lambda: self.refresh_requested.emit(True))
+
         self.ui.labelTitle.setMargin(0)
 
         self.ui.textSpecs.setReadOnly(True)
@@ -266,6 +274,18 @@ class MainWindow(QMainWindow):
         self._loading_overlay.show()
         self._loading_overlay.raise_()
 
+    def show_updated_indicator(self, message: str = "최신 사양으로 갱신되었습니다.") -> None:
+        """
+        사양이 백그라운드에서 갱신되었음을 상태 표시줄에 잠시 표시한다.
+
+        Args:
+            message: 표시할 메시지
+
+        Returns:
+            None
+        """
+        self.statusBar().showMessage(message, 5000)
+
     def hide_loading_overlay(self) -> None:
         """
         로딩 오버레이를 숨긴다.
@@ -382,6 +402,35 @@ class MainWindow(QMainWindow):
         self._update_loading_overlay_geometry()
         super().resizeEvent(event)
 
+    def bring_to_front(self) -> None:
+        """
+        창을 복원하고 앞으로 가져온다. (다른 실행의 활성화 요청 시)
+
+        Args:
+            없음
+
+        Returns:
+            None
+        """
+        if self.isMinimized():
+            self.showNormal()
+        self.show()
+        self.raise_()
+        self.activateWindow()
+
+    def closeEvent(self, event: QCloseEvent) -> None:
+        """
+        창 종료 시 closing 시그널을 발행한다.
+
+        Args:
+            event: 종료 이벤트
+
+        Returns:
+            None
+        """
+        self.closing.emit()
+        super().closeEvent(event)
+
     def _current_dpi_scale(self) -> float:
         """
         현재 DPI 스케일을 기준 DPI 대비 비율로 계산한다.